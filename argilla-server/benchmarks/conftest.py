@@ -0,0 +1,181 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import atexit
+import shutil
+import asyncio
+import tempfile
+
+from uuid import uuid4
+
+# NOTE: Benchmarks never use the database and search engine configured for development. By default a throwaway SQLite
+# database and the embedded search engine are used, unless `ARGILLA_BENCHMARKS_*` variables are defined. Database
+# queries are always instrumented so they can be counted. Settings must be defined before importing any argilla_server
+# module.
+_benchmarks_home_path = tempfile.mkdtemp(prefix="argilla-benchmarks-")
+atexit.register(shutil.rmtree, _benchmarks_home_path, ignore_errors=True)
+os.environ["ARGILLA_HOME_PATH"] = _benchmarks_home_path
+os.environ["ARGILLA_DATABASE_URL"] = os.getenv(
+    "ARGILLA_BENCHMARKS_DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(_benchmarks_home_path, 'argilla.db')}?check_same_thread=False",
+)
+os.environ["ARGILLA_SEARCH_ENGINE"] = os.getenv("ARGILLA_BENCHMARKS_SEARCH_ENGINE", "embedded")
+os.environ["ARGILLA_DATABASE_QUERY_INSTRUMENTATION"] = "true"
+
+import pytest
+import pytest_asyncio
+
+from typing import AsyncGenerator, Generator
+from httpx import ASGITransport, AsyncClient
+
+from argilla_server.cli.database.migrate import migrate_db
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.contexts import accounts
+from argilla_server.database import AsyncSessionLocal
+from argilla_server.models import User, UserRole, Workspace
+from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
+
+from benchmarks.datasets import SyntheticDatasetConfig, SyntheticDatasetGenerator
+from benchmarks.recorder import BenchmarkRecorder
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines.json")
+
+recorder_key = pytest.StashKey[BenchmarkRecorder]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmark-records", type=int, default=2000, help="Number of records of synthetic datasets")
+    group.addoption("--benchmark-iterations", type=int, default=20, help="Measured iterations per benchmark")
+    group.addoption("--benchmark-text-fields", type=int, default=2, help="Number of text fields of synthetic datasets")
+    group.addoption(
+        "--benchmark-image-fields", type=int, default=1, help="Number of image fields of synthetic datasets"
+    )
+    group.addoption("--benchmark-questions", type=int, default=3, help="Number of questions of synthetic datasets")
+    group.addoption("--benchmark-vector-dimensions", type=int, default=64, help="Dimensions of synthetic vectors")
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=1.5,
+        help="How many times slower than the baseline an operation can be before failing",
+    )
+    group.addoption(
+        "--benchmark-update-baselines",
+        action="store_true",
+        default=False,
+        help="Store the measured results as the new baselines",
+    )
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus: int, config: pytest.Config) -> None:
+    recorder = config.stash.get(recorder_key, None)
+    if recorder is None or not recorder.results:
+        return
+
+    terminalreporter.write_sep("=", "benchmarks summary")
+    for line in recorder.summary():
+        terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def event_loop() -> Generator["asyncio.AbstractEventLoop", None, None]:
+    loop = asyncio.get_event_loop_policy().get_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def dataset_config(request: pytest.FixtureRequest) -> SyntheticDatasetConfig:
+    return SyntheticDatasetConfig(
+        records=request.config.getoption("--benchmark-records"),
+        text_fields=request.config.getoption("--benchmark-text-fields"),
+        image_fields=request.config.getoption("--benchmark-image-fields"),
+        questions=request.config.getoption("--benchmark-questions"),
+        vector_dimensions=request.config.getoption("--benchmark-vector-dimensions"),
+    )
+
+
+@pytest.fixture(scope="session")
+def iterations(request: pytest.FixtureRequest) -> int:
+    return request.config.getoption("--benchmark-iterations")
+
+
+@pytest.fixture(scope="session")
+def recorder(
+    request: pytest.FixtureRequest, dataset_config: SyntheticDatasetConfig, iterations: int
+) -> Generator[BenchmarkRecorder, None, None]:
+    recorder = BenchmarkRecorder(
+        BASELINES_PATH,
+        config={
+            **dataset_config.to_dict(),
+            "iterations": iterations,
+            "database": "sqlite" if settings.database_is_sqlite else "postgresql",
+            "search_engine": settings.search_engine,
+        },
+        tolerance=request.config.getoption("--benchmark-tolerance"),
+        update_baselines=request.config.getoption("--benchmark-update-baselines"),
+    )
+
+    request.config.stash[recorder_key] = recorder
+
+    yield recorder
+
+    recorder.save()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def search_engine() -> AsyncGenerator[SearchEngine, None]:
+    async with SearchEngine.get_by_name(settings.search_engine) as search_engine:
+        if not await search_engine.ping():
+            pytest.exit(f"Search engine `{settings.search_engine}` is not available", returncode=1)
+
+        yield search_engine
+
+
+@pytest_asyncio.fixture(scope="session")
+async def owner(search_engine: SearchEngine) -> User:
+    migrate_db("head")
+
+    async with AsyncSessionLocal() as db:
+        return await accounts.create_user_with_random_password(
+            db, username=f"benchmarks-{uuid4()}", first_name="Benchmarks", role=UserRole.owner
+        )
+
+
+@pytest_asyncio.fixture(scope="session")
+async def workspace(owner: User) -> Workspace:
+    async with AsyncSessionLocal() as db:
+        return await accounts.create_workspace(db, {"name": f"benchmarks-{uuid4()}"})
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(owner: User) -> AsyncGenerator[AsyncClient, None]:
+    from argilla_server import app
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app),
+        base_url="http://benchmarks",
+        headers={API_KEY_HEADER_NAME: owner.api_key},
+        timeout=None,
+    ) as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="session")
+def generator(
+    async_client: AsyncClient, workspace: Workspace, dataset_config: SyntheticDatasetConfig
+) -> SyntheticDatasetGenerator:
+    return SyntheticDatasetGenerator(async_client, workspace.id, dataset_config)
@@ -0,0 +1,218 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import random
+import dataclasses
+
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+from httpx import AsyncClient
+
+from argilla_server.api.schemas.v1.records_bulk import RECORDS_BULK_CREATE_MAX_ITEMS
+
+WORDS = [
+    "account",
+    "balance",
+    "card",
+    "cash",
+    "charge",
+    "credit",
+    "declined",
+    "deposit",
+    "exchange",
+    "fee",
+    "loan",
+    "mortgage",
+    "payment",
+    "rate",
+    "receipt",
+    "refund",
+    "transfer",
+    "withdrawal",
+]
+LABELS = ["positive", "neutral", "negative"]
+CATEGORIES = [f"category-{idx}" for idx in range(20)]
+
+
+@dataclasses.dataclass
+class SyntheticDatasetConfig:
+    records: int = 2000
+    text_fields: int = 2
+    image_fields: int = 0
+    questions: int = 3
+    vectors_settings: int = 1
+    vector_dimensions: int = 64
+    seed: int = 42
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+@dataclasses.dataclass
+class SyntheticDataset:
+    id: UUID
+    config: SyntheticDatasetConfig
+    questions_ids: Dict[str, UUID] = dataclasses.field(default_factory=dict)
+    records_ids: List[UUID] = dataclasses.field(default_factory=list)
+
+
+class SyntheticDatasetGenerator:
+    """Creates datasets with random records through the API, so they are stored and indexed like real ones."""
+
+    def __init__(self, client: AsyncClient, workspace_id: UUID, config: SyntheticDatasetConfig):
+        self.client = client
+        self.workspace_id = workspace_id
+        self.config = config
+        self.random = random.Random(config.seed)
+
+    async def create_dataset(self, records: bool = True) -> SyntheticDataset:
+        response = await self.client.post(
+            "/api/v1/datasets",
+            json={"name": f"benchmark-{uuid4()}", "workspace_id": str(self.workspace_id)},
+        )
+        response.raise_for_status()
+        dataset_id = UUID(response.json()["id"])
+
+        for field in self.fields_settings():
+            response = await self.client.post(f"/api/v1/datasets/{dataset_id}/fields", json=field)
+            response.raise_for_status()
+
+        questions_ids = {}
+        for question in self.questions_settings():
+            response = await self.client.post(f"/api/v1/datasets/{dataset_id}/questions", json=question)
+            response.raise_for_status()
+            questions_ids[question["name"]] = UUID(response.json()["id"])
+
+        for metadata_property in self.metadata_properties_settings():
+            response = await self.client.post(
+                f"/api/v1/datasets/{dataset_id}/metadata-properties", json=metadata_property
+            )
+            response.raise_for_status()
+
+        for vector_settings in self.vectors_settings():
+            response = await self.client.post(f"/api/v1/datasets/{dataset_id}/vectors-settings", json=vector_settings)
+            response.raise_for_status()
+
+        response = await self.client.put(f"/api/v1/datasets/{dataset_id}/publish")
+        response.raise_for_status()
+
+        dataset = SyntheticDataset(id=dataset_id, config=self.config, questions_ids=questions_ids)
+        if records:
+            for start in range(0, self.config.records, RECORDS_BULK_CREATE_MAX_ITEMS):
+                count = min(RECORDS_BULK_CREATE_MAX_ITEMS, self.config.records - start)
+                dataset.records_ids.extend(await self.create_records(dataset, self.records(dataset, start, count)))
+
+        return dataset
+
+    async def create_records(self, dataset: SyntheticDataset, records: List[dict]) -> List[UUID]:
+        response = await self.client.post(f"/api/v1/datasets/{dataset.id}/records/bulk", json={"items": records})
+        response.raise_for_status()
+
+        return [UUID(record["id"]) for record in response.json()["items"]]
+
+    async def upsert_records(self, dataset: SyntheticDataset, records: List[dict]) -> List[UUID]:
+        response = await self.client.put(f"/api/v1/datasets/{dataset.id}/records/bulk", json={"items": records})
+        response.raise_for_status()
+
+        return [UUID(record["id"]) for record in response.json()["items"]]
+
+    def fields_settings(self) -> List[dict]:
+        fields = [
+            {"name": f"text-{idx}", "title": f"Text {idx}", "required": True, "settings": {"type": "text"}}
+            for idx in range(self.config.text_fields)
+        ]
+        fields += [
+            {"name": f"image-{idx}", "title": f"Image {idx}", "settings": {"type": "image"}}
+            for idx in range(self.config.image_fields)
+        ]
+
+        return fields
+
+    def questions_settings(self) -> List[dict]:
+        questions = [
+            {
+                "name": "label",
+                "title": "Label",
+                "required": True,
+                "settings": {
+                    "type": "label_selection",
+                    "options": [{"value": label, "text": label} for label in LABELS],
+                },
+            },
+            {
+                "name": "rating",
+                "title": "Rating",
+                "settings": {"type": "rating", "options": [{"value": value} for value in range(1, 6)]},
+            },
+            {"name": "comment", "title": "Comment", "settings": {"type": "text"}},
+        ]
+
+        return questions[: max(self.config.questions, 1)]
+
+    def metadata_properties_settings(self) -> List[dict]:
+        return [
+            {"name": "category", "title": "Category", "settings": {"type": "terms", "values": CATEGORIES}},
+            {"name": "length", "title": "Length", "settings": {"type": "integer"}},
+            {"name": "confidence", "title": "Confidence", "settings": {"type": "float"}},
+        ]
+
+    def vectors_settings(self) -> List[dict]:
+        return [
+            {"name": f"vector-{idx}", "title": f"Vector {idx}", "dimensions": self.config.vector_dimensions}
+            for idx in range(self.config.vectors_settings)
+        ]
+
+    def records(self, dataset: SyntheticDataset, start: int, count: int) -> List[dict]:
+        return [self.record(dataset, idx) for idx in range(start, start + count)]
+
+    def record(self, dataset: SyntheticDataset, idx: int) -> dict:
+        fields = {f"text-{field_idx}": self.text() for field_idx in range(self.config.text_fields)}
+        fields.update(
+            {
+                f"image-{field_idx}": f"https://images.example.com/{idx}/{field_idx}.png"
+                for field_idx in range(self.config.image_fields)
+            }
+        )
+
+        return {
+            "external_id": f"record-{idx}",
+            "fields": fields,
+            "metadata": {
+                "category": self.random.choice(CATEGORIES),
+                "length": self.random.randint(1, 1000),
+                "confidence": self.random.random(),
+            },
+            "suggestions": [
+                {
+                    "question_id": str(dataset.questions_ids["label"]),
+                    "value": self.random.choice(LABELS),
+                    "score": self.random.random(),
+                }
+            ],
+            "vectors": {f"vector-{vector_idx}": self.vector() for vector_idx in range(self.config.vectors_settings)},
+        }
+
+    def text(self, words: int = 30) -> str:
+        return " ".join(self.random.choice(WORDS) for _ in range(words))
+
+    def vector(self) -> List[float]:
+        return [self.random.uniform(-1, 1) for _ in range(self.config.vector_dimensions)]
+
+    def response(self, record_id: UUID) -> dict:
+        values = {"label": {"value": self.random.choice(LABELS)}}
+        if self.config.questions > 1:
+            values["rating"] = {"value": self.random.randint(1, 5)}
+
+        return {"values": values, "status": "submitted", "record_id": str(record_id)}
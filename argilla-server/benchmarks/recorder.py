@@ -0,0 +1,174 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import json
+import math
+import time
+import dataclasses
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from argilla_server.database import count_queries
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """Returns the nearest-rank percentile of the given values."""
+    sorted_values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+
+    return sorted_values[rank - 1]
+
+
+@dataclasses.dataclass
+class BenchmarkResult:
+    name: str
+    durations: List[float]
+    queries: List[int]
+    items: int = 1
+
+    @property
+    def p50_ms(self) -> float:
+        return percentile(self.durations, 50) * 1000
+
+    @property
+    def p95_ms(self) -> float:
+        return percentile(self.durations, 95) * 1000
+
+    @property
+    def p99_ms(self) -> float:
+        return percentile(self.durations, 99) * 1000
+
+    @property
+    def throughput(self) -> float:
+        """Number of items processed per second."""
+        return self.items * len(self.durations) / sum(self.durations)
+
+    @property
+    def queries_per_iteration(self) -> int:
+        return int(percentile(self.queries, 50))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "iterations": len(self.durations),
+            "items": self.items,
+            "p50_ms": round(self.p50_ms, 3),
+            "p95_ms": round(self.p95_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "throughput": round(self.throughput, 3),
+            "queries": self.queries_per_iteration,
+        }
+
+
+class BenchmarkRecorder:
+    """
+    Measures benchmarked operations and compares them against stored baselines.
+
+    Results are only compared when baselines were stored using the same configuration. The number of database queries
+    is compared strictly because it doesn't depend on the machine running the benchmarks, while latencies are allowed
+    to be up to `tolerance` times slower than the baseline.
+    """
+
+    def __init__(self, baselines_path: str, config: Dict[str, Any], tolerance: float, update_baselines: bool):
+        self.baselines_path = baselines_path
+        self.config = config
+        self.tolerance = tolerance
+        self.update_baselines = update_baselines
+        self.results: Dict[str, BenchmarkResult] = {}
+
+        self._baselines = self._read_baselines()
+
+    async def measure(
+        self,
+        name: str,
+        operation: Callable[[int], Awaitable[Any]],
+        iterations: int,
+        items: int = 1,
+        warmup: int = 0,
+    ) -> BenchmarkResult:
+        """Runs `operation` with the iteration number as argument, measuring its duration and database queries."""
+        for iteration in range(warmup):
+            await operation(iteration)
+
+        durations, queries = [], []
+        for iteration in range(warmup, warmup + iterations):
+            with count_queries() as query_counter:
+                started_at = time.perf_counter()
+                await operation(iteration)
+                durations.append(time.perf_counter() - started_at)
+
+            queries.append(query_counter.count)
+
+        result = BenchmarkResult(name=name, durations=durations, queries=queries, items=items)
+        self.results[name] = result
+
+        return result
+
+    def regressions(self, result: BenchmarkResult) -> List[str]:
+        # NOTE: Every benchmarked operation queries the database, so not counting any query means that queries are not
+        # being instrumented and query count regressions would never be detected.
+        if not any(result.queries):
+            return [f"{result.name} didn't count any database query, check that queries instrumentation is enabled"]
+
+        baseline = self._baselines["results"].get(result.name)
+        if self.update_baselines or baseline is None or self._baselines["config"] != self.config:
+            return []
+
+        regressions = []
+        if result.queries_per_iteration > baseline["queries"]:
+            regressions.append(
+                f"{result.name} executes {result.queries_per_iteration} queries per iteration "
+                f"(baseline: {baseline['queries']})"
+            )
+
+        if result.p50_ms > baseline["p50_ms"] * self.tolerance:
+            regressions.append(
+                f"{result.name} p50 latency is {result.p50_ms:.2f}ms (baseline: {baseline['p50_ms']:.2f}ms, "
+                f"tolerance: {self.tolerance}x)"
+            )
+
+        return regressions
+
+    def save(self) -> None:
+        if not self.update_baselines or not self.results:
+            return
+
+        baselines_results = {} if self._baselines["config"] != self.config else dict(self._baselines["results"])
+        baselines_results.update({name: result.to_dict() for name, result in self.results.items()})
+
+        with open(self.baselines_path, "w") as file:
+            json.dump({"config": self.config, "results": dict(sorted(baselines_results.items()))}, file, indent=2)
+            file.write("\n")
+
+    def summary(self) -> List[str]:
+        lines = []
+        for name, result in self.results.items():
+            lines.append(
+                f"{name:<40} p50 {result.p50_ms:>9.2f}ms  p95 {result.p95_ms:>9.2f}ms  p99 {result.p99_ms:>9.2f}ms  "
+                f"{result.throughput:>10.1f} items/s  {result.queries_per_iteration:>4} queries"
+            )
+
+        return lines
+
+    def _read_baselines(self) -> Dict[str, Any]:
+        try:
+            with open(self.baselines_path, "r") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {"config": None, "results": {}}
+
+
+def assert_no_regressions(recorder: BenchmarkRecorder, result: BenchmarkResult, message: Optional[str] = None) -> None:
+    regressions = recorder.regressions(result)
+
+    assert not regressions, message or "\n".join(regressions)
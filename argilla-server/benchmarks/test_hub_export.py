@@ -0,0 +1,59 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from pathlib import Path
+from sqlalchemy.orm import selectinload
+
+from argilla_server.contexts.hub import HubDatasetExporter
+from argilla_server.database import AsyncSessionLocal
+from argilla_server.models import Dataset
+
+from benchmarks.datasets import SyntheticDatasetGenerator
+from benchmarks.recorder import BenchmarkRecorder, assert_no_regressions
+
+
+@pytest.mark.asyncio
+class TestHubExport:
+    async def test_write_parquet_shards(
+        self, generator: SyntheticDatasetGenerator, recorder: BenchmarkRecorder, iterations: int, tmp_path: Path
+    ):
+        synthetic_dataset = await generator.create_dataset()
+
+        async with AsyncSessionLocal() as db:
+            dataset = await Dataset.get_or_raise(
+                db,
+                synthetic_dataset.id,
+                options=[
+                    selectinload(Dataset.fields),
+                    selectinload(Dataset.questions),
+                    selectinload(Dataset.metadata_properties),
+                    selectinload(Dataset.vectors_settings),
+                ],
+            )
+
+        async def write_parquet_shards(iteration: int):
+            HubDatasetExporter(dataset).write_parquet_shards(str(tmp_path / str(iteration)), "train")
+
+        # NOTE: Exporting is slow compared with other operations so fewer iterations are measured.
+        result = await recorder.measure(
+            "hub_export_parquet_shards",
+            write_parquet_shards,
+            iterations=max(iterations // 5, 1),
+            items=len(synthetic_dataset.records_ids),
+        )
+
+        assert_no_regressions(recorder, result)
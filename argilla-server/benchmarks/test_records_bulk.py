@@ -0,0 +1,58 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from benchmarks.datasets import SyntheticDatasetGenerator
+from benchmarks.recorder import BenchmarkRecorder, assert_no_regressions
+
+BULK_SIZE = 100
+
+
+@pytest.mark.asyncio
+class TestRecordsBulk:
+    async def test_create_records_bulk(
+        self, generator: SyntheticDatasetGenerator, recorder: BenchmarkRecorder, iterations: int
+    ):
+        dataset = await generator.create_dataset(records=False)
+
+        async def create_records(iteration: int):
+            await generator.create_records(dataset, generator.records(dataset, iteration * BULK_SIZE, BULK_SIZE))
+
+        result = await recorder.measure(
+            "records_bulk_create", create_records, iterations=iterations, items=BULK_SIZE, warmup=1
+        )
+
+        assert_no_regressions(recorder, result)
+
+    async def test_upsert_records_bulk(
+        self, generator: SyntheticDatasetGenerator, recorder: BenchmarkRecorder, iterations: int
+    ):
+        dataset = await generator.create_dataset()
+        records_count = len(dataset.records_ids)
+
+        async def upsert_records(iteration: int):
+            # NOTE: Half of the records update existing ones (matched by external id) and the other half are new.
+            half = BULK_SIZE // 2
+            existing_records = generator.records(dataset, (iteration * half) % records_count, half)
+            new_records = generator.records(dataset, records_count + iteration * half, half)
+
+            await generator.upsert_records(dataset, existing_records + new_records)
+
+        result = await recorder.measure(
+            "records_bulk_upsert", upsert_records, iterations=iterations, items=BULK_SIZE, warmup=1
+        )
+
+        assert_no_regressions(recorder, result)
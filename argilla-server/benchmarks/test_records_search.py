@@ -0,0 +1,118 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+import pytest_asyncio
+
+from httpx import AsyncClient
+
+from benchmarks.datasets import CATEGORIES, SyntheticDataset, SyntheticDatasetGenerator
+from benchmarks.recorder import BenchmarkRecorder, assert_no_regressions
+
+PAGE_SIZE = 50
+
+
+@pytest_asyncio.fixture(scope="module")
+async def dataset(generator: SyntheticDatasetGenerator) -> SyntheticDataset:
+    return await generator.create_dataset()
+
+
+@pytest.mark.asyncio
+class TestRecordsSearch:
+    async def test_list_dataset_records(
+        self, async_client: AsyncClient, dataset: SyntheticDataset, recorder: BenchmarkRecorder, iterations: int
+    ):
+        async def list_records(iteration: int):
+            response = await async_client.get(
+                f"/api/v1/datasets/{dataset.id}/records",
+                params={
+                    "include": "responses,suggestions",
+                    "offset": (iteration * PAGE_SIZE) % len(dataset.records_ids),
+                    "limit": PAGE_SIZE,
+                },
+            )
+            response.raise_for_status()
+
+        result = await recorder.measure("records_list", list_records, iterations=iterations, items=PAGE_SIZE, warmup=1)
+
+        assert_no_regressions(recorder, result)
+
+    async def test_search_records_by_text(
+        self, async_client: AsyncClient, dataset: SyntheticDataset, recorder: BenchmarkRecorder, iterations: int
+    ):
+        async def search_records(iteration: int):
+            response = await async_client.post(
+                f"/api/v1/me/datasets/{dataset.id}/records/search",
+                params={"include": "responses,suggestions", "limit": PAGE_SIZE},
+                json={"query": {"text": {"q": "refund transfer"}}},
+            )
+            response.raise_for_status()
+
+        result = await recorder.measure(
+            "records_search_text", search_records, iterations=iterations, items=PAGE_SIZE, warmup=1
+        )
+
+        assert_no_regressions(recorder, result)
+
+    async def test_search_records_with_filters_and_sort(
+        self, async_client: AsyncClient, dataset: SyntheticDataset, recorder: BenchmarkRecorder, iterations: int
+    ):
+        async def search_records(iteration: int):
+            response = await async_client.post(
+                f"/api/v1/me/datasets/{dataset.id}/records/search",
+                params={"include": "responses,suggestions", "limit": PAGE_SIZE},
+                json={
+                    "filters": {
+                        "and": [
+                            {
+                                "type": "terms",
+                                "scope": {"entity": "metadata", "metadata_property": "category"},
+                                "values": CATEGORIES[: len(CATEGORIES) // 2],
+                            },
+                            {
+                                "type": "range",
+                                "scope": {"entity": "metadata", "metadata_property": "confidence"},
+                                "ge": 0.25,
+                            },
+                        ]
+                    },
+                    "sort": [{"scope": {"entity": "metadata", "metadata_property": "length"}, "order": "desc"}],
+                },
+            )
+            response.raise_for_status()
+
+        result = await recorder.measure(
+            "records_search_filters_and_sort", search_records, iterations=iterations, items=PAGE_SIZE, warmup=1
+        )
+
+        assert_no_regressions(recorder, result)
+
+    async def test_search_records_by_similarity(
+        self, async_client: AsyncClient, dataset: SyntheticDataset, recorder: BenchmarkRecorder, iterations: int
+    ):
+        async def search_records(iteration: int):
+            record_id = dataset.records_ids[iteration % len(dataset.records_ids)]
+            response = await async_client.post(
+                f"/api/v1/me/datasets/{dataset.id}/records/search",
+                params={"include": "vectors", "limit": PAGE_SIZE},
+                json={"query": {"vector": {"name": "vector-0", "record_id": str(record_id)}}},
+            )
+            response.raise_for_status()
+
+        result = await recorder.measure(
+            "records_search_similarity", search_records, iterations=iterations, items=PAGE_SIZE, warmup=1
+        )
+
+        assert_no_regressions(recorder, result)
@@ -0,0 +1,50 @@
+#  coding=utf-8
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from argilla_server.api.schemas.v1.responses import RESPONSES_BULK_CREATE_MAX_ITEMS
+
+from benchmarks.datasets import SyntheticDatasetGenerator
+from benchmarks.recorder import BenchmarkRecorder, assert_no_regressions
+
+
+@pytest.mark.asyncio
+class TestResponsesBulk:
+    async def test_create_current_user_responses_bulk(
+        self, generator: SyntheticDatasetGenerator, recorder: BenchmarkRecorder, iterations: int
+    ):
+        dataset = await generator.create_dataset()
+        records_count = len(dataset.records_ids)
+
+        async def create_responses(iteration: int):
+            start = (iteration * RESPONSES_BULK_CREATE_MAX_ITEMS) % records_count
+            records_ids = dataset.records_ids[start : start + RESPONSES_BULK_CREATE_MAX_ITEMS]
+
+            response = await generator.client.post(
+                "/api/v1/me/responses/bulk",
+                json={"items": [generator.response(record_id) for record_id in records_ids]},
+            )
+            response.raise_for_status()
+
+        result = await recorder.measure(
+            "responses_bulk_create",
+            create_responses,
+            iterations=iterations,
+            items=RESPONSES_BULK_CREATE_MAX_ITEMS,
+            warmup=1,
+        )
+
+        assert_no_regressions(recorder, result)
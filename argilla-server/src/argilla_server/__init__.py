@@ -13,4 +13,13 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from argilla_server._app import app  # noqa
+
+def __getattr__(name: str):
+    # NOTE: The app is only created when it's requested (e.g. `uvicorn argilla_server:app`) so CLI commands and
+    # background workers importing other argilla_server modules don't pay for building it.
+    if name == "app":
+        from argilla_server._app import app
+
+        return app
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
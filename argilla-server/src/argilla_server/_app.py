@@ -14,39 +14,38 @@
 #  limitations under the License.
 import base64
 import contextlib
-import glob
 import inspect
 import logging
 import os
-import shutil
-import tempfile
 import textwrap
 from urllib.parse import urlencode
 
 import redis
-from datetime import datetime
 from pathlib import Path
 
 import backoff
 from brotli_asgi import BrotliMiddleware
-from fastapi import FastAPI, Request, Query
+from fastapi import FastAPI, Request, Response, Query
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.datastructures import URL
 from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import RedirectResponse, HTMLResponse
 
-from argilla_server import helpers
+from argilla_server import metrics
 from argilla_server._version import __version__ as argilla_version
 from argilla_server.api.routes import api_v1
 from argilla_server.constants import DEFAULT_API_KEY, DEFAULT_PASSWORD, DEFAULT_USERNAME
 from argilla_server.contexts import accounts
-from argilla_server.database import get_async_db
+from argilla_server.contexts.media import MEDIA_REFERENCE_PREFIX
+from argilla_server.database import async_engine, count_queries, get_async_db, pin_to_primary
 from argilla_server.logging import configure_logging
 from argilla_server.models import User, Workspace
 from argilla_server.search_engine import get_search_engine
 from argilla_server.settings import settings
 from argilla_server.static_rewrite import RewriteStaticFiles
-from argilla_server.jobs.queues import REDIS_CONNECTION
+from argilla_server.statics import COMPRESSED_FILE_EXTENSIONS, prepare_statics_folder
+from argilla_server.jobs.queues import DEFAULT_QUEUE, HIGH_QUEUE, REDIS_CONNECTION
 from argilla_server.telemetry import get_telemetry_client
 
 _LOGGER = logging.getLogger("argilla")
@@ -58,10 +57,13 @@ async def app_lifespan(app: FastAPI):
     await configure_database()
     await configure_search_engine()
     configure_redis()
+    await start_telemetry()
     track_server_startup()
 
     yield
 
+    await stop_telemetry()
+
 
 def configure_share_your_progress(app: FastAPI):
     if settings.enable_share_your_progress is False:
@@ -162,9 +164,11 @@ def create_server_app() -> FastAPI:
 
     configure_logging()
     configure_common_middleware(app)
+    configure_database_read_replica(app)
     configure_api_router(app)
     configure_share_your_progress(app)
     configure_telemetry(app)
+    configure_metrics(app)
     configure_app_statics(app)
     configure_api_docs(app)
 
@@ -193,11 +197,14 @@ def configure_common_middleware(app: FastAPI):
 
     @app.middleware("http")
     async def add_server_timing_header(request: Request, call_next):
-        start_time = datetime.utcnow()
+        request_timing = metrics.start_request_timing(endpoint=f"{request.method} {request.url.path}")
         response = await call_next(request)
-        response_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+        response_time = request_timing.finish()
+
+        response.headers["Server-Timing"] = metrics.server_timing_header(request_timing, response_time)
 
-        response.headers["Server-Timing"] = f"total;dur={response_time_ms}"
+        if settings.metrics_enabled:
+            metrics.observe_request(request, response, request_timing, response_time)
 
         return response
 
@@ -209,7 +216,28 @@ def configure_common_middleware(app: FastAPI):
         allow_headers=["*"],
     )
 
-    app.add_middleware(BrotliMiddleware, minimum_size=512, quality=7)
+    app.add_middleware(
+        BrotliMiddleware,
+        minimum_size=512,
+        quality=7,
+        excluded_handlers=[MEDIA_REFERENCE_PREFIX, *[rf"\{extension}$" for extension in COMPRESSED_FILE_EXTENSIONS]],
+    )
+
+
+def configure_database_read_replica(app: FastAPI):
+    """Configures the middleware sending reads of clients writing data to the primary database for a while"""
+    if not settings.database_read_url:
+        return
+
+    @app.middleware("http")
+    async def pin_writers_to_primary_database(request: Request, call_next):
+        with count_queries() as query_counter:
+            response = await call_next(request)
+
+        if query_counter.writes > 0:
+            pin_to_primary(response)
+
+        return response
 
 
 def configure_api_router(app: FastAPI):
@@ -235,6 +263,21 @@ def configure_telemetry(app: FastAPI):
             return response
 
 
+def configure_metrics(app: FastAPI):
+    """
+    Configures the Prometheus metrics endpoint for the app if metrics are enabled
+    """
+    if not settings.metrics_enabled:
+        return
+
+    metrics.register_collector("database_pool", metrics.DatabasePoolCollector(async_engine))
+    metrics.register_collector("jobs_queues", metrics.JobsQueuesCollector([DEFAULT_QUEUE, HIGH_QUEUE]))
+
+    @app.get("/metrics", include_in_schema=False)
+    def get_metrics():
+        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 def configure_app_statics(app: FastAPI):
     """Configure static folder for app"""
 
@@ -243,40 +286,37 @@ def configure_app_statics(app: FastAPI):
     if not (statics_folder.exists() and statics_folder.is_dir()):
         return
 
-    def _create_statics_folder(path_from):
-        """
-        Application statics will be created with a parameterized baseUrl variable.
+    prepared_statics_folder = prepare_statics_folder(
+        str(statics_folder),
+        cache_folder=os.path.join(settings.home_path, "statics"),
+        base_url=settings.base_url,
+        version=str(argilla_version),
+    )
 
-        This function will replace the variable by the real runtime value found in settings.base_url
+    app.mount(
+        "/",
+        RewriteStaticFiles(
+            directory=prepared_statics_folder, html=True, check_dir=False, immutable_directories=["_nuxt"]
+        ),
+        name="static",
+    )
 
-        This allow us to deploy the argilla server under a custom base url, even when webapp does not
-        support it.
 
-        """
-        BASE_URL_VAR_NAME = "@@baseUrl@@"
-        temp_dir = tempfile.mkdtemp()
-        new_folder = shutil.copytree(path_from, temp_dir + "/statics")
-        base_url = helpers.remove_suffix(settings.base_url, suffix="/")
-        for extension in ["*.js", "*.html"]:
-            for file in glob.glob(
-                f"{new_folder}/**/{extension}",
-                recursive=True,
-            ):
-                helpers.replace_string_in_file(
-                    file,
-                    string=BASE_URL_VAR_NAME,
-                    replace_by=base_url,
-                )
+async def start_telemetry() -> None:
+    """
+    Starts sending telemetry events in background if telemetry is enabled
+    """
+    if not settings.enable_telemetry:
+        return
 
-        return new_folder
+    await get_telemetry_client().start()
 
-    temp_statics = _create_statics_folder(statics_folder)
 
-    app.mount(
-        "/",
-        RewriteStaticFiles(directory=temp_statics, html=True, check_dir=False),
-        name="static",
-    )
+async def stop_telemetry() -> None:
+    """
+    Sends pending telemetry events and stops the background task sending them
+    """
+    await get_telemetry_client().stop()
 
 
 def track_server_startup() -> None:
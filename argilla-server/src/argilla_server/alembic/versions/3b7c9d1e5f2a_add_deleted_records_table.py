@@ -0,0 +1,59 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""add deleted_records table
+
+Revision ID: 3b7c9d1e5f2a
+Revises: f6e0b8a4c2d1
+Create Date: 2026-10-19 16:41:07.902314
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3b7c9d1e5f2a"
+down_revision = "f6e0b8a4c2d1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "deleted_records",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("record_id", sa.Uuid(), nullable=False),
+        sa.Column("external_id", sa.String(), nullable=True),
+        sa.Column("dataset_id", sa.Uuid(), nullable=False),
+        sa.Column("inserted_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_deleted_records_record_id"), "deleted_records", ["record_id"], unique=False)
+    op.create_index(op.f("ix_deleted_records_dataset_id"), "deleted_records", ["dataset_id"], unique=False)
+    op.create_index(
+        "ix_deleted_records_dataset_id_inserted_at",
+        "deleted_records",
+        ["dataset_id", "inserted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deleted_records_dataset_id_inserted_at", table_name="deleted_records")
+    op.drop_index(op.f("ix_deleted_records_dataset_id"), table_name="deleted_records")
+    op.drop_index(op.f("ix_deleted_records_record_id"), table_name="deleted_records")
+    op.drop_table("deleted_records")
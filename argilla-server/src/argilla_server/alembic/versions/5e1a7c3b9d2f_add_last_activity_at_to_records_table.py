@@ -0,0 +1,77 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""add last_activity_at to records table
+
+Revision ID: 5e1a7c3b9d2f
+Revises: 9d2f4c6a8b1e
+Create Date: 2026-10-19 19:12:47.530114
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e1a7c3b9d2f"
+down_revision = "9d2f4c6a8b1e"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("records", sa.Column("last_activity_at", sa.DateTime(), nullable=True))
+
+    # NOTE: The multi-argument `max` function of SQLite is the equivalent of `greatest` in PostgreSQL.
+    greatest = "MAX" if op.get_bind().dialect.name == "sqlite" else "GREATEST"
+    op.execute(
+        f"""
+        UPDATE records SET last_activity_at = {greatest}(
+            updated_at,
+            COALESCE((SELECT MAX(updated_at) FROM responses WHERE responses.record_id = records.id), updated_at),
+            COALESCE((SELECT MAX(updated_at) FROM suggestions WHERE suggestions.record_id = records.id), updated_at)
+        )
+        """
+    )
+
+    with op.batch_alter_table("records") as batch_op:
+        batch_op.alter_column("last_activity_at", nullable=False)
+
+    op.create_index(
+        "ix_records_dataset_id_last_activity_at_id",
+        "records",
+        ["dataset_id", "last_activity_at", "id"],
+        unique=False,
+    )
+
+    op.drop_index("ix_deleted_records_dataset_id_inserted_at", table_name="deleted_records")
+    op.create_index(
+        "ix_deleted_records_dataset_id_inserted_at_record_id",
+        "deleted_records",
+        ["dataset_id", "inserted_at", "record_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_deleted_records_dataset_id_inserted_at_record_id", table_name="deleted_records")
+    op.create_index(
+        "ix_deleted_records_dataset_id_inserted_at",
+        "deleted_records",
+        ["dataset_id", "inserted_at"],
+        unique=False,
+    )
+
+    op.drop_index("ix_records_dataset_id_last_activity_at_id", table_name="records")
+    op.drop_column("records", "last_activity_at")
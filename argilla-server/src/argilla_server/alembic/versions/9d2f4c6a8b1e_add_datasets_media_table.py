@@ -0,0 +1,74 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""add datasets_media table
+
+Revision ID: 9d2f4c6a8b1e
+Revises: 3b7c9d1e5f2a
+Create Date: 2026-10-19 18:02:33.417205
+
+"""
+
+import re
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d2f4c6a8b1e"
+down_revision = "3b7c9d1e5f2a"
+branch_labels = None
+depends_on = None
+
+MEDIA_REFERENCE_REGEX = re.compile(r"/api/v1/media/([0-9a-f]{64})")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "datasets_media",
+        sa.Column("dataset_id", sa.Uuid(), nullable=False),
+        sa.Column("hash", sa.String(), nullable=False),
+        sa.Column("inserted_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("dataset_id", "hash"),
+    )
+    op.create_index(op.f("ix_datasets_media_dataset_id"), "datasets_media", ["dataset_id"], unique=False)
+    op.create_index(op.f("ix_datasets_media_hash"), "datasets_media", ["hash"], unique=False)
+
+    bind = op.get_bind()
+
+    records_with_media = bind.execute(
+        sa.text("SELECT dataset_id, fields FROM records WHERE CAST(fields AS TEXT) LIKE '%/api/v1/media/%'")
+    )
+
+    datasets_media = set()
+    for dataset_id, fields in records_with_media:
+        for hash in MEDIA_REFERENCE_REGEX.findall(fields if isinstance(fields, str) else str(fields)):
+            datasets_media.add((dataset_id, hash))
+
+    if datasets_media:
+        bind.execute(
+            sa.text(
+                "INSERT INTO datasets_media (dataset_id, hash, inserted_at, updated_at) "
+                "VALUES (:dataset_id, :hash, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            [{"dataset_id": dataset_id, "hash": hash} for dataset_id, hash in datasets_media],
+        )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_datasets_media_hash"), table_name="datasets_media")
+    op.drop_index(op.f("ix_datasets_media_dataset_id"), table_name="datasets_media")
+    op.drop_table("datasets_media")
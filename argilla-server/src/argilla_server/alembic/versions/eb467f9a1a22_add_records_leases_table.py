@@ -0,0 +1,69 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""add records_leases table
+
+Revision ID: eb467f9a1a22
+Revises: 580a6553186f
+Create Date: 2026-10-19 10:12:41.318802
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "eb467f9a1a22"
+down_revision = "580a6553186f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "records_leases",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.Column("record_id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column("dataset_id", sa.Uuid(), nullable=False),
+        sa.Column("inserted_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["record_id"], ["records.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["dataset_id"], ["datasets.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("record_id", "user_id", name="record_lease_record_id_user_id_uq"),
+    )
+    op.create_index(op.f("ix_records_leases_expires_at"), "records_leases", ["expires_at"], unique=False)
+    op.create_index(op.f("ix_records_leases_record_id"), "records_leases", ["record_id"], unique=False)
+    op.create_index(op.f("ix_records_leases_user_id"), "records_leases", ["user_id"], unique=False)
+    op.create_index(op.f("ix_records_leases_dataset_id"), "records_leases", ["dataset_id"], unique=False)
+
+    op.create_index(
+        "ix_records_dataset_id_status_inserted_at",
+        "records",
+        ["dataset_id", "status", "inserted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_records_dataset_id_status_inserted_at", table_name="records")
+
+    op.drop_index(op.f("ix_records_leases_dataset_id"), table_name="records_leases")
+    op.drop_index(op.f("ix_records_leases_user_id"), table_name="records_leases")
+    op.drop_index(op.f("ix_records_leases_record_id"), table_name="records_leases")
+    op.drop_index(op.f("ix_records_leases_expires_at"), table_name="records_leases")
+    op.drop_table("records_leases")
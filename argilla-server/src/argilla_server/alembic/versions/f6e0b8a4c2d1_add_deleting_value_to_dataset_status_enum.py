@@ -0,0 +1,40 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+"""add deleting value to dataset status enum
+
+Revision ID: f6e0b8a4c2d1
+Revises: eb467f9a1a22
+Create Date: 2026-10-19 12:03:27.514930
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f6e0b8a4c2d1"
+down_revision = "eb467f9a1a22"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if bind.dialect.name == "postgresql":
+        op.execute("ALTER TYPE dataset_status_enum ADD VALUE IF NOT EXISTS 'deleting';")
+
+
+def downgrade() -> None:
+    pass
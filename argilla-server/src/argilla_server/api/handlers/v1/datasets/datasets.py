@@ -29,6 +29,7 @@ from argilla_server.api.schemas.v1.datasets import (
     DatasetProgress,
     Datasets,
     DatasetUpdate,
+    DeletedDataset,
     HubDataset,
     HubDatasetExport,
     UsersProgress,
@@ -43,7 +44,7 @@ from argilla_server.errors.future import UnprocessableEntityError
 from argilla_server.api.schemas.v1.vector_settings import VectorSettings, VectorSettingsCreate, VectorsSettings
 from argilla_server.api.schemas.v1.jobs import Job as JobSchema
 from argilla_server.contexts import datasets
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.enums import DatasetStatus
 from argilla_server.jobs import hub_jobs
 from argilla_server.models import Dataset, User
@@ -75,7 +76,7 @@ async def _filter_metadata_properties_by_policy(
 @router.get("/me/datasets", response_model=Datasets)
 async def list_current_user_datasets(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     current_user: User = Security(auth.get_current_user),
     workspace_id: Optional[UUID] = Query(None, description="Filter by workspace_id"),
     name: Optional[str] = Query(None, description="Filter by dataset name"),
@@ -98,9 +99,12 @@ async def list_current_user_datasets(
 
 @router.get("/datasets/{dataset_id}/fields", response_model=Fields)
 async def list_dataset_fields(
-    *, db: AsyncSession = Depends(get_async_db), dataset_id: UUID, current_user: User = Security(auth.get_current_user)
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.fields)])
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id, options=[selectinload(Dataset.fields)])
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -109,9 +113,12 @@ async def list_dataset_fields(
 
 @router.get("/datasets/{dataset_id}/vectors-settings", response_model=VectorsSettings)
 async def list_dataset_vector_settings(
-    *, db: AsyncSession = Depends(get_async_db), dataset_id: UUID, current_user: User = Security(auth.get_current_user)
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.vectors_settings)])
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id, options=[selectinload(Dataset.vectors_settings)])
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -120,9 +127,14 @@ async def list_dataset_vector_settings(
 
 @router.get("/me/datasets/{dataset_id}/metadata-properties", response_model=MetadataProperties)
 async def list_current_user_dataset_metadata_properties(
-    *, db: AsyncSession = Depends(get_async_db), dataset_id: UUID, current_user: User = Security(auth.get_current_user)
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.metadata_properties)])
+    dataset = await Dataset.get_not_deleting_or_raise(
+        db, dataset_id, options=[selectinload(Dataset.metadata_properties)]
+    )
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -135,9 +147,12 @@ async def list_current_user_dataset_metadata_properties(
 
 @router.get("/datasets/{dataset_id}", response_model=DatasetSchema)
 async def get_dataset(
-    *, db: AsyncSession = Depends(get_async_db), dataset_id: UUID, current_user: User = Security(auth.get_current_user)
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -148,11 +163,11 @@ async def get_dataset(
 async def get_current_user_dataset_metrics(
     *,
     dataset_id: UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -165,11 +180,11 @@ async def get_current_user_dataset_metrics(
 async def get_dataset_progress(
     *,
     dataset_id: UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -182,10 +197,10 @@ async def get_dataset_progress(
 async def get_dataset_users_progress(
     *,
     dataset_id: UUID,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -214,7 +229,7 @@ async def create_dataset_field(
     field_create: FieldCreate,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.create_field(dataset))
 
@@ -232,7 +247,7 @@ async def create_dataset_metadata_property(
     metadata_property_create: MetadataPropertyCreate,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.create_metadata_property(dataset))
 
@@ -250,7 +265,7 @@ async def create_dataset_vector_settings(
     vector_settings_create: VectorSettingsCreate,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.create_vector_settings(dataset))
 
@@ -265,7 +280,7 @@ async def publish_dataset(
     dataset_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ) -> Dataset:
-    dataset = await Dataset.get_or_raise(
+    dataset = await Dataset.get_not_deleting_or_raise(
         db,
         dataset_id,
         options=[
@@ -283,11 +298,10 @@ async def publish_dataset(
     return dataset
 
 
-@router.delete("/datasets/{dataset_id}", response_model=DatasetSchema)
+@router.delete("/datasets/{dataset_id}", response_model=DeletedDataset)
 async def delete_dataset(
     *,
     db: AsyncSession = Depends(get_async_db),
-    search_engine: SearchEngine = Depends(get_search_engine),
     dataset_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
@@ -295,7 +309,12 @@ async def delete_dataset(
 
     await authorize(current_user, DatasetPolicy.delete(dataset))
 
-    return await datasets.delete_dataset(db, search_engine, dataset)
+    job = await datasets.delete_dataset(db, dataset)
+
+    return DeletedDataset(
+        **DatasetSchema.model_validate(dataset).model_dump(),
+        job=JobSchema(id=job.id, status=job.get_status()),
+    )
 
 
 @router.patch("/datasets/{dataset_id}", response_model=DatasetSchema)
@@ -306,7 +325,7 @@ async def update_dataset(
     dataset_update: DatasetUpdate,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.update(dataset))
 
@@ -321,7 +340,7 @@ async def import_dataset_from_hub(
     hub_dataset: HubDataset,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.import_from_hub(dataset))
 
@@ -344,7 +363,7 @@ async def export_dataset_to_hub(
     hub_dataset: HubDatasetExport,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.export_to_hub(dataset))
 
@@ -22,7 +22,7 @@ from starlette import status
 from argilla_server.api.policies.v1 import DatasetPolicy, authorize
 from argilla_server.api.schemas.v1.questions import Question, QuestionCreate, Questions
 from argilla_server.contexts import questions
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.models import Dataset, User
 from argilla_server.security import auth
 from argilla_server.telemetry import TelemetryClient, get_telemetry_client
@@ -32,9 +32,12 @@ router = APIRouter()
 
 @router.get("/datasets/{dataset_id}/questions", response_model=Questions)
 async def list_dataset_questions(
-    *, db: AsyncSession = Depends(get_async_db), dataset_id: UUID, current_user: User = Security(auth.get_current_user)
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.questions)])
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id, options=[selectinload(Dataset.questions)])
 
     await authorize(current_user, DatasetPolicy.get(dataset))
 
@@ -51,7 +54,7 @@ async def create_dataset_question(
 ):
     # TODO: Review this flow since we're putting logic here that will be used internally by the context
     #  Fields and questions are required to apply validations.
-    dataset = await Dataset.get_or_raise(
+    dataset = await Dataset.get_not_deleting_or_raise(
         db,
         dataset_id,
         options=[
@@ -12,51 +12,50 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Union
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query, Security, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-import argilla_server.search_engine as search_engine
 from argilla_server.api.policies.v1 import DatasetPolicy, RecordPolicy, authorize, is_authorized
+from argilla_server.api.schemas.v1.jobs import Job as JobSchema
 from argilla_server.api.schemas.v1.records import (
-    Filters,
-    FilterScope,
-    MetadataFilterScope,
-    Order,
-    RangeFilter,
-    RecordFilterScope,
+    DeletedRecord as DeletedRecordSchema,
+    DeletedRecords,
+    DeleteRecordsQuery,
+    LeasedRecord,
+    LeasedRecords,
     RecordIncludeParam,
     Records,
     SearchRecord,
     SearchRecordsQuery,
     SearchRecordsResult,
-    TermsFilter,
     SEARCH_MAX_SIMILARITY_SEARCH_RESULT,
+    UpdatedRecords,
 )
 from argilla_server.api.schemas.v1.records import Record as RecordSchema
-from argilla_server.api.schemas.v1.responses import ResponseFilterScope
 from argilla_server.api.schemas.v1.suggestions import (
     SearchSuggestionOptions,
     SearchSuggestionOptionsQuestion,
     SearchSuggestionsOptions,
-    SuggestionFilterScope,
 )
-from argilla_server.contexts import datasets, search, records
-from argilla_server.database import get_async_db
+from argilla_server.contexts import datasets, distribution, search, records
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.enums import RecordSortField
 from argilla_server.errors.future import MissingVectorError, NotFoundError, UnprocessableEntityError
 from argilla_server.errors.future.base_errors import MISSING_VECTOR_ERROR_CODE
+from argilla_server.jobs import dataset_jobs
 from argilla_server.models import Dataset, Field, Record, User, VectorSettings
 from argilla_server.search_engine import (
-    AndFilter,
     SearchEngine,
     SearchResponses,
     get_search_engine,
 )
 from argilla_server.security import auth
+from argilla_server.settings import settings
 from argilla_server.telemetry import TelemetryClient, get_telemetry_client
 from argilla_server.utils import parse_query_param, parse_uuids
 
@@ -64,6 +63,8 @@ LIST_DATASET_RECORDS_LIMIT_DEFAULT = 50
 LIST_DATASET_RECORDS_LIMIT_LE = 1000
 LIST_DATASET_RECORDS_DEFAULT_SORT_BY = {RecordSortField.inserted_at.value: "asc"}
 DELETE_DATASET_RECORDS_LIMIT = 100
+RECORDS_QUEUE_NEXT_DEFAULT = 10
+RECORDS_QUEUE_NEXT_LE = 100
 
 parse_record_include_param = parse_query_param(
     name="include", help="Relationships to include in the response", model=RecordIncludeParam
@@ -72,47 +73,6 @@ parse_record_include_param = parse_query_param(
 router = APIRouter()
 
 
-def _to_search_engine_filter_scope(scope: FilterScope, user: Optional[User]) -> search_engine.FilterScope:
-    if isinstance(scope, RecordFilterScope):
-        return search_engine.RecordFilterScope(property=scope.property)
-    elif isinstance(scope, MetadataFilterScope):
-        return search_engine.MetadataFilterScope(metadata_property=scope.metadata_property)
-    elif isinstance(scope, SuggestionFilterScope):
-        return search_engine.SuggestionFilterScope(question=scope.question, property=str(scope.property))
-    elif isinstance(scope, ResponseFilterScope):
-        return search_engine.ResponseFilterScope(question=scope.question, property=scope.property, user=user)
-    else:
-        raise Exception(f"Unknown scope type {type(scope)}")
-
-
-def _to_search_engine_filter(filters: Filters, user: Optional[User]) -> search_engine.Filter:
-    engine_filters = []
-
-    for filter in filters.and_:
-        engine_scope = _to_search_engine_filter_scope(filter.scope, user=user)
-
-        if isinstance(filter, TermsFilter):
-            engine_filter = search_engine.TermsFilter(scope=engine_scope, values=filter.values)
-        elif isinstance(filter, RangeFilter):
-            engine_filter = search_engine.RangeFilter(scope=engine_scope, ge=filter.ge, le=filter.le)
-        else:
-            raise Exception(f"Unknown filter type {type(filter)}")
-
-        engine_filters.append(engine_filter)
-
-    return AndFilter(filters=engine_filters)
-
-
-def _to_search_engine_sort(sort: List[Order], user: Optional[User]) -> List[search_engine.Order]:
-    engine_sort = []
-
-    for order in sort:
-        engine_scope = _to_search_engine_filter_scope(order.scope, user=user)
-        engine_sort.append(search_engine.Order(scope=engine_scope, order=order.order))
-
-    return engine_sort
-
-
 async def _get_search_responses(
     db: "AsyncSession",
     search_engine: "SearchEngine",
@@ -172,7 +132,7 @@ async def _get_search_responses(
         }
 
         if filters:
-            similarity_search_params["filter"] = _to_search_engine_filter(filters, user=user)
+            similarity_search_params["filter"] = search.to_search_engine_filter(filters, user=user)
 
         if offset >= similarity_search_params["max_results"]:
             return SearchResponses(items=[], total=0)
@@ -194,13 +154,21 @@ async def _get_search_responses(
             search_params["user_id"] = user.id
 
         if filters:
-            search_params["filter"] = _to_search_engine_filter(filters, user=user)
+            search_params["filter"] = search.to_search_engine_filter(filters, user=user)
         if sort:
-            search_params["sort"] = _to_search_engine_sort(sort, user=user)
+            search_params["sort"] = search.to_search_engine_sort(sort, user=user)
 
         return await search_engine.search(**search_params)
 
 
+def _to_utc_naive(value: Optional[datetime]) -> Optional[datetime]:
+    # NOTE: Timestamps are stored as naive UTC datetimes, so timezone aware values are converted before comparing.
+    if value is None or value.tzinfo is None:
+        return value
+
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 async def _validate_search_records_query(db: "AsyncSession", query: SearchRecordsQuery, dataset: Dataset):
     try:
         await search.validate_search_records_query(db, query, dataset)
@@ -211,16 +179,26 @@ async def _validate_search_records_query(db: "AsyncSession", query: SearchRecord
 @router.get("/datasets/{dataset_id}/records", response_model=Records, response_model_exclude_unset=True)
 async def list_dataset_records(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     dataset_id: UUID,
     include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
     offset: int = 0,
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    updated_at_ge: Optional[datetime] = Query(
+        None, description="List records where the record, or any of its responses or suggestions, was updated after"
+    ),
+    updated_at_le: Optional[datetime] = Query(
+        None, description="List records where the record, or any of its responses or suggestions, was updated before"
+    ),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
     await authorize(current_user, DatasetPolicy.list_records_with_all_responses(dataset))
 
+    updated_at_ge, updated_at_le = _to_utc_naive(updated_at_ge), _to_utc_naive(updated_at_le)
+    if updated_at_ge is not None and updated_at_le is not None and updated_at_ge > updated_at_le:
+        raise UnprocessableEntityError("'updated_at_ge' must be less than or equal to 'updated_at_le'")
+
     include_args = (
         dict(
             with_responses=include.with_responses,
@@ -236,12 +214,102 @@ async def list_dataset_records(
         dataset_id=dataset.id,
         offset=offset,
         limit=limit,
+        updated_at_ge=updated_at_ge,
+        updated_at_le=updated_at_le,
         **include_args,
     )
 
     return Records(items=dataset_records, total=total)
 
 
+@router.get("/datasets/{dataset_id}/records/updated", response_model=UpdatedRecords, response_model_exclude_unset=True)
+async def list_dataset_updated_records(
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
+    updated_at_ge: Optional[datetime] = Query(
+        None, description="List records where the record, or any of its responses or suggestions, changed after"
+    ),
+    after_last_activity_at: Optional[datetime] = Query(
+        None, description="The `last_activity_at` of the last record listed"
+    ),
+    after_id: Optional[UUID] = Query(None, description="The id of the last record listed"),
+    limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
+    await authorize(current_user, DatasetPolicy.list_records_with_all_responses(dataset))
+
+    if (after_last_activity_at is None) != (after_id is None):
+        raise UnprocessableEntityError("'after_last_activity_at' and 'after_id' must be provided together")
+
+    include_args = (
+        dict(
+            with_responses=include.with_responses,
+            with_suggestions=include.with_suggestions,
+            with_vectors=include.with_all_vectors or include.vectors,
+        )
+        if include
+        else {}
+    )
+
+    dataset_records = await records.list_dataset_updated_records(
+        db=db,
+        dataset_id=dataset.id,
+        limit=limit,
+        last_activity_at_ge=_to_utc_naive(updated_at_ge),
+        after=(_to_utc_naive(after_last_activity_at), after_id) if after_id else None,
+        **include_args,
+    )
+
+    return UpdatedRecords(items=dataset_records)
+
+
+@router.get("/datasets/{dataset_id}/records/deleted", response_model=DeletedRecords)
+async def list_dataset_deleted_records(
+    *,
+    db: AsyncSession = Depends(get_read_async_db),
+    dataset_id: UUID,
+    deleted_at_ge: Optional[datetime] = None,
+    after_deleted_at: Optional[datetime] = Query(None, description="The `deleted_at` of the last record listed"),
+    after_id: Optional[UUID] = Query(None, description="The id of the last record listed"),
+    limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
+    await authorize(current_user, DatasetPolicy.list_records_with_all_responses(dataset))
+
+    if (after_deleted_at is None) != (after_id is None):
+        raise UnprocessableEntityError("'after_deleted_at' and 'after_id' must be provided together")
+
+    deleted_at_ge = _to_utc_naive(deleted_at_ge)
+    if deleted_at_ge is not None and deleted_at_ge < records.deleted_records_retained_since():
+        raise UnprocessableEntityError(
+            f"Deleted records are only tracked for {settings.deleted_records_retention_days} days, "
+            "'deleted_at_ge' can't be older than that"
+        )
+
+    deleted_records = await records.list_dataset_deleted_records(
+        db,
+        dataset.id,
+        limit=limit,
+        deleted_at_ge=deleted_at_ge,
+        after=(_to_utc_naive(after_deleted_at), after_id) if after_id else None,
+    )
+
+    return DeletedRecords(
+        items=[
+            DeletedRecordSchema(
+                id=deleted_record.record_id,
+                external_id=deleted_record.external_id,
+                deleted_at=deleted_record.deleted_at,
+            )
+            for deleted_record in deleted_records
+        ]
+    )
+
+
 @router.delete("/datasets/{dataset_id}/records", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_dataset_records(
     *,
@@ -251,7 +319,7 @@ async def delete_dataset_records(
     current_user: User = Security(auth.get_current_user),
     ids: str = Query(..., description="A comma separated list with the IDs of the records to be removed"),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.delete_records(dataset))
 
@@ -267,6 +335,37 @@ async def delete_dataset_records(
     await records.delete_records(db, search_engine, dataset, record_ids)
 
 
+@router.post(
+    "/datasets/{dataset_id}/records/delete",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=JobSchema,
+)
+async def delete_dataset_records_by_query(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    dataset_id: UUID,
+    body: DeleteRecordsQuery,
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
+
+    await authorize(current_user, DatasetPolicy.delete_records(dataset))
+
+    await _validate_search_records_query(db, SearchRecordsQuery(query=body.query, filters=body.filters), dataset)
+
+    text_query = body.query.text if body.query else None
+    if text_query and text_query.field and not await Field.get_by(db, name=text_query.field, dataset_id=dataset.id):
+        raise UnprocessableEntityError(f"Field `{text_query.field}` not found in dataset `{dataset.id}`.")
+
+    job = dataset_jobs.delete_dataset_records_by_query_job.delay(
+        dataset_id=dataset.id,
+        query=text_query.model_dump() if text_query else None,
+        filters=body.filters.model_dump(mode="json", by_alias=True) if body.filters else None,
+    )
+
+    return JobSchema(id=job.id, status=job.get_status())
+
+
 @router.post(
     "/me/datasets/{dataset_id}/records/search",
     status_code=status.HTTP_200_OK,
@@ -275,7 +374,7 @@ async def delete_dataset_records(
 )
 async def search_current_user_dataset_records(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     search_engine: SearchEngine = Depends(get_search_engine),
     telemetry_client: TelemetryClient = Depends(get_telemetry_client),
     dataset_id: UUID,
@@ -285,7 +384,7 @@ async def search_current_user_dataset_records(
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(
+    dataset = await Dataset.get_not_deleting_or_raise(
         db,
         dataset_id,
         options=[
@@ -321,7 +420,7 @@ async def search_current_user_dataset_records(
         user_id=current_user.id,
     )
 
-    for record in records:
+    for record in filter(None, records):
         record.dataset = dataset
         record.metadata_ = await _filter_record_metadata_for_user(record, current_user)
 
@@ -330,11 +429,67 @@ async def search_current_user_dataset_records(
             query_score=record_id_score_map[record.id]["query_score"],
         )
 
-    return SearchRecordsResult(
-        items=[record["search_record"] for record in record_id_score_map.values()],
-        total=search_responses.total,
+    return _search_records_result(record_id_score_map, search_responses.total)
+
+
+@router.post(
+    "/me/datasets/{dataset_id}/records/queue/next",
+    status_code=status.HTTP_200_OK,
+    response_model=LeasedRecords,
+    response_model_exclude_unset=True,
+)
+async def lease_current_user_dataset_records_queue_next(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    dataset_id: UUID,
+    include: Optional[RecordIncludeParam] = Depends(parse_record_include_param),
+    n: int = Query(default=RECORDS_QUEUE_NEXT_DEFAULT, ge=1, le=RECORDS_QUEUE_NEXT_LE),
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await Dataset.get_not_deleting_or_raise(
+        db, dataset_id, options=[selectinload(Dataset.metadata_properties)]
     )
 
+    await authorize(current_user, DatasetPolicy.search_records(dataset))
+
+    leases = await distribution.lease_next_records(db, dataset, current_user, count=n)
+
+    records = await datasets.get_records_by_ids(
+        db=db,
+        dataset_id=dataset_id,
+        records_ids=[lease.record_id for lease in leases],
+        include=include,
+        user_id=current_user.id,
+    )
+
+    leased_records = []
+    for lease, record in zip(leases, records):
+        if record is None:
+            continue
+
+        record.dataset = dataset
+        record.metadata_ = await _filter_record_metadata_for_user(record, current_user)
+
+        leased_records.append(
+            LeasedRecord(record=RecordSchema.model_validate(record), lease_expires_at=lease.expires_at),
+        )
+
+    return LeasedRecords(items=leased_records)
+
+
+@router.delete("/me/datasets/{dataset_id}/records/queue", status_code=status.HTTP_204_NO_CONTENT)
+async def release_current_user_dataset_records_queue(
+    *,
+    db: AsyncSession = Depends(get_async_db),
+    dataset_id: UUID,
+    current_user: User = Security(auth.get_current_user),
+):
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
+
+    await authorize(current_user, DatasetPolicy.search_records(dataset))
+
+    await distribution.release_records_leases(db, dataset, current_user)
+
 
 @router.post(
     "/datasets/{dataset_id}/records/search",
@@ -344,7 +499,7 @@ async def search_current_user_dataset_records(
 )
 async def search_dataset_records(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     search_engine: SearchEngine = Depends(get_search_engine),
     dataset_id: UUID,
     body: SearchRecordsQuery,
@@ -353,7 +508,7 @@ async def search_dataset_records(
     limit: int = Query(default=LIST_DATASET_RECORDS_LIMIT_DEFAULT, ge=1, le=LIST_DATASET_RECORDS_LIMIT_LE),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.fields)])
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id, options=[selectinload(Dataset.fields)])
 
     await authorize(current_user, DatasetPolicy.search_records_with_all_responses(dataset))
 
@@ -380,16 +535,13 @@ async def search_dataset_records(
         include=include,
     )
 
-    for record in records:
+    for record in filter(None, records):
         record_id_score_map[record.id]["search_record"] = SearchRecord(
             record=RecordSchema.model_validate(record),
             query_score=record_id_score_map[record.id]["query_score"],
         )
 
-    return SearchRecordsResult(
-        items=[record["search_record"] for record in record_id_score_map.values()],
-        total=search_responses.total,
-    )
+    return _search_records_result(record_id_score_map, search_responses.total)
 
 
 @router.get(
@@ -399,11 +551,11 @@ async def search_dataset_records(
 )
 async def list_dataset_records_search_suggestions_options(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     dataset_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(db, dataset_id)
+    dataset = await Dataset.get_not_deleting_or_raise(db, dataset_id)
 
     await authorize(current_user, DatasetPolicy.search_records(dataset))
 
@@ -420,6 +572,16 @@ async def list_dataset_records_search_suggestions_options(
     )
 
 
+def _search_records_result(
+    record_id_score_map: Dict[UUID, Dict[str, Union[float, SearchRecord, None]]], total: int
+) -> SearchRecordsResult:
+    # NOTE: Records found by the search engine can be missing in the database session if they have been deleted
+    # meanwhile or the read replica is lagging behind, so they are left out of the results.
+    items = [record["search_record"] for record in record_id_score_map.values() if record["search_record"]]
+
+    return SearchRecordsResult(items=items, total=total - (len(record_id_score_map) - len(items)))
+
+
 async def _filter_record_metadata_for_user(record: Record, user: User) -> Optional[Dict[str, Any]]:
     if record.metadata_ is None:
         return None
@@ -43,7 +43,7 @@ async def create_dataset_records_bulk(
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(
+    dataset = await Dataset.get_not_deleting_or_raise(
         db,
         dataset_id,
         options=[
@@ -68,7 +68,7 @@ async def upsert_dataset_records_bulk(
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
 ):
-    dataset = await Dataset.get_or_raise(
+    dataset = await Dataset.get_not_deleting_or_raise(
         db,
         dataset_id,
         options=[
@@ -19,6 +19,7 @@ from rq.job import Job
 from rq.exceptions import NoSuchJobError
 
 from argilla_server.database import get_async_db
+from argilla_server.jobs.progress import get_job_progress
 from argilla_server.jobs.queues import REDIS_CONNECTION
 from argilla_server.models import User
 from argilla_server.api.policies.v1 import JobPolicy, authorize
@@ -49,4 +50,4 @@ async def get_job(
 
     await authorize(current_user, JobPolicy.get)
 
-    return JobSchema(id=job.id, status=job.get_status(refresh=True))
+    return JobSchema(id=job.id, status=job.get_status(refresh=True), progress=get_job_progress(job))
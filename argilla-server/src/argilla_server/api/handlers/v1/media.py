@@ -0,0 +1,71 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import FileResponse
+from fastapi.security import SecurityScopes
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.api.policies.v1 import DatasetPolicy, is_authorized
+from argilla_server.contexts import media
+from argilla_server.database import get_async_db
+from argilla_server.errors.base_errors import ForbiddenOperationError
+from argilla_server.errors.future import NotFoundError
+from argilla_server.security import auth
+
+MEDIA_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+router = APIRouter(tags=["media"])
+
+
+@router.get("/media/{hash}")
+async def get_media(
+    *,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    hash: str,
+    token: Optional[str] = None,
+):
+    media_file = media.get_media_store().get(hash)
+    if media_file is None:
+        raise NotFoundError(f"Media with hash `{hash}` not found")
+
+    # NOTE: Signed references are returned as field values of the records the user is allowed to read, so they can
+    # be used as `<img>` sources. Otherwise, the user must have access to one of the datasets referencing the media.
+    if token is None or not media.is_valid_media_token(hash, token):
+        await _authorize_media(request, db, hash)
+
+    return FileResponse(
+        media_file.path,
+        media_type=media_file.mimetype,
+        headers={"Cache-Control": MEDIA_CACHE_CONTROL, "ETag": f'"{hash}"'},
+    )
+
+
+async def _authorize_media(request: Request, db: AsyncSession, hash: str) -> None:
+    current_user = await auth.get_current_user(SecurityScopes(), request, db)
+
+    datasets = await media.list_datasets_referencing_media(db, hash)
+    if not datasets:
+        raise NotFoundError(f"Media with hash `{hash}` not found")
+
+    # NOTE: The same media can be referenced by records of different datasets, so it's enough for the user to have
+    # access to one of them.
+    for dataset in datasets:
+        if await is_authorized(current_user, DatasetPolicy.get(dataset)):
+            return
+
+    raise ForbiddenOperationError()
@@ -27,7 +27,7 @@ from argilla_server.api.schemas.v1.metadata_properties import (
     MetadataProperty as MetadataPropertySchema,
 )
 from argilla_server.contexts import datasets
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.models import MetadataProperty, User
 from argilla_server.search_engine import SearchEngine, get_search_engine
 from argilla_server.security import auth
@@ -38,7 +38,7 @@ router = APIRouter(tags=["metadata properties"])
 @router.get("/metadata-properties/{metadata_property_id}/metrics", response_model=MetadataMetrics)
 async def get_metadata_property_metrics(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     metadata_property_id: UUID,
     search_engine: SearchEngine = Depends(get_search_engine),
     current_user: User = Security(auth.get_current_user),
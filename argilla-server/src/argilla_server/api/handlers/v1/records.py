@@ -26,7 +26,7 @@ from argilla_server.api.schemas.v1.responses import Response, ResponseCreate
 from argilla_server.api.schemas.v1.suggestions import Suggestion as SuggestionSchema
 from argilla_server.api.schemas.v1.suggestions import SuggestionCreate, Suggestions
 from argilla_server.contexts import datasets, records
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.errors.future.base_errors import NotFoundError, UnprocessableEntityError
 from argilla_server.models import Dataset, Question, Record, Suggestion, User
 from argilla_server.search_engine import SearchEngine, get_search_engine
@@ -41,11 +41,11 @@ router = APIRouter(tags=["records"])
 @router.get("/records/{record_id}", response_model=RecordSchema)
 async def get_record(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     record_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
@@ -70,7 +70,7 @@ async def update_record(
     record_update: RecordUpdate,
     current_user: User = Security(auth.get_current_user),
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
@@ -100,7 +100,7 @@ async def create_record_response(
     response_create: ResponseCreate,
     current_user: User = Security(auth.get_current_user),
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
@@ -117,11 +117,11 @@ async def create_record_response(
 @router.get("/records/{record_id}/suggestions", status_code=status.HTTP_200_OK, response_model=Suggestions)
 async def get_record_suggestions(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     record_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
@@ -155,7 +155,7 @@ async def upsert_suggestion(
     current_user: User = Security(auth.get_current_user),
     response: HTTPResponse,
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
@@ -196,7 +196,7 @@ async def delete_record_suggestions(
     current_user: User = Security(auth.get_current_user),
     ids: str = Query(..., description="A comma separated list with the IDs of the suggestions to be removed"),
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
@@ -227,7 +227,7 @@ async def delete_record(
     record_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
-    record = await Record.get_or_raise(
+    record = await Record.get_not_deleting_or_raise(
         db,
         record_id,
         options=[
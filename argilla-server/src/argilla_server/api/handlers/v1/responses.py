@@ -61,7 +61,7 @@ async def update_response(
     response_update: ResponseUpdate,
     current_user: User = Security(auth.get_current_user),
 ):
-    response = await Response.get_or_raise(
+    response = await Response.get_not_deleting_or_raise(
         db,
         response_id,
         options=[
@@ -82,7 +82,7 @@ async def delete_response(
     response_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
-    response = await Response.get_or_raise(
+    response = await Response.get_not_deleting_or_raise(
         db,
         response_id,
         options=[
@@ -37,7 +37,7 @@ async def delete_suggestion(
     suggestion_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
-    suggestion = await Suggestion.get_or_raise(
+    suggestion = await Suggestion.get_not_deleting_or_raise(
         db,
         suggestion_id,
         options=[
@@ -22,7 +22,7 @@ from argilla_server.api.schemas.v1.users import User as UserSchema
 from argilla_server.api.schemas.v1.users import UserCreate, Users, UserUpdate
 from argilla_server.api.schemas.v1.workspaces import Workspaces
 from argilla_server.contexts import accounts
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.models import User
 from argilla_server.security import auth
 
@@ -39,7 +39,7 @@ async def get_current_user(
 @router.get("/users/{user_id}", response_model=UserSchema)
 async def get_user(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     user_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
@@ -51,7 +51,7 @@ async def get_user(
 @router.get("/users", response_model=Users)
 async def list_users(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     current_user: User = Security(auth.get_current_user),
 ):
     await authorize(current_user, UserPolicy.list)
@@ -107,7 +107,7 @@ async def update_user(
 @router.get("/users/{user_id}/workspaces", response_model=Workspaces)
 async def list_user_workspaces(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     user_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
@@ -16,7 +16,7 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, Depends, Security, status
 
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.api.policies.v1 import WebhookPolicy, authorize
 from argilla_server.webhooks.v1.ping import notify_ping_event
 from argilla_server.security import auth
@@ -36,7 +36,7 @@ router = APIRouter(tags=["webhooks"])
 @router.get("/webhooks", response_model=WebhooksSchema)
 async def list_webhooks(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     current_user: User = Security(auth.get_current_user),
 ):
     await authorize(current_user, WebhookPolicy.list)
@@ -29,7 +29,7 @@ from argilla_server.api.schemas.v1.workspaces import (
     WorkspaceUserCreate,
 )
 from argilla_server.contexts import accounts
-from argilla_server.database import get_async_db
+from argilla_server.database import get_async_db, get_read_async_db
 from argilla_server.errors.future import NotFoundError, UnprocessableEntityError
 from argilla_server.models import User, Workspace, WorkspaceUser
 from argilla_server.security import auth
@@ -40,7 +40,7 @@ router = APIRouter(tags=["workspaces"])
 @router.get("/workspaces/{workspace_id}", response_model=WorkspaceSchema)
 async def get_workspace(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     workspace_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
@@ -78,7 +78,7 @@ async def delete_workspace(
 @router.get("/me/workspaces", response_model=Workspaces)
 async def list_workspaces_me(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     current_user: User = Security(auth.get_current_user),
 ) -> Workspaces:
     await authorize(current_user, WorkspacePolicy.list_workspaces_me)
@@ -94,7 +94,7 @@ async def list_workspaces_me(
 @router.get("/workspaces/{workspace_id}/users", response_model=Users)
 async def list_workspace_users(
     *,
-    db: AsyncSession = Depends(get_async_db),
+    db: AsyncSession = Depends(get_read_async_db),
     workspace_id: UUID,
     current_user: User = Security(auth.get_current_user),
 ):
@@ -14,6 +14,7 @@
 
 from typing import Awaitable, Callable
 
+from argilla_server import metrics
 from argilla_server.errors import ForbiddenOperationError
 from argilla_server.models import User
 
@@ -26,4 +27,5 @@ async def authorize(actor: User, policy_action: PolicyAction) -> None:
 
 
 async def is_authorized(actor: User, policy_action: PolicyAction) -> bool:
-    return await policy_action(actor)
+    with metrics.span(metrics.SPAN_POLICIES):
+        return await policy_action(actor)
@@ -20,6 +20,7 @@ set the required security dependencies if api security is enabled
 
 from fastapi import FastAPI
 
+from argilla_server import metrics
 from argilla_server._version import __version__ as argilla_version
 from argilla_server.api.errors.v1.exception_handlers import add_exception_handlers as add_exception_handlers_v1
 from argilla_server.api.handlers.v1 import authentication as authentication_v1
@@ -64,6 +65,7 @@ from argilla_server.api.handlers.v1 import (
 )
 from argilla_server.api.handlers.v1 import webhooks as webhooks_v1
 from argilla_server.api.handlers.v1 import jobs as jobs_v1
+from argilla_server.api.handlers.v1 import media as media_v1
 from argilla_server.errors.base_errors import __ALL__
 from argilla_server.errors.error_handler import APIErrorHandler
 
@@ -96,11 +98,14 @@ def create_api_v1():
         workspaces_v1.router,
         webhooks_v1.router,
         jobs_v1.router,
+        media_v1.router,
         oauth2_v1.router,
         settings_v1.router,
     ]:
         api_v1.include_router(router)
 
+    metrics.instrument_endpoints(api_v1)
+
     return api_v1
 
 
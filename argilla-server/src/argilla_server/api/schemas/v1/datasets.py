@@ -19,6 +19,7 @@ from uuid import UUID
 from pydantic.v1.utils import GetterDict
 
 from argilla_server.api.schemas.v1.commons import UpdateSchema
+from argilla_server.api.schemas.v1.jobs import Job
 from argilla_server.enums import DatasetDistributionStrategy, DatasetStatus
 from pydantic import BaseModel, Field, constr, ConfigDict, model_validator
 
@@ -135,6 +136,9 @@ class Dataset(BaseModel):
     @model_validator(mode="before")
     @classmethod
     def validate(cls, value) -> dict:
+        if isinstance(value, dict):
+            return value
+
         getter = DatasetGetterDict(value)
 
         data = {}
@@ -148,6 +152,10 @@ class Datasets(BaseModel):
     items: List[Dataset]
 
 
+class DeletedDataset(Dataset):
+    job: Job
+
+
 class DatasetCreate(BaseModel):
     name: DatasetName
     guidelines: Optional[DatasetGuidelines] = None
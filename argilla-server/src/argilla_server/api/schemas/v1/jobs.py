@@ -12,10 +12,18 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
+
 from rq.job import JobStatus
 from pydantic import BaseModel
 
 
+class JobProgress(BaseModel):
+    processed: int
+    total: Optional[int] = None
+
+
 class Job(BaseModel):
     id: str
     status: JobStatus
+    progress: Optional[JobProgress] = None
@@ -29,6 +29,7 @@ from pydantic import (
     ConfigDict,
     model_validator,
     field_validator,
+    field_serializer,
 )
 from pydantic.v1.utils import GetterDict
 from argilla_server.search_engine import TextQuery
@@ -111,6 +112,13 @@ class Record(BaseModel):
 
         return data
 
+    @field_serializer("fields")
+    def serialize_fields(self, fields: Dict[str, Any]) -> Dict[str, Any]:
+        # NOTE: Imported here to avoid a circular import with the security module
+        from argilla_server.contexts import media
+
+        return media.sign_fields_media_references(fields)
+
 
 FieldValueCreate = Union[StrictStr, List[ChatFieldValue], Dict[StrictStr, Any], None]
 
@@ -272,6 +280,24 @@ class Records(BaseModel):
     total: Optional[int] = None
 
 
+class UpdatedRecord(Record):
+    last_activity_at: datetime
+
+
+class UpdatedRecords(BaseModel):
+    items: List[UpdatedRecord]
+
+
+class DeletedRecord(BaseModel):
+    id: UUID
+    external_id: Optional[str] = None
+    deleted_at: datetime
+
+
+class DeletedRecords(BaseModel):
+    items: List[DeletedRecord]
+
+
 class RecordsCreate(BaseModel):
     items: List[RecordCreate] = Field(..., min_length=RECORDS_CREATE_MIN_ITEMS, max_length=RECORDS_CREATE_MAX_ITEMS)
 
@@ -381,6 +407,21 @@ class SearchRecordsQuery(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
 
+class DeleteRecordsQuery(BaseModel):
+    query: Optional[Query] = None
+    filters: Optional[Filters] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @field_validator("query")
+    @classmethod
+    def check_query_has_no_vector(cls, query: Optional[Query]) -> Optional[Query]:
+        if query and query.vector:
+            raise ValueError("Deleting records by vector similarity is not supported")
+
+        return query
+
+
 class SearchRecord(BaseModel):
     record: Record
     query_score: Optional[float] = None
@@ -389,3 +430,12 @@ class SearchRecord(BaseModel):
 class SearchRecordsResult(BaseModel):
     items: List[SearchRecord]
     total: int = 0
+
+
+class LeasedRecord(BaseModel):
+    record: Record
+    lease_expires_at: datetime
+
+
+class LeasedRecords(BaseModel):
+    items: List[LeasedRecord]
@@ -34,10 +34,11 @@ from argilla_server.api.schemas.v1.suggestions import SuggestionCreate
 from argilla_server.models.database import DatasetUser
 from argilla_server.webhooks.v1.enums import RecordEvent
 from argilla_server.webhooks.v1.records import notify_record_event as notify_record_event_v1
-from argilla_server.contexts import distribution
+from argilla_server.contexts import distribution, media
 from argilla_server.contexts.records import (
     fetch_records_by_external_ids_as_dict,
     fetch_records_by_ids_as_dict,
+    touch_records_last_activity_at,
 )
 from argilla_server.errors.future import UnprocessableEntityError
 from argilla_server.models import Dataset, Record, Response, Suggestion, Vector
@@ -53,14 +54,18 @@ class CreateRecordsBulk:
     async def create_records_bulk(self, dataset: Dataset, bulk_create: RecordsBulkCreate) -> RecordsBulk:
         await RecordsBulkCreateValidator.validate(self._db, bulk_create, dataset)
 
+        records_fields = await media.store_records_fields_media(
+            self._db, dataset, [jsonable_encoder(record_create.fields) for record_create in bulk_create.items]
+        )
+
         records = [
             Record(
-                fields=jsonable_encoder(record_create.fields),
+                fields=record_fields,
                 metadata_=record_create.metadata,
                 external_id=record_create.external_id,
                 dataset_id=dataset.id,
             )
-            for record_create in bulk_create.items
+            for record_create, record_fields in zip(bulk_create.items, records_fields)
         ]
 
         self._db.add_all(records)
@@ -88,6 +93,14 @@ class CreateRecordsBulk:
         await self._upsert_records_suggestions(records_and_suggestions)
         await self._upsert_records_vectors(records_and_vectors)
         await self._upsert_records_responses(records_and_responses)
+        await touch_records_last_activity_at(
+            self._db,
+            [
+                record.id
+                for record, record_create in zip(records, records_create)
+                if record_create.responses or record_create.suggestions
+            ],
+        )
 
     async def _upsert_records_suggestions(
         self, records_and_suggestions: List[Tuple[Record, List[SuggestionCreate]]]
@@ -168,6 +181,9 @@ class UpsertRecordsBulk(CreateRecordsBulk):
 
             try:
                 await RecordUpsertValidator.validate(record_upsert, dataset, record)
+                (record_fields,) = await media.store_records_fields_media(
+                    self._db, dataset, [jsonable_encoder(record_upsert.fields)]
+                )
             except Exception as ex:
                 if raise_on_error:
                     raise UnprocessableEntityError(f"Record at position {idx} is not valid because {ex}") from ex
@@ -177,7 +193,7 @@ class UpsertRecordsBulk(CreateRecordsBulk):
 
             if not record:
                 record = Record(
-                    fields=jsonable_encoder(record_upsert.fields),
+                    fields=record_fields,
                     metadata_=record_upsert.metadata,
                     external_id=record_upsert.external_id,
                     dataset_id=dataset.id,
@@ -186,7 +202,7 @@ class UpsertRecordsBulk(CreateRecordsBulk):
                 if record_upsert.is_set("metadata"):
                     record.metadata_ = record_upsert.metadata
                 if record_upsert.is_set("fields"):
-                    record.fields = jsonable_encoder(record_upsert.fields)
+                    record.fields = record_fields
 
                 if self._db.is_modified(record):
                     record.updated_at = datetime.now(UTC)
@@ -18,7 +18,6 @@ import typer
 
 from argilla_server.api.schemas.v1.users import USER_PASSWORD_MIN_LENGTH, UserCreate
 from argilla_server.api.schemas.v1.workspaces import WorkspaceCreate
-from argilla_server.contexts import accounts
 from argilla_server.database import AsyncSessionLocal
 from argilla_server.models import User, UserRole
 from pydantic import constr
@@ -64,6 +63,8 @@ async def _create(
     workspace: List[str] = None,
 ):
     """Creates a new user in the Argilla database with provided parameters"""
+    from argilla_server.contexts import accounts
+
     if workspace is None:
         workspace = []
 
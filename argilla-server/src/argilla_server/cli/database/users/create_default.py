@@ -16,7 +16,6 @@ import asyncio
 import typer
 
 from argilla_server.constants import DEFAULT_API_KEY, DEFAULT_PASSWORD, DEFAULT_USERNAME
-from argilla_server.contexts import accounts
 from argilla_server.database import AsyncSessionLocal
 from argilla_server.models import User, UserRole
 
@@ -25,6 +24,8 @@ from .utils import get_or_new_workspace
 
 async def _create_default(api_key: str, password: str, quiet: bool):
     """Creates a user with default credentials on database suitable to start experimenting with argilla."""
+    from argilla_server.contexts import accounts
+
     async with AsyncSessionLocal() as session:
         if await accounts.get_user_by_username(session, DEFAULT_USERNAME):
             if not quiet:
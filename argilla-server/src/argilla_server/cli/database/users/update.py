@@ -15,12 +15,13 @@ import asyncio
 
 import typer
 
-from argilla_server.contexts import accounts
 from argilla_server.database import AsyncSessionLocal
 from argilla_server.models import UserRole
 
 
 async def _update(username: str, role: UserRole):
+    from argilla_server.contexts import accounts
+
     async with AsyncSessionLocal() as session:
         user = await accounts.get_user_by_username(session, username)
 
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import asyncio
-from typing import AsyncGenerator, Optional
+from typing import TYPE_CHECKING, AsyncGenerator, Optional
 from uuid import UUID
 
 import typer
@@ -25,14 +25,16 @@ from sqlalchemy.orm import selectinload
 from argilla_server.cli.rich import echo_in_panel
 from argilla_server.database import AsyncSessionLocal
 from argilla_server.models import Dataset, Record, Response, Suggestion
-from argilla_server.search_engine import SearchEngine, get_search_engine
+
+if TYPE_CHECKING:
+    from argilla_server.search_engine import SearchEngine
 
 
 class Reindexer:
     YIELD_PER = 100
 
     @classmethod
-    async def reindex_dataset(cls, db: AsyncSession, search_engine: SearchEngine, dataset_id: UUID) -> Dataset:
+    async def reindex_dataset(cls, db: AsyncSession, search_engine: "SearchEngine", dataset_id: UUID) -> Dataset:
         dataset = (
             await db.execute(
                 select(Dataset)
@@ -52,7 +54,7 @@ class Reindexer:
         return dataset
 
     @classmethod
-    async def reindex_datasets(cls, db: AsyncSession, search_engine: SearchEngine) -> AsyncGenerator[Dataset, None]:
+    async def reindex_datasets(cls, db: AsyncSession, search_engine: "SearchEngine") -> AsyncGenerator[Dataset, None]:
         stream = await db.stream(
             select(Dataset)
             .order_by(Dataset.inserted_at.asc())
@@ -73,7 +75,7 @@ class Reindexer:
 
     @classmethod
     async def reindex_dataset_records(
-        cls, db: AsyncSession, search_engine: SearchEngine, dataset: Dataset
+        cls, db: AsyncSession, search_engine: "SearchEngine", dataset: Dataset
     ) -> AsyncGenerator[list[Record], None]:
         stream = await db.stream(
             select(Record)
@@ -103,7 +105,9 @@ class Reindexer:
         return (await db.execute(select(func.count(Record.id)).filter_by(dataset_id=dataset.id))).scalar_one()
 
 
-async def _reindex_dataset(db: AsyncSession, search_engine: SearchEngine, progress: Progress, dataset_id: UUID) -> None:
+async def _reindex_dataset(
+    db: AsyncSession, search_engine: "SearchEngine", progress: Progress, dataset_id: UUID
+) -> None:
     try:
         dataset = await Reindexer.reindex_dataset(db, search_engine, dataset_id)
     except NoResultFound as e:
@@ -123,7 +127,7 @@ async def _reindex_dataset(db: AsyncSession, search_engine: SearchEngine, progre
     progress.advance(task)
 
 
-async def _reindex_datasets(db: AsyncSession, search_engine: SearchEngine, progress: Progress) -> None:
+async def _reindex_datasets(db: AsyncSession, search_engine: "SearchEngine", progress: Progress) -> None:
     task = progress.add_task("reindexing datasets...", total=await Reindexer.count_datasets(db))
 
     async for dataset in Reindexer.reindex_datasets(db, search_engine):
@@ -133,7 +137,7 @@ async def _reindex_datasets(db: AsyncSession, search_engine: SearchEngine, progr
 
 
 async def _reindex_dataset_records(
-    db: AsyncSession, search_engine: SearchEngine, progress: Progress, dataset: Dataset
+    db: AsyncSession, search_engine: "SearchEngine", progress: Progress, dataset: Dataset
 ) -> None:
     task = progress.add_task(
         f"reindexing dataset `{dataset.name}` records...",
@@ -145,6 +149,8 @@ async def _reindex_dataset_records(
 
 
 async def _reindex(dataset_id: Optional[UUID] = None) -> None:
+    from argilla_server.search_engine import get_search_engine
+
     async with AsyncSessionLocal() as db:
         async for search_engine in get_search_engine():
             with Progress() as progress:
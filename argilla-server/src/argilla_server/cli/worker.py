@@ -13,6 +13,7 @@
 #  limitations under the License.
 
 import typer
+import importlib
 
 from typing import List
 
@@ -20,14 +21,28 @@ from argilla_server.jobs.queues import DEFAULT_QUEUE, HIGH_QUEUE
 
 DEFAULT_NUM_WORKERS = 2
 
+# NOTE: Modules imported by jobs. Importing them before starting the workers means every forked process shares
+# them instead of importing them again (and heavy dependencies like datasets or pyarrow) for every job.
+WORKER_PRELOAD_MODULES = [
+    "argilla_server.jobs.dataset_jobs",
+    "argilla_server.jobs.hub_jobs",
+    "argilla_server.jobs.webhook_jobs",
+    "argilla_server.contexts.hub",
+    "argilla_server.webhooks.v1.commons",
+]
+
 
 def worker(
     queues: List[str] = typer.Option([DEFAULT_QUEUE.name, HIGH_QUEUE.name], help="Name of queues to listen"),
     num_workers: int = typer.Option(DEFAULT_NUM_WORKERS, help="Number of workers to start"),
+    preload: bool = typer.Option(True, help="Import jobs modules before starting the workers"),
 ) -> None:
     from rq.worker_pool import WorkerPool
     from argilla_server.jobs.queues import REDIS_CONNECTION
 
+    if preload:
+        preload_modules()
+
     worker_pool = WorkerPool(
         connection=REDIS_CONNECTION,
         queues=queues,
@@ -35,3 +50,8 @@ def worker(
     )
 
     worker_pool.start()
+
+
+def preload_modules() -> None:
+    for module in WORKER_PRELOAD_MODULES:
+        importlib.import_module(module)
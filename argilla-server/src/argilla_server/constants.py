@@ -20,18 +20,39 @@ DATABASE_POSTGRESQL = "postgresql"
 
 SEARCH_ENGINE_ELASTICSEARCH = "elasticsearch"
 SEARCH_ENGINE_OPENSEARCH = "opensearch"
+SEARCH_ENGINE_EMBEDDED = "embedded"
 
 DEFAULT_USERNAME = "argilla"
 DEFAULT_PASSWORD = "1234"
 DEFAULT_API_KEY = "argilla.apikey"
 
 DEFAULT_DATABASE_SQLITE_TIMEOUT = 5
+DEFAULT_DATABASE_SQLITE_JOURNAL_MODE = "WAL"
+DEFAULT_DATABASE_SQLITE_SYNCHRONOUS = "NORMAL"
+# NOTE: Negative values are the cache size in KiB (64MiB), positive ones a number of pages.
+DEFAULT_DATABASE_SQLITE_CACHE_SIZE = -64_000
+DEFAULT_DATABASE_SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+
+DEFAULT_DATABASE_READ_PRIMARY_PIN_SECONDS = 5
 
 DEFAULT_DATABASE_POSTGRESQL_POOL_SIZE = 15
 DEFAULT_DATABASE_POSTGRESQL_MAX_OVERFLOW = 10
 
 DEFAULT_MAX_KEYWORD_LENGTH = 128
 
+# Annotation queue defaults
+DEFAULT_RECORDS_QUEUE_LEASE_TTL = 300
+
+# Records sync defaults
+DEFAULT_DELETED_RECORDS_RETENTION_DAYS = 30
+
+# Hugging Face Hub import defaults
+DEFAULT_HUB_IMPORT_BATCH_SIZE = 100
+DEFAULT_HUB_IMPORT_QUEUE_SIZE = 4
+DEFAULT_HUB_IMPORT_IMAGE_WORKERS = 2
+DEFAULT_HUB_EXPORT_SHARD_SIZE = 10_000
+DEFAULT_HUB_EXPORT_WORKERS = 4
+
 # Questions settings defaults
 DEFAULT_LABEL_SELECTION_OPTIONS_MAX_ITEMS = 500
 DEFAULT_SPAN_OPTIONS_MAX_ITEMS = 500
@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 import secrets
+import functools
 from typing import Iterable, List, Sequence, Union
 from uuid import UUID
 
@@ -207,11 +208,16 @@ def generate_user_token(user: User) -> str:
 
 
 _DUMMY_SECRET = "dummy_secret"
-_DUMMY_HASH = hash_password(_DUMMY_SECRET)
+
+
+# NOTE: Hashing is slow on purpose, so the dummy hash is computed on first use instead of at import time.
+@functools.lru_cache(maxsize=None)
+def _dummy_hash() -> str:
+    return hash_password(_DUMMY_SECRET)
 
 
 def _dummy_verify():
-    verify_password(_DUMMY_SECRET, _DUMMY_HASH)
+    verify_password(_DUMMY_SECRET, _dummy_hash())
 
 
 def _generate_random_password() -> str:
@@ -16,6 +16,7 @@ from collections import defaultdict
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
+    Callable,
     Iterable,
     List,
     Optional,
@@ -26,6 +27,7 @@ from uuid import UUID
 
 import sqlalchemy
 from fastapi.encoders import jsonable_encoder
+from rq.job import Job
 from sqlalchemy import Select, and_, func, select, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import contains_eager, joinedload, selectinload
@@ -61,7 +63,7 @@ from argilla_server.webhooks.v1.datasets import (
     build_dataset_event as build_dataset_event_v1,
     notify_dataset_event as notify_dataset_event_v1,
 )
-from argilla_server.contexts import accounts, distribution
+from argilla_server.contexts import accounts, distribution, records
 from argilla_server.database import get_async_db
 from argilla_server.enums import DatasetStatus, UserRole
 from argilla_server.errors.future import NotUniqueError, UnprocessableEntityError
@@ -117,7 +119,12 @@ async def list_datasets(db: AsyncSession, user: Optional[User] = None, **filters
     Additionally, filters based on `Dataset` class attributes can be applied
 
     """
-    query = select(Dataset).filter_by(**filters).order_by(Dataset.inserted_at.asc())
+    query = (
+        select(Dataset)
+        .filter_by(**filters)
+        .where(Dataset.status != DatasetStatus.deleting)
+        .order_by(Dataset.inserted_at.asc())
+    )
 
     if user and not user.is_owner:
         query = query.join(
@@ -135,7 +142,9 @@ async def list_datasets(db: AsyncSession, user: Optional[User] = None, **filters
 
 async def list_datasets_by_workspace_id(db: AsyncSession, workspace_id: UUID) -> Sequence[Dataset]:
     result = await db.execute(
-        select(Dataset).where(Dataset.workspace_id == workspace_id).order_by(Dataset.inserted_at.asc())
+        select(Dataset)
+        .where(Dataset.workspace_id == workspace_id, Dataset.status != DatasetStatus.deleting)
+        .order_by(Dataset.inserted_at.asc())
     )
     return result.scalars().all()
 
@@ -190,9 +199,28 @@ async def update_dataset(db: AsyncSession, dataset: Dataset, dataset_attrs: dict
     return dataset
 
 
-async def delete_dataset(db: AsyncSession, search_engine: SearchEngine, dataset: Dataset) -> Dataset:
+async def delete_dataset(db: AsyncSession, dataset: Dataset) -> Job:
+    """
+    Marks the dataset as `deleting` (hiding it from listings) and enqueues a job removing its content in chunks.
+    """
+    dataset = await dataset.update(db, status=DatasetStatus.deleting)
+
+    return dataset_jobs.delete_dataset_job.delay(dataset.id)
+
+
+async def delete_dataset_in_chunks(
+    db: AsyncSession,
+    search_engine: SearchEngine,
+    dataset: Dataset,
+    chunk_size: int = records.DELETE_RECORDS_BY_QUERY_CHUNK_SIZE,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> Dataset:
     deleted_dataset_event_v1 = await build_dataset_event_v1(db, DatasetEvent.deleted, dataset)
 
+    # NOTE: Records are deleted in chunks first so the dataset deletion below does not cascade over all of them
+    # inside a single long transaction.
+    await records.delete_dataset_records_in_chunks(db, dataset, chunk_size, on_progress, track_deleted=False)
+
     dataset = await dataset.delete(db)
 
     await search_engine.delete_index(dataset)
@@ -496,6 +524,7 @@ async def create_response(
         autocommit=False,
     )
     await _touch_dataset_last_activity_at(db, record.dataset)
+    await records.touch_records_last_activity_at(db, [record.id])
     await DatasetUser.upsert(
         db,
         schema={"dataset_id": record.dataset_id, "user_id": user.id},
@@ -528,6 +557,7 @@ async def update_response(
         autocommit=False,
     )
     await _touch_dataset_last_activity_at(db, response.record.dataset)
+    await records.touch_records_last_activity_at(db, [response.record_id])
 
     await db.commit()
 
@@ -558,6 +588,7 @@ async def upsert_response(
         autocommit=False,
     )
     await _touch_dataset_last_activity_at(db, response.record.dataset)
+    await records.touch_records_last_activity_at(db, [record.id])
     await DatasetUser.upsert(
         db,
         schema={"dataset_id": record.dataset_id, "user_id": user.id},
@@ -584,6 +615,7 @@ async def delete_response(db: AsyncSession, search_engine: SearchEngine, respons
 
     response = await response.delete(db, autocommit=False)
     await _touch_dataset_last_activity_at(db, response.record.dataset)
+    await records.touch_records_last_activity_at(db, [response.record_id])
 
     await db.commit()
 
@@ -621,7 +653,11 @@ async def upsert_suggestion(
         db,
         schema=SuggestionCreateWithRecordId(record_id=record.id, **suggestion_create.model_dump()),
         constraints=[Suggestion.record_id, Suggestion.question_id],
+        autocommit=False,
     )
+    await records.touch_records_last_activity_at(db, [record.id])
+
+    await db.commit()
 
     await _preload_suggestion_relationships_before_index(db, suggestion)
     await search_engine.update_record_suggestion(suggestion)
@@ -637,7 +673,11 @@ async def delete_suggestions(
     await Suggestion.delete_many(
         db=db,
         conditions=[Suggestion.id.in_(suggestions_ids), Suggestion.record_id == record.id],
+        autocommit=False,
     )
+    await records.touch_records_last_activity_at(db, [record.id])
+
+    await db.commit()
 
     for suggestion in suggestions:
         await search_engine.delete_record_suggestion(suggestion)
@@ -659,7 +699,10 @@ async def list_suggestions_by_id_and_record_id(
 
 
 async def delete_suggestion(db: AsyncSession, search_engine: SearchEngine, suggestion: Suggestion) -> Suggestion:
-    suggestion = await suggestion.delete(db)
+    suggestion = await suggestion.delete(db, autocommit=False)
+    await records.touch_records_last_activity_at(db, [suggestion.record_id])
+
+    await db.commit()
 
     await search_engine.delete_record_suggestion(suggestion)
 
@@ -15,19 +15,21 @@
 import backoff
 import sqlalchemy
 
+from datetime import datetime, timedelta
 from typing import List
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import and_, exists, func, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.webhooks.v1.enums import RecordEvent
 from argilla_server.webhooks.v1.records import notify_record_event as notify_record_event_v1
-from argilla_server.enums import DatasetDistributionStrategy, RecordStatus
-from argilla_server.models import Record
+from argilla_server.enums import DatasetDistributionStrategy, RecordStatus, ResponseStatus
+from argilla_server.models import Dataset, Record, RecordLease, Response, User
 from argilla_server.search_engine.base import SearchEngine
 from argilla_server.database import _get_async_db
+from argilla_server.settings import settings
 
 MAX_TIME_RETRY_SQLALCHEMY_ERROR = 15
 
@@ -82,3 +84,121 @@ async def _update_record_status_with_overlap_strategy(db: AsyncSession, record:
         record.status = RecordStatus.pending
 
     return await record.save(db, autocommit=False)
+
+
+async def lease_next_records(db: AsyncSession, dataset: Dataset, user: User, count: int) -> List[RecordLease]:
+    """
+    Returns the leases for the next `count` pending records that `user` should annotate.
+
+    Records already leased by the user are handed out first and their leases renewed. The remaining slots are filled
+    scanning the dataset pending records by insertion order, skipping records the user already responded and records
+    that have enough submitted responses plus active leases from other users to reach the `min_submitted` value
+    of the dataset distribution.
+    """
+    now = datetime.utcnow()
+    expires_at = now + timedelta(seconds=settings.records_queue_lease_ttl)
+
+    if dataset.distribution_strategy != DatasetDistributionStrategy.overlap:
+        raise NotImplementedError(f"unsupported distribution strategy `{dataset.distribution_strategy}`")
+
+    await RecordLease.delete_many(
+        db,
+        conditions=[
+            RecordLease.dataset_id == dataset.id,
+            RecordLease.user_id == user.id,
+            RecordLease.expires_at <= now,
+        ],
+        autocommit=False,
+    )
+
+    leased_record_ids = (
+        await db.scalars(
+            select(RecordLease.record_id)
+            .join(Record, Record.id == RecordLease.record_id)
+            .where(
+                RecordLease.dataset_id == dataset.id,
+                RecordLease.user_id == user.id,
+                Record.status == RecordStatus.pending,
+                ~_record_has_response_from(RecordLease.user_id),
+            )
+            .order_by(RecordLease.inserted_at.asc(), RecordLease.record_id.asc())
+            .limit(count)
+        )
+    ).all()
+
+    new_record_ids = []
+    if len(leased_record_ids) < count:
+        new_record_ids = (
+            await db.scalars(
+                _build_next_records_query(dataset, user, now)
+                .where(Record.id.not_in(leased_record_ids))
+                .limit(count - len(leased_record_ids))
+            )
+        ).all()
+
+    record_ids = [*leased_record_ids, *new_record_ids]
+    if not record_ids:
+        await db.commit()
+        return []
+
+    leases = await RecordLease.upsert_many(
+        db,
+        objects=[
+            {"record_id": record_id, "user_id": user.id, "dataset_id": dataset.id, "expires_at": expires_at}
+            for record_id in record_ids
+        ],
+        constraints=[RecordLease.record_id, RecordLease.user_id],
+        autocommit=False,
+    )
+
+    await db.commit()
+
+    # Preserve the order of the `record_ids` list
+    leases_by_record_id = {lease.record_id: lease for lease in leases}
+
+    return [leases_by_record_id[record_id] for record_id in record_ids]
+
+
+async def release_records_leases(db: AsyncSession, dataset: Dataset, user: User) -> None:
+    await RecordLease.delete_many(
+        db,
+        conditions=[RecordLease.dataset_id == dataset.id, RecordLease.user_id == user.id],
+        autocommit=True,
+    )
+
+
+def _record_has_response_from(user_id) -> sqlalchemy.Exists:
+    return exists().where(Response.record_id == Record.id, Response.user_id == user_id)
+
+
+def _build_next_records_query(dataset: Dataset, user: User, now: datetime) -> sqlalchemy.Select:
+    submitted_responses_count = (
+        select(func.count(Response.id))
+        .where(Response.record_id == Record.id, Response.status == ResponseStatus.submitted)
+        .scalar_subquery()
+    )
+
+    other_users_leases_count = (
+        select(func.count(RecordLease.id))
+        .where(
+            RecordLease.record_id == Record.id,
+            RecordLease.user_id != user.id,
+            RecordLease.expires_at > now,
+            ~exists().where(and_(Response.record_id == RecordLease.record_id, Response.user_id == RecordLease.user_id)),
+        )
+        .scalar_subquery()
+    )
+
+    # NOTE: `FOR UPDATE SKIP LOCKED` avoids handing out the same records to concurrent annotators with PostgreSQL.
+    # It is ignored with SQLite where writes are already serialized.
+    return (
+        select(Record.id)
+        .where(
+            Record.dataset_id == dataset.id,
+            Record.status == RecordStatus.pending,
+            ~_record_has_response_from(user.id),
+            submitted_responses_count + other_users_leases_count < dataset.distribution["min_submitted"],
+        )
+        .order_by(Record.inserted_at.asc(), Record.id.asc())
+        .with_for_update(of=Record, skip_locked=True)
+    )
@@ -16,23 +16,41 @@ import io
 import os
 import base64
 import json
+import asyncio
+import multiprocessing
 
-from uuid import uuid4
+from collections import deque
 from pathlib import Path
-from typing import Any, Optional, List
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional, List, Set, Tuple
 from typing_extensions import Self
 from tempfile import TemporaryDirectory
 
+import pyarrow as pa
+import pyarrow.parquet as pq
 from PIL import Image
-from sqlalchemy.orm import selectinload
+from sqlalchemy import exists, or_, select
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 from huggingface_hub import HfApi, DatasetCard, DatasetCardData
-from datasets import Dataset as HFDataset, NamedSplit, load_dataset, features
-
-from argilla_server.contexts import info
-from argilla_server.database import get_sync_db
-from argilla_server.models.database import Dataset, Record, Field, Question, MetadataProperty, VectorSettings
+from datasets import load_dataset, features
+from datasets.arrow_writer import TypedSequence
+from datasets.data_files import sanitize_patterns
+
+from argilla_server.contexts import info, media
+from argilla_server.database import get_sync_read_db
+from argilla_server.settings import settings
+from argilla_server.models.database import (
+    Dataset,
+    Record,
+    Field,
+    Question,
+    Suggestion,
+    MetadataProperty,
+    VectorSettings,
+)
 from argilla_server.search_engine import SearchEngine
 from argilla_server.bulk.records_bulk import UpsertRecordsBulk
 from argilla_server.api.schemas.v1.datasets import (
@@ -43,12 +61,14 @@ from argilla_server.api.schemas.v1.datasets import (
 from argilla_server.api.schemas.v1.fields import Field as FieldSchema
 from argilla_server.api.schemas.v1.questions import Question as QuestionSchema
 from argilla_server.api.schemas.v1.records import RecordUpsert as RecordUpsertSchema
-from argilla_server.api.schemas.v1.records_bulk import RecordsBulkUpsert as RecordsBulkUpsertSchema
+from argilla_server.api.schemas.v1.records_bulk import (
+    RecordsBulkUpsert as RecordsBulkUpsertSchema,
+    RECORDS_BULK_UPSERT_MAX_ITEMS,
+)
 from argilla_server.api.schemas.v1.metadata_properties import MetadataProperty as MetadataPropertySchema
 from argilla_server.api.schemas.v1.vector_settings import VectorSettings as VectorSettingsSchema
 from argilla_server.api.schemas.v1.suggestions import SuggestionCreate
 
-BATCH_SIZE = 100
 RESET_ROW_IDX = -1
 
 FEATURE_CLASS_LABEL_NO_LABEL = -1
@@ -57,6 +77,8 @@ DATA_URL_DEFAULT_IMAGE_FORMAT = "png"
 DATA_URL_DEFAULT_IMAGE_MIMETYPE = "image/png"
 
 HUB_RECORDS_YIELD_PER = 100
+HUB_DEFAULT_SUBSET = "default"
+HUB_DATASET_CARD_FILENAME = "README.md"
 HUB_DATASET_CARD_TEMPLATE_PATH = os.path.join(Path(__file__).parent, "hub_templates", "README.md.jinja2")
 
 
@@ -67,25 +89,159 @@ class HubDataset:
         self.mapping = mapping
         self.mapping_feature_names = mapping.sources
         self.row_idx = RESET_ROW_IDX
+        self.limit = None
+        self.batch_size = min(settings.hub_import_batch_size, RECORDS_BULK_UPSERT_MAX_ITEMS)
+
+        self._skip_image_features_decoding()
 
     @property
     def features(self) -> dict:
         return self.dataset.features
 
+    @property
+    def image_feature_names(self) -> List[str]:
+        return [
+            feature_name
+            for feature_name, feature in (self.features or {}).items()
+            if feature_name in self.mapping_feature_names and isinstance(feature, features.Image)
+        ]
+
+    @property
+    def num_rows(self) -> Optional[int]:
+        split_info = (self.dataset.info.splits or {}).get(self.split)
+        if split_info is None or not split_info.num_examples:
+            return self.limit
+
+        if self.limit is None:
+            return split_info.num_examples
+
+        return min(split_info.num_examples, self.limit)
+
     def take(self, n: int) -> Self:
         self.dataset = self.dataset.take(n)
+        self.limit = n
 
         return self
 
-    async def import_to(self, db: AsyncSession, search_engine: SearchEngine, dataset: Dataset) -> None:
+    async def import_to(
+        self,
+        db: AsyncSession,
+        search_engine: SearchEngine,
+        dataset: Dataset,
+        on_progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    ) -> None:
+        """
+        Imports the Hub dataset rows as dataset records using three overlapping stages connected by bounded queues:
+        fetching (and decoding) batches of rows, mapping them to records (encoding images in a process pool), and
+        writing the records to the database and search engine.
+        """
         if not dataset.is_ready:
             raise Exception("it's not possible to import records to a non published dataset")
 
         self._reset_row_idx()
 
-        batched_dataset = self.dataset.batch(batch_size=BATCH_SIZE)
-        for batch in batched_dataset:
-            await self._import_batch_to(db, search_engine, batch, dataset)
+        batches = asyncio.Queue(maxsize=settings.hub_import_queue_size)
+        records_batches = asyncio.Queue(maxsize=settings.hub_import_queue_size)
+
+        with self._images_executor() as images_executor:
+            tasks = [
+                asyncio.create_task(self._fetch_batches(batches)),
+                asyncio.create_task(self._map_batches(batches, records_batches, dataset, images_executor)),
+                asyncio.create_task(self._write_batches(records_batches, db, search_engine, dataset, on_progress)),
+            ]
+
+            try:
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+    def _skip_image_features_decoding(self) -> None:
+        # NOTE: Images are decoded and encoded as data URLs by the process pool so we keep the raw image bytes here.
+        for feature_name in self.image_feature_names:
+            self.dataset = self.dataset.cast_column(feature_name, features.Image(decode=False))
+
+    @contextmanager
+    def _images_executor(self) -> Iterator[Optional[Executor]]:
+        if not self.image_feature_names:
+            yield None
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=settings.hub_import_image_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        try:
+            yield executor
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _fetch_batches(self, batches: asyncio.Queue) -> None:
+        iterator = iter(self.dataset.batch(batch_size=self.batch_size))
+
+        while True:
+            # NOTE: Iterating a streaming dataset is blocking (downloading and decoding rows) so it's done in a thread.
+            batch = await asyncio.to_thread(next, iterator, None)
+            await batches.put(batch)
+
+            if batch is None:
+                return
+
+    async def _map_batches(
+        self,
+        batches: asyncio.Queue,
+        records_batches: asyncio.Queue,
+        dataset: Dataset,
+        images_executor: Optional[Executor],
+    ) -> None:
+        while (batch := await batches.get()) is not None:
+            if images_executor is not None:
+                await self._encode_batch_images(batch, images_executor)
+
+            batch_size = len(next(iter(batch.values())))
+
+            items = []
+            for i in range(batch_size):
+                items.append(self._row_to_record_schema(self._batch_index_to_row(batch, i), dataset))
+
+            await records_batches.put(items)
+
+        await records_batches.put(None)
+
+    async def _encode_batch_images(self, batch: dict, images_executor: Executor) -> None:
+        loop = asyncio.get_running_loop()
+        chunk_size = max(1, len(next(iter(batch.values()))) // settings.hub_import_image_workers)
+
+        for feature_name in self.image_feature_names:
+            values = batch[feature_name]
+            chunks = [values[i : i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+            encoded_chunks = await asyncio.gather(
+                *[loop.run_in_executor(images_executor, images_to_data_urls, chunk) for chunk in chunks]
+            )
+
+            batch[feature_name] = [data_url for encoded_chunk in encoded_chunks for data_url in encoded_chunk]
+
+    async def _write_batches(
+        self,
+        records_batches: asyncio.Queue,
+        db: AsyncSession,
+        search_engine: SearchEngine,
+        dataset: Dataset,
+        on_progress: Optional[Callable[[int, Optional[int]], None]],
+    ) -> None:
+        processed = 0
+
+        while (items := await records_batches.get()) is not None:
+            await UpsertRecordsBulk(db, search_engine).upsert_records_bulk(
+                dataset,
+                RecordsBulkUpsertSchema(items=items),
+                raise_on_error=False,
+            )
+
+            processed += len(items)
+            if on_progress:
+                on_progress(processed, self.num_rows)
 
     def _reset_row_idx(self) -> None:
         self.row_idx = RESET_ROW_IDX
@@ -95,21 +251,6 @@ class HubDataset:
 
         return self.row_idx
 
-    async def _import_batch_to(
-        self, db: AsyncSession, search_engine: SearchEngine, batch: dict, dataset: Dataset
-    ) -> None:
-        batch_size = len(next(iter(batch.values())))
-
-        items = []
-        for i in range(batch_size):
-            items.append(self._row_to_record_schema(self._batch_index_to_row(batch, i), dataset))
-
-        await UpsertRecordsBulk(db, search_engine).upsert_records_bulk(
-            dataset,
-            RecordsBulkUpsertSchema(items=items),
-            raise_on_error=False,
-        )
-
     def _batch_index_to_row(self, batch: dict, index: int) -> dict:
         row = {}
         for feature_name, values in batch.items():
@@ -224,27 +365,76 @@ class HubDatasetSettingsSchema(BaseModel):
 class HubDatasetExporter:
     def __init__(self, dataset: Dataset):
         self.dataset = dataset
-
-        # NOTE: Using this to bypass datasets generator cache.
-        # self is the only parameter received by _rows_generator function. Setting a different value to
-        # self.cache_version is bypassing the datasets generator cache.
-        self.cache_version = uuid4()
+        self.shard_size = settings.hub_export_shard_size
+        self.workers = settings.hub_export_workers
 
     def export_to(self, name: str, subset: str, split: str, private: bool, token: str) -> None:
-        hf_dataset = HFDataset.from_generator(self._rows_generator, split=NamedSplit(split))
-        hf_dataset.push_to_hub(
-            repo_id=name,
-            config_name=subset,
-            private=private,
-            token=token,
-        )
+        hf_api = HfApi(token=token)
+        data_directory = self._data_directory_for_subset(subset)
+
+        with TemporaryDirectory() as temporary_directory:
+            self.write_parquet_shards(os.path.join(temporary_directory, data_directory), split)
+
+            hf_api.create_repo(repo_id=name, repo_type="dataset", private=private, exist_ok=True)
+            configs = self._dataset_card_configs(hf_api, repo_id=name, subset=subset, split=split)
+            self._create_extra_files(temporary_directory, repo_id=name, configs=configs)
+
+            hf_api.upload_folder(
+                repo_id=name,
+                repo_type="dataset",
+                folder_path=temporary_directory,
+                delete_patterns=f"{data_directory}/{split}-*",
+            )
+
+    def write_parquet_shards(self, directory: str, split: str) -> List[str]:
+        """Writes every dataset record as Parquet shards named like `{split}-00000-of-00003.parquet`.
+
+        Records are read from the database in chunks and converted column-wise into Arrow record batches. Every shard
+        is written to disk by a pool of threads as soon as it is ready, so at most a few shards are kept in memory.
+        Shards whose inferred schema differs from the final one (e.g. a column with only nulls) are rewritten at the end.
+        """
+        os.makedirs(directory, exist_ok=True)
+
+        shards = []
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            for shard_idx, (columns, columns_features) in enumerate(self._columns_generator()):
+                if len(pending) >= self.workers:
+                    shards.append(pending.popleft().result())
+
+                shard_path = os.path.join(directory, f"{split}-{shard_idx:05d}.parquet")
+                pending.append(executor.submit(self._write_shard, shard_path, columns, columns_features))
+
+            shards.extend(future.result() for future in pending)
 
-        self._push_extra_files_to_hub(repo_id=name, token=token)
+        if not shards:
+            return []
 
-    def _rows_generator(self):
-        for session in get_sync_db():
-            query = (
-                session.query(Record)
+        features = self._unify_shards_features([shard_features for _, shard_features in shards])
+
+        shard_paths = []
+        for shard_idx, (shard_path, shard_features) in enumerate(shards):
+            if shard_features != features:
+                self._rewrite_shard(shard_path, features)
+
+            final_shard_path = os.path.join(directory, f"{split}-{shard_idx:05d}-of-{len(shards):05d}.parquet")
+            os.replace(shard_path, final_shard_path)
+            shard_paths.append(final_shard_path)
+
+        return shard_paths
+
+    def _columns_generator(self) -> Iterator[Tuple[Dict[str, list], Dict[str, features.Image]]]:
+        for session in get_sync_read_db():
+            image_fields_with_embedded_images = self._image_fields_with_embedded_images(session)
+            questions_with_suggestions = self._questions_with_suggestions(session)
+            columns_features = {
+                self._feature_name_for_field(field): features.Image()
+                for field in self.dataset.fields
+                if field.name in image_fields_with_embedded_images
+            }
+
+            result = session.execute(
+                select(Record)
                 .filter_by(dataset_id=self.dataset.id)
                 .order_by(Record.inserted_at.asc())
                 .options(
@@ -252,131 +442,234 @@ class HubDatasetExporter:
                     selectinload(Record.suggestions),
                     selectinload(Record.vectors),
                 )
+                .execution_options(yield_per=HUB_RECORDS_YIELD_PER)
             )
 
-            for record in query.yield_per(HUB_RECORDS_YIELD_PER):
-                yield self._record_to_row(record)
+            shard_records = []
+            for records in result.scalars().partitions():
+                shard_records.extend(records)
+
+                while len(shard_records) >= self.shard_size:
+                    yield (
+                        self._records_to_columns(
+                            shard_records[: self.shard_size],
+                            image_fields_with_embedded_images,
+                            questions_with_suggestions,
+                        ),
+                        columns_features,
+                    )
+                    shard_records = shard_records[self.shard_size :]
+
+            if shard_records:
+                yield (
+                    self._records_to_columns(
+                        shard_records, image_fields_with_embedded_images, questions_with_suggestions
+                    ),
+                    columns_features,
+                )
+
+    def _image_fields_with_embedded_images(self, session: Session) -> Set[str]:
+        image_fields_with_embedded_images = set()
+        for field in self.dataset.fields:
+            if not field.is_image:
+                continue
+
+            has_embedded_images = session.execute(
+                select(
+                    exists().where(
+                        Record.dataset_id == self.dataset.id,
+                        or_(
+                            Record.fields[field.name].as_string().startswith("data:"),
+                            Record.fields[field.name].as_string().startswith(media.MEDIA_REFERENCE_PREFIX),
+                        ),
+                    )
+                )
+            ).scalar()
+
+            if has_embedded_images:
+                image_fields_with_embedded_images.add(field.name)
 
-    def _record_to_row(self, record: Record) -> dict:
+        return image_fields_with_embedded_images
+
+    def _questions_with_suggestions(self, session: Session) -> List[Question]:
+        question_ids = set(
+            session.execute(
+                select(Suggestion.question_id)
+                .join(Record, Record.id == Suggestion.record_id)
+                .where(Record.dataset_id == self.dataset.id)
+                .distinct()
+            ).scalars()
+        )
+
+        return [question for question in self.dataset.questions if question.id in question_ids]
+
+    def _records_to_columns(
+        self,
+        records: List[Record],
+        image_fields_with_embedded_images: Set[str],
+        questions_with_suggestions: List[Question],
+    ) -> Dict[str, list]:
         return (
-            self._row_attributes(record)
-            | self._row_fields(record)
-            | self._row_responses(record)
-            | self._row_suggestions(record)
-            | self._row_metadata(record)
-            # TODO: Is not possible to add extra metadata because the features need to be specified (even if with NULL) for all records.
-            # | self._row_extra_metadata(record)
-            | self._row_vectors(record)
+            self._attributes_columns(records)
+            | self._fields_columns(records, image_fields_with_embedded_images)
+            | self._responses_columns(records)
+            | self._suggestions_columns(records, questions_with_suggestions)
+            | self._metadata_columns(records)
+            | self._vectors_columns(records)
         )
 
-    def _row_attributes(self, record: Record) -> dict:
+    def _attributes_columns(self, records: List[Record]) -> Dict[str, list]:
         return {
-            "id": record.external_id,
-            "status": record.status,
-            "inserted_at": record.inserted_at,
-            "updated_at": record.updated_at,
-            "_server_id": str(record.id),
+            "id": [record.external_id for record in records],
+            "status": [record.status for record in records],
+            "inserted_at": [record.inserted_at for record in records],
+            "updated_at": [record.updated_at for record in records],
+            "_server_id": [str(record.id) for record in records],
         }
 
-    def _row_fields(self, record: Record) -> dict:
-        row_fields = {}
+    def _fields_columns(self, records: List[Record], image_fields_with_embedded_images: Set[str]) -> Dict[str, list]:
+        columns = {}
         for field in self.dataset.fields:
-            feature_name = self._feature_name_for_field(field)
-            feature_value = record.fields.get(field.name)
+            feature_values = [record.fields.get(field.name) for record in records]
 
-            if field.is_image and feature_value is not None and feature_value.startswith("data:"):
-                row_fields[feature_name] = Image.open(io.BytesIO(data_url_to_bytes(feature_value)))
-            else:
-                row_fields[feature_name] = feature_value
+            if field.name in image_fields_with_embedded_images:
+                feature_values = [_image_feature_value(feature_value) for feature_value in feature_values]
 
-        return row_fields
+            columns[self._feature_name_for_field(field)] = feature_values
 
-    def _row_responses(self, record: Record) -> dict:
-        row_responses = {}
-        for question in self.dataset.questions:
-            feature_name = self._feature_name_for_response(question)
-            feature_name_users = self._feature_name_for_response_users(question)
-            feature_name_status = self._feature_name_for_response_status(question)
-
-            row_responses[feature_name] = None
-            row_responses[feature_name_users] = None
-            row_responses[feature_name_status] = None
-            for response in record.responses:
-                response_values = response.values or {}
-                response_value = response_values.get(question.name, {})
-
-                feature_value = response_value.get("value")
-
-                if row_responses[feature_name] is None:
-                    row_responses[feature_name] = []
-                    row_responses[feature_name_users] = []
-                    row_responses[feature_name_status] = []
-
-                row_responses[feature_name].append(feature_value)
-                row_responses[feature_name_users].append(str(response.user_id))
-                row_responses[feature_name_status].append(response.status)
-
-        return row_responses
-
-    def _row_suggestions(self, record: Record) -> dict:
-        row_suggestions = {}
-        for suggestion in record.suggestions:
-            question = self.dataset.question_by_id(suggestion.question_id)
-            if question is None:
-                continue
+        return columns
 
-            feature_name = self._feature_name_for_suggestion(question)
-            feature_name_agent = self._feature_name_for_suggestion_agent(question)
-            feature_name_score = self._feature_name_for_suggestion_score(question)
+    def _responses_columns(self, records: List[Record]) -> Dict[str, list]:
+        questions_values = {question.name: [] for question in self.dataset.questions}
+        users_values, status_values = [], []
 
-            row_suggestions[feature_name] = suggestion.value
-            row_suggestions[feature_name_agent] = suggestion.agent
-            row_suggestions[feature_name_score] = suggestion.score
+        # NOTE: Responses are pivoted by question visiting only the values each response has, instead of looking up
+        # every question for every response.
+        for record in records:
+            if not record.responses:
+                for question_values in questions_values.values():
+                    question_values.append(None)
+                users_values.append(None)
+                status_values.append(None)
+                continue
 
-        return row_suggestions
+            record_questions_values = {name: [None] * len(record.responses) for name in questions_values}
+            for response_idx, response in enumerate(record.responses):
+                for question_name, response_value in (response.values or {}).items():
+                    if question_name in record_questions_values:
+                        record_questions_values[question_name][response_idx] = response_value.get("value")
 
-    def _row_metadata(self, record: Record) -> dict:
-        row_metadata = {}
+            for question_name, question_values in questions_values.items():
+                question_values.append(record_questions_values[question_name])
+            users_values.append([str(response.user_id) for response in record.responses])
+            status_values.append([response.status for response in record.responses])
 
-        record_metadata = record.metadata_ or {}
+        columns = {}
+        for question in self.dataset.questions:
+            columns[self._feature_name_for_response(question)] = questions_values[question.name]
+            columns[self._feature_name_for_response_users(question)] = users_values
+            columns[self._feature_name_for_response_status(question)] = status_values
+
+        return columns
+
+    def _suggestions_columns(self, records: List[Record], questions: List[Question]) -> Dict[str, list]:
+        columns = {}
+        for question in questions:
+            suggestions = [
+                next((suggestion for suggestion in record.suggestions if suggestion.question_id == question.id), None)
+                for record in records
+            ]
+
+            columns[self._feature_name_for_suggestion(question)] = [
+                suggestion.value if suggestion else None for suggestion in suggestions
+            ]
+            columns[self._feature_name_for_suggestion_agent(question)] = [
+                suggestion.agent if suggestion else None for suggestion in suggestions
+            ]
+            columns[self._feature_name_for_suggestion_score(question)] = [
+                suggestion.score if suggestion else None for suggestion in suggestions
+            ]
+
+        return columns
+
+    def _metadata_columns(self, records: List[Record]) -> Dict[str, list]:
+        columns = {}
         for metadata_property in self.dataset.metadata_properties:
-            feature_name = self._feature_name_for_metadata_property(metadata_property)
-            feature_value = record_metadata.get(metadata_property.name)
+            feature_values = []
+            for record in records:
+                feature_value = (record.metadata_ or {}).get(metadata_property.name)
 
-            if metadata_property.is_terms and not isinstance(feature_value, list):
-                feature_value = [feature_value]
+                if metadata_property.is_terms and not isinstance(feature_value, list):
+                    feature_value = [feature_value]
 
-            row_metadata[feature_name] = feature_value
+                feature_values.append(feature_value)
 
-        return row_metadata
+            columns[self._feature_name_for_metadata_property(metadata_property)] = feature_values
 
-    def _row_extra_metadata(self, record: Record) -> dict:
-        if not self.dataset.allow_extra_metadata:
-            return {}
+        return columns
 
-        row_extra_metadata = {}
-        record_metadata = record.metadata_ or {}
-        metadata_properties_names = [metadata_property.name for metadata_property in self.dataset.metadata_properties]
-        for metadata_name, metadata_value in record_metadata.items():
-            if metadata_name in metadata_properties_names:
-                continue
+    def _vectors_columns(self, records: List[Record]) -> Dict[str, list]:
+        columns = {}
+        for vector_settings in self.dataset.vectors_settings:
+            columns[self._feature_name_for_vector_settings(vector_settings)] = [
+                record.vector_value_by_vector_settings(vector_settings) for record in records
+            ]
 
-            feature_name = self._feature_name_for_extra_metadata(metadata_name)
-            feature_value = metadata_value
+        return columns
 
-            row_extra_metadata[feature_name] = feature_value
+    def _write_shard(
+        self, path: str, columns: Dict[str, list], columns_features: Dict[str, features.Image]
+    ) -> Tuple[str, features.Features]:
+        arrays, shard_features = [], {}
+        for name, values in columns.items():
+            typed_sequence = TypedSequence(values, type=columns_features.get(name))
+            arrays.append(pa.array(typed_sequence))
+            shard_features[name] = columns_features.get(name, typed_sequence.get_inferred_type())
 
-        return row_extra_metadata
+        shard_features = features.Features(shard_features)
+        table = pa.Table.from_arrays(arrays, schema=self._arrow_schema(shard_features))
 
-    def _row_vectors(self, record: Record) -> dict:
-        row_vectors = {}
-        for vector_settings in self.dataset.vectors_settings:
-            feature_name = self._feature_name_for_vector_settings(vector_settings)
-            feature_value = record.vector_value_by_vector_settings(vector_settings)
+        pq.write_table(table, path)
 
-            row_vectors[feature_name] = feature_value
+        return path, shard_features
 
-        return row_vectors
+    def _unify_shards_features(self, shards_features: List[features.Features]) -> features.Features:
+        schema = pa.unify_schemas(
+            [shard_features.arrow_schema for shard_features in shards_features],
+            promote_options="permissive",
+        )
+
+        unified_features = features.Features.from_arrow_schema(schema)
+        for shard_features in shards_features:
+            for name, feature in shard_features.items():
+                if isinstance(feature, features.Image):
+                    unified_features[name] = feature
+
+        return unified_features
+
+    def _rewrite_shard(self, path: str, shard_features: features.Features) -> None:
+        table = pq.read_table(path)
+        schema = self._arrow_schema(shard_features)
+
+        arrays = []
+        for arrow_field in schema:
+            column = table.column(arrow_field.name)
+            try:
+                arrays.append(column.cast(arrow_field.type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # NOTE: Structs with missing fields cannot be casted, so they are rebuilt from Python values.
+                arrays.append(pa.array(column.to_pylist(), type=arrow_field.type))
+
+        pq.write_table(pa.Table.from_arrays(arrays, schema=schema), path)
+
+    def _arrow_schema(self, shard_features: features.Features) -> pa.Schema:
+        # NOTE: Using the same metadata written by `datasets` so Image features are decoded when loading the dataset.
+        return shard_features.arrow_schema.with_metadata(
+            {"huggingface": json.dumps({"info": {"features": shard_features.to_dict()}})}
+        )
+
+    def _data_directory_for_subset(self, subset: str) -> str:
+        return "data" if subset == HUB_DEFAULT_SUBSET else subset
 
     def _feature_name_for_field(self, field: Field) -> str:
         return field.name
@@ -408,23 +701,41 @@ class HubDatasetExporter:
     def _feature_name_for_vector_settings(self, vector_settings: VectorSettings) -> str:
         return f"vector.{vector_settings.name}"
 
-    def _push_extra_files_to_hub(self, repo_id: str, token: str) -> None:
-        hf_api = HfApi(token=token)
-
-        with TemporaryDirectory() as temporary_directory:
-            argilla_directory = os.path.join(temporary_directory, ".argilla")
-            os.makedirs(argilla_directory)
+    def _dataset_card_configs(self, hf_api: HfApi, repo_id: str, subset: str, split: str) -> List[dict]:
+        """Returns the dataset card `configs` including the exported subset and split.
 
-            self._create_version_file(argilla_directory)
-            self._create_dataset_file(argilla_directory)
-            self._create_settings_file(argilla_directory)
-            self._create_readme_file(temporary_directory, repo_id)
+        Configs already in the dataset card of the Hub repository are kept, so exporting a subset doesn't remove the
+        other subsets or the other splits of the same subset, like `datasets` does on `push_to_hub`.
+        """
+        data_files = {"split": split, "path": f"{self._data_directory_for_subset(subset)}/{split}-*"}
 
-            hf_api.upload_folder(
-                repo_id=repo_id,
-                repo_type="dataset",
-                folder_path=temporary_directory,
+        configs = []
+        if hf_api.file_exists(repo_id=repo_id, filename=HUB_DATASET_CARD_FILENAME, repo_type="dataset"):
+            dataset_card_path = hf_api.hf_hub_download(
+                repo_id=repo_id, filename=HUB_DATASET_CARD_FILENAME, repo_type="dataset"
             )
+            configs = DatasetCard.load(dataset_card_path).data.get("configs") or []
+
+        for config in configs:
+            if config.get("config_name", HUB_DEFAULT_SUBSET) == subset:
+                config["data_files"] = [
+                    {"split": config_split, "path": patterns[0] if len(patterns) == 1 else patterns}
+                    for config_split, patterns in sanitize_patterns(config.get("data_files", [])).items()
+                    if config_split != split
+                ] + [data_files]
+
+                return configs
+
+        return [*configs, {"config_name": subset, "data_files": [data_files]}]
+
+    def _create_extra_files(self, directory: str, repo_id: str, configs: List[dict]) -> None:
+        argilla_directory = os.path.join(directory, ".argilla")
+        os.makedirs(argilla_directory)
+
+        self._create_version_file(argilla_directory)
+        self._create_dataset_file(argilla_directory)
+        self._create_settings_file(argilla_directory)
+        self._create_readme_file(directory, repo_id, configs)
 
     def _create_version_file(self, directory: str) -> None:
         with open(os.path.join(directory, "version.json"), "w") as file:
@@ -454,11 +765,12 @@ class HubDatasetExporter:
 
             file.write(dataset_settings.model_dump_json(indent=2))
 
-    def _create_readme_file(self, directory: str, repo_id: str) -> None:
+    def _create_readme_file(self, directory: str, repo_id: str, configs: List[dict]) -> None:
         card = DatasetCard.from_template(
             card_data=DatasetCardData(
                 # size_categories=size_categories_parser(dataset_size),
                 tags=["rlfh", "argilla", "human-feedback"],
+                configs=configs,
             ),
             template_path=HUB_DATASET_CARD_TEMPLATE_PATH,
             repo_id=repo_id,
@@ -471,7 +783,7 @@ class HubDatasetExporter:
             # huggingface_record=sample_huggingface_record,
         )
 
-        card.save(os.path.join(directory, "README.md"))
+        card.save(os.path.join(directory, HUB_DATASET_CARD_FILENAME))
 
 
 def pil_image_to_data_url(image: Image.Image):
@@ -487,6 +799,35 @@ def pil_image_to_data_url(image: Image.Image):
     return f"data:{image_mimetype};base64,{base64_image}"
 
 
+def images_to_data_urls(values: List[Optional[dict]]) -> List[Optional[str]]:
+    """Encodes a list of raw (not decoded) `datasets` image values as data URLs. Used by the import process pool."""
+    data_urls = []
+    for value in values:
+        if value is None:
+            data_urls.append(None)
+        elif value.get("bytes"):
+            data_urls.append(pil_image_to_data_url(Image.open(io.BytesIO(value["bytes"]))))
+        elif value.get("path"):
+            data_urls.append(pil_image_to_data_url(Image.open(value["path"])))
+        else:
+            data_urls.append(None)
+
+    return data_urls
+
+
+def _image_feature_value(value: Optional[str]) -> Optional[dict]:
+    if value is None:
+        return None
+
+    if value.startswith("data:"):
+        return {"bytes": data_url_to_bytes(value), "path": None}
+
+    if media.is_media_reference(value):
+        return {"bytes": media.read_media_reference(value), "path": None}
+
+    return {"bytes": None, "path": value}
+
+
 def data_url_to_bytes(data_url: str):
     header, encoded = data_url.split(",", 1)
 
@@ -0,0 +1,237 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import re
+import math
+import time
+import base64
+import binascii
+import asyncio
+import hashlib
+import tempfile
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.errors import UnauthorizedError
+from argilla_server.errors.future import UnprocessableEntityError
+from argilla_server.models import Dataset, DatasetMedia
+from argilla_server.security.authentication.jwt import JWT
+from argilla_server.settings import settings
+
+MEDIA_REFERENCE_PREFIX = "/api/v1/media/"
+MEDIA_HASH_REGEX = re.compile(r"^[0-9a-f]{64}$")
+MEDIA_DEFAULT_MIMETYPE = "application/octet-stream"
+MEDIA_MIMETYPE_FILE_SUFFIX = ".mimetype"
+MEDIA_TOKEN_EXPIRATION_ROUNDING_SECONDS = 60 * 60
+
+
+@dataclass
+class MediaFile:
+    path: str
+    mimetype: str
+
+
+class FileSystemMediaStore:
+    """Stores media content on the local filesystem addressed by the SHA-256 hash of its bytes.
+
+    Files are sharded in directories using the first two characters of the hash. Storing the same content twice is
+    a no-op, so media shared by several records is only written once.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def put(self, content: bytes, mimetype: str) -> str:
+        hash = hashlib.sha256(content).hexdigest()
+
+        media_path = self._media_path(hash)
+        if os.path.exists(media_path):
+            return hash
+
+        os.makedirs(os.path.dirname(media_path), exist_ok=True)
+        self._write_atomically(f"{media_path}{MEDIA_MIMETYPE_FILE_SUFFIX}", mimetype.encode("utf-8"))
+        self._write_atomically(media_path, content)
+
+        return hash
+
+    def get(self, hash: str) -> Optional[MediaFile]:
+        if not MEDIA_HASH_REGEX.match(hash):
+            return None
+
+        media_path = self._media_path(hash)
+        if not os.path.exists(media_path):
+            return None
+
+        return MediaFile(path=media_path, mimetype=self._read_mimetype(media_path))
+
+    def read(self, hash: str) -> Optional[bytes]:
+        media_file = self.get(hash)
+        if media_file is None:
+            return None
+
+        with open(media_file.path, "rb") as file:
+            return file.read()
+
+    def _media_path(self, hash: str) -> str:
+        return os.path.join(self.path, hash[:2], hash)
+
+    def _read_mimetype(self, media_path: str) -> str:
+        try:
+            with open(f"{media_path}{MEDIA_MIMETYPE_FILE_SUFFIX}", "r") as file:
+                return file.read().strip() or MEDIA_DEFAULT_MIMETYPE
+        except FileNotFoundError:
+            return MEDIA_DEFAULT_MIMETYPE
+
+    def _write_atomically(self, path: str, content: bytes) -> None:
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(content)
+            os.replace(temporary_path, path)
+        except Exception:
+            os.unlink(temporary_path)
+            raise
+
+
+def get_media_store() -> FileSystemMediaStore:
+    return FileSystemMediaStore(settings.media_path)
+
+
+def media_reference(hash: str) -> str:
+    return f"{MEDIA_REFERENCE_PREFIX}{hash}"
+
+
+def signed_media_reference(hash: str) -> str:
+    """Returns a reference to the media including a token, so it can be fetched without authentication headers
+    (e.g. as the source of an `<img>` element)."""
+    # NOTE: The expiration is rounded, so the same media gets the same URL for a while and clients can cache it.
+    expires_at = math.ceil((time.time() + JWT.expires) / MEDIA_TOKEN_EXPIRATION_ROUNDING_SECONDS)
+    token = JWT.encode({"sub": hash, "exp": expires_at * MEDIA_TOKEN_EXPIRATION_ROUNDING_SECONDS})
+
+    return f"{media_reference(hash)}?token={token}"
+
+
+def sign_fields_media_references(fields: Dict[str, Any]) -> Dict[str, Any]:
+    if not settings.media_store_enabled or not fields:
+        return fields
+
+    return {
+        name: signed_media_reference(hash) if (hash := media_hash_from_reference(value)) else value
+        for name, value in fields.items()
+    }
+
+
+def is_valid_media_token(hash: str, token: str) -> bool:
+    try:
+        return JWT.decode(token).get("sub") == hash
+    except UnauthorizedError:
+        return False
+
+
+def is_media_reference(value: Any) -> bool:
+    return media_hash_from_reference(value) is not None
+
+
+def media_hash_from_reference(value: Any) -> Optional[str]:
+    if not isinstance(value, str) or not value.startswith(MEDIA_REFERENCE_PREFIX):
+        return None
+
+    # NOTE: Signed references include the token as a query parameter
+    hash = value[len(MEDIA_REFERENCE_PREFIX) :].split("?", 1)[0]
+    if not MEDIA_HASH_REGEX.match(hash):
+        return None
+
+    return hash
+
+
+def read_media_reference(value: str) -> Optional[bytes]:
+    hash = media_hash_from_reference(value)
+    if hash is None:
+        return None
+
+    return get_media_store().read(hash)
+
+
+async def list_datasets_referencing_media(db: AsyncSession, hash: str) -> Sequence[Dataset]:
+    """Returns the datasets having records with field values referencing the media with the given hash."""
+    return (await db.execute(select(Dataset).join(DatasetMedia).where(DatasetMedia.hash == hash))).scalars().all()
+
+
+def store_fields_media(dataset: Dataset, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Replaces data URLs of image fields with references to the media store, storing their decoded content."""
+    if not settings.media_store_enabled or not fields:
+        return fields
+
+    media_store = get_media_store()
+
+    stored_fields = dict(fields)
+    for field in filter(lambda field: field.is_image, dataset.fields):
+        field_value = fields.get(field.name)
+        if hash := media_hash_from_reference(field_value):
+            # NOTE: References are stored without the token of signed references
+            stored_fields[field.name] = media_reference(hash)
+            continue
+
+        if not isinstance(field_value, str) or not field_value.startswith("data:"):
+            continue
+
+        try:
+            header, encoded = field_value.split(",", 1)
+            content = base64.b64decode(encoded, validate=True)
+        except (ValueError, binascii.Error):
+            raise UnprocessableEntityError(f"image field {field.name!r} has an invalid data URL value")
+
+        mimetype = header[len("data:") :].split(";", 1)[0] or MEDIA_DEFAULT_MIMETYPE
+
+        stored_fields[field.name] = media_reference(media_store.put(content, mimetype))
+
+    return stored_fields
+
+
+async def store_records_fields_media(
+    db: AsyncSession, dataset: Dataset, records_fields: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    if not settings.media_store_enabled:
+        return records_fields
+
+    stored_records_fields = await asyncio.to_thread(
+        lambda: [store_fields_media(dataset, record_fields) for record_fields in records_fields]
+    )
+
+    await _upsert_dataset_media(db, dataset, stored_records_fields)
+
+    return stored_records_fields
+
+
+async def _upsert_dataset_media(db: AsyncSession, dataset: Dataset, records_fields: List[Dict[str, Any]]) -> None:
+    hashes = {
+        hash
+        for record_fields in records_fields
+        for value in (record_fields or {}).values()
+        if (hash := media_hash_from_reference(value))
+    }
+    if not hashes:
+        return
+
+    await DatasetMedia.upsert_many(
+        db,
+        objects=[{"dataset_id": dataset.id, "hash": hash} for hash in hashes],
+        constraints=[DatasetMedia.dataset_id, DatasetMedia.hash],
+        autocommit=False,
+    )
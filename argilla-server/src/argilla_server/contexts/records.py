@@ -12,27 +12,32 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from datetime import datetime
-from typing import Dict, Sequence, Union, List, Tuple, Optional
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Sequence, Union, List, Tuple, Optional
 from uuid import UUID
 
 from fastapi.encoders import jsonable_encoder
-from sqlalchemy import select, and_, func, Select
+from sqlalchemy import select, and_, or_, delete, exists, func, insert, update, ColumnElement, Select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload, contains_eager
 
 from argilla_server.api.schemas.v1.records import RecordUpdate
 from argilla_server.api.schemas.v1.vectors import Vector as VectorSchema
 
-from argilla_server.models import Dataset, Record, VectorSettings, Vector, Response, Suggestion
-from argilla_server.search_engine import SearchEngine
+from argilla_server.contexts import media
+from argilla_server.models import Dataset, DeletedRecord, Record, VectorSettings, Vector, Response, Suggestion
+from argilla_server.search_engine import Filter, SearchEngine, TextQuery
+from argilla_server.settings import settings
 from argilla_server.validators.records import RecordUpdateValidator
 from argilla_server.webhooks.v1.enums import RecordEvent
 from argilla_server.webhooks.v1.records import (
     build_record_event as build_record_event_v1,
     notify_record_event as notify_record_event_v1,
+    notify_records_deleted_event as notify_records_deleted_event_v1,
 )
 
+DELETE_RECORDS_BY_QUERY_CHUNK_SIZE = 1000
+
 
 async def list_dataset_records(
     db: AsyncSession,
@@ -42,7 +47,14 @@ async def list_dataset_records(
     with_responses: bool = False,
     with_suggestions: bool = False,
     with_vectors: Union[bool, List[str]] = False,
+    updated_at_ge: Optional[datetime] = None,
+    updated_at_le: Optional[datetime] = None,
 ) -> Tuple[Sequence[Record], int]:
+    """
+    Lists the dataset records. When `updated_at_ge` or `updated_at_le` are provided, only the records updated in
+    that range are listed. A record is considered updated when the record itself, or any of its responses or
+    suggestions, was updated.
+    """
     query = _build_list_records_query(
         dataset_id=dataset_id,
         offset=offset,
@@ -51,13 +63,111 @@ async def list_dataset_records(
         with_suggestions=with_suggestions,
         with_vectors=with_vectors,
     )
+    total_query = select(func.count(Record.id)).filter_by(dataset_id=dataset_id)
+
+    if updated_at_ge is not None or updated_at_le is not None:
+        updated_in_range = _record_updated_in_range(updated_at_ge, updated_at_le)
+        query = query.where(updated_in_range)
+        total_query = total_query.where(updated_in_range)
 
     records = (await db.scalars(query)).unique().all()
-    total = await db.scalar(select(func.count(Record.id)).filter_by(dataset_id=dataset_id))
+    total = await db.scalar(total_query)
 
     return records, total
 
 
+async def list_dataset_updated_records(
+    db: AsyncSession,
+    dataset_id: UUID,
+    limit: int,
+    with_responses: bool = False,
+    with_suggestions: bool = False,
+    with_vectors: Union[bool, List[str]] = False,
+    last_activity_at_ge: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+) -> Sequence[Record]:
+    """
+    Lists the dataset records ordered by `last_activity_at`, the last time the record, or any of its responses or
+    suggestions, was changed, and then by id. Records are paginated by keyset: `after` is the `last_activity_at` and
+    id of the last record of the previous page. Unlike offsets, keysets don't skip records when other records are
+    updated or deleted between pages, and records updated in the meantime are listed again in a later page.
+    """
+    query = _build_list_records_query(
+        dataset_id=dataset_id,
+        limit=limit,
+        with_responses=with_responses,
+        with_suggestions=with_suggestions,
+        with_vectors=with_vectors,
+    )
+
+    if last_activity_at_ge is not None:
+        query = query.where(Record.last_activity_at >= last_activity_at_ge)
+
+    if after is not None:
+        after_last_activity_at, after_id = after
+        query = query.where(
+            or_(
+                Record.last_activity_at > after_last_activity_at,
+                and_(Record.last_activity_at == after_last_activity_at, Record.id > after_id),
+            )
+        )
+
+    query = query.order_by(None).order_by(Record.last_activity_at, Record.id)
+
+    return (await db.scalars(query)).unique().all()
+
+
+async def list_dataset_deleted_records(
+    db: AsyncSession,
+    dataset_id: UUID,
+    limit: int,
+    deleted_at_ge: Optional[datetime] = None,
+    after: Optional[Tuple[datetime, UUID]] = None,
+) -> Sequence[DeletedRecord]:
+    """
+    Lists the dataset deleted records ordered by deletion time and then by record id. Deleted records are paginated
+    by keyset: `after` is the deletion time and record id of the last deleted record of the previous page.
+    """
+    query = select(DeletedRecord).filter_by(dataset_id=dataset_id)
+
+    if deleted_at_ge is not None:
+        query = query.where(DeletedRecord.inserted_at >= deleted_at_ge)
+
+    if after is not None:
+        after_deleted_at, after_record_id = after
+        query = query.where(
+            or_(
+                DeletedRecord.inserted_at > after_deleted_at,
+                and_(DeletedRecord.inserted_at == after_deleted_at, DeletedRecord.record_id > after_record_id),
+            )
+        )
+
+    query = query.order_by(DeletedRecord.inserted_at, DeletedRecord.record_id).limit(limit)
+
+    return (await db.scalars(query)).all()
+
+
+def deleted_records_retained_since() -> datetime:
+    """Returns the oldest deletion time of the deleted records that are still tracked."""
+    return datetime.utcnow() - timedelta(days=settings.deleted_records_retention_days)
+
+
+async def touch_records_last_activity_at(db: AsyncSession, records_ids: Iterable[UUID]) -> None:
+    """Sets the records `last_activity_at` to now, keeping their `updated_at`. Changes are not committed."""
+    records_ids = set(records_ids)
+    if not records_ids:
+        return
+
+    await db.execute(
+        update(Record)
+        .where(Record.id.in_(records_ids))
+        .values(
+            last_activity_at=datetime.utcnow(),
+            updated_at=Record.__table__.c.updated_at,
+        )
+    )
+
+
 async def list_dataset_records_by_ids(
     db: AsyncSession, dataset_id: UUID, record_ids: Sequence[UUID]
 ) -> Sequence[Record]:
@@ -126,6 +236,22 @@ def _build_list_records_query(
     return query.order_by(Record.inserted_at)
 
 
+def _record_updated_in_range(updated_at_ge: Optional[datetime], updated_at_le: Optional[datetime]) -> ColumnElement:
+    def in_range(column) -> ColumnElement:
+        conditions = []
+        if updated_at_ge is not None:
+            conditions.append(column >= updated_at_ge)
+        if updated_at_le is not None:
+            conditions.append(column <= updated_at_le)
+        return and_(*conditions)
+
+    return or_(
+        in_range(Record.updated_at),
+        exists().where(Response.record_id == Record.id, in_range(Response.updated_at)),
+        exists().where(Suggestion.record_id == Record.id, in_range(Suggestion.updated_at)),
+    )
+
+
 async def _preload_record_relationships_before_index(db: AsyncSession, record: Record) -> None:
     await db.execute(
         select(Record)
@@ -149,7 +275,7 @@ async def update_record(
     await RecordUpdateValidator.validate(record_update, dataset, record)
 
     if record_update.is_set("fields"):
-        record.fields = record_update.fields
+        (record.fields,) = await media.store_records_fields_media(db, dataset, [record_update.fields])
 
     if record_update.is_set("metadata"):
         record.metadata_ = record_update.metadata
@@ -200,6 +326,7 @@ async def update_record(
 
 async def delete_record(db: AsyncSession, search_engine: "SearchEngine", record: Record) -> Record:
     deleted_record_event_v1 = await build_record_event_v1(db, RecordEvent.deleted, record)
+    await _create_deleted_records(db, record.dataset_id, [(record.id, record.external_id)])
     record = await record.delete(db=db, autocommit=True)
 
     await search_engine.delete_records(dataset=record.dataset, records=[record])
@@ -222,6 +349,7 @@ async def delete_records(
             await build_record_event_v1(db, RecordEvent.deleted, record),
         )
 
+    await _create_deleted_records(db, dataset.id, [(record.id, record.external_id) for record in records])
     records = await Record.delete_many(
         db,
         conditions=params,
@@ -232,3 +360,162 @@ async def delete_records(
 
     for deleted_record_event_v1 in deleted_record_events_v1:
         await deleted_record_event_v1.notify(db)
+
+
+async def delete_records_by_query(
+    db: AsyncSession,
+    search_engine: "SearchEngine",
+    dataset: Dataset,
+    query: Optional[Union[TextQuery, str]] = None,
+    filter: Optional[Filter] = None,
+    chunk_size: int = DELETE_RECORDS_BY_QUERY_CHUNK_SIZE,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """
+    Deletes all the dataset records matching the query and filter, in chunks of `chunk_size` records so
+    the database is never locked for a long time. A single `records.deleted` webhook event is sent at the end
+    instead of one `record.deleted` event per record.
+    """
+    if query is None and filter is None:
+        deleted = await _delete_all_dataset_records(db, search_engine, dataset, chunk_size, on_progress)
+    else:
+        deleted = await _delete_dataset_records_matching(
+            db, search_engine, dataset, query, filter, chunk_size, on_progress
+        )
+
+    if deleted > 0:
+        await notify_records_deleted_event_v1(db, dataset, deleted)
+
+    return deleted
+
+
+async def _delete_all_dataset_records(
+    db: AsyncSession,
+    search_engine: "SearchEngine",
+    dataset: Dataset,
+    chunk_size: int,
+    on_progress: Optional[Callable[[int, int], None]],
+) -> int:
+    deleted = await delete_dataset_records_in_chunks(db, dataset, chunk_size, on_progress)
+
+    # NOTE: Records are removed from the search engine at once using a delete by query request.
+    await search_engine.delete_records_by_query(dataset)
+
+    return deleted
+
+
+async def delete_dataset_records_in_chunks(
+    db: AsyncSession,
+    dataset: Dataset,
+    chunk_size: int = DELETE_RECORDS_BY_QUERY_CHUNK_SIZE,
+    on_progress: Optional[Callable[[int, int], None]] = None,
+    track_deleted: bool = True,
+) -> int:
+    """
+    Deletes all the dataset records from the database (but not from the search engine) committing every
+    `chunk_size` records. Responses, suggestions and vectors are removed by the database cascades of each chunk.
+    When `track_deleted` is False, deleted records are not tracked (e.g. because the dataset is being deleted).
+    """
+    total = (await db.execute(select(func.count(Record.id)).filter_by(dataset_id=dataset.id))).scalar_one()
+
+    deleted = 0
+    while True:
+        records_ids = await _delete_records_chunk(
+            db,
+            select(Record.id).filter_by(dataset_id=dataset.id).limit(chunk_size),
+            dataset_id=dataset.id if track_deleted else None,
+        )
+        if not records_ids:
+            break
+
+        deleted += len(records_ids)
+        if on_progress:
+            on_progress(deleted, total)
+
+    return deleted
+
+
+async def _delete_dataset_records_matching(
+    db: AsyncSession,
+    search_engine: "SearchEngine",
+    dataset: Dataset,
+    query: Optional[Union[TextQuery, str]],
+    filter: Optional[Filter],
+    chunk_size: int,
+    on_progress: Optional[Callable[[int, int], None]],
+) -> int:
+    total = None
+
+    deleted = 0
+    while True:
+        # NOTE: Matching records are removed from the search engine on every iteration so we always
+        # fetch the first page of results, avoiding deep pagination on big datasets.
+        responses = await search_engine.search(dataset, query=query, filter=filter, offset=0, limit=chunk_size)
+        if total is None:
+            total = responses.total
+
+        if not responses.items:
+            break
+
+        records_ids = await _delete_records_chunk(
+            db,
+            select(Record.id).filter(
+                Record.id.in_([item.record_id for item in responses.items]),
+                Record.dataset_id == dataset.id,
+            ),
+            dataset_id=dataset.id,
+        )
+
+        # NOTE: Records could be removed from the database but not from the search engine (e.g. a previous
+        # failed execution) so we remove all the returned records from the search engine.
+        await search_engine.delete_records(
+            dataset=dataset,
+            records=[Record(id=item.record_id, dataset_id=dataset.id) for item in responses.items],
+        )
+
+        deleted += len(records_ids)
+        if on_progress:
+            on_progress(deleted, total)
+
+    return deleted
+
+
+async def _delete_records_chunk(
+    db: AsyncSession, records_ids_query: Select, dataset_id: Optional[UUID] = None
+) -> List[UUID]:
+    result = await db.execute(
+        delete(Record)
+        .where(Record.id.in_(records_ids_query.scalar_subquery()))
+        .returning(Record.id, Record.external_id)
+        .execution_options(synchronize_session=False),
+    )
+    deleted_records = result.all()
+
+    if dataset_id is not None:
+        await _create_deleted_records(db, dataset_id, deleted_records)
+    await db.commit()
+
+    return [record_id for record_id, _ in deleted_records]
+
+
+async def _create_deleted_records(
+    db: AsyncSession, dataset_id: UUID, records: Iterable[Tuple[UUID, Optional[str]]]
+) -> None:
+    """Tracks deleted records, so clients syncing the dataset can remove them too. Changes are not committed."""
+    deleted_records = [
+        {"record_id": record_id, "external_id": external_id, "dataset_id": dataset_id}
+        for record_id, external_id in records
+    ]
+    if deleted_records:
+        await db.execute(insert(DeletedRecord), deleted_records)
+        await _prune_deleted_records(db, dataset_id)
+
+
+async def _prune_deleted_records(db: AsyncSession, dataset_id: UUID) -> None:
+    """Removes the dataset deleted records older than the retention. Changes are not committed."""
+    await db.execute(
+        delete(DeletedRecord).where(
+            DeletedRecord.dataset_id == dataset_id,
+            DeletedRecord.inserted_at < deleted_records_retained_since(),
+        )
+    )
@@ -11,22 +11,27 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, Optional
 from uuid import UUID
 
 from sqlalchemy import func, select
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 
+import argilla_server.search_engine as search_engine
 from argilla_server.api.schemas.v1.records import (
+    Filters,
     FilterScope,
     MetadataFilterScope,
+    Order,
+    RangeFilter,
     RecordFilterScope,
     SearchRecordsQuery,
+    TermsFilter,
 )
 from argilla_server.api.schemas.v1.responses import ResponseFilterScope
 from argilla_server.api.schemas.v1.suggestions import SuggestionFilterScope
-from argilla_server.models import MetadataProperty, Question, Suggestion, Dataset
+from argilla_server.models import MetadataProperty, Question, Suggestion, Dataset, User
 
 
 class SearchRecordsQueryValidator:
@@ -83,6 +88,47 @@ async def validate_search_records_query(db: AsyncSession, query: SearchRecordsQu
     await SearchRecordsQueryValidator.validate(db, dataset, query)
 
 
+def to_search_engine_filter_scope(scope: FilterScope, user: Optional[User]) -> search_engine.FilterScope:
+    if isinstance(scope, RecordFilterScope):
+        return search_engine.RecordFilterScope(property=scope.property)
+    elif isinstance(scope, MetadataFilterScope):
+        return search_engine.MetadataFilterScope(metadata_property=scope.metadata_property)
+    elif isinstance(scope, SuggestionFilterScope):
+        return search_engine.SuggestionFilterScope(question=scope.question, property=str(scope.property))
+    elif isinstance(scope, ResponseFilterScope):
+        return search_engine.ResponseFilterScope(question=scope.question, property=scope.property, user=user)
+    else:
+        raise Exception(f"Unknown scope type {type(scope)}")
+
+
+def to_search_engine_filter(filters: Filters, user: Optional[User]) -> search_engine.Filter:
+    engine_filters = []
+
+    for filter in filters.and_:
+        engine_scope = to_search_engine_filter_scope(filter.scope, user=user)
+
+        if isinstance(filter, TermsFilter):
+            engine_filter = search_engine.TermsFilter(scope=engine_scope, values=filter.values)
+        elif isinstance(filter, RangeFilter):
+            engine_filter = search_engine.RangeFilter(scope=engine_scope, ge=filter.ge, le=filter.le)
+        else:
+            raise Exception(f"Unknown filter type {type(filter)}")
+
+        engine_filters.append(engine_filter)
+
+    return search_engine.AndFilter(filters=engine_filters)
+
+
+def to_search_engine_sort(sort: List[Order], user: Optional[User]) -> List[search_engine.Order]:
+    engine_sort = []
+
+    for order in sort:
+        engine_scope = to_search_engine_filter_scope(order.scope, user=user)
+        engine_sort.append(search_engine.Order(scope=engine_scope, order=order.order))
+
+    return engine_sort
+
+
 async def get_dataset_suggestion_agents_by_question(db: AsyncSession, dataset_id: UUID) -> List[Mapping[str, Any]]:
     if db.bind.dialect.name == postgresql.dialect.name:
         return await _get_dataset_suggestion_agents_by_question_postgresql(db, dataset_id)
@@ -13,20 +13,32 @@
 #  limitations under the License.
 
 import os
+import re
+import time
+import asyncio
+import logging
+import weakref
 
 from collections import OrderedDict
-from typing import AsyncGenerator, Optional, Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncGenerator, Iterator, List, Optional, Generator, Tuple
 
+from fastapi import Depends, Request, Response
 from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import IsolationLevel
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from sqlalchemy.util import await_only
 
+from argilla_server import metrics
 from argilla_server.settings import settings
 
 import argilla_server
 
+_LOGGER = logging.getLogger("argilla.database")
 
 ALEMBIC_CONFIG_FILE = os.path.normpath(os.path.join(os.path.dirname(argilla_server.__file__), "alembic.ini"))
 TAGGED_REVISIONS = OrderedDict(
@@ -44,32 +56,199 @@ TAGGED_REVISIONS = OrderedDict(
     }
 )
 
+WRITE_STATEMENT_REGEX = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+PRIMARY_PIN_COOKIE_NAME = "argilla_primary_pin"
+
 
 @event.listens_for(Engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     if settings.database_is_sqlite:
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys = ON")
+        for name, value in settings.database_sqlite_pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
         cursor.close()
 
 
-def database_url_sync() -> str:
+class SQLiteWriterLock:
+    """
+    Serialises the write transactions of an async SQLite engine so they wait in an asyncio queue instead of
+    competing for the database lock and failing with `database is locked` errors.
+
+    SQLite drivers only open a transaction right before the first statement modifying data, so the lock is
+    acquired at that point and released when the transaction finishes. Statements only reading data never wait
+    for the lock, and using WAL journal mode they are not blocked by the writer either.
+    """
+
+    CONNECTION_INFO_KEY = "sqlite_writer_lock"
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    def install(self, engine: Engine) -> None:
+        event.listen(engine, "before_cursor_execute", self._acquire)
+        event.listen(engine, "commit", self._release)
+        event.listen(engine, "rollback", self._release)
+        event.listen(engine, "reset", self._reset)
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if loop not in self._locks:
+            self._locks[loop] = asyncio.Lock()
+
+        return self._locks[loop]
+
+    def _acquire(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if self.CONNECTION_INFO_KEY in conn.info or not WRITE_STATEMENT_REGEX.match(statement):
+            return
+
+        lock = self._lock()
+        try:
+            await_only(asyncio.wait_for(lock.acquire(), self.timeout))
+        except asyncio.TimeoutError:
+            # NOTE: The statement is executed anyway and SQLite decides if it can be run or not.
+            _LOGGER.warning(f"Timeout waiting for SQLite writer lock after {self.timeout} seconds")
+            return
+
+        conn.info[self.CONNECTION_INFO_KEY] = lock
+
+    def _release(self, conn) -> None:
+        self._release_lock(conn.info)
+
+    def _reset(self, dbapi_connection, connection_record, reset_state) -> None:
+        self._release_lock(connection_record.info)
+
+    def _release_lock(self, info: dict) -> None:
+        lock = info.pop(self.CONNECTION_INFO_KEY, None)
+        if lock is not None:
+            lock.release()
+
+
+@dataclass
+class QueryCounter:
+    statements: List[str] = field(default_factory=list)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    @property
+    def writes(self) -> int:
+        return sum(1 for statement in self.statements if WRITE_STATEMENT_REGEX.match(statement))
+
+
+_query_counters: ContextVar[Tuple[QueryCounter, ...]] = ContextVar("query_counters", default=())
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    """Counts the statements executed by the current context (and the tasks it spawns) while the block runs."""
+    query_counter = QueryCounter()
+    token = _query_counters.set(_query_counters.get() + (query_counter,))
+
+    try:
+        yield query_counter
+    finally:
+        _query_counters.reset(token)
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """
+    Counts and times the statements executed by the engine, recording them in the `db` span of the current request,
+    the active query counters and logging the slow ones. It's only installed when
+    `settings.database_query_instrumentation_enabled` so other deployments don't pay for it on every statement.
+    """
+    event.listen(engine, "before_cursor_execute", start_query_timing)
+    event.listen(engine, "after_cursor_execute", finish_query_timing)
+
+
+def start_query_timing(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+def finish_query_timing(conn, cursor, statement, parameters, context, executemany):
+    query_duration = time.perf_counter() - conn.info["query_started_at"].pop()
+
+    metrics.record_query(query_duration)
+    for query_counter in _query_counters.get():
+        query_counter.statements.append(statement)
+
+    slow_query_threshold = settings.database_slow_query_threshold
+    if slow_query_threshold is not None and query_duration >= slow_query_threshold:
+        _LOGGER.warning(
+            f"Slow query ({query_duration * 1000:.2f}ms) running {metrics.current_endpoint() or 'outside requests'}: "
+            f"{statement}"
+        )
+
+
+def database_url_sync(database_url: Optional[str] = None) -> str:
     """
-    Returns a "sync" version of the configured database URL. This may be useful in cases we don't need
-    an asynchronous connection, like running database migration inside the alembic script.
+    Returns a "sync" version of the configured database URL (or the given one). This may be useful in cases we
+    don't need an asynchronous connection, like running database migration inside the alembic script.
     """
-    database_url = make_url(settings.database_url)
-    return settings.database_url.replace(f"+{database_url.get_driver_name()}", "")
+    database_url = database_url or settings.database_url
+    return database_url.replace(f"+{make_url(database_url).get_driver_name()}", "")
 
 
 sync_engine = create_engine(database_url_sync(), **settings.database_engine_args)
 
 async_engine = create_async_engine(settings.database_url, **settings.database_engine_args)
+if settings.database_is_sqlite and settings.database_sqlite_single_writer:
+    SQLiteWriterLock(timeout=settings.database_sqlite_timeout).install(async_engine.sync_engine)
 
 SyncSessionLocal = scoped_session(sessionmaker(autocommit=False, expire_on_commit=False, bind=sync_engine))
 
 AsyncSessionLocal = async_sessionmaker(autocommit=False, expire_on_commit=False, bind=async_engine)
 
+# NOTE: When a read replica is not configured read sessions use the primary database engines.
+if settings.database_read_url:
+    sync_read_engine = create_engine(database_url_sync(settings.database_read_url), **settings.database_engine_args)
+    async_read_engine = create_async_engine(settings.database_read_url, **settings.database_engine_args)
+else:
+    sync_read_engine = sync_engine
+    async_read_engine = async_engine
+
+if settings.database_query_instrumentation_enabled:
+    for engine in {sync_engine, async_engine.sync_engine, sync_read_engine, async_read_engine.sync_engine}:
+        install_query_instrumentation(engine)
+
+SyncReadSessionLocal = scoped_session(sessionmaker(autocommit=False, expire_on_commit=False, bind=sync_read_engine))
+
+AsyncReadSessionLocal = async_sessionmaker(autocommit=False, expire_on_commit=False, bind=async_read_engine)
+
+
+def pin_to_primary(response: Response) -> None:
+    """
+    Sends the reads of the client receiving the response to the primary database for the next
+    `ARGILLA_DATABASE_READ_PRIMARY_PIN_SECONDS`, so they see its writes even if the read replica is lagging behind.
+
+    The pin is kept by the client as a cookie, so it's honored by every server instance.
+    """
+    pin_seconds = settings.database_read_primary_pin_seconds
+    if pin_seconds <= 0:
+        return
+
+    response.set_cookie(
+        PRIMARY_PIN_COOKIE_NAME,
+        value=str(time.time() + pin_seconds),
+        max_age=pin_seconds,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def is_pinned_to_primary(request: Request) -> bool:
+    try:
+        pinned_until = float(request.cookies.get(PRIMARY_PIN_COOKIE_NAME, 0))
+    except ValueError:
+        return False
+
+    # NOTE: Pins further in the future than the configured time are ignored, so clients can't pin themselves forever.
+    now = time.time()
+    return now < pinned_until <= now + settings.database_read_primary_pin_seconds
+
 
 def get_sync_db() -> Generator[Session, None, None]:
     db = SyncSessionLocal()
@@ -80,11 +259,40 @@ def get_sync_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_sync_read_db() -> Generator[Session, None, None]:
+    db = SyncReadSessionLocal()
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     async for db in _get_async_db():
         yield db
 
 
+async def get_read_async_db(
+    request: Request, primary_db: AsyncSession = Depends(get_async_db)
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Returns a session using the read replica configured with `ARGILLA_DATABASE_READ_URL`, or the primary database
+    session of the request if there is no replica or the client has written recently. Only endpoints that do not
+    write should use it.
+    """
+    if async_read_engine is async_engine or is_pinned_to_primary(request):
+        yield primary_db
+        return
+
+    db: AsyncSession = AsyncReadSessionLocal()
+
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 async def _get_async_db(isolation_level: Optional[IsolationLevel] = None) -> AsyncGenerator[AsyncSession, None]:
     db: AsyncSession = AsyncSessionLocal()
 
@@ -47,6 +47,7 @@ class SuggestionType(StrEnum):
 class DatasetStatus(StrEnum):
     draft = "draft"
     ready = "ready"
+    deleting = "deleting"
 
 
 class DatasetDistributionStrategy(StrEnum):
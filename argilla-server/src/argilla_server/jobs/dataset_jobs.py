@@ -12,19 +12,23 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from typing import Optional
 from uuid import UUID
 
 from rq import Retry
 from rq.decorators import job
 
 from sqlalchemy import select
+from sqlalchemy.orm import selectinload
 
-from argilla_server.models import Record, Response
+from argilla_server.api.schemas.v1.records import Filters
+from argilla_server.models import Dataset, Record, Response
 from argilla_server.database import AsyncSessionLocal
+from argilla_server.jobs.progress import update_current_job_progress
 from argilla_server.jobs.queues import DEFAULT_QUEUE, JOB_TIMEOUT_DISABLED
-from argilla_server.search_engine.base import SearchEngine
+from argilla_server.search_engine.base import SearchEngine, TextQuery
 from argilla_server.settings import settings
-from argilla_server.contexts import distribution
+from argilla_server.contexts import datasets, distribution, records, search
 
 JOB_RECORDS_YIELD_PER = 100
 
@@ -51,3 +55,42 @@ async def update_dataset_records_status_job(dataset_id: UUID) -> None:
     async with SearchEngine.get_by_name(settings.search_engine) as search_engine:
         for record_id in record_ids:
             await distribution.update_record_status(search_engine, record_id)
+
+
+@job(DEFAULT_QUEUE, timeout=JOB_TIMEOUT_DISABLED, retry=Retry(max=3))
+async def delete_dataset_records_by_query_job(
+    dataset_id: UUID, query: Optional[dict] = None, filters: Optional[dict] = None
+) -> int:
+    """This Job deletes all the records in the dataset matching the given text query and filters."""
+
+    async with AsyncSessionLocal() as db:
+        dataset = await Dataset.get_or_raise(db, dataset_id, options=[selectinload(Dataset.fields)])
+
+        text_query = TextQuery.model_validate(query) if query else None
+        engine_filter = search.to_search_engine_filter(Filters.model_validate(filters), user=None) if filters else None
+
+        async with SearchEngine.get_by_name(settings.search_engine) as search_engine:
+            return await records.delete_records_by_query(
+                db,
+                search_engine,
+                dataset,
+                query=text_query,
+                filter=engine_filter,
+                on_progress=update_current_job_progress,
+            )
+
+
+@job(DEFAULT_QUEUE, timeout=JOB_TIMEOUT_DISABLED, retry=Retry(max=3))
+async def delete_dataset_job(dataset_id: UUID) -> None:
+    """This Job deletes the dataset content in chunks, the dataset itself and its search engine index."""
+
+    async with AsyncSessionLocal() as db:
+        dataset = await Dataset.get_or_raise(db, dataset_id)
+
+        async with SearchEngine.get_by_name(settings.search_engine) as search_engine:
+            await datasets.delete_dataset_in_chunks(
+                db,
+                search_engine,
+                dataset,
+                on_progress=update_current_job_progress,
+            )
@@ -20,10 +20,10 @@ from sqlalchemy.orm import selectinload
 
 from argilla_server.models import Dataset
 from argilla_server.settings import settings
-from argilla_server.contexts.hub import HubDataset, HubDatasetExporter
-from argilla_server.database import AsyncSessionLocal
+from argilla_server.database import AsyncReadSessionLocal, AsyncSessionLocal
 from argilla_server.search_engine.base import SearchEngine
 from argilla_server.api.schemas.v1.datasets import HubDatasetMapping
+from argilla_server.jobs.progress import update_current_job_progress
 from argilla_server.jobs.queues import DEFAULT_QUEUE, JOB_TIMEOUT_DISABLED
 
 HUB_DATASET_TAKE_ROWS = 10_000
@@ -31,6 +31,9 @@ HUB_DATASET_TAKE_ROWS = 10_000
 
 @job(DEFAULT_QUEUE, timeout=JOB_TIMEOUT_DISABLED, retry=Retry(max=3))
 async def import_dataset_from_hub_job(name: str, subset: str, split: str, dataset_id: UUID, mapping: dict) -> None:
+    # NOTE: Hub dependencies (datasets, pyarrow, PIL, etc.) are heavy, so they are only imported when running jobs.
+    from argilla_server.contexts.hub import HubDataset
+
     async with AsyncSessionLocal() as db:
         dataset = await Dataset.get_or_raise(
             db,
@@ -48,7 +51,7 @@ async def import_dataset_from_hub_job(name: str, subset: str, split: str, datase
             await (
                 HubDataset(name, subset, split, parsed_mapping)
                 .take(HUB_DATASET_TAKE_ROWS)
-                .import_to(db, search_engine, dataset)
+                .import_to(db, search_engine, dataset, on_progress=update_current_job_progress)
             )
 
 
@@ -56,7 +59,9 @@ async def import_dataset_from_hub_job(name: str, subset: str, split: str, datase
 async def export_dataset_to_hub_job(
     name: str, subset: str, split: str, private: bool, token: str, dataset_id: UUID
 ) -> None:
-    async with AsyncSessionLocal() as db:
+    from argilla_server.contexts.hub import HubDatasetExporter
+
+    async with AsyncReadSessionLocal() as db:
         dataset = await Dataset.get_or_raise(
             db,
             dataset_id,
@@ -0,0 +1,34 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from typing import Optional
+
+from rq import get_current_job
+from rq.job import Job
+
+JOB_PROGRESS_META_KEY = "progress"
+
+
+def update_current_job_progress(processed: int, total: Optional[int]) -> None:
+    """Stores the progress of the job being executed (if any) so it can be consulted using the jobs endpoint."""
+    job = get_current_job()
+    if job is None:
+        return
+
+    job.meta[JOB_PROGRESS_META_KEY] = {"processed": processed, "total": total}
+    job.save_meta()
+
+
+def get_job_progress(job: Job) -> Optional[dict]:
+    return job.meta.get(JOB_PROGRESS_META_KEY)
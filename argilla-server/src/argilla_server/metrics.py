@@ -0,0 +1,287 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import time
+import asyncio
+import functools
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
+
+from prometheus_client import REGISTRY, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI, Request, Response
+    from rq import Queue
+    from sqlalchemy.ext.asyncio import AsyncEngine
+
+SPAN_DB = "db"
+SPAN_SEARCH = "search"
+SPAN_VALIDATION = "validation"
+SPAN_SERIALIZATION = "serialization"
+SPAN_WEBHOOKS = "webhooks"
+SPAN_POLICIES = "policies"
+
+SERVER_TIMING_TOTAL = "total"
+
+HTTP_REQUEST_DURATION = Histogram(
+    "argilla_http_request_duration_seconds",
+    "Duration of HTTP requests in seconds",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DATABASE_QUERIES = Histogram(
+    "argilla_http_request_database_queries",
+    "Number of database queries executed by HTTP requests",
+    ["route"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, 200, 500),
+)
+HTTP_REQUEST_SPAN_DURATION = Histogram(
+    "argilla_http_request_span_duration_seconds",
+    "Time spent by HTTP requests on every span (database, search engine, etc.) in seconds",
+    ["span"],
+)
+SEARCH_ENGINE_REQUEST_DURATION = Histogram(
+    "argilla_search_engine_request_duration_seconds",
+    "Duration of requests sent to the search engine in seconds",
+    ["operation"],
+)
+
+
+@dataclass
+class RequestTiming:
+    endpoint: Optional[str] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    spans: Dict[str, float] = field(default_factory=dict)
+    queries: int = 0
+    endpoint_started_at: Optional[float] = None
+    endpoint_finished_at: Optional[float] = None
+    spans_before_endpoint: float = 0.0
+
+    def add(self, name: str, duration: float) -> None:
+        self.spans[name] = self.spans.get(name, 0.0) + duration
+
+    def finish(self) -> float:
+        finished_at = time.perf_counter()
+
+        # NOTE: Time before the endpoint runs is spent parsing and validating the request and solving dependencies,
+        # and time after it finishes is spent serialising the response. Dependencies can query the database (e.g. to
+        # authenticate the user), so the time already recorded by other spans is not counted as validation.
+        if self.endpoint_started_at is not None:
+            self.add(SPAN_VALIDATION, self.endpoint_started_at - self.started_at - self.spans_before_endpoint)
+        if self.endpoint_finished_at is not None:
+            self.add(SPAN_SERIALIZATION, finished_at - self.endpoint_finished_at)
+
+        return finished_at - self.started_at
+
+
+_request_timing: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def start_request_timing(endpoint: Optional[str] = None) -> RequestTiming:
+    request_timing = RequestTiming(endpoint=endpoint)
+    _request_timing.set(request_timing)
+
+    return request_timing
+
+
+def current_endpoint() -> Optional[str]:
+    request_timing = _request_timing.get()
+    if request_timing is not None:
+        return request_timing.endpoint
+
+
+def record_span(name: str, duration: float) -> None:
+    request_timing = _request_timing.get()
+    if request_timing is not None:
+        request_timing.add(name, duration)
+
+
+def record_query(duration: float) -> None:
+    request_timing = _request_timing.get()
+    if request_timing is not None:
+        request_timing.add(SPAN_DB, duration)
+        request_timing.queries += 1
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_span(name, time.perf_counter() - started_at)
+
+
+def timed_search_engine_request(func: Callable) -> Callable:
+    """Decorates search engine async methods sending requests so they are recorded in the search span."""
+
+    operation = func.__name__.strip("_").removesuffix("_request")
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        started_at = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - started_at
+            record_span(SPAN_SEARCH, duration)
+            SEARCH_ENGINE_REQUEST_DURATION.labels(operation=operation).observe(duration)
+
+    return wrapper
+
+
+def instrument_endpoints(app: "FastAPI") -> None:
+    """Wraps every API route endpoint to know when it starts and finishes running for the current request."""
+    from fastapi.routing import APIRoute
+
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            route.dependant.call = _timed_endpoint(route.dependant.call)
+
+
+def _timed_endpoint(endpoint: Callable) -> Callable:
+    def start() -> None:
+        request_timing = _request_timing.get()
+        if request_timing is not None:
+            request_timing.endpoint_started_at = time.perf_counter()
+            request_timing.spans_before_endpoint = sum(request_timing.spans.values())
+
+    def finish() -> None:
+        request_timing = _request_timing.get()
+        if request_timing is not None:
+            request_timing.endpoint_finished_at = time.perf_counter()
+
+    # NOTE: FastAPI checks if the endpoint is a coroutine to decide if it should run it in a thread pool.
+    if asyncio.iscoroutinefunction(endpoint):
+
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            start()
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                finish()
+
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        start()
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            finish()
+
+    return wrapper
+
+
+def server_timing_header(request_timing: RequestTiming, total: float) -> str:
+    entries = [f"{SERVER_TIMING_TOTAL};dur={total * 1000}"]
+    for name, duration in request_timing.spans.items():
+        entries.append(f"{name};dur={duration * 1000}")
+
+    return ", ".join(entries)
+
+
+def server_timing_total(server_timing: str) -> str:
+    """Returns the total duration in milliseconds from a `Server-Timing` header value."""
+    return server_timing.split(",", 1)[0].strip().removeprefix(f"{SERVER_TIMING_TOTAL};dur=")
+
+
+def observe_request(request: "Request", response: "Response", request_timing: RequestTiming, total: float) -> None:
+    from fastapi.routing import APIRoute
+
+    # NOTE: Route templates are used instead of request paths to keep the cardinality of labels bounded.
+    route = request.scope.get("route")
+    route_path = f"{request.scope.get('root_path', '')}{route.path}" if isinstance(route, APIRoute) else "other"
+
+    HTTP_REQUEST_DURATION.labels(
+        method=request.method,
+        route=route_path,
+        status=str(response.status_code),
+    ).observe(total)
+
+    HTTP_REQUEST_DATABASE_QUERIES.labels(route=route_path).observe(request_timing.queries)
+
+    for name, duration in request_timing.spans.items():
+        HTTP_REQUEST_SPAN_DURATION.labels(span=name).observe(duration)
+
+
+class DatabasePoolCollector(Collector):
+    def __init__(self, engine: "AsyncEngine"):
+        self.engine = engine
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        pool = self.engine.sync_engine.pool
+
+        # NOTE: Only pools keeping a queue of connections (like the ones used by PostgreSQL) expose these stats.
+        if not all(hasattr(pool, attribute) for attribute in ["size", "checkedin", "checkedout", "overflow"]):
+            return
+
+        pool_size = GaugeMetricFamily("argilla_database_pool_size", "Size of the database connection pool")
+        pool_size.add_metric([], pool.size())
+        yield pool_size
+
+        pool_connections = GaugeMetricFamily(
+            "argilla_database_pool_connections",
+            "Number of database connections in the pool by state",
+            labels=["state"],
+        )
+        pool_connections.add_metric(["checked_in"], pool.checkedin())
+        pool_connections.add_metric(["checked_out"], pool.checkedout())
+        pool_connections.add_metric(["overflow"], pool.overflow())
+        yield pool_connections
+
+
+class JobsQueuesCollector(Collector):
+    def __init__(self, queues: List["Queue"]):
+        self.queues = queues
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        queue_size = GaugeMetricFamily(
+            "argilla_jobs_queue_size",
+            "Number of jobs waiting in the background jobs queues",
+            labels=["queue"],
+        )
+        queue_failed = GaugeMetricFamily(
+            "argilla_jobs_queue_failed",
+            "Number of failed jobs in the background jobs queues",
+            labels=["queue"],
+        )
+
+        for queue in self.queues:
+            try:
+                queue_size.add_metric([queue.name], queue.count)
+                queue_failed.add_metric([queue.name], queue.failed_job_registry.count)
+            except Exception:
+                # NOTE: Metrics are still exposed when Redis is not available.
+                continue
+
+        yield queue_size
+        yield queue_failed
+
+
+_registered_collectors: Dict[str, Collector] = {}
+
+
+def register_collector(name: str, collector: Collector) -> None:
+    if name in _registered_collectors:
+        REGISTRY.unregister(_registered_collectors[name])
+
+    REGISTRY.register(collector)
+    _registered_collectors[name] = collector
@@ -22,14 +22,17 @@ from sqlalchemy import Enum as SAEnum, PrimaryKeyConstraint
 from sqlalchemy import (
     JSON,
     ForeignKey,
+    Index,
     String,
     Text,
     UniqueConstraint,
     sql,
 )
 from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.base import ExecutableOption
 
 from argilla_server.api.schemas.v1.questions import QuestionSettings
 from argilla_server.enums import (
@@ -45,6 +48,7 @@ from argilla_server.enums import (
 )
 from argilla_server.models.base import DatabaseModel
 from argilla_server.models.metadata_properties import MetadataPropertySettings
+from argilla_server.errors.future import NotFoundError
 from argilla_server.models.mixins import inserted_at_current_value
 from pydantic import TypeAdapter
 
@@ -64,6 +68,9 @@ __all__ = [
     "VectorSettings",
     "Webhook",
     "DatasetUser",
+    "RecordLease",
+    "DeletedRecord",
+    "DatasetMedia",
 ]
 
 _USER_API_KEY_BYTES_LENGTH = 80
@@ -128,6 +135,18 @@ class Response(DatabaseModel):
     __table_args__ = (UniqueConstraint("record_id", "user_id", name="response_record_id_user_id_uq"),)
     __upsertable_columns__ = {"values", "status"}
 
+    @classmethod
+    async def get_not_deleting_or_raise(
+        cls, db: AsyncSession, id: UUID, options: List[ExecutableOption] = []
+    ) -> "Response":
+        """Same as `get_or_raise` but responses of datasets being deleted are not found."""
+        response = await cls.get_or_raise(db, id, options)
+        record = await response.awaitable_attrs.record
+        if (await record.awaitable_attrs.dataset).is_deleting:
+            raise NotFoundError(f"{cls.__name__} with id `{id}` not found")
+
+        return response
+
     @property
     def is_submitted(self) -> bool:
         return self.status == ResponseStatus.submitted
@@ -158,6 +177,18 @@ class Suggestion(DatabaseModel):
     __table_args__ = (UniqueConstraint("record_id", "question_id", name="suggestion_record_id_question_id_uq"),)
     __upsertable_columns__ = {"value", "score", "agent", "type"}
 
+    @classmethod
+    async def get_not_deleting_or_raise(
+        cls, db: AsyncSession, id: UUID, options: List[ExecutableOption] = []
+    ) -> "Suggestion":
+        """Same as `get_or_raise` but suggestions of datasets being deleted are not found."""
+        suggestion = await cls.get_or_raise(db, id, options)
+        record = await suggestion.awaitable_attrs.record
+        if (await record.awaitable_attrs.dataset).is_deleting:
+            raise NotFoundError(f"{cls.__name__} with id `{id}` not found")
+
+        return suggestion
+
     def __repr__(self) -> str:
         return (
             f"Suggestion(id={self.id}, score={self.score}, agent={self.agent}, type={self.type}, "
@@ -216,6 +247,10 @@ class VectorSettings(DatabaseModel):
 RecordStatusEnum = SAEnum(RecordStatus, name="record_status_enum")
 
 
+def _updated_at_current_value(context: DefaultExecutionContext) -> datetime:
+    return context.get_current_parameters(isolate_multiinsert_groups=False)["updated_at"]
+
+
 class Record(DatabaseModel):
     __tablename__ = "records"
 
@@ -226,6 +261,11 @@ class Record(DatabaseModel):
     )
     external_id: Mapped[Optional[str]] = mapped_column(index=True)
     dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), index=True)
+    inserted_at: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(default=inserted_at_current_value, onupdate=datetime.utcnow)
+    last_activity_at: Mapped[datetime] = mapped_column(
+        default=inserted_at_current_value, onupdate=_updated_at_current_value
+    )
 
     dataset: Mapped["Dataset"] = relationship(back_populates="records")
     responses: Mapped[List["Response"]] = relationship(
@@ -253,7 +293,22 @@ class Record(DatabaseModel):
         order_by=Vector.inserted_at.asc(),
     )
 
-    __table_args__ = (UniqueConstraint("external_id", "dataset_id", name="record_external_id_dataset_id_uq"),)
+    __table_args__ = (
+        UniqueConstraint("external_id", "dataset_id", name="record_external_id_dataset_id_uq"),
+        Index("ix_records_dataset_id_status_inserted_at", "dataset_id", "status", "inserted_at"),
+        Index("ix_records_dataset_id_last_activity_at_id", "dataset_id", "last_activity_at", "id"),
+    )
+
+    @classmethod
+    async def get_not_deleting_or_raise(
+        cls, db: AsyncSession, id: UUID, options: List[ExecutableOption] = []
+    ) -> "Record":
+        """Same as `get_or_raise` but records of datasets being deleted are not found."""
+        record = await cls.get_or_raise(db, id, options)
+        if (await record.awaitable_attrs.dataset).is_deleting:
+            raise NotFoundError(f"{cls.__name__} with id `{id}` not found")
+
+        return record
 
     def is_completed(self) -> bool:
         return self.status == RecordStatus.completed
@@ -270,6 +325,74 @@ class Record(DatabaseModel):
         )
 
 
+class RecordLease(DatabaseModel):
+    __tablename__ = "records_leases"
+
+    expires_at: Mapped[datetime] = mapped_column(index=True)
+    record_id: Mapped[UUID] = mapped_column(ForeignKey("records.id", ondelete="CASCADE"), index=True)
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), index=True)
+    dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), index=True)
+
+    record: Mapped["Record"] = relationship()
+    user: Mapped["User"] = relationship()
+
+    __table_args__ = (UniqueConstraint("record_id", "user_id", name="record_lease_record_id_user_id_uq"),)
+    __upsertable_columns__ = {"expires_at"}
+
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
+        return self.expires_at <= (now or datetime.utcnow())
+
+    def __repr__(self):
+        return (
+            f"RecordLease(id={str(self.id)!r}, record_id={str(self.record_id)!r}, user_id={str(self.user_id)!r}, "
+            f"dataset_id={str(self.dataset_id)!r}, expires_at={str(self.expires_at)!r}, "
+            f"inserted_at={str(self.inserted_at)!r}, updated_at={str(self.updated_at)!r})"
+        )
+
+
+class DeletedRecord(DatabaseModel):
+    __tablename__ = "deleted_records"
+
+    record_id: Mapped[UUID] = mapped_column(index=True)
+    external_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), index=True)
+
+    __table_args__ = (
+        Index("ix_deleted_records_dataset_id_inserted_at_record_id", "dataset_id", "inserted_at", "record_id"),
+    )
+
+    @property
+    def deleted_at(self) -> datetime:
+        return self.inserted_at
+
+    def __repr__(self):
+        return (
+            f"DeletedRecord(id={str(self.id)!r}, record_id={str(self.record_id)!r}, "
+            f"external_id={self.external_id!r}, dataset_id={str(self.dataset_id)!r}, "
+            f"inserted_at={str(self.inserted_at)!r}, updated_at={str(self.updated_at)!r})"
+        )
+
+
+class DatasetMedia(DatabaseModel):
+    __tablename__ = "datasets_media"
+    __upsertable_columns__ = {}
+
+    id = None  # This is a workaround to avoid the id column in the table
+
+    dataset_id: Mapped[UUID] = mapped_column(ForeignKey("datasets.id", ondelete="CASCADE"), index=True)
+    hash: Mapped[str] = mapped_column(String, index=True)
+
+    dataset: Mapped["Dataset"] = relationship()
+
+    __table_args__ = (PrimaryKeyConstraint("dataset_id", "hash"),)
+
+    def __repr__(self):
+        return (
+            f"DatasetMedia(dataset_id={str(self.dataset_id)!r}, hash={self.hash!r}, "
+            f"inserted_at={str(self.inserted_at)!r}, updated_at={str(self.updated_at)!r})"
+        )
+
+
 class Question(DatabaseModel):
     __tablename__ = "questions"
 
@@ -385,10 +508,6 @@ class MetadataProperty(DatabaseModel):
 DatasetStatusEnum = SAEnum(DatasetStatus, name="dataset_status_enum")
 
 
-def _updated_at_current_value(context: DefaultExecutionContext) -> datetime:
-    return context.get_current_parameters(isolate_multiinsert_groups=False)["updated_at"]
-
-
 class DatasetUser(DatabaseModel):
     __tablename__ = "datasets_users"
     __upsertable_columns__ = {}
@@ -468,6 +587,17 @@ class Dataset(DatabaseModel):
 
     __table_args__ = (UniqueConstraint("name", "workspace_id", name="dataset_name_workspace_id_uq"),)
 
+    @classmethod
+    async def get_not_deleting_or_raise(
+        cls, db: AsyncSession, id: UUID, options: List[ExecutableOption] = []
+    ) -> "Dataset":
+        """Same as `get_or_raise` but datasets being deleted are not found, so they can't be read or written."""
+        dataset = await cls.get_or_raise(db, id, options)
+        if dataset.is_deleting:
+            raise NotFoundError(f"{cls.__name__} with id `{id}` not found")
+
+        return dataset
+
     @property
     def is_draft(self) -> bool:
         return self.status == DatasetStatus.draft
@@ -476,6 +606,10 @@ class Dataset(DatabaseModel):
     def is_ready(self) -> bool:
         return self.status == DatasetStatus.ready
 
+    @property
+    def is_deleting(self) -> bool:
+        return self.status == DatasetStatus.deleting
+
     @property
     def distribution_strategy(self) -> DatasetDistributionStrategy:
         return DatasetDistributionStrategy(self.distribution["strategy"])
@@ -150,9 +150,12 @@ class CRUDMixin:
         # On conflict, update the columns that are upsertable (defined in `Model.__upsertable_columns__`)
         columns_to_update = {column: insert_stmt.excluded[column] for column in cls.__upsertable_columns__}
 
-        # onupdate for `updated_at` is not working. We need to force a new value on update
+        # onupdate for `updated_at` and `last_activity_at` is not working. We need to force a new value on update
+        updated_at = datetime.utcnow()
         if hasattr(cls, "updated_at"):
-            columns_to_update["updated_at"] = datetime.utcnow()
+            columns_to_update["updated_at"] = updated_at
+        if hasattr(cls, "last_activity_at"):
+            columns_to_update["last_activity_at"] = updated_at
         upsert_stmt = (
             insert_stmt.on_conflict_do_update(index_elements=constraints, set_=columns_to_update)
             .returning(cls)
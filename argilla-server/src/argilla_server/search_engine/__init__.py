@@ -18,6 +18,7 @@ from ..settings import settings
 from .base import *  # noqa
 from .base import SearchEngine
 from .elasticsearch import ElasticSearchEngine
+from .embedded import EmbeddedSearchEngine
 from .opensearch import OpenSearchEngine
 
 
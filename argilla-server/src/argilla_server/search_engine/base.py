@@ -252,6 +252,15 @@ class SearchEngine(metaclass=ABCMeta):
     async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
         pass
 
+    @abstractmethod
+    async def delete_records_by_query(
+        self,
+        dataset: Dataset,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+    ) -> int:
+        pass
+
     @abstractmethod
     async def update_record_response(self, response: Response):
         pass
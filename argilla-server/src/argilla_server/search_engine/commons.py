@@ -324,6 +324,22 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
 
         await self._bulk_op_request(bulk_actions)
 
+    async def delete_records_by_query(
+        self,
+        dataset: Dataset,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+    ) -> int:
+        index_name = es_index_name_for_dataset(dataset)
+
+        bool_query: Dict[str, Any] = {"must": [self._build_text_query(dataset, text=query)]}
+        if filter:
+            bool_query["filter"] = self.build_elasticsearch_filter(filter)
+
+        response = await self._delete_by_query_request(index_name, query={"bool": bool_query})
+
+        return response.get("deleted", 0)
+
     async def update_record_response(self, response: Response) -> None:
         record = response.record
         index_name = es_index_name_for_dataset(record.dataset)
@@ -960,6 +976,11 @@ class BaseElasticAndOpenSearchEngine(SearchEngine):
         """Executes request for search documents on a index"""
         pass
 
+    @abstractmethod
+    async def _delete_by_query_request(self, index: str, query: dict) -> dict:
+        """Executes request for delete documents matching a query on a index"""
+        pass
+
     @abstractmethod
     async def _index_exists_request(self, index_name: str) -> bool:
         """Executes request for check if index exists"""
@@ -19,6 +19,7 @@ from uuid import UUID
 from elasticsearch8 import AsyncElasticsearch, helpers
 
 from argilla_server.constants import SEARCH_ENGINE_ELASTICSEARCH
+from argilla_server.metrics import timed_search_engine_request
 from argilla_server.models import VectorSettings
 from argilla_server.search_engine import SearchEngine
 from argilla_server.search_engine.commons import (
@@ -65,9 +66,11 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
     async def close(self):
         await self.client.close()
 
+    @timed_search_engine_request
     async def ping(self) -> bool:
         return await self.client.ping()
 
+    @timed_search_engine_request
     async def info(self) -> dict:
         return await self.client.info()
 
@@ -84,6 +87,7 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             }
         }
 
+    @timed_search_engine_request
     async def _request_similarity_search(
         self,
         index: str,
@@ -116,19 +120,24 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             knn_query["filter"] = bool_filter_query
         return await self.client.search(index=index, knn=knn_query, _source=False, track_total_hits=True, size=k)
 
+    @timed_search_engine_request
     async def _create_index_request(self, index_name: str, mappings: dict, settings: dict) -> None:
         await self.client.indices.create(index=index_name, settings=settings, mappings=mappings)
 
+    @timed_search_engine_request
     async def _delete_index_request(self, index_name: str):
         await self.client.indices.delete(index=index_name, ignore=[404], ignore_unavailable=True)
 
+    @timed_search_engine_request
     async def _update_document_request(self, index_name: str, id: str, body: dict):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-refresh.html
         await self.client.update(index=index_name, id=id, **body, refresh=True)
 
+    @timed_search_engine_request
     async def put_index_mapping_request(self, index: str, mappings: dict):
         await self.client.indices.put_mapping(index=index, properties=mappings)
 
+    @timed_search_engine_request
     async def _index_search_request(
         self,
         index: str,
@@ -149,9 +158,23 @@ class ElasticSearchEngine(BaseElasticAndOpenSearchEngine):
             track_total_hits=True,
         )
 
+    @timed_search_engine_request
+    async def _delete_by_query_request(self, index: str, query: dict) -> dict:
+        # https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-delete-by-query.html#docs-delete-by-query-slice
+        return await self.client.delete_by_query(
+            index=index,
+            query=query,
+            slices="auto",
+            conflicts="proceed",
+            refresh=True,
+            wait_for_completion=True,
+        )
+
+    @timed_search_engine_request
     async def _index_exists_request(self, index_name: str) -> bool:
         return await self.client.indices.exists(index=index_name)
 
+    @timed_search_engine_request
     async def _bulk_op_request(self, actions: List[Dict[str, Any]]):
         # https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-refresh.html
         _, errors = await helpers.async_bulk(
@@ -0,0 +1,1125 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import re
+import json
+import asyncio
+import hashlib
+import sqlite3
+import dataclasses
+import threading
+
+from collections import OrderedDict
+from contextlib import closing
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from uuid import UUID
+
+from argilla_server.constants import SEARCH_ENGINE_EMBEDDED
+from argilla_server.enums import MetadataPropertyType, ResponseStatusFilter, SimilarityOrder, SortOrder
+from argilla_server.metrics import timed_search_engine_request
+from argilla_server.models import Dataset, Field, MetadataProperty, Record, Response, Suggestion, User, VectorSettings
+from argilla_server.search_engine.base import (
+    AndFilter,
+    Filter,
+    FilterScope,
+    FloatMetadataMetrics,
+    IntegerMetadataMetrics,
+    MetadataFilterScope,
+    MetadataMetrics,
+    Order,
+    RangeFilter,
+    RecordFilterScope,
+    ResponseFilterScope,
+    SearchEngine,
+    SearchResponseItem,
+    SearchResponses,
+    SuggestionFilterScope,
+    TermsFilter,
+    TermsMetrics,
+    TextQuery,
+)
+from argilla_server.settings import settings
+
+if TYPE_CHECKING:
+    import numpy as np
+
+INDEX_FILE_EXTENSION = ".db"
+INDEX_FILE_SUFFIXES = ["", "-wal", "-shm", "-journal"]
+
+RECORDS_TABLE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS records (
+        rowid INTEGER PRIMARY KEY,
+        id TEXT NOT NULL UNIQUE,
+        status TEXT,
+        inserted_at TEXT,
+        updated_at TEXT,
+        document TEXT NOT NULL
+    )
+"""
+VECTORS_TABLE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS vectors (
+        vector_settings_id TEXT NOT NULL,
+        record_rowid INTEGER NOT NULL,
+        value BLOB NOT NULL,
+        PRIMARY KEY (vector_settings_id, record_rowid)
+    )
+"""
+VECTORS_VERSION_TABLE_SCHEMA = "CREATE TABLE IF NOT EXISTS vectors_version (version INTEGER NOT NULL)"
+
+# NOTE: FTS5 tables need at least one column, so this one is used for datasets without fields.
+EMPTY_FIELDS_COLUMN = "_"
+
+MATCH_ALL = "1"
+MATCH_NONE = "0"
+MATCH_ALL_SCORE = 1.0
+
+# NOTE: Tokens of the `simple_query_string` syntax supported by Elasticsearch and OpenSearch. See
+# https://www.elastic.co/guide/en/elasticsearch/reference/current/query-dsl-simple-query-string-query.html#simple-query-string-syntax
+QUERY_TOKEN_REGEX = re.compile(
+    r'\s*(?:(?P<phrase>"[^"]*"?)|(?P<operator>[()|+])|(?P<term>-?[^\s()|+"-][^\s()|+"]*)|(?P<not>-))'
+)
+QUERY_TERM_SUFFIX_REGEX = re.compile(r"~\d*$")
+QUERY_WORD_REGEX = re.compile(r"\w")
+
+RANDOM_SCORE_FUNCTION = "argilla_random_score"
+
+
+def embedded_index_path(path: str, dataset: Dataset) -> str:
+    return os.path.join(path, f"{dataset.id}{INDEX_FILE_EXTENSION}")
+
+
+def _quote_identifier(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _json_path(*keys: str) -> str:
+    return "$" + "".join(f'."{key}"' for key in keys)
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return _datetime_to_text(value)
+
+    return str(value)
+
+
+def _json_dumps(value: Any) -> str:
+    return json.dumps(value, default=_json_default)
+
+
+def _datetime_to_text(value: Optional[datetime]) -> Optional[str]:
+    if value is None:
+        return None
+
+    # NOTE: Datetimes are always stored with microseconds so they can be compared and sorted as text.
+    return value.isoformat(timespec="microseconds")
+
+
+def _random_score(seed: str, rowid: int) -> float:
+    digest = hashlib.blake2b(f"{seed}:{rowid}".encode("utf-8"), digest_size=8).digest()
+
+    return int.from_bytes(digest, "big") / 2**64
+
+
+class _VectorsCache:
+    """Keeps normalized vector matrices in memory so similarity searches don't load them from disk every time.
+
+    Entries are invalidated using a version number stored in the index, which is increased every time vectors change.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[int, np.ndarray, np.ndarray]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str], version: int) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    def put(self, key: Tuple[str, str], version: int, rowids: "np.ndarray", matrix: "np.ndarray") -> None:
+        with self._lock:
+            self._entries[key] = (version, rowids, matrix)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def evict(self, path: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                del self._entries[key]
+
+
+_vectors_cache = _VectorsCache(max_size=8)
+
+
+@SearchEngine.register(engine_name=SEARCH_ENGINE_EMBEDDED)
+@dataclasses.dataclass
+class EmbeddedSearchEngine(SearchEngine):
+    """
+    Search engine running in the server process, without any external service.
+
+    Every dataset is indexed in its own SQLite file. Records are stored as JSON documents used by term and range
+    filters, sorting and metrics, record fields are indexed in a FTS5 table for text queries, and vectors are stored
+    as float32 blobs used to compute exact cosine similarity searches with NumPy.
+
+    It's meant for single-node deployments where running Elasticsearch or OpenSearch is not worth it.
+    """
+
+    path: str
+    timeout: float = 30.0
+
+    # See https://www.elastic.co/guide/en/elasticsearch/reference/current/search-settings.html#search-settings-max-buckets
+    max_terms_size: int = 2**14
+
+    def __post_init__(self):
+        os.makedirs(self.path, exist_ok=True)
+
+    @classmethod
+    async def new_instance(cls) -> "EmbeddedSearchEngine":
+        return cls(path=settings.search_engine_embedded_path)
+
+    async def close(self):
+        pass
+
+    async def ping(self) -> bool:
+        return os.path.isdir(self.path) and os.access(self.path, os.W_OK)
+
+    async def info(self) -> dict:
+        return {
+            "name": SEARCH_ENGINE_EMBEDDED,
+            "version": {"number": sqlite3.sqlite_version, "distribution": SEARCH_ENGINE_EMBEDDED},
+        }
+
+    @timed_search_engine_request
+    async def create_index(self, dataset: Dataset):
+        index_path = embedded_index_path(self.path, dataset)
+        fields = [field.name for field in dataset.fields]
+
+        def create_index(connection: sqlite3.Connection) -> None:
+            columns = ", ".join(_quote_identifier(field) for field in fields or [EMPTY_FIELDS_COLUMN])
+
+            connection.execute(RECORDS_TABLE_SCHEMA)
+            connection.execute(VECTORS_TABLE_SCHEMA)
+            connection.execute(VECTORS_VERSION_TABLE_SCHEMA)
+            connection.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5({columns}, tokenize='unicode61')"
+            )
+            if connection.execute("SELECT COUNT(*) FROM vectors_version").fetchone()[0] == 0:
+                connection.execute("INSERT INTO vectors_version (version) VALUES (0)")
+
+        await asyncio.to_thread(self._execute, index_path, create_index, create=True)
+
+    @timed_search_engine_request
+    async def delete_index(self, dataset: Dataset):
+        index_path = embedded_index_path(self.path, dataset)
+
+        def delete_index() -> None:
+            for suffix in INDEX_FILE_SUFFIXES:
+                try:
+                    os.remove(f"{index_path}{suffix}")
+                except FileNotFoundError:
+                    pass
+
+            _vectors_cache.evict(index_path)
+
+        await asyncio.to_thread(delete_index)
+
+    async def configure_metadata_property(self, dataset: Dataset, metadata_property: MetadataProperty):
+        # NOTE: Metadata is stored in schemaless JSON documents, so there is nothing to configure.
+        pass
+
+    @timed_search_engine_request
+    async def index_records(self, dataset: Dataset, records: Iterable[Record]):
+        index_path = embedded_index_path(self.path, dataset)
+        documents = [self._map_record_to_document(record) for record in records]
+
+        def index_records(connection: sqlite3.Connection) -> None:
+            columns = self._fields_columns(connection)
+            vectors_changed = False
+
+            for document, fields, vectors in documents:
+                (rowid,) = connection.execute(
+                    """
+                    INSERT INTO records (id, status, inserted_at, updated_at, document) VALUES (?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET
+                        status = excluded.status,
+                        inserted_at = excluded.inserted_at,
+                        updated_at = excluded.updated_at,
+                        document = excluded.document
+                    RETURNING rowid
+                    """,
+                    (
+                        document["id"],
+                        document["status"],
+                        document["inserted_at"],
+                        document["updated_at"],
+                        _json_dumps(document),
+                    ),
+                ).fetchone()
+
+                fields = {name: text for name, text in fields.items() if name in columns}
+                connection.execute("DELETE FROM records_fts WHERE rowid = ?", (rowid,))
+                connection.execute(
+                    f"INSERT INTO records_fts (rowid{''.join(f', {_quote_identifier(name)}' for name in fields)}) "
+                    f"VALUES (?{', ?' * len(fields)})",
+                    (rowid, *fields.values()),
+                )
+
+                deleted_vectors = connection.execute("DELETE FROM vectors WHERE record_rowid = ?", (rowid,))
+                connection.executemany(
+                    "INSERT INTO vectors (vector_settings_id, record_rowid, value) VALUES (?, ?, ?)",
+                    [(vector_settings_id, rowid, value) for vector_settings_id, value in vectors.items()],
+                )
+                vectors_changed = vectors_changed or deleted_vectors.rowcount > 0 or bool(vectors)
+
+            if vectors_changed:
+                self._increase_vectors_version(connection)
+
+        await asyncio.to_thread(self._execute, index_path, index_records)
+
+    @timed_search_engine_request
+    async def partial_record_update(self, record: Record, **update):
+        index_path = embedded_index_path(self.path, record.dataset)
+        record_id = str(record.id)
+
+        def partial_record_update(document: dict) -> dict:
+            document.update(json.loads(_json_dumps(update)))
+            return document
+
+        await asyncio.to_thread(self._execute, index_path, self._update_document, record_id, partial_record_update)
+
+    @timed_search_engine_request
+    async def delete_records(self, dataset: Dataset, records: Iterable[Record]):
+        index_path = embedded_index_path(self.path, dataset)
+        records_ids = [str(record.id) for record in records]
+
+        def delete_records(connection: sqlite3.Connection) -> None:
+            rowids = [
+                rowid
+                for (rowid,) in connection.execute(
+                    f"SELECT rowid FROM records WHERE id IN ({', '.join('?' * len(records_ids))})", records_ids
+                )
+            ]
+            self._delete_rowids(connection, rowids)
+
+        if records_ids:
+            await asyncio.to_thread(self._execute, index_path, delete_records)
+
+    @timed_search_engine_request
+    async def delete_records_by_query(
+        self,
+        dataset: Dataset,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+    ) -> int:
+        index_path = embedded_index_path(self.path, dataset)
+        where, params = self._build_where(dataset, query, filter)
+
+        def delete_records_by_query(connection: sqlite3.Connection) -> int:
+            rowids = [rowid for (rowid,) in connection.execute(f"SELECT rowid FROM records WHERE {where}", params)]
+            self._delete_rowids(connection, rowids)
+
+            return len(rowids)
+
+        return await asyncio.to_thread(self._execute, index_path, delete_records_by_query)
+
+    @timed_search_engine_request
+    async def update_record_response(self, response: Response) -> None:
+        index_path = embedded_index_path(self.path, response.record.dataset)
+        document_response = self._map_record_response_to_document(response)
+
+        def update_record_response(document: dict) -> dict:
+            responses = [item for item in document.get("responses", []) if item["id"] != document_response["id"]]
+            document["responses"] = [*responses, document_response]
+            return document
+
+        await asyncio.to_thread(
+            self._execute, index_path, self._update_document, str(response.record_id), update_record_response
+        )
+
+    @timed_search_engine_request
+    async def delete_record_response(self, response: Response) -> None:
+        index_path = embedded_index_path(self.path, response.record.dataset)
+        response_id = str(response.id)
+
+        def delete_record_response(document: dict) -> dict:
+            document["responses"] = [item for item in document.get("responses", []) if item["id"] != response_id]
+            return document
+
+        await asyncio.to_thread(
+            self._execute, index_path, self._update_document, str(response.record_id), delete_record_response
+        )
+
+    @timed_search_engine_request
+    async def update_record_suggestion(self, suggestion: Suggestion):
+        index_path = embedded_index_path(self.path, suggestion.record.dataset)
+        document_suggestions = self._map_record_suggestions_to_document([suggestion])
+
+        def update_record_suggestion(document: dict) -> dict:
+            document["suggestions"] = {**document.get("suggestions", {}), **document_suggestions}
+            return document
+
+        await asyncio.to_thread(
+            self._execute, index_path, self._update_document, str(suggestion.record_id), update_record_suggestion
+        )
+
+    @timed_search_engine_request
+    async def delete_record_suggestion(self, suggestion: Suggestion):
+        index_path = embedded_index_path(self.path, suggestion.record.dataset)
+        question_name = suggestion.question.name
+
+        def delete_record_suggestion(document: dict) -> dict:
+            document.get("suggestions", {}).pop(question_name, None)
+            return document
+
+        await asyncio.to_thread(
+            self._execute, index_path, self._update_document, str(suggestion.record_id), delete_record_suggestion
+        )
+
+    @timed_search_engine_request
+    async def get_dataset_progress(self, dataset: Dataset) -> dict:
+        if dataset.is_draft:
+            return {}
+
+        index_path = embedded_index_path(self.path, dataset)
+
+        def get_dataset_progress(connection: sqlite3.Connection) -> List[Tuple[str, int]]:
+            return connection.execute(
+                "SELECT status, COUNT(*) FROM records WHERE status IS NOT NULL GROUP BY status ORDER BY COUNT(*) DESC"
+            ).fetchall()
+
+        counts = await asyncio.to_thread(self._execute, index_path, get_dataset_progress)
+
+        return {"total": sum(count for _, count in counts), **dict(counts)}
+
+    @timed_search_engine_request
+    async def get_dataset_user_progress(self, dataset: Dataset, user: User) -> dict:
+        if dataset.is_draft:
+            return {}
+
+        index_path = embedded_index_path(self.path, dataset)
+        user_id = str(user.id)
+
+        def get_dataset_user_progress(connection: sqlite3.Connection) -> List[Tuple[str, int]]:
+            return connection.execute(
+                """
+                SELECT json_extract(response.value, '$.status') AS response_status, COUNT(*)
+                FROM records, json_each(records.document, '$.responses') AS response
+                WHERE json_extract(response.value, '$.user_id') = ? AND response_status IS NOT NULL
+                GROUP BY response_status
+                ORDER BY COUNT(*) DESC
+                """,
+                (user_id,),
+            ).fetchall()
+
+        counts = await asyncio.to_thread(self._execute, index_path, get_dataset_user_progress)
+
+        return {"total": sum(count for _, count in counts), **dict(counts)}
+
+    @timed_search_engine_request
+    async def search(
+        self,
+        dataset: Dataset,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        sort: Optional[List[Order]] = None,
+        offset: int = 0,
+        limit: int = 100,
+        user_id: Optional[str] = None,
+    ) -> SearchResponses:
+        index_path = embedded_index_path(self.path, dataset)
+
+        text_query = self._text_query(dataset, query)
+        where, params = self._build_where(dataset, query, filter)
+        score, score_params = self._build_score(text_query)
+
+        order_by, order_by_params = [], []
+        for order in sort or []:
+            expression, expression_params = self._order_expression(order.scope)
+            direction = "DESC" if order.order == SortOrder.desc else "ASC"
+            # NOTE: Records without a value are always sorted last, like Elasticsearch does by default.
+            order_by.extend([f"({expression}) IS NULL", f"({expression}) {direction}"])
+            order_by_params.extend(expression_params * 2)
+
+        if not order_by:
+            if user_id:
+                # NOTE: When a `user_id` is provided it's used as seed to sort records in a "random" and different way
+                # for each user, but still deterministic for the same user.
+                order_by.append(f"score * {RANDOM_SCORE_FUNCTION}(?, records.rowid) DESC")
+                order_by_params.append(str(user_id))
+            else:
+                order_by.append("score DESC")
+
+        def search(connection: sqlite3.Connection) -> SearchResponses:
+            (total,) = connection.execute(f"SELECT COUNT(*) FROM records WHERE {where}", params).fetchone()
+
+            rows = connection.execute(
+                f"""
+                SELECT records.id, {score} AS score FROM records
+                WHERE {where}
+                ORDER BY {', '.join(order_by)}, records.rowid ASC
+                LIMIT ? OFFSET ?
+                """,
+                [*score_params, *params, *order_by_params, limit, offset],
+            ).fetchall()
+
+            return SearchResponses(
+                items=[SearchResponseItem(record_id=UUID(id), score=score) for id, score in rows],
+                total=total,
+            )
+
+        return await asyncio.to_thread(self._execute, index_path, search)
+
+    @timed_search_engine_request
+    async def similarity_search(
+        self,
+        dataset: Dataset,
+        vector_settings: VectorSettings,
+        value: Optional[List[float]] = None,
+        record: Optional[Record] = None,
+        query: Optional[Union[TextQuery, str]] = None,
+        filter: Optional[Filter] = None,
+        max_results: int = 100,
+        order: SimilarityOrder = SimilarityOrder.most_similar,
+        threshold: Optional[float] = None,
+    ) -> SearchResponses:
+        if bool(value) == bool(record):
+            raise ValueError("Must provide either vector value or record to compute the similarity search")
+
+        index_path = embedded_index_path(self.path, dataset)
+        vector_value = value
+        excluded_id = None
+
+        if not vector_value:
+            excluded_id = str(record.id)
+            vector_value = record.vector_value_by_vector_settings(vector_settings)
+
+        if not vector_value:
+            raise ValueError("Cannot find a vector value to apply with provided info")
+
+        where, params = self._build_where(dataset, query, filter) if query or filter else (None, [])
+        vector_settings_id = str(vector_settings.id)
+
+        def similarity_search(connection: sqlite3.Connection) -> SearchResponses:
+            import numpy as np
+
+            rowids, matrix = self._load_vectors(connection, index_path, vector_settings_id)
+            if len(rowids) == 0:
+                return SearchResponses(items=[], total=0)
+
+            query_vector = np.asarray(vector_value, dtype=np.float32)
+            query_vector = query_vector / (np.linalg.norm(query_vector) or 1.0)
+            if order == SimilarityOrder.least_similar:
+                query_vector = -query_vector
+
+            # NOTE: Scores are computed like Elasticsearch does for cosine similarity, so they are always positive.
+            scores = (1.0 + matrix @ query_vector) / 2.0
+
+            candidates = np.ones(len(rowids), dtype=bool)
+            if where is not None:
+                matching_rowids = [
+                    rowid for (rowid,) in connection.execute(f"SELECT rowid FROM records WHERE {where}", params)
+                ]
+                candidates &= np.isin(rowids, np.asarray(matching_rowids, dtype=np.int64))
+            if excluded_id is not None:
+                candidates &= rowids != self._rowid_for_id(connection, excluded_id)
+
+            candidates_positions = np.flatnonzero(candidates)
+            k = min(max_results, len(candidates_positions))
+            if k == 0:
+                return SearchResponses(items=[], total=0)
+
+            candidates_scores = scores[candidates_positions]
+            top_positions = candidates_positions[np.argpartition(-candidates_scores, k - 1)[:k]]
+            top_positions = sorted(top_positions, key=lambda position: (-scores[position], rowids[position]))
+
+            hits = [(int(rowids[position]), float(scores[position])) for position in top_positions]
+            ids = self._ids_for_rowids(connection, [rowid for rowid, _ in hits])
+
+            items = [SearchResponseItem(record_id=UUID(ids[rowid]), score=score) for rowid, score in hits]
+            if threshold is not None:
+                items = [item for item in items if item.score >= threshold]
+
+            return SearchResponses(items=items, total=len(hits))
+
+        return await asyncio.to_thread(self._execute, index_path, similarity_search)
+
+    @timed_search_engine_request
+    async def compute_metrics_for(self, metadata_property: MetadataProperty) -> MetadataMetrics:
+        index_path = embedded_index_path(self.path, metadata_property.dataset)
+        path = _json_path("metadata", metadata_property.name)
+
+        if metadata_property.type == MetadataPropertyType.terms:
+
+            def terms_metrics(connection: sqlite3.Connection) -> TermsMetrics:
+                counts = connection.execute(
+                    """
+                    SELECT CAST(value.value AS TEXT) AS term, COUNT(*) AS count
+                    FROM records, json_each(records.document, ?) AS value
+                    WHERE value.type NOT IN ('null', 'object', 'array')
+                    GROUP BY term
+                    ORDER BY count DESC, term ASC
+                    """,
+                    (path,),
+                ).fetchall()
+
+                return TermsMetrics(
+                    total=sum(count for _, count in counts),
+                    values=[
+                        TermsMetrics.TermCount(term=term, count=count) for term, count in counts[: self.max_terms_size]
+                    ],
+                )
+
+            return await asyncio.to_thread(self._execute, index_path, terms_metrics)
+
+        if metadata_property.type in [MetadataPropertyType.float, MetadataPropertyType.integer]:
+            metrics_class = (
+                IntegerMetadataMetrics
+                if metadata_property.type == MetadataPropertyType.integer
+                else FloatMetadataMetrics
+            )
+
+            def numeric_metrics(connection: sqlite3.Connection) -> Union[IntegerMetadataMetrics, FloatMetadataMetrics]:
+                min, max = connection.execute(
+                    """
+                    SELECT MIN(value.value), MAX(value.value)
+                    FROM records, json_each(records.document, ?) AS value
+                    WHERE value.type IN ('integer', 'real')
+                    """,
+                    (path,),
+                ).fetchone()
+
+                return metrics_class(min=min, max=max)
+
+            return await asyncio.to_thread(self._execute, index_path, numeric_metrics)
+
+    def _execute(self, index_path: str, func: Callable, *args: Any, create: bool = False) -> Any:
+        if not create and not os.path.exists(index_path):
+            raise ValueError(f"Index {index_path!r} does not exist")
+
+        with closing(sqlite3.connect(index_path, timeout=self.timeout)) as connection:
+            if create:
+                connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            connection.create_function(RANDOM_SCORE_FUNCTION, 2, _random_score, deterministic=True)
+
+            with connection:
+                return func(connection, *args)
+
+    def _update_document(self, connection: sqlite3.Connection, record_id: str, update: Callable[[dict], dict]) -> None:
+        row = connection.execute("SELECT document FROM records WHERE id = ?", (record_id,)).fetchone()
+        if row is None:
+            return
+
+        document = update(json.loads(row[0]))
+        connection.execute(
+            "UPDATE records SET status = ?, updated_at = ?, document = ? WHERE id = ?",
+            (document.get("status"), document.get("updated_at"), _json_dumps(document), record_id),
+        )
+
+    def _delete_rowids(self, connection: sqlite3.Connection, rowids: List[int]) -> None:
+        if not rowids:
+            return
+
+        rows = [(rowid,) for rowid in rowids]
+        connection.executemany("DELETE FROM records WHERE rowid = ?", rows)
+        connection.executemany("DELETE FROM records_fts WHERE rowid = ?", rows)
+
+        vectors = connection.executemany("DELETE FROM vectors WHERE record_rowid = ?", rows)
+        if vectors.rowcount > 0:
+            self._increase_vectors_version(connection)
+
+    @staticmethod
+    def _increase_vectors_version(connection: sqlite3.Connection) -> None:
+        connection.execute("UPDATE vectors_version SET version = version + 1")
+
+    @staticmethod
+    def _fields_columns(connection: sqlite3.Connection) -> List[str]:
+        return [column[1] for column in connection.execute("PRAGMA table_info(records_fts)").fetchall()]
+
+    @staticmethod
+    def _rowid_for_id(connection: sqlite3.Connection, record_id: str) -> Optional[int]:
+        row = connection.execute("SELECT rowid FROM records WHERE id = ?", (record_id,)).fetchone()
+
+        return row[0] if row else None
+
+    @staticmethod
+    def _ids_for_rowids(connection: sqlite3.Connection, rowids: List[int]) -> Dict[int, str]:
+        return dict(
+            connection.execute(
+                f"SELECT rowid, id FROM records WHERE rowid IN ({', '.join('?' * len(rowids))})", rowids
+            ).fetchall()
+        )
+
+    @staticmethod
+    def _load_vectors(
+        connection: sqlite3.Connection, index_path: str, vector_settings_id: str
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        import numpy as np
+
+        (version,) = connection.execute("SELECT version FROM vectors_version").fetchone()
+
+        cache_key = (index_path, vector_settings_id)
+        cached = _vectors_cache.get(cache_key, version)
+        if cached is not None:
+            return cached
+
+        rows = connection.execute(
+            "SELECT record_rowid, value FROM vectors WHERE vector_settings_id = ? ORDER BY record_rowid",
+            (vector_settings_id,),
+        ).fetchall()
+
+        rowids = np.asarray([rowid for rowid, _ in rows], dtype=np.int64)
+        if rows:
+            matrix = np.vstack([np.frombuffer(value, dtype=np.float32) for _, value in rows])
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            matrix = matrix / np.where(norms == 0, 1.0, norms)
+        else:
+            matrix = np.empty((0, 0), dtype=np.float32)
+
+        _vectors_cache.put(cache_key, version, rowids, matrix)
+
+        return rowids, matrix
+
+    @staticmethod
+    def _text_query(dataset: Dataset, query: Optional[Union[TextQuery, str]]) -> Optional[TextQuery]:
+        if query is None:
+            return None
+
+        if isinstance(query, str):
+            query = TextQuery(q=query)
+
+        if query.field and dataset.field_by_name(query.field) is None:
+            raise Exception(f"Field {query.field} not found in dataset {dataset.id}")
+
+        return query
+
+    def _build_where(
+        self, dataset: Dataset, query: Optional[Union[TextQuery, str]], filter: Optional[Filter]
+    ) -> Tuple[str, List[Any]]:
+        conditions, params = [], []
+
+        text_query = self._text_query(dataset, query)
+        if text_query is not None:
+            condition, condition_params = _SimpleQueryString(text_query).to_sql()
+            conditions.append(condition)
+            params.extend(condition_params)
+
+        if filter is not None:
+            condition, condition_params = self._filter_to_sql(filter)
+            conditions.append(condition)
+            params.extend(condition_params)
+
+        if not conditions:
+            return MATCH_ALL, []
+
+        return " AND ".join(f"({condition})" for condition in conditions), params
+
+    @staticmethod
+    def _build_score(text_query: Optional[TextQuery]) -> Tuple[str, List[Any]]:
+        match = _SimpleQueryString(text_query).score_match() if text_query else None
+        if match is None:
+            return str(MATCH_ALL_SCORE), []
+
+        # NOTE: FTS5 bm25 returns lower values for better matches, so it's negated to get Elasticsearch-like scores.
+        return (
+            f"""COALESCE(
+                (SELECT -bm25(records_fts) FROM records_fts WHERE records_fts MATCH ? AND rowid = records.rowid),
+                {MATCH_ALL_SCORE}
+            )""",
+            [match],
+        )
+
+    def _filter_to_sql(self, filter: Filter) -> Tuple[str, List[Any]]:
+        if isinstance(filter, AndFilter):
+            conditions, params = [], []
+            for and_filter in filter.filters:
+                condition, condition_params = self._filter_to_sql(and_filter)
+                conditions.append(f"({condition})")
+                params.extend(condition_params)
+
+            return " AND ".join(conditions) or MATCH_ALL, params
+
+        if isinstance(filter.scope, ResponseFilterScope):
+            return self._response_filter_to_sql(filter)
+
+        return self._values_filter_to_sql(filter, "records.document", self._path_for_scope(filter.scope))
+
+    @staticmethod
+    def _values_filter_to_sql(filter: Filter, document: str, path: str) -> Tuple[str, List[Any]]:
+        if isinstance(filter, TermsFilter):
+            values = [str(value) for value in filter.values]
+            if not values:
+                return MATCH_NONE, []
+
+            return (
+                f"EXISTS (SELECT 1 FROM json_each({document}, ?) AS value "
+                f"WHERE CAST(value.value AS TEXT) IN ({', '.join('?' * len(values))}))",
+                [path, *values],
+            )
+
+        if isinstance(filter, RangeFilter):
+            conditions, params = [], [path]
+            for operator, bound in [(">=", filter.ge), ("<=", filter.le)]:
+                if bound is None:
+                    continue
+
+                if isinstance(bound, str):
+                    conditions.append(f"value.type = 'text' AND value.value {operator} ?")
+                else:
+                    conditions.append(f"value.type IN ('integer', 'real') AND value.value {operator} ?")
+                params.append(bound)
+
+            return (
+                f"EXISTS (SELECT 1 FROM json_each({document}, ?) AS value "
+                f"WHERE {' AND '.join(f'({condition})' for condition in conditions) or MATCH_ALL})",
+                params,
+            )
+
+        raise ValueError(f"Cannot process request for filter {filter}")
+
+    def _response_filter_to_sql(self, filter: Filter) -> Tuple[str, List[Any]]:
+        scope: ResponseFilterScope = filter.scope
+
+        if scope.question:
+            condition, params = self._values_filter_to_sql(
+                filter, "response.value", _json_path("values", scope.question)
+            )
+            return self._responses_exist_sql([condition], params, scope.user)
+
+        if scope.property == "status" and isinstance(filter, TermsFilter):
+            return self._response_status_filter_to_sql(filter)
+
+        raise Exception(f"Cannot process filter scope {scope}")
+
+    def _response_status_filter_to_sql(self, filter: TermsFilter) -> Tuple[str, List[Any]]:
+        user = filter.scope.user
+        statuses = [str(status) for status in filter.values if status != ResponseStatusFilter.pending]
+
+        conditions, params = [], []
+        if ResponseStatusFilter.pending in filter.values:
+            # NOTE: Records are pending for a user when they don't have a response from them, or pending for everyone
+            # when they don't have any response at all.
+            if user:
+                conditions.append(
+                    "NOT EXISTS (SELECT 1 FROM json_each(records.document, '$.responses') AS response "
+                    "WHERE json_extract(response.value, '$.user_id') = ?)"
+                )
+                params.append(str(user.id))
+            else:
+                conditions.append("NOT EXISTS (SELECT 1 FROM json_each(records.document, '$.responses'))")
+
+        if statuses:
+            condition, condition_params = self._responses_exist_sql(
+                [f"json_extract(response.value, '$.status') IN ({', '.join('?' * len(statuses))})"], statuses, user
+            )
+            conditions.append(condition)
+            params.extend(condition_params)
+        elif not conditions and user:
+            condition, condition_params = self._responses_exist_sql([], [], user)
+            conditions.append(condition)
+            params.extend(condition_params)
+
+        if not conditions:
+            return MATCH_ALL, []
+
+        return " OR ".join(f"({condition})" for condition in conditions), params
+
+    @staticmethod
+    def _responses_exist_sql(conditions: List[str], params: List[Any], user: Optional[User]) -> Tuple[str, List[Any]]:
+        conditions, params = list(conditions), list(params)
+        if user:
+            conditions.append("json_extract(response.value, '$.user_id') = ?")
+            params.append(str(user.id))
+
+        return (
+            "EXISTS (SELECT 1 FROM json_each(records.document, '$.responses') AS response "
+            f"WHERE {' AND '.join(f'({condition})' for condition in conditions) or MATCH_ALL})",
+            params,
+        )
+
+    def _order_expression(self, scope: FilterScope) -> Tuple[str, List[Any]]:
+        if isinstance(scope, ResponseFilterScope):
+            path = _json_path("values", scope.question) if scope.question else _json_path(scope.property)
+            condition, params = "1", [path]
+            if scope.user:
+                condition = "json_extract(response.value, '$.user_id') = ?"
+                params.append(str(scope.user.id))
+
+            return (
+                "SELECT AVG(json_extract(response.value, ?)) "
+                f"FROM json_each(records.document, '$.responses') AS response WHERE {condition}",
+                params,
+            )
+
+        if isinstance(scope, RecordFilterScope) and scope.property in ["id", "status", "inserted_at", "updated_at"]:
+            return f"records.{scope.property}", []
+
+        return "json_extract(records.document, ?)", [self._path_for_scope(scope)]
+
+    @staticmethod
+    def _path_for_scope(scope: FilterScope) -> str:
+        if isinstance(scope, MetadataFilterScope):
+            return _json_path("metadata", scope.metadata_property)
+        elif isinstance(scope, SuggestionFilterScope):
+            return _json_path("suggestions", scope.question, scope.property)
+        elif isinstance(scope, RecordFilterScope):
+            return _json_path(scope.property)
+
+        raise ValueError(f"Cannot process request for search scope {scope}")
+
+    def _map_record_to_document(self, record: Record) -> Tuple[dict, Dict[str, str], Dict[str, bytes]]:
+        import numpy as np
+
+        dataset = record.dataset
+
+        document = {
+            "id": str(record.id),
+            "external_id": record.external_id,
+            "status": record.status,
+            "inserted_at": _datetime_to_text(record.inserted_at),
+            "updated_at": _datetime_to_text(record.updated_at),
+            "metadata": self._map_record_metadata_to_document(record.metadata_ or {}, dataset.metadata_properties),
+            "responses": [self._map_record_response_to_document(response) for response in record.responses],
+            "suggestions": self._map_record_suggestions_to_document(record.suggestions),
+        }
+
+        fields = self._map_record_fields_to_text(record.fields, dataset.fields)
+        vectors = {
+            str(vector.vector_settings_id): np.asarray(vector.value, dtype=np.float32).tobytes()
+            for vector in record.vectors
+        }
+
+        return json.loads(_json_dumps(document)), fields, vectors
+
+    @staticmethod
+    def _map_record_fields_to_text(fields: dict, dataset_fields: List[Field]) -> Dict[str, str]:
+        texts = {}
+        for field in dataset_fields:
+            value = fields.get(field.name)
+
+            if field.is_image or value is None:
+                continue
+            elif field.is_chat and isinstance(value, list):
+                texts[field.name] = "\n".join(
+                    f"{message.get('role', '')}: {message.get('content', '')}"
+                    for message in value
+                    if isinstance(message, dict)
+                )
+            else:
+                texts[field.name] = str(value)
+
+        return texts
+
+    @staticmethod
+    def _map_record_metadata_to_document(
+        metadata: Dict[str, Any], metadata_properties: List[MetadataProperty]
+    ) -> Dict[str, Any]:
+        document_metadata = {}
+        for metadata_property in metadata_properties:
+            value = metadata.get(metadata_property.name)
+            if value is None:
+                continue
+
+            # NOTE: Numeric values are coerced like Elasticsearch does using the index mappings, so they can be
+            # filtered and aggregated as numbers.
+            try:
+                if metadata_property.type == MetadataPropertyType.integer:
+                    value = int(value)
+                elif metadata_property.type == MetadataPropertyType.float:
+                    value = float(value)
+            except (TypeError, ValueError):
+                pass
+
+            document_metadata[metadata_property.name] = value
+
+        return document_metadata
+
+    @staticmethod
+    def _map_record_suggestions_to_document(suggestions: List[Suggestion]) -> dict:
+        return {
+            suggestion.question.name: {
+                "type": suggestion.type,
+                "agent": suggestion.agent,
+                "score": suggestion.score,
+                "value": suggestion.value,
+            }
+            for suggestion in suggestions
+        }
+
+    @staticmethod
+    def _map_record_response_to_document(response: Response) -> Dict[str, Any]:
+        return json.loads(
+            _json_dumps(
+                {
+                    "id": response.id,
+                    "status": response.status,
+                    "user_id": response.user_id,
+                    "values": {question: value.get("value") for question, value in (response.values or {}).items()},
+                }
+            )
+        )
+
+
+class _SimpleQueryString:
+    """
+    Translates queries using the `simple_query_string` syntax into SQL conditions using FTS5 queries.
+
+    Terms are joined with AND by default, `|` joins them with OR, `-` negates them, `"` wraps phrases, `*` at the end of
+    a term does a prefix search and parentheses set the precedence.
+    """
+
+    def __init__(self, text_query: TextQuery):
+        self.text_query = text_query
+        self._tokens = self._tokenize(text_query.q)
+        self._position = 0
+        self._node = self._parse_or()
+
+    def to_sql(self) -> Tuple[str, List[Any]]:
+        if self._node is None:
+            return MATCH_NONE, []
+
+        return self._node_to_sql(self._node)
+
+    def score_match(self) -> Optional[str]:
+        """Returns a FTS5 query matching any of the positive terms, used to score the matching records."""
+        matches = [self._leaf_to_match(leaf) for leaf in self._positive_leaves(self._node)]
+
+        return " OR ".join(matches) if matches else None
+
+    @staticmethod
+    def _tokenize(q: str) -> List[Tuple[str, str]]:
+        tokens = []
+        for match in QUERY_TOKEN_REGEX.finditer(q):
+            if match.group("phrase") is not None:
+                tokens.append(("phrase", match.group("phrase").strip('"')))
+            elif match.group("operator") is not None:
+                tokens.append(("operator", match.group("operator")))
+            elif match.group("not") is not None:
+                tokens.append(("operator", "-"))
+            elif match.group("term") is not None:
+                term = match.group("term")
+                if term.startswith("-"):
+                    tokens.append(("operator", "-"))
+                    term = term[1:]
+                tokens.append(("term", term))
+
+        return tokens
+
+    def _peek(self) -> Optional[Tuple[str, str]]:
+        return self._tokens[self._position] if self._position < len(self._tokens) else None
+
+    def _parse_or(self) -> Optional[tuple]:
+        nodes = [self._parse_and()]
+        while self._peek() == ("operator", "|"):
+            self._position += 1
+            nodes.append(self._parse_and())
+
+        return self._combine("or", nodes)
+
+    def _parse_and(self) -> Optional[tuple]:
+        nodes = []
+        while True:
+            token = self._peek()
+            if token is None or token in [("operator", "|"), ("operator", ")")]:
+                break
+
+            if token == ("operator", "+"):
+                self._position += 1
+                continue
+
+            nodes.append(self._parse_unary())
+
+        return self._combine("and", nodes)
+
+    def _parse_unary(self) -> Optional[tuple]:
+        token = self._peek()
+        self._position += 1
+
+        if token == ("operator", "-"):
+            node = self._parse_unary()
+            return ("not", node) if node is not None else None
+
+        if token == ("operator", "("):
+            node = self._parse_or()
+            if self._peek() == ("operator", ")"):
+                self._position += 1
+            return node
+
+        kind, text = token
+        if kind == "term":
+            text = QUERY_TERM_SUFFIX_REGEX.sub("", text)
+            prefix = text.endswith("*")
+            text = text.rstrip("*")
+        else:
+            prefix = False
+
+        if not QUERY_WORD_REGEX.search(text):
+            return None
+
+        return ("leaf", text, prefix)
+
+    @staticmethod
+    def _combine(operator: str, nodes: List[Optional[tuple]]) -> Optional[tuple]:
+        nodes = [node for node in nodes if node is not None]
+        if not nodes:
+            return None
+        if len(nodes) == 1:
+            return nodes[0]
+
+        return (operator, nodes)
+
+    def _node_to_sql(self, node: tuple) -> Tuple[str, List[Any]]:
+        if node[0] == "leaf":
+            return (
+                "records.rowid IN (SELECT rowid FROM records_fts WHERE records_fts MATCH ?)",
+                [self._leaf_to_match(node)],
+            )
+
+        if node[0] == "not":
+            condition, params = self._node_to_sql(node[1])
+            return f"NOT ({condition})", params
+
+        conditions, params = [], []
+        for child in node[1]:
+            condition, child_params = self._node_to_sql(child)
+            conditions.append(f"({condition})")
+            params.extend(child_params)
+
+        return f" {node[0].upper()} ".join(conditions), params
+
+    def _positive_leaves(self, node: Optional[tuple]) -> List[tuple]:
+        if node is None or node[0] == "not":
+            return []
+        if node[0] == "leaf":
+            return [node]
+
+        return [leaf for child in node[1] for leaf in self._positive_leaves(child)]
+
+    def _leaf_to_match(self, leaf: tuple) -> str:
+        _, text, prefix = leaf
+
+        match = _quote_identifier(text) + (" *" if prefix else "")
+        if self.text_query.field:
+            return f"{_quote_identifier(self.text_query.field)} : {match}"
+
+        return match
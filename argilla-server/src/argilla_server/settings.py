@@ -22,7 +22,7 @@ import os
 import re
 import warnings
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_core.core_schema import ValidationInfo
@@ -33,10 +33,23 @@ from argilla_server.constants import (
     DATABASE_SQLITE,
     DEFAULT_DATABASE_POSTGRESQL_MAX_OVERFLOW,
     DEFAULT_DATABASE_POSTGRESQL_POOL_SIZE,
+    DEFAULT_DATABASE_READ_PRIMARY_PIN_SECONDS,
+    DEFAULT_DATABASE_SQLITE_CACHE_SIZE,
+    DEFAULT_DATABASE_SQLITE_JOURNAL_MODE,
+    DEFAULT_DATABASE_SQLITE_MMAP_SIZE,
+    DEFAULT_DATABASE_SQLITE_SYNCHRONOUS,
     DEFAULT_DATABASE_SQLITE_TIMEOUT,
+    DEFAULT_DELETED_RECORDS_RETENTION_DAYS,
+    DEFAULT_HUB_IMPORT_BATCH_SIZE,
+    DEFAULT_HUB_IMPORT_IMAGE_WORKERS,
+    DEFAULT_HUB_EXPORT_SHARD_SIZE,
+    DEFAULT_HUB_EXPORT_WORKERS,
+    DEFAULT_HUB_IMPORT_QUEUE_SIZE,
     DEFAULT_LABEL_SELECTION_OPTIONS_MAX_ITEMS,
+    DEFAULT_RECORDS_QUEUE_LEASE_TTL,
     DEFAULT_SPAN_OPTIONS_MAX_ITEMS,
     SEARCH_ENGINE_ELASTICSEARCH,
+    SEARCH_ENGINE_EMBEDDED,
     SEARCH_ENGINE_OPENSEARCH,
 )
 
@@ -92,6 +105,15 @@ class Settings(BaseSettings):
         validate_default=True,
         description="The database url that argilla will use as data store",
     )
+    database_read_url: Optional[str] = Field(
+        None,
+        description="If set, the database url of a read replica used by endpoints and jobs only reading data",
+    )
+    database_read_primary_pin_seconds: int = Field(
+        default=DEFAULT_DATABASE_READ_PRIMARY_PIN_SECONDS,
+        ge=0,
+        description="Number of seconds reads of a client go to the primary database after it writes data",
+    )
     # https://docs.sqlalchemy.org/en/20/core/engines.html#sqlalchemy.create_engine.params.pool_size
     database_postgresql_pool_size: Optional[int] = Field(
         default=DEFAULT_DATABASE_POSTGRESQL_POOL_SIZE,
@@ -107,6 +129,35 @@ class Settings(BaseSettings):
         default=DEFAULT_DATABASE_SQLITE_TIMEOUT,
         description="SQLite database connection timeout in seconds",
     )
+    # https://www.sqlite.org/pragma.html
+    database_sqlite_journal_mode: Optional[str] = Field(
+        default=DEFAULT_DATABASE_SQLITE_JOURNAL_MODE,
+        description="SQLite journal mode set for every connection. If not set, SQLite default is used",
+    )
+    database_sqlite_synchronous: Optional[str] = Field(
+        default=DEFAULT_DATABASE_SQLITE_SYNCHRONOUS,
+        description="SQLite synchronous flag set for every connection. If not set, SQLite default is used",
+    )
+    database_sqlite_cache_size: Optional[int] = Field(
+        default=DEFAULT_DATABASE_SQLITE_CACHE_SIZE,
+        description="SQLite page cache size set for every connection. Negative values are a size in KiB",
+    )
+    database_sqlite_mmap_size: Optional[int] = Field(
+        default=DEFAULT_DATABASE_SQLITE_MMAP_SIZE,
+        description="Max number of bytes of the SQLite database file accessed using memory-mapped I/O",
+    )
+    database_sqlite_single_writer: bool = Field(
+        default=True,
+        description="If True, SQLite write transactions of the server are serialised instead of competing for locks",
+    )
+    database_slow_query_threshold: Optional[float] = Field(
+        default=None,
+        description="If set, database queries taking more seconds than this threshold are logged as warnings",
+    )
+    database_query_instrumentation: bool = Field(
+        default=False,
+        description="If True, database queries are counted and timed per request, reporting them in the db span",
+    )
 
     elasticsearch: str = "http://localhost:9200"
     elasticsearch_ssl_verify: bool = True
@@ -124,6 +175,11 @@ class Settings(BaseSettings):
     es_mapping_total_fields_limit: int = 2000
 
     search_engine: str = SEARCH_ENGINE_ELASTICSEARCH
+    search_engine_embedded_path: Optional[str] = Field(
+        None,
+        validate_default=True,
+        description="The path where the embedded search engine indexes will be stored",
+    )
 
     # Questions settings
     label_selection_options_max_items: int = Field(
@@ -136,6 +192,59 @@ class Settings(BaseSettings):
         description="Max number of label options for questions of type `span`",
     )
 
+    # Annotation queue settings
+    records_queue_lease_ttl: int = Field(
+        default=DEFAULT_RECORDS_QUEUE_LEASE_TTL,
+        description="Number of seconds a record handed out by the annotation queue stays leased to a user",
+    )
+
+    # Records sync settings
+    deleted_records_retention_days: int = Field(
+        default=DEFAULT_DELETED_RECORDS_RETENTION_DAYS,
+        ge=1,
+        description="Number of days deleted records are tracked so clients syncing datasets can remove them",
+    )
+
+    # Media store settings
+    media_store_enabled: bool = Field(
+        default=False,
+        description="If True, data URLs of image fields are stored in the media store and records keep a reference",
+    )
+    media_path: Optional[str] = Field(
+        None,
+        validate_default=True,
+        description="The path where the media store files will be stored",
+    )
+
+    # Hugging Face Hub import settings
+    hub_import_batch_size: int = Field(
+        default=DEFAULT_HUB_IMPORT_BATCH_SIZE,
+        ge=1,
+        description="Number of rows written to the database and search engine at once when importing from the Hub",
+    )
+    hub_import_queue_size: int = Field(
+        default=DEFAULT_HUB_IMPORT_QUEUE_SIZE,
+        ge=1,
+        description="Max number of batches waiting between two consecutive stages of the Hub import pipeline",
+    )
+    hub_import_image_workers: int = Field(
+        default=DEFAULT_HUB_IMPORT_IMAGE_WORKERS,
+        ge=1,
+        description="Number of processes used to encode images when importing datasets from the Hub",
+    )
+
+    # Hugging Face Hub export settings
+    hub_export_shard_size: int = Field(
+        default=DEFAULT_HUB_EXPORT_SHARD_SIZE,
+        ge=1,
+        description="Max number of records written to every Parquet shard when exporting to the Hub",
+    )
+    hub_export_workers: int = Field(
+        default=DEFAULT_HUB_EXPORT_WORKERS,
+        ge=1,
+        description="Number of threads used to write Parquet shards when exporting to the Hub",
+    )
+
     # Hugging Face settings
     show_huggingface_space_persistent_storage_warning: bool = Field(
         default=True,
@@ -149,6 +258,11 @@ class Settings(BaseSettings):
         description="The telemetry configuration for Hugging Face hub telemetry. ",
     )
 
+    metrics_enabled: bool = Field(
+        default=False,
+        description="If True, Prometheus metrics are collected and exposed in the /metrics endpoint",
+    )
+
     enable_share_your_progress: bool = Field(
         default=False,
         description="Share your progress feature for community initiatives. Default=False",
@@ -174,6 +288,16 @@ class Settings(BaseSettings):
     def set_home_path_default(cls, home_path: str):
         return home_path or os.path.join(Path.home(), ".argilla")
 
+    @field_validator("media_path", mode="before")
+    @classmethod
+    def set_media_path_default(cls, media_path: str, info: ValidationInfo) -> str:
+        return media_path or os.path.join(info.data.get("home_path"), "media")
+
+    @field_validator("search_engine_embedded_path", mode="before")
+    @classmethod
+    def set_search_engine_embedded_path_default(cls, search_engine_embedded_path: str, info: ValidationInfo) -> str:
+        return search_engine_embedded_path or os.path.join(info.data.get("home_path"), "search_engine")
+
     @field_validator("base_url")
     @classmethod
     def normalize_base_url(cls, base_url: str):
@@ -186,6 +310,14 @@ class Settings(BaseSettings):
 
         return base_url
 
+    @field_validator("database_read_url", mode="before")
+    @classmethod
+    def set_database_read_url(cls, database_read_url: Optional[str], info: ValidationInfo) -> Optional[str]:
+        if not database_read_url:
+            return None
+
+        return cls.set_database_url(database_read_url, info)
+
     @field_validator("database_url", mode="before")
     @classmethod
     def set_database_url(cls, database_url: str, info: ValidationInfo) -> str:
@@ -240,6 +372,27 @@ class Settings(BaseSettings):
 
         return {}
 
+    @property
+    def database_sqlite_pragmas(self) -> Dict[str, Union[str, int]]:
+        pragmas = {
+            "journal_mode": self.database_sqlite_journal_mode,
+            "synchronous": self.database_sqlite_synchronous,
+            "cache_size": self.database_sqlite_cache_size,
+            "mmap_size": self.database_sqlite_mmap_size,
+        }
+
+        return {name: value for name, value in pragmas.items() if value is not None}
+
+    @property
+    def database_query_instrumentation_enabled(self) -> bool:
+        # NOTE: Slow queries logging, metrics and the read replica writers detection need queries to be instrumented.
+        return (
+            self.database_query_instrumentation
+            or self.database_slow_query_threshold is not None
+            or self.metrics_enabled
+            or self.database_read_url is not None
+        )
+
     @property
     def database_is_sqlite(self) -> bool:
         if self.database_url is None:
@@ -262,6 +415,10 @@ class Settings(BaseSettings):
     def search_engine_is_opensearch(self) -> bool:
         return self.search_engine == SEARCH_ENGINE_OPENSEARCH
 
+    @property
+    def search_engine_is_embedded(self) -> bool:
+        return self.search_engine == SEARCH_ENGINE_EMBEDDED
+
     class Config:
         env_prefix = "ARGILLA_"
 
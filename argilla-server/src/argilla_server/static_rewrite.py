@@ -14,17 +14,90 @@
 #  limitations under the License.
 import os
 import stat
-from typing import Union
+from mimetypes import guess_type
+from typing import List, Optional, Union
 
 import anyio
 from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
 from starlette.exceptions import HTTPException
 from starlette.responses import FileResponse, RedirectResponse, Response
+from starlette.staticfiles import NotModifiedResponse
 from starlette.types import Scope
 
+from argilla_server.statics import PRECOMPRESSED_ENCODINGS
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+NO_CACHE_CACHE_CONTROL = "no-cache"
+
 
 class RewriteStaticFiles(StaticFiles):
-    """Simple server rewrite implementation for SPI apps"""
+    """
+    Simple server rewrite implementation for SPI apps
+
+    Precompressed `.br` and `.gz` files are served when they exist and the client accepts them. Files inside
+    `immutable_directories` have hashed names, so they are served with long-lived caching headers.
+    """
+
+    def __init__(self, *args, immutable_directories: Optional[List[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.immutable_directories = [directory.strip("/") + "/" for directory in immutable_directories or []]
+
+    def file_response(
+        self,
+        full_path: Union[str, "os.PathLike[str]"],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+
+        response = self._precompressed_file_response(full_path, request_headers, status_code)
+        if response is None:
+            response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+
+        response.headers["Cache-Control"] = self._cache_control(full_path)
+
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def _precompressed_file_response(
+        self,
+        full_path: Union[str, "os.PathLike[str]"],
+        request_headers: Headers,
+        status_code: int,
+    ) -> Optional[Response]:
+        accepted_encodings = _accepted_encodings(request_headers.get("accept-encoding", ""))
+
+        has_precompressed_files = False
+        for encoding, extension in PRECOMPRESSED_ENCODINGS.items():
+            try:
+                stat_result = os.stat(f"{full_path}{extension}")
+            except OSError:
+                continue
+
+            has_precompressed_files = True
+            if encoding in accepted_encodings:
+                return FileResponse(
+                    f"{full_path}{extension}",
+                    status_code=status_code,
+                    stat_result=stat_result,
+                    media_type=guess_type(full_path)[0] or "text/plain",
+                    headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+                )
+
+        if has_precompressed_files:
+            return FileResponse(full_path, status_code=status_code, headers={"Vary": "Accept-Encoding"})
+
+    def _cache_control(self, full_path: Union[str, "os.PathLike[str]"]) -> str:
+        relative_path = os.path.relpath(full_path, os.path.realpath(self.directory)).replace(os.sep, "/")
+
+        if any(relative_path.startswith(directory) for directory in self.immutable_directories):
+            return IMMUTABLE_CACHE_CONTROL
+
+        return NO_CACHE_CACHE_CONTROL
 
     async def get_response(self, path: str, scope: Scope) -> Response:
         try:
@@ -82,3 +155,14 @@ class RewriteStaticFiles(StaticFiles):
             if stat_result and stat.S_ISREG(stat_result.st_mode):
                 return FileResponse(full_path, stat_result=stat_result, status_code=404)
         raise HTTPException(status_code=404)
+
+
+def _accepted_encodings(accept_encoding: str) -> List[str]:
+    accepted_encodings = []
+    for value in accept_encoding.split(","):
+        encoding, _, params = value.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted_encodings.append(encoding.strip().lower())
+
+    return accepted_encodings
@@ -0,0 +1,118 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import glob
+import gzip
+import shutil
+import hashlib
+import logging
+import tempfile
+
+import brotli
+
+from argilla_server import helpers
+
+_LOGGER = logging.getLogger("argilla.server")
+
+BASE_URL_VAR_NAME = "@@baseUrl@@"
+BASE_URL_REWRITE_EXTENSIONS = ["*.js", "*.html"]
+
+PRECOMPRESSED_ENCODINGS = {"br": ".br", "gzip": ".gz"}
+PRECOMPRESSED_EXTENSIONS = [".js", ".css", ".html", ".json", ".svg", ".txt", ".map", ".xml", ".ico"]
+PRECOMPRESSED_MIN_SIZE = 512
+
+# NOTE: Dynamic compression is skipped for these files because their content is already compressed.
+COMPRESSED_FILE_EXTENSIONS = [".br", ".gz", ".zip", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".woff", ".woff2"]
+
+
+def prepare_statics_folder(statics_folder: str, cache_folder: str, base_url: str, version: str) -> str:
+    """
+    Returns a folder with the application statics ready to be served, preparing it only once.
+
+    Statics are created with a parameterized baseUrl variable that is replaced by the runtime value found in
+    `base_url`, allowing to deploy the argilla server under a custom base url even when webapp does not support it.
+    Text files are also compressed ahead of time so `.br` and `.gz` files can be served instead of compressing
+    them on every request.
+
+    Prepared statics are cached in `cache_folder` using a key computed from `version`, `base_url` and the source
+    statics, so server starts after the first one reuse them.
+    """
+    prepared_folder = os.path.join(cache_folder, _statics_cache_key(statics_folder, base_url, version))
+    if os.path.isdir(prepared_folder):
+        return prepared_folder
+
+    os.makedirs(cache_folder, exist_ok=True)
+    temp_folder = tempfile.mkdtemp(dir=cache_folder, prefix=".statics-")
+    try:
+        new_folder = shutil.copytree(statics_folder, os.path.join(temp_folder, "statics"))
+        _rewrite_base_url(new_folder, base_url)
+        _precompress_files(new_folder)
+
+        # NOTE: Several server workers can prepare the statics at the same time, so the first one renaming its
+        # folder wins and the rest use it.
+        try:
+            os.rename(new_folder, prepared_folder)
+        except OSError:
+            if not os.path.isdir(prepared_folder):
+                raise
+    finally:
+        shutil.rmtree(temp_folder, ignore_errors=True)
+
+    _LOGGER.info(f"Statics prepared at {prepared_folder!r}")
+
+    return prepared_folder
+
+
+def _statics_cache_key(statics_folder: str, base_url: str, version: str) -> str:
+    key = hashlib.sha256(f"{version}\n{base_url}".encode("utf-8"))
+
+    index_path = os.path.join(statics_folder, "index.html")
+    if os.path.exists(index_path):
+        index_stat = os.stat(index_path)
+        key.update(f"\n{index_stat.st_mtime_ns}\n{index_stat.st_size}".encode("utf-8"))
+
+    return f"{version}-{key.hexdigest()[:16]}"
+
+
+def _rewrite_base_url(folder: str, base_url: str) -> None:
+    base_url = helpers.remove_suffix(base_url, suffix="/")
+
+    for extension in BASE_URL_REWRITE_EXTENSIONS:
+        for file in glob.glob(f"{folder}/**/{extension}", recursive=True):
+            helpers.replace_string_in_file(file, string=BASE_URL_VAR_NAME, replace_by=base_url)
+
+
+def _precompress_files(folder: str) -> None:
+    for root, _, files in os.walk(folder):
+        for file in files:
+            if os.path.splitext(file)[1].lower() in PRECOMPRESSED_EXTENSIONS:
+                _precompress_file(os.path.join(root, file))
+
+
+def _precompress_file(path: str) -> None:
+    with open(path, "rb") as file:
+        content = file.read()
+
+    if len(content) < PRECOMPRESSED_MIN_SIZE:
+        return
+
+    for encoding, compressed_content in [
+        ("br", brotli.compress(content, quality=11)),
+        ("gzip", gzip.compress(content, compresslevel=9, mtime=0)),
+    ]:
+        # NOTE: Compressed files are only kept when they are smaller than the original one.
+        if len(compressed_content) < len(content):
+            with open(f"{path}{PRECOMPRESSED_ENCODINGS[encoding]}", "wb") as file:
+                file.write(compressed_content)
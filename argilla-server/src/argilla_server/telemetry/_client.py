@@ -12,17 +12,19 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import asyncio
+import contextlib
 import dataclasses
 import json
 import logging
 import platform
 import uuid
-from typing import Optional
+from typing import List, Optional, Tuple
 
 from fastapi import Request, Response
-from huggingface_hub.utils import send_telemetry
 
 from argilla_server._version import __version__
+from argilla_server.metrics import server_timing_total
 from argilla_server.api.errors.v1.exception_handlers import get_request_error
 from argilla_server.integrations.huggingface.spaces import HUGGINGFACE_SETTINGS
 from argilla_server.security.authentication.provider import get_request_user
@@ -35,10 +37,31 @@ from argilla_server.telemetry._helpers import (
 
 _LOGGER = logging.getLogger(__name__)
 
+TELEMETRY_QUEUE_MAX_SIZE = 1_000
+TELEMETRY_BATCH_SIZE = 100
+TELEMETRY_FLUSH_INTERVAL = 5.0
+
+TelemetryEvent = Tuple[str, Optional[dict]]
+
 
 @dataclasses.dataclass
 class TelemetryClient:
+    """
+    Client sending telemetry events to the Hugging Face Hub.
+
+    Once started, tracked events are pushed into a bounded in-memory queue and sent in batches by a background task,
+    when `batch_size` events are waiting or `flush_interval` seconds have passed since the first one. When the queue
+    is full new events are dropped so tracking never adds latency to requests.
+    """
+
+    queue_max_size: int = TELEMETRY_QUEUE_MAX_SIZE
+    batch_size: int = TELEMETRY_BATCH_SIZE
+    flush_interval: float = TELEMETRY_FLUSH_INTERVAL
+
     _server_id: uuid.UUID = dataclasses.field(init=False)
+    _queue: Optional[asyncio.Queue] = dataclasses.field(init=False, default=None)
+    _flush_task: Optional[asyncio.Task] = dataclasses.field(init=False, default=None)
+    _dropped_events: int = dataclasses.field(init=False, default=0)
 
     def __post_init__(self):
         self._server_id = get_server_id()
@@ -56,7 +79,81 @@ class TelemetryClient:
         _LOGGER.info("System Info:")
         _LOGGER.info(f"Context: {json.dumps(self._system_info, indent=2)}")
 
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
+
+    async def start(self) -> None:
+        if self._flush_task is not None:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.queue_max_size)
+        self._flush_task = asyncio.create_task(self._flush_periodically())
+
+    async def stop(self) -> None:
+        if self._flush_task is None:
+            return
+
+        self._flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._flush_task
+
+        pending_events = []
+        while not self._queue.empty():
+            pending_events.append(self._queue.get_nowait())
+
+        self._queue = None
+        self._flush_task = None
+
+        await self._flush(pending_events)
+
     def track_data(self, topic: str, data: Optional[dict] = None):
+        if self._queue is None:
+            self._send_event((topic, data))
+            return
+
+        try:
+            self._queue.put_nowait((topic, data))
+        except asyncio.QueueFull:
+            self._dropped_events += 1
+
+    async def _flush_periodically(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            events = [await self._queue.get()]
+            flush_at = loop.time() + self.flush_interval
+
+            while len(events) < self.batch_size:
+                timeout = flush_at - loop.time()
+                if timeout <= 0:
+                    break
+
+                try:
+                    events.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._flush(events)
+
+    async def _flush(self, events: List[TelemetryEvent]) -> None:
+        if not events:
+            return
+
+        try:
+            await asyncio.to_thread(self._send_events, events)
+        except Exception as e:
+            _LOGGER.warning(f"Error sending telemetry events: {e}")
+
+    def _send_events(self, events: List[TelemetryEvent]) -> None:
+        for event in events:
+            self._send_event(event)
+
+    def _send_event(self, event: TelemetryEvent) -> None:
+        from huggingface_hub.utils import send_telemetry
+
+        topic, data = event
+
         library_name = "argilla-server"
         topic = f"argilla/server/{topic}"
 
@@ -88,7 +185,7 @@ class TelemetryClient:
         }
 
         if server_timing := response.headers.get("Server-Timing"):
-            duration_in_ms = server_timing.removeprefix("total;dur=")
+            duration_in_ms = server_timing_total(server_timing)
             data["duration_in_milliseconds"] = duration_in_ms
 
         if user := get_request_user(request=request):
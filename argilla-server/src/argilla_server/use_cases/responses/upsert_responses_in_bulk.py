@@ -40,7 +40,7 @@ class UpsertResponsesInBulkUseCase:
         await datasets.preload_records_relationships_before_validate(self.db, non_empty_records)
         for item, record in zip(responses, all_records):
             try:
-                if record is None:
+                if record is None or record.dataset.is_deleting:
                     raise errors.NotFoundError(f"Record with id `{item.record_id}` not found")
 
                 await authorize(user, RecordPolicy.create_response(record))
@@ -26,7 +26,7 @@ from argilla_server.api.schemas.v1.records import RecordCreate, RecordUpsert, Re
 from argilla_server.api.schemas.v1.records_bulk import RecordsBulkCreate
 from argilla_server.api.schemas.v1.responses import UserResponseCreate
 from argilla_server.api.schemas.v1.suggestions import SuggestionCreate
-from argilla_server.contexts import records
+from argilla_server.contexts import media, records
 from argilla_server.errors.future.base_errors import UnprocessableEntityError
 from argilla_server.models import Dataset, Record
 from argilla_server.validators.responses import ResponseCreateValidator
@@ -136,6 +136,8 @@ class RecordValidatorBase(ABC):
             return cls._validate_web_url(field_name, field_value, parse_result)
         elif parse_result.scheme in ["data"]:
             return cls._validate_data_url(field_name, field_value, parse_result)
+        elif media.is_media_reference(field_value):
+            return
         else:
             raise UnprocessableEntityError(f"image field {field_name!r} has an invalid URL value")
 
@@ -19,7 +19,6 @@ import httpx
 from math import floor
 from typing_extensions import Dict
 from datetime import datetime, timezone
-from standardwebhooks.webhooks import Webhook
 
 from argilla_server.models import Webhook as WebhookModel
 
@@ -31,6 +30,8 @@ NOTIFY_EVENT_DEFAULT_TIMEOUT = httpx.Timeout(timeout=20.0)
 # NOTE: We are using standard webhooks implementation.
 # For more information take a look to https://www.standardwebhooks.com
 def notify_event(webhook: WebhookModel, event: str, timestamp: datetime, data: Dict) -> httpx.Response:
+    from standardwebhooks.webhooks import Webhook
+
     timestamp_attempt = datetime.utcnow()
 
     msg_id = _generate_msg_id()
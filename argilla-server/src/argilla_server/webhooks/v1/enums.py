@@ -29,6 +29,8 @@ class WebhookEvent(StrEnum):
     record_deleted = "record.deleted"
     record_completed = "record.completed"
 
+    records_deleted = "records.deleted"
+
     response_created = "response.created"
     response_updated = "response.updated"
     response_deleted = "response.deleted"
@@ -48,6 +50,10 @@ class RecordEvent(StrEnum):
     completed = WebhookEvent.record_completed.value
 
 
+class RecordsEvent(StrEnum):
+    deleted = WebhookEvent.records_deleted.value
+
+
 class ResponseEvent(StrEnum):
     created = WebhookEvent.response_created.value
     updated = WebhookEvent.response_updated.value
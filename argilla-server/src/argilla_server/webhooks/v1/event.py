@@ -18,6 +18,7 @@ from datetime import datetime
 from rq.job import Job
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server import metrics
 from argilla_server.jobs.webhook_jobs import enqueue_notify_events
 
 
@@ -28,9 +29,10 @@ class Event:
         self.data = data
 
     async def notify(self, db: AsyncSession) -> List[Job]:
-        return await enqueue_notify_events(
-            db,
-            event=self.event,
-            timestamp=self.timestamp,
-            data=self.data,
-        )
+        with metrics.span(metrics.SPAN_WEBHOOKS):
+            return await enqueue_notify_events(
+                db,
+                event=self.event,
+                timestamp=self.timestamp,
+                data=self.data,
+            )
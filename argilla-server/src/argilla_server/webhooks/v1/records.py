@@ -22,8 +22,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from argilla_server.models import Record, Dataset
 from argilla_server.webhooks.v1.event import Event
-from argilla_server.webhooks.v1.enums import RecordEvent
-from argilla_server.webhooks.v1.schemas import RecordEventSchema
+from argilla_server.webhooks.v1.enums import RecordEvent, RecordsEvent
+from argilla_server.webhooks.v1.schemas import DatasetEventSchema, RecordEventSchema, RecordsDeletedEventSchema
 
 
 async def notify_record_event(db: AsyncSession, record_event: RecordEvent, record: Record) -> List[Job]:
@@ -53,3 +53,35 @@ async def build_record_event(db: AsyncSession, record_event: RecordEvent, record
         timestamp=datetime.utcnow(),
         data=RecordEventSchema.model_validate(record).model_dump(),
     )
+
+
+async def notify_records_deleted_event(db: AsyncSession, dataset: Dataset, count: int) -> List[Job]:
+    event = await build_records_deleted_event(db, dataset, count)
+
+    return await event.notify(db)
+
+
+async def build_records_deleted_event(db: AsyncSession, dataset: Dataset, count: int) -> Event:
+    # NOTE: Force loading required association resources required by the event schema
+    dataset = (
+        await db.execute(
+            select(Dataset)
+            .where(Dataset.id == dataset.id)
+            .options(
+                selectinload(Dataset.workspace),
+                selectinload(Dataset.fields),
+                selectinload(Dataset.questions),
+                selectinload(Dataset.metadata_properties),
+                selectinload(Dataset.vectors_settings),
+            )
+        )
+    ).scalar_one()
+
+    return Event(
+        event=RecordsEvent.deleted,
+        timestamp=datetime.utcnow(),
+        data=RecordsDeletedEventSchema(
+            dataset=DatasetEventSchema.model_validate(dataset),
+            count=count,
+        ).model_dump(),
+    )
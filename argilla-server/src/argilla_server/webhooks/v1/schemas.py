@@ -138,6 +138,11 @@ class RecordEventSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class RecordsDeletedEventSchema(BaseModel):
+    dataset: DatasetEventSchema
+    count: int
+
+
 class ResponseEventSchema(BaseModel):
     id: UUID
     values: Optional[dict] = None
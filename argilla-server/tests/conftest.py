@@ -23,7 +23,7 @@ from sqlalchemy import NullPool, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
 from argilla_server.cli.database.migrate import migrate_db
-from argilla_server.database import database_url_sync
+from argilla_server.database import database_url_sync, install_query_instrumentation
 from argilla_server.jobs.queues import REDIS_CONNECTION
 from argilla_server.settings import settings
 
@@ -51,6 +51,8 @@ async def connection() -> AsyncGenerator["AsyncConnection", None]:
     set_task(asyncio.current_task())
     database_url = settings.database_url
     engine = create_async_engine(database_url, poolclass=NullPool)
+    # NOTE: Queries are instrumented so tests can assert the number of queries run by the endpoints.
+    install_query_instrumentation(engine.sync_engine)
     conn = await engine.connect()
     TestSession.configure(bind=conn)
     migrate_db("head")
@@ -13,11 +13,14 @@
 #  limitations under the License.
 
 import asyncio
-from typing import Union
+from contextlib import contextmanager
+from typing import Iterator, Union
 
 from sqlalchemy import orm
 from sqlalchemy.ext.asyncio import async_scoped_session, async_sessionmaker
 
+from argilla_server.database import QueryCounter, count_queries
+
 task: Union[asyncio.Task, None] = None
 
 
@@ -32,3 +35,12 @@ def get_task() -> asyncio.Task:
 
 TestSession = async_scoped_session(async_sessionmaker(expire_on_commit=False, future=True), get_task)
 SyncTestSession = orm.scoped_session(orm.sessionmaker(class_=orm.Session, expire_on_commit=False))
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryCounter]:
+    with count_queries() as query_counter:
+        yield query_counter
+
+    statements = "\n".join(query_counter.statements)
+    assert query_counter.count <= max_queries, f"{query_counter.count} queries executed:\n{statements}"
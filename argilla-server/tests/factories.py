@@ -23,12 +23,14 @@ from sqlalchemy.ext.asyncio import async_object_session
 from argilla_server.enums import DatasetDistributionStrategy, FieldType, MetadataPropertyType, OptionsOrder
 from argilla_server.webhooks.v1.enums import WebhookEvent
 from argilla_server.models import (
+    DatasetMedia,
     Dataset,
     Field,
     MetadataProperty,
     Question,
     QuestionType,
     Record,
+    RecordLease,
     Response,
     Suggestion,
     User,
@@ -232,6 +234,14 @@ class DatasetUserFactory(BaseFactory):
     user = factory.SubFactory(UserFactory)
 
 
+class DatasetMediaFactory(BaseFactory):
+    class Meta:
+        model = DatasetMedia
+
+    dataset = factory.SubFactory(DatasetFactory)
+    hash = factory.Sequence(lambda n: f"{n:064x}")
+
+
 class RecordSyncFactory(BaseSyncFactory):
     class Meta:
         model = Record
@@ -272,6 +282,15 @@ class ResponseFactory(BaseFactory):
     user = factory.SubFactory(UserFactory)
 
 
+class RecordLeaseFactory(BaseFactory):
+    class Meta:
+        model = RecordLease
+
+    record = factory.SubFactory(RecordFactory)
+    user = factory.SubFactory(UserFactory)
+    dataset_id = factory.LazyAttribute(lambda lease: lease.record.dataset_id)
+
+
 class VectorSettingsSyncFactory(BaseSyncFactory):
     class Meta:
         model = VectorSettings
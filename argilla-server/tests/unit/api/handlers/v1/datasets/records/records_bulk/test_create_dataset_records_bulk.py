@@ -11,6 +11,7 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import base64
 import pytest
 
 from typing import Any
@@ -28,8 +29,10 @@ from argilla_server.enums import (
     RecordStatus,
     DatasetDistributionStrategy,
 )
+from argilla_server.contexts import media
 from argilla_server.jobs.queues import HIGH_QUEUE
-from argilla_server.models.database import Record, Response, Suggestion, User
+from argilla_server.settings import settings
+from argilla_server.models.database import DatasetMedia, Record, Response, Suggestion, User
 from argilla_server.webhooks.v1.enums import RecordEvent
 from argilla_server.webhooks.v1.records import build_record_event
 from argilla_server.models.database import Record, Response, Suggestion, User
@@ -239,6 +242,24 @@ class TestCreateDatasetRecordsBulk:
 
         assert dataset.users == [owner]
 
+    async def test_create_dataset_records_bulk_for_dataset_being_deleted(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+
+        await TextFieldFactory.create(name="text-field", dataset=dataset)
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"items": [{"fields": {"text-field": "value"}}]},
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Dataset with id `{dataset.id}` not found"}
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 0
+
     async def test_create_dataset_records_bulk_with_empty_fields(
         self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
     ):
@@ -336,6 +357,52 @@ class TestCreateDatasetRecordsBulk:
 
         assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 1
 
+    async def test_create_dataset_records_bulk_with_data_url_image_field_using_media_store(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(settings, "media_store_enabled", True)
+        monkeypatch.setattr(settings, "media_path", str(tmp_path))
+
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+
+        await ImageFieldFactory.create(name="image", dataset=dataset)
+        await LabelSelectionQuestionFactory.create(dataset=dataset)
+
+        data_url = "data:image/gif;base64,R0lGODlhAQABAAAAACH5BAEKAAEALAAAAAABAAEAAAICTAEAOw=="
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "items": [
+                    {"fields": {"image": data_url}},
+                    {"fields": {"image": data_url}},
+                ],
+            },
+        )
+
+        assert response.status_code == 201
+
+        records = (await db.execute(select(Record))).scalars().all()
+        media_hash = media.media_hash_from_reference(records[0].fields["image"])
+
+        assert media_hash is not None
+        assert records[1].fields["image"] == records[0].fields["image"]
+        assert media.get_media_store().read(media_hash) == base64.b64decode(data_url.split(",", 1)[1])
+
+        datasets_media = (await db.execute(select(DatasetMedia))).scalars().all()
+        assert [(dataset_media.dataset_id, dataset_media.hash) for dataset_media in datasets_media] == [
+            (dataset.id, media_hash)
+        ]
+
+        response_image = response.json()["items"][0]["fields"]["image"]
+        assert response_image.startswith(f"{records[0].fields['image']}?token=")
+
+        response = await async_client.get(response_image)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/gif"
+
     @pytest.mark.parametrize(
         "invalid_url",
         [
@@ -72,6 +72,24 @@ class TestUpsertDatasetRecordsBulk:
 
         assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 0
 
+    async def test_upsert_dataset_records_bulk_for_dataset_being_deleted(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+
+        await TextFieldFactory.create(name="text-field", dataset=dataset)
+
+        response = await async_client.put(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"items": [{"fields": {"text-field": "value"}}]},
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Dataset with id `{dataset.id}` not found"}
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 0
+
     async def test_upsert_dataset_records_with_empty_fields_updating_record(
         self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
     ):
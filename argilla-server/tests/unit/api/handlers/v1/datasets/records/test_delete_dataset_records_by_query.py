@@ -0,0 +1,153 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from uuid import UUID, uuid4
+from rq.job import JobStatus
+from httpx import AsyncClient
+
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.jobs.queues import DEFAULT_QUEUE
+
+from tests.factories import AnnotatorFactory, DatasetFactory, FloatMetadataPropertyFactory, TextFieldFactory
+
+
+@pytest.mark.asyncio
+class TestDeleteDatasetRecordsByQuery:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/datasets/{dataset_id}/records/delete"
+
+    async def test_delete_dataset_records_by_query(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(name="text", dataset=dataset)
+        await FloatMetadataPropertyFactory.create(name="score", dataset=dataset)
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "query": {"text": {"q": "spam", "field": "text"}},
+                "filters": {
+                    "and": [
+                        {"type": "range", "scope": {"entity": "metadata", "metadata_property": "score"}, "le": 0.5},
+                    ],
+                },
+            },
+        )
+
+        assert response.status_code == 202
+
+        response_json = response.json()
+        assert response_json["id"]
+        assert response_json["status"] == JobStatus.QUEUED
+
+        assert DEFAULT_QUEUE.count == 1
+        assert DEFAULT_QUEUE.jobs[0].kwargs == {
+            "dataset_id": dataset.id,
+            "query": {"q": "spam", "field": "text"},
+            "filters": {
+                "and": [
+                    {
+                        "type": "range",
+                        "scope": {"entity": "metadata", "metadata_property": "score"},
+                        "ge": None,
+                        "le": 0.5,
+                    },
+                ],
+            },
+        }
+
+    async def test_delete_dataset_records_by_query_without_query(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(self.url(dataset.id), headers=owner_auth_header, json={})
+
+        assert response.status_code == 202
+
+        assert DEFAULT_QUEUE.count == 1
+        assert DEFAULT_QUEUE.jobs[0].kwargs == {"dataset_id": dataset.id, "query": None, "filters": None}
+
+    async def test_delete_dataset_records_by_query_with_vector_query(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"query": {"vector": {"name": "vector", "value": [1.0, 2.0]}}},
+        )
+
+        assert response.status_code == 422
+        assert DEFAULT_QUEUE.count == 0
+
+    async def test_delete_dataset_records_by_query_with_nonexistent_metadata_property(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={
+                "filters": {
+                    "and": [
+                        {
+                            "type": "terms",
+                            "scope": {"entity": "metadata", "metadata_property": "missing"},
+                            "values": ["a"],
+                        },
+                    ],
+                },
+            },
+        )
+
+        assert response.status_code == 422
+        assert DEFAULT_QUEUE.count == 0
+
+    async def test_delete_dataset_records_by_query_with_nonexistent_field(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"query": {"text": {"q": "spam", "field": "missing"}}},
+        )
+
+        assert response.status_code == 422
+        assert DEFAULT_QUEUE.count == 0
+
+    async def test_delete_dataset_records_by_query_as_annotator(self, async_client: AsyncClient):
+        dataset = await DatasetFactory.create()
+        annotator = await AnnotatorFactory.create(workspaces=[dataset.workspace])
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: annotator.api_key}, json={}
+        )
+
+        assert response.status_code == 403
+        assert DEFAULT_QUEUE.count == 0
+
+    async def test_delete_dataset_records_by_query_with_nonexistent_dataset(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        response = await async_client.post(self.url(uuid4()), headers=owner_auth_header, json={})
+
+        assert response.status_code == 404
+        assert DEFAULT_QUEUE.count == 0
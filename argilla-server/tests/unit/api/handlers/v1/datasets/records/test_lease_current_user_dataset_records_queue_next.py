@@ -0,0 +1,179 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from datetime import datetime, timedelta
+from uuid import UUID
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.enums import DatasetDistributionStrategy, RecordStatus, ResponseStatus
+from argilla_server.models import RecordLease, User
+
+from tests.factories import (
+    AnnotatorFactory,
+    DatasetFactory,
+    RecordFactory,
+    RecordLeaseFactory,
+    ResponseFactory,
+    WorkspaceUserFactory,
+)
+
+
+@pytest.mark.asyncio
+class TestLeaseCurrentUserDatasetRecordsQueueNext:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/me/datasets/{dataset_id}/records/queue/next"
+
+    async def test_lease_next_records(self, db: AsyncSession, async_client: AsyncClient, owner: User):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(5, dataset=dataset)
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: owner.api_key}, params={"n": 3}
+        )
+
+        assert response.status_code == 200
+
+        response_json = response.json()
+        assert [item["record"]["id"] for item in response_json["items"]] == [str(record.id) for record in records[:3]]
+        assert all(
+            datetime.fromisoformat(item["lease_expires_at"]) > datetime.utcnow() for item in response_json["items"]
+        )
+
+        assert (await db.execute(select(func.count(RecordLease.id)))).scalar_one() == 3
+
+    async def test_lease_next_records_renews_current_user_leases(
+        self, db: AsyncSession, async_client: AsyncClient, owner: User
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        lease = await RecordLeaseFactory.create(
+            record=records[2], user=owner, expires_at=datetime.utcnow() + timedelta(seconds=10)
+        )
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: owner.api_key}, params={"n": 2}
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(records[2].id), str(records[0].id)]
+
+        await db.refresh(lease)
+        assert lease.expires_at > datetime.utcnow() + timedelta(seconds=10)
+
+    async def test_lease_next_records_skips_records_leased_by_other_users(self, async_client: AsyncClient, owner: User):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        await RecordLeaseFactory.create(record=records[0], expires_at=datetime.utcnow() + timedelta(minutes=5))
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: owner.api_key}, params={"n": 3}
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(records[1].id), str(records[2].id)]
+
+    async def test_lease_next_records_with_expired_leases_from_other_users(
+        self, async_client: AsyncClient, owner: User
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+        await RecordLeaseFactory.create(record=records[0], expires_at=datetime.utcnow() - timedelta(seconds=1))
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: owner.api_key}, params={"n": 2}
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(records[0].id), str(records[1].id)]
+
+    async def test_lease_next_records_respects_min_submitted(self, async_client: AsyncClient, owner: User):
+        dataset = await DatasetFactory.create(
+            distribution={"strategy": DatasetDistributionStrategy.overlap, "min_submitted": 2}
+        )
+        records = await RecordFactory.create_batch(3, dataset=dataset)
+        await RecordLeaseFactory.create(record=records[0], expires_at=datetime.utcnow() + timedelta(minutes=5))
+        await ResponseFactory.create(record=records[1], status=ResponseStatus.submitted)
+        await RecordLeaseFactory.create(record=records[1], expires_at=datetime.utcnow() + timedelta(minutes=5))
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: owner.api_key}, params={"n": 3}
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(records[0].id), str(records[2].id)]
+
+    async def test_lease_next_records_skips_responded_and_completed_records(
+        self, async_client: AsyncClient, owner: User
+    ):
+        dataset = await DatasetFactory.create()
+        records = [
+            await RecordFactory.create(dataset=dataset),
+            await RecordFactory.create(dataset=dataset, status=RecordStatus.completed),
+            await RecordFactory.create(dataset=dataset),
+        ]
+        await ResponseFactory.create(record=records[0], user=owner, status=ResponseStatus.draft)
+
+        response = await async_client.post(
+            self.url(dataset.id), headers={API_KEY_HEADER_NAME: owner.api_key}, params={"n": 3}
+        )
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(records[2].id)]
+
+    async def test_lease_next_records_with_annotator(self, async_client: AsyncClient):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+        annotator = await AnnotatorFactory.create()
+        await WorkspaceUserFactory.create(workspace_id=dataset.workspace_id, user_id=annotator.id)
+
+        response = await async_client.post(self.url(dataset.id), headers={API_KEY_HEADER_NAME: annotator.api_key})
+
+        assert response.status_code == 200
+        assert [item["record"]["id"] for item in response.json()["items"]] == [str(record.id) for record in records]
+
+    async def test_lease_next_records_with_annotator_from_different_workspace(self, async_client: AsyncClient):
+        dataset = await DatasetFactory.create()
+        annotator = await AnnotatorFactory.create()
+
+        response = await async_client.post(self.url(dataset.id), headers={API_KEY_HEADER_NAME: annotator.api_key})
+
+        assert response.status_code == 403
+
+    async def test_lease_next_records_with_nonexistent_dataset(self, async_client: AsyncClient, owner: User):
+        dataset_id = UUID("00000000-0000-0000-0000-000000000000")
+
+        response = await async_client.post(self.url(dataset_id), headers={API_KEY_HEADER_NAME: owner.api_key})
+
+        assert response.status_code == 404
+
+    async def test_release_current_user_dataset_records_queue(
+        self, db: AsyncSession, async_client: AsyncClient, owner: User
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(2, dataset=dataset)
+        expires_at = datetime.utcnow() + timedelta(minutes=5)
+        await RecordLeaseFactory.create(record=records[0], user=owner, expires_at=expires_at)
+        other_user_lease = await RecordLeaseFactory.create(record=records[1], expires_at=expires_at)
+
+        response = await async_client.delete(
+            f"/api/v1/me/datasets/{dataset.id}/records/queue", headers={API_KEY_HEADER_NAME: owner.api_key}
+        )
+
+        assert response.status_code == 204
+        assert (await db.execute(select(RecordLease.id))).scalars().all() == [other_user_lease.id]
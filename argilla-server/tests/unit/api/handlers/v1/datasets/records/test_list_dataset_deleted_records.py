@@ -0,0 +1,157 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import records
+from argilla_server.models import DeletedRecord
+from argilla_server.settings import settings
+
+from tests.factories import DatasetFactory, RecordFactory
+
+
+@pytest.mark.asyncio
+class TestListDatasetDeletedRecords:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/datasets/{dataset_id}/records/deleted"
+
+    async def test_list_dataset_deleted_records(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        record_a, record_b, record_c = await RecordFactory.create_batch(3, dataset=dataset)
+
+        response = await async_client.delete(
+            f"/api/v1/datasets/{dataset.id}/records",
+            headers=owner_auth_header,
+            params={"ids": f"{record_a.id},{record_b.id}"},
+        )
+        assert response.status_code == 204
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert {item["id"] for item in items} == {str(record_a.id), str(record_b.id)}
+        assert {item["external_id"] for item in items} == {record_a.external_id, record_b.external_id}
+        assert all(item["deleted_at"] for item in items)
+
+    async def test_list_dataset_deleted_records_with_deleted_at_ge(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset)
+
+        await records._create_deleted_records(db, dataset.id, [(record.id, record.external_id)])
+        await db.commit()
+
+        response = await async_client.get(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"deleted_at_ge": (datetime.utcnow() + timedelta(minutes=1)).isoformat()},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {"items": []}
+
+    async def test_list_dataset_deleted_records_by_keyset(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        deleted_at = datetime.utcnow()
+        deleted_records = sorted(
+            [DeletedRecord(record_id=uuid4(), dataset_id=dataset.id, inserted_at=deleted_at) for _ in range(3)],
+            key=lambda deleted_record: deleted_record.record_id,
+        )
+        db.add_all(deleted_records)
+        await db.commit()
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header, params={"limit": 2})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [str(deleted_records[0].record_id), str(deleted_records[1].record_id)]
+
+        response = await async_client.get(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"limit": 2, "after_deleted_at": items[-1]["deleted_at"], "after_id": items[-1]["id"]},
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [str(deleted_records[2].record_id)]
+
+    async def test_list_dataset_deleted_records_with_incomplete_keyset(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.get(
+            self.url(dataset.id), headers=owner_auth_header, params={"after_deleted_at": datetime.utcnow().isoformat()}
+        )
+
+        assert response.status_code == 422
+
+    async def test_list_dataset_deleted_records_with_deleted_at_ge_before_retention(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        deleted_at_ge = datetime.utcnow() - timedelta(days=settings.deleted_records_retention_days + 1)
+
+        response = await async_client.get(
+            self.url(dataset.id), headers=owner_auth_header, params={"deleted_at_ge": deleted_at_ge.isoformat()}
+        )
+
+        assert response.status_code == 422
+
+    async def test_deleted_records_older_than_retention_are_pruned(self, db: AsyncSession):
+        dataset = await DatasetFactory.create()
+        other_dataset = await DatasetFactory.create()
+        expired_at = datetime.utcnow() - timedelta(days=settings.deleted_records_retention_days + 1)
+        db.add_all(
+            [
+                DeletedRecord(record_id=uuid4(), dataset_id=dataset.id, inserted_at=expired_at),
+                DeletedRecord(record_id=uuid4(), dataset_id=other_dataset.id, inserted_at=expired_at),
+            ]
+        )
+        await db.commit()
+        record = await RecordFactory.create(dataset=dataset)
+
+        await records._create_deleted_records(db, dataset.id, [(record.id, record.external_id)])
+        await db.commit()
+
+        assert (await db.scalars(select(DeletedRecord.record_id).filter_by(dataset_id=dataset.id))).all() == [record.id]
+        assert (await db.scalar(select(func.count(DeletedRecord.id)).filter_by(dataset_id=other_dataset.id))) == 1
+
+    async def test_delete_dataset_records_by_query_tracks_deleted_records(self, db: AsyncSession, mock_search_engine):
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create_batch(3, dataset=dataset)
+
+        deleted = await records.delete_records_by_query(db, mock_search_engine, dataset, chunk_size=2)
+
+        assert deleted == 3
+        assert (await db.scalar(select(func.count(DeletedRecord.id)).filter_by(dataset_id=dataset.id))) == 3
+
+    async def test_list_dataset_deleted_records_with_nonexistent_dataset(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        response = await async_client.get(
+            self.url(UUID("00000000-0000-0000-0000-000000000000")), headers=owner_auth_header
+        )
+
+        assert response.status_code == 404
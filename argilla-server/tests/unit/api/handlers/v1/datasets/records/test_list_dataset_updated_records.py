@@ -0,0 +1,158 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from datetime import datetime
+from uuid import UUID
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.enums import ResponseStatus, SuggestionType
+from tests.factories import (
+    DatasetFactory,
+    RecordFactory,
+    SuggestionFactory,
+    TextQuestionFactory,
+)
+
+
+@pytest.mark.asyncio
+class TestListDatasetUpdatedRecords:
+    def url(self, dataset_id: UUID) -> str:
+        return f"/api/v1/datasets/{dataset_id}/records/updated"
+
+    async def test_list_dataset_updated_records(self, async_client: AsyncClient, owner_auth_header: dict):
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 1, 1))
+        record_b = await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 6, 3))
+        record_a = await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 6, 1))
+
+        response = await async_client.get(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"updated_at_ge": "2024-05-01T00:00:00+00:00"},
+        )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [str(record_a.id), str(record_b.id)]
+        assert [item["last_activity_at"] for item in items] == ["2024-06-01T00:00:00", "2024-06-03T00:00:00"]
+
+    async def test_list_dataset_updated_records_after_responses_and_suggestions_changes(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        question = await TextQuestionFactory.create(name="text-question", dataset=dataset)
+        await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 1, 1))
+        record_with_response = await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 1, 1))
+        record_with_suggestion = await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 1, 1))
+        record_with_deleted_suggestion = await RecordFactory.create(
+            dataset=dataset, last_activity_at=datetime(2024, 1, 1)
+        )
+        suggestion = await SuggestionFactory.create(record=record_with_deleted_suggestion, question=question)
+        records_updated_at = {
+            str(record.id): record.updated_at.isoformat()
+            for record in [record_with_suggestion, record_with_deleted_suggestion]
+        }
+
+        response = await async_client.post(
+            f"/api/v1/records/{record_with_response.id}/responses",
+            headers=owner_auth_header,
+            json={"values": {"text-question": {"value": "text"}}, "status": ResponseStatus.submitted},
+        )
+        assert response.status_code == 201
+
+        response = await async_client.put(
+            f"/api/v1/records/{record_with_suggestion.id}/suggestions",
+            headers=owner_auth_header,
+            json={"question_id": str(question.id), "type": SuggestionType.model, "value": "text"},
+        )
+        assert response.status_code == 201
+
+        response = await async_client.delete(f"/api/v1/suggestions/{suggestion.id}", headers=owner_auth_header)
+        assert response.status_code == 200
+
+        response = await async_client.get(
+            self.url(dataset.id), headers=owner_auth_header, params={"updated_at_ge": "2024-06-01T00:00:00+00:00"}
+        )
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert {item["id"] for item in items} == {
+            str(record_with_response.id),
+            str(record_with_suggestion.id),
+            str(record_with_deleted_suggestion.id),
+        }
+        # Changes of suggestions don't change the records `updated_at`
+        assert {
+            item["id"]: item["updated_at"] for item in items if item["id"] != str(record_with_response.id)
+        } == records_updated_at
+
+    async def test_list_dataset_updated_records_by_keyset(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        records = [
+            await RecordFactory.create(dataset=dataset, last_activity_at=datetime(2024, 1, day)) for day in range(1, 5)
+        ]
+
+        response = await async_client.get(self.url(dataset.id), headers=owner_auth_header, params={"limit": 2})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert [item["id"] for item in items] == [str(records[0].id), str(records[1].id)]
+
+        # The first record is deleted and the second one updated before the next page is requested
+        await records[0].delete(db)
+        records[1].updated_at = datetime(2024, 2, 1)
+        await db.commit()
+
+        response = await async_client.get(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"limit": 2, "after_last_activity_at": items[-1]["last_activity_at"], "after_id": items[-1]["id"]},
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [str(records[2].id), str(records[3].id)]
+
+        response = await async_client.get(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            params={"limit": 2, "after_last_activity_at": "2024-01-04T00:00:00", "after_id": str(records[3].id)},
+        )
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [str(records[1].id)]
+
+    async def test_list_dataset_updated_records_with_incomplete_keyset(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+
+        response = await async_client.get(
+            self.url(dataset.id), headers=owner_auth_header, params={"after_last_activity_at": "2024-01-01T00:00:00"}
+        )
+
+        assert response.status_code == 422
+
+    async def test_list_dataset_updated_records_with_nonexistent_dataset(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        response = await async_client.get(
+            self.url(UUID("00000000-0000-0000-0000-000000000000")), headers=owner_auth_header
+        )
+
+        assert response.status_code == 404
@@ -15,15 +15,17 @@
 import pytest
 
 from uuid import UUID
+from rq.job import JobStatus
 from httpx import AsyncClient
-from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.enums import DatasetStatus
+from argilla_server.jobs.queues import DEFAULT_QUEUE, HIGH_QUEUE
+from argilla_server.models import Record
 from argilla_server.webhooks.v1.enums import DatasetEvent
-from argilla_server.webhooks.v1.datasets import build_dataset_event
 
-from tests.factories import DatasetFactory, WebhookFactory
+from tests.factories import DatasetFactory, RecordFactory, WebhookFactory
 
 
 @pytest.mark.asyncio
@@ -31,22 +33,33 @@ class TestDeleteDataset:
     def url(self, dataset_id: UUID) -> str:
         return f"/api/v1/datasets/{dataset_id}"
 
-    async def test_delete_dataset_enqueue_webhook_dataset_deleted_event(
+    async def test_delete_dataset_enqueue_delete_dataset_job(
         self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
     ):
         dataset = await DatasetFactory.create()
-        webhook = await WebhookFactory.create(events=[DatasetEvent.deleted])
+        await RecordFactory.create_batch(3, dataset=dataset)
 
-        event = await build_dataset_event(db, DatasetEvent.deleted, dataset)
-
-        response = await async_client.delete(
-            self.url(dataset.id),
-            headers=owner_auth_header,
-        )
+        response = await async_client.delete(self.url(dataset.id), headers=owner_auth_header)
 
         assert response.status_code == 200
 
-        assert HIGH_QUEUE.count == 1
-        assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
-        assert HIGH_QUEUE.jobs[0].args[1] == DatasetEvent.deleted
-        assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
+        response_json = response.json()
+        assert response_json["status"] == DatasetStatus.deleting
+        assert response_json["job"]["status"] == JobStatus.QUEUED
+
+        assert DEFAULT_QUEUE.count == 1
+        assert DEFAULT_QUEUE.jobs[0].id == response_json["job"]["id"]
+        assert DEFAULT_QUEUE.jobs[0].args == (dataset.id,)
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 3
+
+    async def test_delete_dataset_does_not_enqueue_webhook_dataset_deleted_event(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        await WebhookFactory.create(events=[DatasetEvent.deleted])
+
+        response = await async_client.delete(self.url(dataset.id), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert HIGH_QUEUE.count == 0
@@ -18,6 +18,7 @@ from datetime import timedelta
 
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.enums import DatasetStatus, UserRole
+from tests.database import assert_max_queries
 from tests.factories import DatasetFactory, WorkspaceUserFactory, WorkspaceFactory, UserFactory
 
 
@@ -76,6 +77,17 @@ class TestListCurrentUserDatasets:
         assert len(datasets) == 1
         assert datasets[0]["id"] == str(dataset.id)
 
+    async def test_list_current_user_datasets_without_deleting_datasets(
+        self, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+        await DatasetFactory.create(status=DatasetStatus.deleting)
+
+        response = await async_client.get(self.url(), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert [dataset["id"] for dataset in response.json()["items"]] == [str(dataset.id)]
+
     async def test_list_current_user_datasets_by_workspace_id(self, async_client: AsyncClient, owner_auth_header: dict):
         dataset = await DatasetFactory.create()
         await DatasetFactory.create()
@@ -137,3 +149,12 @@ class TestListCurrentUserDatasets:
         assert response.status_code == 200
 
         assert [item["name"] for item in response.json()["items"]] == ["dataset-a", "dataset-b"]
+
+    async def test_list_current_user_datasets_query_budget(self, async_client: AsyncClient, owner_auth_header: dict):
+        await DatasetFactory.create_batch(10)
+
+        with assert_max_queries(5):
+            response = await async_client.get(self.url(), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 10
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from uuid import UUID
+from uuid import UUID, uuid4
 
 import pytest
 from argilla_server.constants import API_KEY_HEADER_NAME
@@ -221,6 +221,32 @@ class TestSearchCurrentUserDatasetRecords:
             "message": f"Record `{record_without_vector.id}` does not have a vector for vector settings `{vector_settings.name}`",
         }
 
+    async def test_with_records_missing_in_database(
+        self, async_client: AsyncClient, owner_auth_header: dict, mock_search_engine: SearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        record = await RecordFactory.create(dataset=dataset)
+
+        mock_search_engine.search.return_value = SearchResponses(
+            items=[
+                SearchResponseItem(record_id=uuid4(), score=1.0),
+                SearchResponseItem(record_id=record.id, score=0.5),
+            ],
+            total=10,
+        )
+
+        response = await async_client.post(
+            self.url(dataset.id),
+            headers=owner_auth_header,
+            json={"query": {"text": {"q": "text"}}},
+        )
+
+        assert response.status_code == 200
+
+        response_json = response.json()
+        assert [item["record"]["id"] for item in response_json["items"]] == [str(record.id)]
+        assert response_json["total"] == 9
+
     async def test_with_invalid_filter(self, async_client: AsyncClient, owner_auth_header: dict):
         dataset = await DatasetFactory.create()
 
@@ -0,0 +1,147 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from httpx import AsyncClient
+
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.contexts import media
+from argilla_server.settings import settings
+
+from tests.factories import AnnotatorFactory, DatasetFactory, DatasetMediaFactory, WorkspaceUserFactory
+
+MEDIA_CONTENT = b"GIF89a\x01\x00\x01\x00\x00\x00\x00!\xf9\x04\x01\n\x00\x01\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02L\x01\x00;"
+
+
+@pytest.fixture
+def media_path(monkeypatch, tmp_path) -> str:
+    monkeypatch.setattr(settings, "media_path", str(tmp_path))
+
+    return str(tmp_path)
+
+
+@pytest.mark.asyncio
+class TestGetMedia:
+    def url(self, hash: str) -> str:
+        return f"/api/v1/media/{hash}"
+
+    async def test_get_media(self, async_client: AsyncClient, owner_auth_header: dict, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        await DatasetMediaFactory.create(hash=hash)
+
+        response = await async_client.get(self.url(hash), headers=owner_auth_header)
+
+        assert response.status_code == 200
+        assert response.content == MEDIA_CONTENT
+        assert response.headers["content-type"] == "image/gif"
+        assert response.headers["cache-control"] == "private, max-age=31536000, immutable"
+        assert response.headers["etag"] == f'"{hash}"'
+
+    async def test_get_media_with_range(self, async_client: AsyncClient, owner_auth_header: dict, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        await DatasetMediaFactory.create(hash=hash)
+
+        response = await async_client.get(self.url(hash), headers={**owner_auth_header, "Range": "bytes=0-5"})
+
+        assert response.status_code == 206
+        assert response.content == b"GIF89a"
+        assert response.headers["content-range"] == f"bytes 0-5/{len(MEDIA_CONTENT)}"
+
+    async def test_get_media_with_signed_reference(self, async_client: AsyncClient, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+
+        response = await async_client.get(media.signed_media_reference(hash))
+
+        assert response.status_code == 200
+        assert response.content == MEDIA_CONTENT
+        assert response.headers["content-type"] == "image/gif"
+
+    async def test_get_media_with_signed_reference_of_different_media(self, async_client: AsyncClient, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        other_hash = media.get_media_store().put(b"other", "image/gif")
+
+        response = await async_client.get(
+            f"{self.url(hash)}?token={media.signed_media_reference(other_hash).split('=', 1)[1]}"
+        )
+
+        assert response.status_code == 401
+
+    async def test_get_media_with_invalid_token(self, async_client: AsyncClient, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        await DatasetMediaFactory.create(hash=hash)
+
+        response = await async_client.get(self.url(hash), params={"token": "invalid"})
+
+        assert response.status_code == 401
+
+    async def test_get_media_without_authentication(self, async_client: AsyncClient, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        await DatasetMediaFactory.create(hash=hash)
+
+        response = await async_client.get(self.url(hash))
+
+        assert response.status_code == 401
+
+    async def test_get_media_as_annotator(self, async_client: AsyncClient, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        dataset = await DatasetFactory.create()
+        await DatasetMediaFactory.create(hash=hash)
+        await DatasetMediaFactory.create(hash=hash, dataset=dataset)
+
+        annotator = await AnnotatorFactory.create()
+        await WorkspaceUserFactory.create(workspace_id=dataset.workspace_id, user_id=annotator.id)
+
+        response = await async_client.get(self.url(hash), headers={API_KEY_HEADER_NAME: annotator.api_key})
+
+        assert response.status_code == 200
+        assert response.content == MEDIA_CONTENT
+
+    async def test_get_media_as_annotator_from_different_workspace(self, async_client: AsyncClient, media_path: str):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+        await DatasetMediaFactory.create(hash=hash)
+
+        annotator = await AnnotatorFactory.create()
+        await WorkspaceUserFactory.create(
+            workspace_id=(await DatasetFactory.create()).workspace_id, user_id=annotator.id
+        )
+
+        response = await async_client.get(self.url(hash), headers={API_KEY_HEADER_NAME: annotator.api_key})
+
+        assert response.status_code == 403
+
+    async def test_get_media_not_referenced_by_any_record(
+        self, async_client: AsyncClient, owner_auth_header: dict, media_path: str
+    ):
+        hash = media.get_media_store().put(MEDIA_CONTENT, "image/gif")
+
+        response = await async_client.get(self.url(hash), headers=owner_auth_header)
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Media with hash `{hash}` not found"}
+
+    async def test_get_media_with_nonexistent_hash(
+        self, async_client: AsyncClient, owner_auth_header: dict, media_path: str
+    ):
+        response = await async_client.get(self.url("a" * 64), headers=owner_auth_header)
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Media with hash `{'a' * 64}` not found"}
+
+    async def test_get_media_with_invalid_hash(
+        self, async_client: AsyncClient, owner_auth_header: dict, media_path: str
+    ):
+        response = await async_client.get(self.url("invalid"), headers=owner_auth_header)
+
+        assert response.status_code == 404
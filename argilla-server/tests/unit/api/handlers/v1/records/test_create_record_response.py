@@ -26,7 +26,7 @@ from argilla_server.jobs.queues import HIGH_QUEUE
 from argilla_server.webhooks.v1.enums import RecordEvent, ResponseEvent
 from argilla_server.webhooks.v1.responses import build_response_event
 from argilla_server.webhooks.v1.records import build_record_event
-from argilla_server.enums import ResponseStatus, RecordStatus, DatasetDistributionStrategy
+from argilla_server.enums import ResponseStatus, RecordStatus, DatasetDistributionStrategy, DatasetStatus
 
 from tests.factories import DatasetFactory, RecordFactory, SpanQuestionFactory, TextQuestionFactory, WebhookFactory
 
@@ -635,3 +635,26 @@ class TestCreateRecordResponse:
         assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
         assert HIGH_QUEUE.jobs[0].args[1] == RecordEvent.completed
         assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
+
+    async def test_create_record_response_for_dataset_being_deleted(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+
+        await TextQuestionFactory.create(name="text-question", dataset=dataset)
+
+        record = await RecordFactory.create(fields={"field-a": "Hello"}, dataset=dataset)
+
+        response = await async_client.post(
+            self.url(record.id),
+            headers=owner_auth_header,
+            json={
+                "values": {"text-question": {"value": "text"}},
+                "status": ResponseStatus.submitted,
+            },
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Record with id `{record.id}` not found"}
+
+        assert (await db.execute(select(func.count(Response.id)))).scalar() == 0
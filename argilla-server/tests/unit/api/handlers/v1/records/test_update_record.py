@@ -19,11 +19,12 @@ from httpx import AsyncClient
 from fastapi.encoders import jsonable_encoder
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server.enums import DatasetStatus
 from argilla_server.jobs.queues import HIGH_QUEUE
 from argilla_server.webhooks.v1.enums import RecordEvent
 from argilla_server.webhooks.v1.records import build_record_event
 
-from tests.factories import RecordFactory, WebhookFactory
+from tests.factories import DatasetFactory, RecordFactory, WebhookFactory
 
 
 @pytest.mark.asyncio
@@ -51,3 +52,21 @@ class TestUpdateRecord:
         assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
         assert HIGH_QUEUE.jobs[0].args[1] == RecordEvent.updated
         assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
+
+    async def test_update_record_for_dataset_being_deleted(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+        record = await RecordFactory.create(dataset=dataset, metadata_={"old": "value"})
+
+        response = await async_client.patch(
+            self.url(record.id),
+            headers=owner_auth_header,
+            json={"metadata": {"new": "value"}},
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Record with id `{record.id}` not found"}
+
+        await db.refresh(record)
+        assert record.metadata_ == {"old": "value"}
@@ -17,7 +17,7 @@ from typing import List
 from uuid import UUID, uuid4
 
 import pytest
-from argilla_server.enums import QuestionType, SuggestionType
+from argilla_server.enums import DatasetStatus, QuestionType, SuggestionType
 from argilla_server.models import Suggestion
 from httpx import AsyncClient
 from sqlalchemy import func, select
@@ -724,3 +724,21 @@ class TestUpsertSuggestion:
         assert response.json() == {"detail": "overlapping values found between spans at index idx=0 and idx=2"}
 
         assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 0
+
+    async def test_upsert_suggestion_for_dataset_being_deleted(
+        self, db: AsyncSession, async_client: AsyncClient, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+        question = await TextQuestionFactory.create(dataset=dataset)
+        record = await RecordFactory.create(dataset=dataset)
+
+        response = await async_client.put(
+            self.url(record.id),
+            headers=owner_auth_header,
+            json={"question_id": str(question.id), "type": SuggestionType.model, "value": "value"},
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Record with id `{record.id}` not found"}
+
+        assert (await db.execute(select(func.count(Suggestion.id)))).scalar() == 0
@@ -26,7 +26,7 @@ from argilla_server.jobs.queues import HIGH_QUEUE
 from argilla_server.webhooks.v1.enums import RecordEvent, ResponseEvent
 from argilla_server.webhooks.v1.responses import build_response_event
 from argilla_server.webhooks.v1.records import build_record_event
-from argilla_server.enums import ResponseStatus, DatasetDistributionStrategy, RecordStatus
+from argilla_server.enums import ResponseStatus, DatasetDistributionStrategy, DatasetStatus, RecordStatus
 
 from tests.factories import (
     DatasetFactory,
@@ -780,3 +780,32 @@ class TestUpdateResponse:
         assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
         assert HIGH_QUEUE.jobs[0].args[1] == RecordEvent.completed
         assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
+
+    async def test_update_response_for_dataset_being_deleted(
+        self, async_client: AsyncClient, db: AsyncSession, owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+
+        await TextQuestionFactory.create(name="text-question", dataset=dataset)
+
+        record = await RecordFactory.create(dataset=dataset)
+        response = await ResponseFactory.create(
+            status=ResponseStatus.draft,
+            values={"text-question": {"value": "text"}},
+            record=record,
+        )
+
+        resp = await async_client.put(
+            self.url(response.id),
+            headers=owner_auth_header,
+            json={
+                "values": {"text-question": {"value": "updated"}},
+                "status": ResponseStatus.submitted,
+            },
+        )
+
+        assert resp.status_code == 404
+        assert resp.json() == {"detail": f"Response with id `{response.id}` not found"}
+
+        await db.refresh(response)
+        assert response.status == ResponseStatus.draft
@@ -19,6 +19,7 @@ from unittest.mock import ANY
 from uuid import UUID, uuid4
 
 import pytest
+from rq.job import JobStatus
 from sqlalchemy import func, inspect, select
 
 from argilla_server.api.handlers.v1.datasets.records import LIST_DATASET_RECORDS_LIMIT_DEFAULT
@@ -30,6 +31,7 @@ from argilla_server.api.schemas.v1.vector_settings import (
     VECTOR_SETTINGS_CREATE_TITLE_MAX_LENGTH,
 )
 from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server.jobs.queues import DEFAULT_QUEUE
 from argilla_server.enums import (
     DatasetDistributionStrategy,
     DatasetStatus,
@@ -730,6 +732,14 @@ class TestSuiteDatasets:
         assert response.status_code == 404
         assert response.json() == {"detail": f"Dataset with id `{dataset_id}` not found"}
 
+    async def test_get_dataset_being_deleted(self, async_client: "AsyncClient", owner_auth_header: dict):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+
+        response = await async_client.get(f"/api/v1/datasets/{dataset.id}", headers=owner_auth_header)
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": f"Dataset with id `{dataset.id}` not found"}
+
     async def test_get_current_user_dataset_metrics(
         self,
         async_client: "AsyncClient",
@@ -4599,54 +4609,41 @@ class TestSuiteDatasets:
         await TextQuestionFactory.create(dataset=dataset)
 
         other_dataset = await DatasetFactory.create()
-        other_field = await TextFieldFactory.create(dataset=other_dataset)
-        other_question = await TextQuestionFactory.create(dataset=other_dataset)
-        other_record = await RecordFactory.create(dataset=other_dataset)
-        other_response = await ResponseFactory.create(record=other_record, user=owner)
 
         response = await async_client.delete(f"/api/v1/datasets/{dataset.id}", headers=owner_auth_header)
 
         assert response.status_code == 200
 
-        # assert [dataset.id for dataset in (await db.execute(select(Dataset))).all()] == [other_dataset.id]
-        # assert [field.id for field in db.query(Field).all()] == [other_field.id]
-        # assert [question.id for question in db.query(Question).all()] == [other_question.id]
-        # assert [record.id for record in db.query(Record).all()] == [other_record.id]
-        # assert [response.id for response in db.query(Response).all()] == [other_response.id]
-        # assert [workspace.id for workspace in db.query(Workspace).order_by(Workspace.inserted_at.asc()).all()] == [
-        #     dataset.workspace_id,
-        #     other_dataset.workspace_id,
-        # ]
+        response_json = response.json()
+        assert response_json["id"] == str(dataset.id)
+        assert response_json["status"] == DatasetStatus.deleting
+        assert response_json["job"]["id"]
+        assert response_json["job"]["status"] == JobStatus.QUEUED
+
+        assert dataset.status == DatasetStatus.deleting
+        assert other_dataset.status != DatasetStatus.deleting
+
+        assert DEFAULT_QUEUE.count == 1
+        assert DEFAULT_QUEUE.jobs[0].args == (dataset.id,)
 
-        mock_search_engine.delete_index.assert_called_once_with(dataset)
+        assert not mock_search_engine.delete_index.called
 
     async def test_delete_published_dataset(
         self, async_client: "AsyncClient", db: "AsyncSession", owner: User, owner_auth_header: dict
     ):
-        dataset = await DatasetFactory.create()
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
         await TextFieldFactory.create(dataset=dataset)
         await TextQuestionFactory.create(dataset=dataset)
         record = await RecordFactory.create(dataset=dataset)
         await ResponseFactory.create(record=record, user=owner)
 
-        other_dataset = await DatasetFactory.create()
-        other_field = await TextFieldFactory.create(dataset=other_dataset)
-        other_question = await TextQuestionFactory.create(dataset=other_dataset)
-        other_record = await RecordFactory.create(dataset=other_dataset)
-        other_response = await ResponseFactory.create(record=other_record, user=owner)
-
         response = await async_client.delete(f"/api/v1/datasets/{dataset.id}", headers=owner_auth_header)
 
         assert response.status_code == 200
-        # assert [dataset.id for dataset in db.query(Dataset).all()] == [other_dataset.id]
-        # assert [field.id for field in db.query(Field).all()] == [other_field.id]
-        # assert [question.id for question in db.query(Question).all()] == [other_question.id]
-        # assert [record.id for record in db.query(Record).all()] == [other_record.id]
-        # assert [response.id for response in db.query(Response).all()] == [other_response.id]
-        # assert [workspace.id for workspace in db.query(Workspace).order_by(Workspace.inserted_at.asc()).all()] == [
-        #     dataset.workspace_id,
-        #     other_dataset.workspace_id,
-        # ]
+        assert response.json()["status"] == DatasetStatus.deleting
+
+        assert (await db.execute(select(func.count(Record.id)))).scalar() == 1
+        assert DEFAULT_QUEUE.count == 1
 
     async def test_delete_dataset_without_authentication(
         self, async_client: "AsyncClient", db: "AsyncSession", mock_search_engine: SearchEngine
@@ -4670,7 +4667,7 @@ class TestSuiteDatasets:
         )
 
         assert response.status_code == 200
-        assert (await db.execute(select(func.count(Dataset.id)))).scalar() == 0
+        assert dataset.status == DatasetStatus.deleting
 
     async def test_delete_dataset_as_annotator(self, async_client: "AsyncClient", db: "AsyncSession"):
         annotator = await AnnotatorFactory.create()
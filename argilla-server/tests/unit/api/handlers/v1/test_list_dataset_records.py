@@ -12,6 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+from datetime import datetime
 from typing import List, Optional, Tuple, Union
 
 import pytest
@@ -20,6 +21,7 @@ from httpx import AsyncClient
 from argilla_server.constants import API_KEY_HEADER_NAME
 from argilla_server.enums import RecordInclude, ResponseStatus
 from argilla_server.models import Dataset, Question, Record, Response, Suggestion, User, Workspace
+from tests.database import assert_max_queries
 from tests.factories import (
     AdminFactory,
     AnnotatorFactory,
@@ -327,6 +329,24 @@ class TestSuiteListDatasetRecords:
             "total": 3,
         }
 
+    async def test_list_dataset_records_with_include_responses_query_budget(
+        self, async_client: "AsyncClient", owner_auth_header: dict
+    ):
+        dataset = await DatasetFactory.create()
+        records = await RecordFactory.create_batch(size=10, dataset=dataset)
+        for record in records:
+            await ResponseFactory.create(record=record)
+
+        with assert_max_queries(8):
+            response = await async_client.get(
+                f"/api/v1/datasets/{dataset.id}/records",
+                headers=owner_auth_header,
+                params={"include": RecordInclude.responses.value},
+            )
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 10
+
     async def test_list_dataset_records_with_offset(self, async_client: "AsyncClient", owner_auth_header: dict):
         dataset = await DatasetFactory.create()
         await RecordFactory.create(fields={"record_a": "value_a"}, dataset=dataset)
@@ -383,6 +403,44 @@ class TestSuiteListDatasetRecords:
         response_body = response.json()
         assert [item["id"] for item in response_body["items"]] == [str(record_c.id)]
 
+    async def test_list_dataset_records_with_updated_at_range(
+        self, async_client: "AsyncClient", owner_auth_header: dict
+    ):
+        old, recent = datetime(2024, 1, 1), datetime(2024, 6, 1)
+        dataset = await DatasetFactory.create()
+        question = await TextQuestionFactory.create(dataset=dataset)
+        await RecordFactory.create(dataset=dataset, inserted_at=old, updated_at=old)
+        record_updated = await RecordFactory.create(dataset=dataset, inserted_at=old, updated_at=recent)
+        record_with_response = await RecordFactory.create(dataset=dataset, inserted_at=old, updated_at=old)
+        await ResponseFactory.create(record=record_with_response, inserted_at=old, updated_at=recent)
+        record_with_suggestion = await RecordFactory.create(dataset=dataset, inserted_at=old, updated_at=old)
+        await SuggestionFactory.create(
+            record=record_with_suggestion, question=question, inserted_at=old, updated_at=recent
+        )
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records",
+            headers=owner_auth_header,
+            params={"updated_at_ge": "2024-05-01T00:00:00+00:00"},
+        )
+
+        assert response.status_code == 200
+        response_body = response.json()
+        assert response_body["total"] == 3
+        assert {item["id"] for item in response_body["items"]} == {
+            str(record_updated.id),
+            str(record_with_response.id),
+            str(record_with_suggestion.id),
+        }
+
+        response = await async_client.get(
+            f"/api/v1/datasets/{dataset.id}/records",
+            headers=owner_auth_header,
+            params={"updated_at_ge": "2024-05-01T00:00:00", "updated_at_le": "2024-04-01T00:00:00"},
+        )
+
+        assert response.status_code == 422
+
     async def create_records_with_response(
         self,
         num_records: int,
@@ -11,8 +11,9 @@
 #  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
+import asyncio
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock
 
 import pytest
 from fastapi import Request
@@ -57,7 +58,7 @@ class TestSuiteTelemetry:
     def test_track_data(self, mocker: MockerFixture):
         from argilla_server._version import __version__ as version
 
-        mock = mocker.patch("argilla_server.telemetry._client.send_telemetry")
+        mock = mocker.patch("huggingface_hub.utils.send_telemetry")
 
         telemetry = TelemetryClient()
         telemetry.track_data("test_topic", {"test": "test"})
@@ -69,6 +70,56 @@ class TestSuiteTelemetry:
             user_agent={"test": "test", **telemetry._system_info},
         )
 
+    async def test_track_data_when_started(self, mocker: MockerFixture):
+        mock = mocker.patch("huggingface_hub.utils.send_telemetry")
+
+        telemetry = TelemetryClient(flush_interval=60)
+        await telemetry.start()
+
+        telemetry.track_data("test_topic", {"test": "test"})
+        mock.assert_not_called()
+
+        await telemetry.stop()
+
+        mock.assert_called_once_with(
+            topic="argilla/server/test_topic",
+            library_name="argilla-server",
+            library_version=ANY,
+            user_agent={"test": "test", **telemetry._system_info},
+        )
+
+    async def test_track_data_when_started_flushes_batches(self, mocker: MockerFixture):
+        mock = mocker.patch("huggingface_hub.utils.send_telemetry")
+
+        telemetry = TelemetryClient(batch_size=2, flush_interval=60)
+        await telemetry.start()
+
+        telemetry.track_data("test_topic_a")
+        telemetry.track_data("test_topic_b")
+        for _ in range(100):
+            if mock.call_count == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert mock.call_count == 2
+
+        await telemetry.stop()
+
+    async def test_track_data_when_started_drops_events_with_full_queue(self, mocker: MockerFixture):
+        mock = mocker.patch("huggingface_hub.utils.send_telemetry")
+
+        telemetry = TelemetryClient(queue_max_size=2, flush_interval=60)
+        await telemetry.start()
+
+        for _ in range(5):
+            telemetry.track_data("test_topic")
+
+        assert telemetry.dropped_events >= 2
+
+        await telemetry.stop()
+
+        assert mock.call_count == 5 - telemetry.dropped_events
+
     async def test_track_api_request(self, test_telemetry: TelemetryClient, mocker: MockerFixture):
         mocker.patch(
             "argilla_server.telemetry._client.resolve_endpoint_path_for_request", return_value="/api/test/endpoint"
@@ -0,0 +1,74 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import datasets
+from argilla_server.enums import DatasetStatus
+from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.models import Dataset, Record, Response
+from argilla_server.search_engine import SearchEngine
+from argilla_server.webhooks.v1.datasets import build_dataset_event
+from argilla_server.webhooks.v1.enums import DatasetEvent
+
+from tests.factories import DatasetFactory, RecordFactory, ResponseFactory, TextFieldFactory, WebhookFactory
+
+
+@pytest.mark.asyncio
+class TestDeleteDatasetInChunks:
+    async def test_delete_dataset_in_chunks(self, db: AsyncSession, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+        await TextFieldFactory.create(dataset=dataset)
+        records = await RecordFactory.create_batch(5, dataset=dataset)
+        await ResponseFactory.create(record=records[0])
+
+        other_dataset = await DatasetFactory.create()
+        other_record = await RecordFactory.create(dataset=other_dataset)
+        other_response = await ResponseFactory.create(record=other_record)
+
+        progress = []
+        await datasets.delete_dataset_in_chunks(
+            db,
+            mock_search_engine,
+            dataset,
+            chunk_size=2,
+            on_progress=lambda processed, total: progress.append((processed, total)),
+        )
+
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+
+        assert (await db.execute(select(Dataset.id))).scalars().all() == [other_dataset.id]
+        assert (await db.execute(select(Record.id))).scalars().all() == [other_record.id]
+        assert (await db.execute(select(Response.id))).scalars().all() == [other_response.id]
+
+        mock_search_engine.delete_index.assert_called_once_with(dataset)
+
+    async def test_delete_dataset_in_chunks_enqueue_webhook_dataset_deleted_event(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        dataset = await DatasetFactory.create(status=DatasetStatus.deleting)
+        webhook = await WebhookFactory.create(events=[DatasetEvent.deleted])
+
+        event = await build_dataset_event(db, DatasetEvent.deleted, dataset)
+
+        await datasets.delete_dataset_in_chunks(db, mock_search_engine, dataset)
+
+        assert HIGH_QUEUE.count == 1
+        assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
+        assert HIGH_QUEUE.jobs[0].args[1] == DatasetEvent.deleted
+        assert HIGH_QUEUE.jobs[0].args[3] == jsonable_encoder(event.data)
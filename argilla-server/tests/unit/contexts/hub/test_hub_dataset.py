@@ -14,6 +14,8 @@
 
 import pytest
 
+from PIL import Image
+from datasets import Dataset as HFDataset
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -22,6 +24,7 @@ from argilla_server.enums import DatasetStatus, QuestionType
 from argilla_server.models import Record
 from argilla_server.contexts.hub import HubDataset
 from argilla_server.search_engine import SearchEngine
+from argilla_server.settings import settings
 
 from tests.factories import (
     ChatFieldFactory,
@@ -532,3 +535,51 @@ class TestHubDataset:
             "test_3",
             "test_4",
         ]
+
+    async def test_hub_dataset_import_to_in_batches_reporting_progress(
+        self, db: AsyncSession, mock_search_engine: SearchEngine, monkeypatch, tmp_path
+    ):
+        monkeypatch.setattr(settings, "hub_import_batch_size", 2)
+
+        HFDataset.from_dict(
+            {
+                "text": [f"text-{i}" for i in range(5)],
+                "image": [Image.new("RGB", (4, 4)) for _ in range(5)],
+            },
+        ).to_parquet(str(tmp_path / "train.parquet"))
+
+        dataset = await DatasetFactory.create(status=DatasetStatus.ready)
+
+        await TextFieldFactory.create(name="text", required=True, dataset=dataset)
+        await ImageFieldFactory.create(name="image", required=True, dataset=dataset)
+
+        await dataset.awaitable_attrs.fields
+        await dataset.awaitable_attrs.questions
+        await dataset.awaitable_attrs.metadata_properties
+
+        hub_dataset = HubDataset(
+            name=str(tmp_path),
+            subset="default",
+            split="train",
+            mapping=HubDatasetMapping(
+                fields=[
+                    HubDatasetMappingItem(source="text", target="text"),
+                    HubDatasetMappingItem(source="image", target="image"),
+                ],
+            ),
+        )
+
+        progress = []
+        await hub_dataset.take(4).import_to(
+            db,
+            mock_search_engine,
+            dataset,
+            on_progress=lambda processed, total: progress.append((processed, total)),
+        )
+
+        assert progress == [(2, 4), (4, 4)]
+
+        records = (await db.execute(select(Record).order_by(Record.external_id))).scalars().all()
+        assert [record.external_id for record in records] == ["train_0", "train_1", "train_2", "train_3"]
+        assert [record.fields["text"] for record in records] == ["text-0", "text-1", "text-2", "text-3"]
+        assert all(record.fields["image"].startswith("data:image/png;base64,") for record in records)
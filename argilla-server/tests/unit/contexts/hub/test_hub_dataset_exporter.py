@@ -17,9 +17,9 @@ import pytest
 
 from PIL import Image
 from uuid import uuid4
-from typing import Generator
-from huggingface_hub import HfApi
-from datasets import load_dataset, get_dataset_config_names, get_dataset_split_names
+from typing import Generator, List
+from huggingface_hub import DatasetCard, DatasetCardData, HfApi
+from datasets import features, load_dataset, get_dataset_config_names, get_dataset_split_names
 
 from argilla_server.contexts import hub
 from argilla_server.contexts.hub import HubDatasetExporter
@@ -53,7 +53,7 @@ def sync_test_session(mocker):
     def override_get_sync_db():
         yield session
 
-    mocker.patch.object(hub, "get_sync_db", override_get_sync_db)
+    mocker.patch.object(hub, "get_sync_read_db", override_get_sync_db)
 
     yield session
 
@@ -1287,3 +1287,155 @@ class TestHubDatasetExporter:
         assert exported_dataset[0]["vector.vector-a"] == [1.0, 2.0, 3.0]
         assert exported_dataset[0]["vector.vector-b"] == [3.14, 3.15]
         assert exported_dataset[0]["vector.vector-c"] == None
+
+
+class TestHubDatasetExporterWriteParquetShards:
+    def test_write_parquet_shards(self, sync_test_session, tmp_path):
+        dataset = DatasetSyncFactory.create(status=DatasetStatus.ready)
+
+        FieldSyncFactory.create(name="text", settings={"type": FieldType.text, "use_markdown": False}, dataset=dataset)
+        records = RecordSyncFactory.create_batch(3, fields={"text": "Hello World"}, dataset=dataset)
+
+        exporter = HubDatasetExporter(dataset)
+        exporter.shard_size = 2
+
+        shard_paths = exporter.write_parquet_shards(str(tmp_path), "train")
+
+        assert [os.path.basename(shard_path) for shard_path in shard_paths] == [
+            "train-00000-of-00002.parquet",
+            "train-00001-of-00002.parquet",
+        ]
+
+        exported_dataset = load_dataset("parquet", data_files=shard_paths, split="train")
+
+        assert exported_dataset.to_list() == [
+            {
+                "id": record.external_id,
+                "status": record.status,
+                "inserted_at": record.inserted_at,
+                "updated_at": record.updated_at,
+                "_server_id": str(record.id),
+                "text": "Hello World",
+            }
+            for record in records
+        ]
+
+    def test_write_parquet_shards_with_shards_having_different_schemas(self, sync_test_session, tmp_path):
+        dataset = DatasetSyncFactory.create(status=DatasetStatus.ready)
+        annotator = AnnotatorSyncFactory.create(workspaces=[dataset.workspace])
+
+        FieldSyncFactory.create(name="image", settings={"type": FieldType.image}, dataset=dataset)
+        question = QuestionSyncFactory.create(
+            name="ranking-question",
+            settings={
+                "type": QuestionType.ranking,
+                "options": [
+                    {"value": "completion-a", "text": "Completion A"},
+                    {"value": "completion-b", "text": "Completion B"},
+                ],
+            },
+            dataset=dataset,
+        )
+
+        records = [
+            RecordSyncFactory.create(fields={"image": IMAGE_URL}, dataset=dataset),
+            RecordSyncFactory.create(fields={"image": IMAGE_DATA_URL}, dataset=dataset),
+        ]
+        ResponseSyncFactory.create(
+            values={"ranking-question": {"value": [{"value": "completion-a"}, {"value": "completion-b", "rank": 1}]}},
+            record=records[1],
+            user=annotator,
+        )
+        SuggestionSyncFactory.create(value=[{"value": "completion-a"}], record=records[1], question=question)
+
+        exporter = HubDatasetExporter(dataset)
+        exporter.shard_size = 1
+
+        shard_paths = exporter.write_parquet_shards(str(tmp_path), "train")
+        exported_dataset = load_dataset("parquet", data_files=shard_paths, split="train")
+
+        assert len(shard_paths) == 2
+        assert isinstance(exported_dataset[1]["image"], Image.Image)
+
+        exported_dataset = exported_dataset.cast_column("image", features.Image(decode=False))
+
+        assert exported_dataset[0]["image"] == {"bytes": None, "path": IMAGE_URL}
+        assert exported_dataset[0]["ranking-question.responses"] is None
+        assert exported_dataset[0]["ranking-question.suggestion"] is None
+        assert exported_dataset[1]["ranking-question.responses"] == [
+            [{"value": "completion-a", "rank": None}, {"value": "completion-b", "rank": 1}]
+        ]
+        assert exported_dataset[1]["ranking-question.responses.users"] == [str(annotator.id)]
+        assert exported_dataset[1]["ranking-question.suggestion"] == [{"value": "completion-a"}]
+
+
+class TestHubDatasetExporterDatasetCard:
+    def _export_to(self, mocker, tmp_path, dataset, existing_configs, subset: str, split: str) -> List[dict]:
+        hf_api = mocker.Mock(spec=HfApi)
+        mocker.patch.object(hub, "HfApi", return_value=hf_api)
+
+        hf_api.file_exists.return_value = existing_configs is not None
+        if existing_configs is not None:
+            dataset_card_path = str(tmp_path / "README.md")
+            DatasetCard(f"---\n{DatasetCardData(configs=existing_configs).to_yaml()}\n---\n").save(dataset_card_path)
+            hf_api.hf_hub_download.return_value = dataset_card_path
+
+        uploaded_configs = []
+
+        def upload_folder(folder_path: str, **kwargs):
+            uploaded_configs.extend(DatasetCard.load(os.path.join(folder_path, "README.md")).data["configs"])
+
+        hf_api.upload_folder.side_effect = upload_folder
+
+        HubDatasetExporter(dataset).export_to(name="org/dataset", subset=subset, split=split, private=False, token="")
+
+        return uploaded_configs
+
+    def test_export_to_creates_dataset_card_configs(self, sync_test_session, mocker, tmp_path):
+        dataset = DatasetSyncFactory.create(status=DatasetStatus.ready)
+
+        FieldSyncFactory.create(name="text", settings={"type": FieldType.text, "use_markdown": False}, dataset=dataset)
+        RecordSyncFactory.create(fields={"text": "Hello World"}, dataset=dataset)
+
+        configs = self._export_to(mocker, tmp_path, dataset, None, subset="default", split="train")
+
+        assert configs == [{"config_name": "default", "data_files": [{"split": "train", "path": "data/train-*"}]}]
+
+    def test_export_to_keeps_dataset_card_configs_of_other_subsets_and_splits(
+        self, sync_test_session, mocker, tmp_path
+    ):
+        dataset = DatasetSyncFactory.create(status=DatasetStatus.ready)
+
+        FieldSyncFactory.create(name="text", settings={"type": FieldType.text, "use_markdown": False}, dataset=dataset)
+        RecordSyncFactory.create(fields={"text": "Hello World"}, dataset=dataset)
+
+        existing_configs = [
+            {
+                "config_name": "default",
+                "data_files": [
+                    {"split": "train", "path": "data/train-*"},
+                    {"split": "test", "path": "data/test-*"},
+                ],
+            },
+            {"config_name": "custom", "data_files": [{"split": "train", "path": "custom/train-*"}]},
+        ]
+
+        configs = self._export_to(mocker, tmp_path, dataset, existing_configs, subset="default", split="train")
+
+        assert configs == [
+            {
+                "config_name": "default",
+                "data_files": [
+                    {"split": "test", "path": "data/test-*"},
+                    {"split": "train", "path": "data/train-*"},
+                ],
+            },
+            {"config_name": "custom", "data_files": [{"split": "train", "path": "custom/train-*"}]},
+        ]
+
+        configs = self._export_to(mocker, tmp_path, dataset, existing_configs, subset="other", split="validation")
+
+        assert configs == [
+            *existing_configs,
+            {"config_name": "other", "data_files": [{"split": "validation", "path": "other/validation-*"}]},
+        ]
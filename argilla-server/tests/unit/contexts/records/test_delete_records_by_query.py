@@ -0,0 +1,107 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.contexts import records
+from argilla_server.jobs.queues import HIGH_QUEUE
+from argilla_server.models import Record
+from argilla_server.search_engine import SearchEngine, SearchResponseItem, SearchResponses
+from argilla_server.webhooks.v1.enums import RecordsEvent
+
+from tests.factories import DatasetFactory, RecordFactory, WebhookFactory
+
+
+@pytest.mark.asyncio
+class TestDeleteRecordsByQuery:
+    async def test_delete_records_by_query_without_query(self, db: AsyncSession, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create_batch(5, dataset=dataset)
+        other_record = await RecordFactory.create()
+
+        progress = []
+        deleted = await records.delete_records_by_query(
+            db,
+            mock_search_engine,
+            dataset,
+            chunk_size=2,
+            on_progress=lambda processed, total: progress.append((processed, total)),
+        )
+
+        assert deleted == 5
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+        assert (await db.execute(select(Record.id))).scalars().all() == [other_record.id]
+
+        mock_search_engine.delete_records_by_query.assert_called_once_with(dataset)
+        mock_search_engine.search.assert_not_called()
+
+    async def test_delete_records_by_query_with_query(self, db: AsyncSession, mock_search_engine: SearchEngine):
+        dataset = await DatasetFactory.create()
+        matching_records = await RecordFactory.create_batch(3, dataset=dataset)
+        await RecordFactory.create_batch(2, dataset=dataset)
+
+        mock_search_engine.search.side_effect = [
+            SearchResponses(
+                items=[SearchResponseItem(record_id=record.id) for record in matching_records[:2]], total=3
+            ),
+            SearchResponses(items=[SearchResponseItem(record_id=matching_records[2].id)], total=1),
+            SearchResponses(items=[], total=0),
+        ]
+
+        progress = []
+        deleted = await records.delete_records_by_query(
+            db,
+            mock_search_engine,
+            dataset,
+            query="spam",
+            chunk_size=2,
+            on_progress=lambda processed, total: progress.append((processed, total)),
+        )
+
+        assert deleted == 3
+        assert progress == [(2, 3), (3, 3)]
+        assert (await db.execute(select(func.count(Record.id)))).scalar_one() == 2
+
+        assert mock_search_engine.search.call_count == 3
+        assert mock_search_engine.delete_records.call_count == 2
+        mock_search_engine.delete_records_by_query.assert_not_called()
+
+    async def test_delete_records_by_query_enqueue_a_single_webhook_event(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        await RecordFactory.create_batch(3, dataset=dataset)
+        webhook = await WebhookFactory.create(events=[RecordsEvent.deleted])
+
+        await records.delete_records_by_query(db, mock_search_engine, dataset, chunk_size=1)
+
+        assert HIGH_QUEUE.count == 1
+        assert HIGH_QUEUE.jobs[0].args[0] == webhook.id
+        assert HIGH_QUEUE.jobs[0].args[1] == RecordsEvent.deleted
+        assert HIGH_QUEUE.jobs[0].args[3]["count"] == 3
+        assert HIGH_QUEUE.jobs[0].args[3]["dataset"]["id"] == str(dataset.id)
+
+    async def test_delete_records_by_query_without_matching_records(
+        self, db: AsyncSession, mock_search_engine: SearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        await WebhookFactory.create(events=[RecordsEvent.deleted])
+
+        deleted = await records.delete_records_by_query(db, mock_search_engine, dataset)
+
+        assert deleted == 0
+        assert HIGH_QUEUE.count == 0
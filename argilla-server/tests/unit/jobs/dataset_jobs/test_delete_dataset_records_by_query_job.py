@@ -0,0 +1,69 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import pytest
+
+from pytest_mock import MockerFixture
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from argilla_server.constants import SEARCH_ENGINE_EMBEDDED
+from argilla_server.jobs.dataset_jobs import delete_dataset_records_by_query_job
+from argilla_server.models import Record
+from argilla_server.search_engine import EmbeddedSearchEngine
+from argilla_server.settings import settings
+
+from tests.factories import DatasetFactory, RecordFactory, TextFieldFactory
+from tests.unit.search_engine.test_commons import refresh_dataset, refresh_records
+
+
+@pytest.mark.asyncio
+class TestDeleteDatasetRecordsByQueryJob:
+    @pytest.fixture(autouse=True)
+    def embedded_search_engine(self, mocker: MockerFixture, db: AsyncSession, tmp_path) -> EmbeddedSearchEngine:
+        mocker.patch("argilla_server.jobs.dataset_jobs.AsyncSessionLocal", return_value=db)
+        mocker.patch.object(settings, "search_engine", SEARCH_ENGINE_EMBEDDED)
+        mocker.patch.object(settings, "search_engine_embedded_path", str(tmp_path / "search_engine"))
+
+        return EmbeddedSearchEngine(path=settings.search_engine_embedded_path)
+
+    async def test_delete_dataset_records_by_query_job_with_field_query(
+        self, db: AsyncSession, embedded_search_engine: EmbeddedSearchEngine
+    ):
+        dataset = await DatasetFactory.create()
+        await TextFieldFactory.create(name="text", dataset=dataset)
+        await TextFieldFactory.create(name="other", dataset=dataset)
+        records_to_delete = await RecordFactory.create_batch(
+            2, dataset=dataset, fields={"text": "delete me", "other": "keep"}
+        )
+        records_to_keep = await RecordFactory.create_batch(
+            3, dataset=dataset, fields={"text": "keep", "other": "delete me"}
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records(records_to_delete + records_to_keep)
+        await embedded_search_engine.create_index(dataset)
+        await embedded_search_engine.index_records(dataset, records_to_delete + records_to_keep)
+
+        # NOTE: The job runs in a worker, so the dataset and its relationships must be loaded from scratch.
+        dataset_id = dataset.id
+        db.expunge_all()
+
+        deleted = await delete_dataset_records_by_query_job(dataset_id, query={"q": "delete", "field": "text"})
+
+        assert deleted == 2
+        assert (await db.execute(select(func.count(Record.id)).filter_by(dataset_id=dataset_id))).scalar_one() == 3
+        assert set((await db.execute(select(Record.id).filter_by(dataset_id=dataset_id))).scalars()) == {
+            record.id for record in records_to_keep
+        }
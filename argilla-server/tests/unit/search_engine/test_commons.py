@@ -1172,6 +1172,29 @@ class TestBaseElasticAndOpenSearchEngine:
         ]
         assert len(records_to_keep) == 5
 
+    async def test_delete_records_by_query(self, search_engine: BaseElasticAndOpenSearchEngine, opensearch: OpenSearch):
+        text_field = await TextFieldFactory.create(name="text")
+        dataset = await DatasetFactory.create(fields=[text_field], questions=[])
+        records_to_delete = await RecordFactory.create_batch(size=3, dataset=dataset, fields={"text": "spam"})
+        records_to_keep = await RecordFactory.create_batch(size=2, dataset=dataset, fields={"text": "ham"})
+        records = records_to_delete + records_to_keep
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await search_engine.create_index(dataset)
+        await search_engine.index_records(dataset, records)
+
+        deleted = await search_engine.delete_records_by_query(dataset, query=TextQuery(q="spam"))
+
+        assert deleted == 3
+
+        index_name = es_index_name_for_dataset(dataset)
+        es_ids = [
+            hit["_id"] for hit in opensearch.search(index=index_name, body={"query": {"match_all": {}}})["hits"]["hits"]
+        ]
+        assert sorted(es_ids) == sorted([str(record.id) for record in records_to_keep])
+
     async def test_update_record_response(
         self,
         search_engine: BaseElasticAndOpenSearchEngine,
@@ -1704,8 +1727,6 @@ class TestBaseElasticAndOpenSearchEngine:
             if status not in response_status and status != ResponseStatusFilter.pending:
                 await self._update_records_responses(opensearch, index_name, rest_of_the_records, status, user)
 
-        opensearch.indices.refresh(index=index_name)
-
     async def _update_records_responses(
         self,
         opensearch: OpenSearch,
@@ -1739,3 +1760,5 @@ class TestBaseElasticAndOpenSearchEngine:
             record_responses.extend(responses)
 
             opensearch.update(index_name, id=record.id, body={"doc": {"responses": record_responses}})
+
+        opensearch.indices.refresh(index=index_name)
@@ -0,0 +1,751 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import random
+import uuid
+from typing import List, Optional, Union
+
+import pytest
+import pytest_asyncio
+
+from argilla_server.enums import (
+    DatasetStatus,
+    MetadataPropertyType,
+    RecordStatus,
+    ResponseStatus,
+    ResponseStatusFilter,
+    SimilarityOrder,
+    SortOrder,
+)
+from argilla_server.models import Dataset, Record, User, VectorSettings
+from argilla_server.search_engine import (
+    AndFilter,
+    EmbeddedSearchEngine,
+    Filter,
+    MetadataFilterScope,
+    Order,
+    RangeFilter,
+    RecordFilterScope,
+    ResponseFilterScope,
+    SuggestionFilterScope,
+    TermsFilter,
+    TextQuery,
+)
+from argilla_server.search_engine.embedded import embedded_index_path
+from tests.factories import (
+    ChatFieldFactory,
+    CustomFieldFactory,
+    DatasetFactory,
+    LabelSelectionQuestionFactory,
+    RecordFactory,
+    ResponseFactory,
+    SuggestionFactory,
+    TextFieldFactory,
+    UserFactory,
+    VectorFactory,
+    VectorSettingsFactory,
+)
+from tests.unit.search_engine import test_commons
+from tests.unit.search_engine.test_commons import (
+    refresh_dataset,
+    refresh_records,
+    test_banking_sentiment_dataset_non_indexed,  # noqa: F401
+)
+
+
+@pytest.fixture
+def embedded_search_engine(tmp_path) -> EmbeddedSearchEngine:
+    return EmbeddedSearchEngine(path=str(tmp_path / "search_engine"))
+
+
+@pytest_asyncio.fixture
+async def banking_dataset(
+    embedded_search_engine: EmbeddedSearchEngine, test_banking_sentiment_dataset_non_indexed: Dataset
+) -> Dataset:
+    dataset = test_banking_sentiment_dataset_non_indexed
+
+    await embedded_search_engine.create_index(dataset)
+    await embedded_search_engine.index_records(dataset, dataset.records)
+
+    return dataset
+
+
+@pytest_asyncio.fixture
+async def banking_dataset_with_vectors(
+    embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+) -> Dataset:
+    vector_settings = await VectorSettingsFactory.create(dataset=banking_dataset, dimensions=3)
+
+    for position, record in enumerate(banking_dataset.records):
+        await VectorFactory.create(vector_settings=vector_settings, record=record, value=[1.0, position, position**2])
+        await record.awaitable_attrs.vectors
+
+    await refresh_dataset(banking_dataset)
+    await embedded_search_engine.index_records(banking_dataset, banking_dataset.records)
+
+    return banking_dataset
+
+
+async def _index_response(
+    search_engine: EmbeddedSearchEngine, record: Record, status: ResponseStatus, user=None, rating: int = 1
+) -> None:
+    response = await ResponseFactory.create(
+        record=record, user=user or await UserFactory.create(), status=status, values={"rating": {"value": rating}}
+    )
+    await response.awaitable_attrs.record
+
+    await search_engine.update_record_response(response)
+
+
+@pytest.mark.asyncio
+class TestEmbeddedSearchEngine:
+    async def test_create_and_delete_index(self, embedded_search_engine: EmbeddedSearchEngine):
+        dataset = await DatasetFactory.create()
+        await refresh_dataset(dataset)
+
+        await embedded_search_engine.create_index(dataset)
+        assert os.path.exists(embedded_index_path(embedded_search_engine.path, dataset))
+
+        await embedded_search_engine.delete_index(dataset)
+        assert not os.path.exists(embedded_index_path(embedded_search_engine.path, dataset))
+
+        with pytest.raises(ValueError, match="does not exist"):
+            await embedded_search_engine.search(dataset)
+
+    async def test_ping_and_info(self, embedded_search_engine: EmbeddedSearchEngine):
+        assert await embedded_search_engine.ping()
+        assert (await embedded_search_engine.info())["name"] == "embedded"
+
+    @pytest.mark.parametrize(
+        ("query", "expected_items"),
+        [
+            ("card", 5),
+            ("account", 1),
+            ("payment", 6),
+            ("cash", 3),
+            ("negative", 4),
+            ("00000", 1),
+            ("card payment", 5),
+            ("nothing", 0),
+            ("cash | negative", 6),
+            ("cash + negative", 1),
+            ("-(cash | negative)", 3),
+            ('"card payment"', 2),
+            ("pay*", 6),
+            (TextQuery(q="rate negative"), 1),
+            (TextQuery(q="negative", field="label"), 4),
+            (TextQuery(q="00000", field="textId"), 1),
+            (TextQuery(q="card payment", field="text"), 5),
+            (TextQuery(q="cash | negative", field="text"), 3),
+            (TextQuery(q="cash + negative", field="text"), 0),
+            (TextQuery(q="-(cash | negative)", field="text"), 6),
+        ],
+    )
+    async def test_search_with_query_string(
+        self,
+        embedded_search_engine: EmbeddedSearchEngine,
+        banking_dataset: Dataset,
+        query: Union[str, TextQuery],
+        expected_items: int,
+    ):
+        result = await embedded_search_engine.search(banking_dataset, query=query)
+
+        assert len(result.items) == expected_items
+        assert result.total == expected_items
+
+        scores = [item.score for item in result.items]
+        assert all(score > 0 for score in scores)
+        assert scores == sorted(scores, reverse=True)
+
+    async def test_search_for_chat_and_custom_fields(self, embedded_search_engine: EmbeddedSearchEngine):
+        chat_field = await ChatFieldFactory.create(name="chat")
+        custom_field = await CustomFieldFactory.create(name="custom")
+        dataset = await DatasetFactory.create(fields=[chat_field, custom_field])
+        records = await RecordFactory.create_batch(
+            size=2,
+            dataset=dataset,
+            fields={
+                "chat": [{"role": "user", "content": "Hello world"}, {"role": "bot", "content": "Hi"}],
+                "custom": {"a": "This is a value", "b": 100},
+            },
+        )
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await embedded_search_engine.create_index(dataset)
+        await embedded_search_engine.index_records(dataset, records)
+
+        for query in [TextQuery(q="world", field="chat"), TextQuery(q="value", field="custom"), TextQuery(q=100)]:
+            result = await embedded_search_engine.search(dataset, query=query)
+            assert result.total == 2
+
+        result = await embedded_search_engine.search(dataset, query=TextQuery(q="world", field="custom"))
+        assert result.total == 0
+
+    @pytest.mark.parametrize(
+        ("filter", "expected_items"),
+        [
+            (TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["neutral"]), 4),
+            (TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["neutral", "positive"]), 5),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="textId"), ge=3, le=4), 2),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="textId"), ge=3), 6),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="textId"), le=4), 5),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="seq_float"), ge=0, le=12.03), 3),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="seq_float"), ge=0.13, le=0.13), 1),
+            (RangeFilter(scope=MetadataFilterScope(metadata_property="seq_float"), ge=0.0), 7),
+            (TermsFilter(scope=RecordFilterScope(property="status"), values=[RecordStatus.pending]), 9),
+            (
+                AndFilter(
+                    filters=[
+                        TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["negative"]),
+                        RangeFilter(scope=MetadataFilterScope(metadata_property="textId"), ge=3, le=4),
+                    ]
+                ),
+                1,
+            ),
+        ],
+    )
+    async def test_search_with_filter(
+        self,
+        embedded_search_engine: EmbeddedSearchEngine,
+        banking_dataset: Dataset,
+        filter: Filter,
+        expected_items: int,
+    ):
+        result = await embedded_search_engine.search(banking_dataset, filter=filter)
+
+        assert len(result.items) == expected_items
+        assert result.total == expected_items
+
+    async def test_search_with_no_query(self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset):
+        result = await embedded_search_engine.search(banking_dataset)
+
+        assert result.total == len(banking_dataset.records)
+        assert [item.record_id for item in result.items] == [record.id for record in banking_dataset.records]
+        assert {item.score for item in result.items} == {1.0}
+
+    @pytest.mark.parametrize(
+        ("statuses", "with_user", "expected_items"),
+        [
+            ([], False, 9),
+            ([], True, 4),
+            ([ResponseStatusFilter.pending], False, 5),
+            ([ResponseStatusFilter.pending], True, 5),
+            ([ResponseStatusFilter.submitted], False, 3),
+            ([ResponseStatusFilter.submitted], True, 2),
+            ([ResponseStatusFilter.draft, ResponseStatusFilter.discarded], True, 2),
+            ([ResponseStatusFilter.pending, ResponseStatusFilter.submitted], True, 7),
+        ],
+    )
+    async def test_search_with_response_status_filter(
+        self,
+        embedded_search_engine: EmbeddedSearchEngine,
+        banking_dataset: Dataset,
+        statuses: List[ResponseStatusFilter],
+        with_user: bool,
+        expected_items: int,
+    ):
+        user = await UserFactory.create()
+        records = banking_dataset.records
+
+        await _index_response(embedded_search_engine, records[0], ResponseStatus.submitted, user)
+        await _index_response(embedded_search_engine, records[1], ResponseStatus.submitted, user)
+        await _index_response(embedded_search_engine, records[2], ResponseStatus.draft, user)
+        await _index_response(embedded_search_engine, records[3], ResponseStatus.discarded, user)
+        await _index_response(embedded_search_engine, records[3], ResponseStatus.submitted)
+
+        result = await embedded_search_engine.search(
+            banking_dataset,
+            filter=TermsFilter(
+                scope=ResponseFilterScope(property="status", user=user if with_user else None), values=statuses
+            ),
+        )
+
+        assert result.total == expected_items
+
+    async def test_search_with_response_value_filter_and_sort(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+    ):
+        user = await UserFactory.create()
+        records = banking_dataset.records
+
+        await _index_response(embedded_search_engine, records[0], ResponseStatus.submitted, user, rating=2)
+        await _index_response(embedded_search_engine, records[1], ResponseStatus.submitted, user, rating=4)
+        await _index_response(embedded_search_engine, records[2], ResponseStatus.submitted, rating=4)
+
+        result = await embedded_search_engine.search(
+            banking_dataset, filter=TermsFilter(scope=ResponseFilterScope(question="rating"), values=["4"])
+        )
+        assert {item.record_id for item in result.items} == {records[1].id, records[2].id}
+
+        result = await embedded_search_engine.search(
+            banking_dataset,
+            filter=RangeFilter(scope=ResponseFilterScope(question="rating", user=user), ge=1, le=3),
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await embedded_search_engine.search(
+            banking_dataset, sort=[Order(scope=ResponseFilterScope(question="rating", user=user), order=SortOrder.desc)]
+        )
+        assert [item.record_id for item in result.items[:2]] == [records[1].id, records[0].id]
+
+    @pytest.mark.parametrize(
+        "property, filter_match_value, filter_unmatch_value",
+        [("value", "A", "C"), ("score", "0.5", "0"), ("agent", "peter", "john"), ("type", "human", "model")],
+    )
+    async def test_search_with_suggestion_filter(
+        self,
+        embedded_search_engine: EmbeddedSearchEngine,
+        property: str,
+        filter_match_value: str,
+        filter_unmatch_value: str,
+    ):
+        text_field = await TextFieldFactory.create()
+        question = await LabelSelectionQuestionFactory.create()
+        dataset = await DatasetFactory.create(fields=[text_field], questions=[question])
+        records = await RecordFactory.create_batch(size=2, dataset=dataset, fields={text_field.name: "text"})
+
+        await SuggestionFactory.create(
+            record=records[0], question=question, value="A", type="human", agent="peter", score=0.5
+        )
+        await SuggestionFactory.create(record=records[1], question=question, value="B")
+
+        await refresh_dataset(dataset)
+        await refresh_records(records)
+
+        await embedded_search_engine.create_index(dataset)
+        await embedded_search_engine.index_records(dataset, records)
+
+        scope = SuggestionFilterScope(question=question.name, property=property)
+
+        result = await embedded_search_engine.search(
+            dataset, filter=TermsFilter(scope=scope, values=[filter_match_value])
+        )
+        assert [item.record_id for item in result.items] == [records[0].id]
+
+        result = await embedded_search_engine.search(
+            dataset, filter=TermsFilter(scope=scope, values=[filter_unmatch_value])
+        )
+        assert result.total == 0
+
+    @pytest.mark.parametrize(("offset", "limit"), [(0, 5), (3, 4), (0, 0), (8, 100)])
+    async def test_search_with_pagination(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset, offset: int, limit: int
+    ):
+        all_results = await embedded_search_engine.search(banking_dataset, offset=0, limit=100)
+        results = await embedded_search_engine.search(banking_dataset, offset=offset, limit=limit)
+
+        assert results.total == len(banking_dataset.records)
+        assert results.items == all_results.items[offset : offset + limit]
+
+    @pytest.mark.parametrize(
+        "sort_order",
+        [
+            Order(scope=RecordFilterScope(property="inserted_at"), order=SortOrder.asc),
+            Order(scope=RecordFilterScope(property="inserted_at"), order=SortOrder.desc),
+            Order(scope=MetadataFilterScope(metadata_property="seq_float"), order=SortOrder.asc),
+            Order(scope=MetadataFilterScope(metadata_property="seq_float"), order=SortOrder.desc),
+        ],
+    )
+    async def test_search_with_sort_by(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset, sort_order: Order
+    ):
+        def _local_sort_by(record: Record):
+            if isinstance(sort_order.scope, MetadataFilterScope):
+                return record.metadata_[sort_order.scope.metadata_property]
+            return getattr(record, sort_order.scope.property)
+
+        results = await embedded_search_engine.search(banking_dataset, sort=[sort_order])
+
+        records = sorted(banking_dataset.records, key=_local_sort_by, reverse=sort_order.order == SortOrder.desc)
+        assert [item.record_id for item in results.items] == [record.id for record in records]
+
+    async def test_search_with_user_id(self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset):
+        results = await embedded_search_engine.search(banking_dataset, user_id="user-a")
+
+        assert results == await embedded_search_engine.search(banking_dataset, user_id="user-a")
+        assert results.items != (await embedded_search_engine.search(banking_dataset, user_id="user-b")).items
+        assert {item.record_id for item in results.items} == {record.id for record in banking_dataset.records}
+
+    async def test_delete_records(self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset):
+        await embedded_search_engine.delete_records(banking_dataset, banking_dataset.records[:3])
+
+        result = await embedded_search_engine.search(banking_dataset)
+        assert [item.record_id for item in result.items] == [record.id for record in banking_dataset.records[3:]]
+
+        result = await embedded_search_engine.search(banking_dataset, query="payment")
+        assert result.total == 3
+
+    async def test_delete_records_by_query(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+    ):
+        deleted = await embedded_search_engine.delete_records_by_query(
+            banking_dataset,
+            query="payment",
+            filter=TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["negative"]),
+        )
+
+        assert deleted == 2
+        assert (await embedded_search_engine.search(banking_dataset)).total == len(banking_dataset.records) - 2
+
+    async def test_update_and_delete_record_response(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+    ):
+        record = banking_dataset.records[0]
+        response = await ResponseFactory.create(record=record, values={"text": {"value": "test"}})
+        await response.awaitable_attrs.record
+
+        await embedded_search_engine.update_record_response(response)
+        await embedded_search_engine.update_record_response(response)
+
+        progress = await embedded_search_engine.get_dataset_user_progress(banking_dataset, user=response.user)
+        assert progress == {"total": 1, "submitted": 1}
+
+        await embedded_search_engine.delete_record_response(response)
+
+        progress = await embedded_search_engine.get_dataset_user_progress(banking_dataset, user=response.user)
+        assert progress == {"total": 0}
+
+    async def test_get_dataset_user_progress_with_mixed_response_statuses(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+    ):
+        user, other_user = await UserFactory.create(), await UserFactory.create()
+        records = banking_dataset.records
+
+        await _index_response(embedded_search_engine, records[0], ResponseStatus.submitted, user=user)
+        await _index_response(embedded_search_engine, records[1], ResponseStatus.discarded, user=user)
+        await _index_response(embedded_search_engine, records[2], ResponseStatus.draft, user=user)
+        await _index_response(embedded_search_engine, records[3], ResponseStatus.submitted, user=user)
+        await _index_response(embedded_search_engine, records[0], ResponseStatus.discarded, user=other_user)
+
+        progress = await embedded_search_engine.get_dataset_user_progress(banking_dataset, user=user)
+        assert progress == {"total": 4, "submitted": 2, "discarded": 1, "draft": 1}
+
+        progress = await embedded_search_engine.get_dataset_user_progress(banking_dataset, user=other_user)
+        assert progress == {"total": 1, "discarded": 1}
+
+    async def test_partial_record_update(self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset):
+        await embedded_search_engine.partial_record_update(banking_dataset.records[0], status=RecordStatus.completed)
+
+        progress = await embedded_search_engine.get_dataset_progress(banking_dataset)
+        assert progress == {
+            "total": len(banking_dataset.records),
+            "pending": len(banking_dataset.records) - 1,
+            "completed": 1,
+        }
+
+    async def test_get_dataset_progress_for_draft_dataset(self, embedded_search_engine: EmbeddedSearchEngine):
+        dataset = await DatasetFactory.create(status=DatasetStatus.draft)
+
+        assert await embedded_search_engine.get_dataset_progress(dataset) == {}
+        assert await embedded_search_engine.get_dataset_user_progress(dataset, user=await UserFactory.create()) == {}
+
+    @pytest.mark.parametrize(
+        ("property_name", "expected_metrics"),
+        [
+            (
+                "label",
+                {
+                    "total": 8,
+                    "type": MetadataPropertyType.terms,
+                    "values": [
+                        {"count": 4, "term": "neutral"},
+                        {"count": 3, "term": "negative"},
+                        {"count": 1, "term": "positive"},
+                    ],
+                },
+            ),
+            ("textId", {"max": 8, "min": 0, "type": MetadataPropertyType.integer}),
+            ("seq_float", {"max": 120020.13, "min": -149.13, "type": MetadataPropertyType.float}),
+        ],
+    )
+    async def test_compute_metrics_for(
+        self,
+        embedded_search_engine: EmbeddedSearchEngine,
+        banking_dataset: Dataset,
+        property_name: str,
+        expected_metrics: dict,
+    ):
+        metadata_property = next(
+            metadata_property
+            for metadata_property in banking_dataset.metadata_properties
+            if metadata_property.name == property_name
+        )
+        await metadata_property.awaitable_attrs.dataset
+
+        metrics = await embedded_search_engine.compute_metrics_for(metadata_property)
+
+        assert metrics.model_dump() == expected_metrics
+
+    async def test_similarity_search_with_incomplete_inputs(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset_with_vectors: Dataset
+    ):
+        with pytest.raises(ValueError, match="Must provide either vector value or record"):
+            await embedded_search_engine.similarity_search(
+                dataset=banking_dataset_with_vectors,
+                vector_settings=banking_dataset_with_vectors.vectors_settings[0],
+            )
+
+    @pytest.mark.parametrize(
+        ("order", "expected_position"), [(SimilarityOrder.most_similar, 4), (SimilarityOrder.least_similar, 0)]
+    )
+    async def test_similarity_search_by_vector_value(
+        self,
+        embedded_search_engine: EmbeddedSearchEngine,
+        banking_dataset_with_vectors: Dataset,
+        order: SimilarityOrder,
+        expected_position: int,
+    ):
+        records = banking_dataset_with_vectors.records
+
+        responses = await embedded_search_engine.similarity_search(
+            dataset=banking_dataset_with_vectors,
+            vector_settings=banking_dataset_with_vectors.vectors_settings[0],
+            value=[1.0, 4, 16],
+            order=order,
+            max_results=1,
+        )
+
+        assert responses.total == 1
+        assert responses.items[0].record_id == records[expected_position].id
+
+    async def test_similarity_search_without_indexed_vectors(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+    ):
+        vector_settings = await VectorSettingsFactory.create(dataset=banking_dataset, dimensions=3)
+        await refresh_dataset(banking_dataset)
+
+        responses = await embedded_search_engine.similarity_search(
+            dataset=banking_dataset,
+            vector_settings=vector_settings,
+            value=[1.0, 4, 16],
+        )
+
+        assert responses.total == 0
+        assert responses.items == []
+
+    async def test_similarity_search_by_record(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset_with_vectors: Dataset
+    ):
+        records = banking_dataset_with_vectors.records
+        vector_settings: VectorSettings = banking_dataset_with_vectors.vectors_settings[0]
+
+        responses = await embedded_search_engine.similarity_search(
+            dataset=banking_dataset_with_vectors, vector_settings=vector_settings, record=records[4], max_results=2
+        )
+
+        assert responses.total == 2
+        assert {item.record_id for item in responses.items} == {records[5].id, records[6].id}
+        assert all(0 <= item.score <= 1 for item in responses.items)
+
+        responses = await embedded_search_engine.similarity_search(
+            dataset=banking_dataset_with_vectors,
+            vector_settings=vector_settings,
+            record=records[4],
+            threshold=2,
+        )
+        assert responses.items == []
+
+    async def test_similarity_search_with_query_and_filter(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset_with_vectors: Dataset
+    ):
+        records = banking_dataset_with_vectors.records
+
+        responses = await embedded_search_engine.similarity_search(
+            dataset=banking_dataset_with_vectors,
+            vector_settings=banking_dataset_with_vectors.vectors_settings[0],
+            record=records[0],
+            query=TextQuery(q="payment"),
+            filter=TermsFilter(scope=MetadataFilterScope(metadata_property="label"), values=["negative"]),
+        )
+
+        assert {item.record_id for item in responses.items} == {records[2].id, records[3].id}
+
+    async def test_similarity_search_after_deleting_records(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset_with_vectors: Dataset
+    ):
+        records = banking_dataset_with_vectors.records
+        vector_settings = banking_dataset_with_vectors.vectors_settings[0]
+
+        await embedded_search_engine.similarity_search(
+            dataset=banking_dataset_with_vectors, vector_settings=vector_settings, value=[1.0, 4, 16], max_results=1
+        )
+        await embedded_search_engine.delete_records(banking_dataset_with_vectors, [records[4]])
+
+        responses = await embedded_search_engine.similarity_search(
+            dataset=banking_dataset_with_vectors, vector_settings=vector_settings, value=[1.0, 4, 16], max_results=1
+        )
+
+        assert responses.items[0].record_id == records[5].id
+
+
+class TestEmbeddedSearchEngineCommons(test_commons.TestBaseElasticAndOpenSearchEngine):
+    """
+    Runs the common search engine test suite against the embedded search engine.
+
+    Tests checking Elasticsearch and OpenSearch index mappings and documents are skipped, and fixtures and helpers
+    writing documents directly into those engines are overridden to use the embedded index.
+    """
+
+    @pytest.fixture
+    def search_engine(self, embedded_search_engine: EmbeddedSearchEngine) -> EmbeddedSearchEngine:
+        return embedded_search_engine
+
+    @pytest.fixture
+    def opensearch(self, embedded_search_engine: EmbeddedSearchEngine) -> EmbeddedSearchEngine:
+        return embedded_search_engine
+
+    @pytest_asyncio.fixture
+    async def test_banking_sentiment_dataset(self, banking_dataset: Dataset) -> Dataset:
+        return banking_dataset
+
+    @pytest_asyncio.fixture
+    async def test_banking_sentiment_dataset_with_vectors(
+        self, embedded_search_engine: EmbeddedSearchEngine, banking_dataset: Dataset
+    ) -> Dataset:
+        vectors_settings = await VectorSettingsFactory.create_batch(5, dataset=banking_dataset)
+
+        for record in banking_dataset.records:
+            for vector_settings in vectors_settings:
+                await VectorFactory.create(
+                    vector_settings=vector_settings,
+                    record=record,
+                    value=[random.uniform(-10, 10) for _ in range(0, vector_settings.dimensions)],
+                )
+            await record.awaitable_attrs.vectors
+
+        await refresh_dataset(banking_dataset)
+        await embedded_search_engine.index_records(banking_dataset, banking_dataset.records)
+
+        return banking_dataset
+
+    @pytest_asyncio.fixture
+    async def dataset_for_pagination(self, embedded_search_engine: EmbeddedSearchEngine) -> Dataset:
+        dataset = await DatasetFactory.create(fields=[await TextFieldFactory.create(name="text")], questions=[])
+        await RecordFactory.create_batch(size=100, dataset=dataset, fields={"text": "The same text for all documents"})
+
+        await refresh_dataset(dataset)
+        records = await dataset.awaitable_attrs.records
+        await refresh_records(records)
+
+        await embedded_search_engine.create_index(dataset)
+        await embedded_search_engine.index_records(dataset, records)
+
+        return dataset
+
+    async def _update_records_responses(
+        self,
+        opensearch: EmbeddedSearchEngine,
+        index_name: str,
+        records: List[Record],
+        status: ResponseStatusFilter,
+        user: Optional[User] = None,
+        rating_value: Optional[int] = None,
+    ):
+        another_user = await UserFactory.create()
+
+        for record in records:
+            responses = [
+                {"id": str(uuid.uuid4()), "status": status.value, "user_id": str(another_user.id), "values": {}},
+            ]
+            if user:
+                responses.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "status": status.value,
+                        "user_id": str(user.id),
+                        "values": {"rating": rating_value or -1},
+                    }
+                )
+
+            def update_record_responses(document: dict, responses: List[dict] = responses) -> dict:
+                document["responses"] = [*document.get("responses", []), *responses]
+                return document
+
+            opensearch._execute(
+                embedded_index_path(opensearch.path, record.dataset),
+                opensearch._update_document,
+                str(record.id),
+                update_record_responses,
+            )
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_create_index_for_dataset(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_create_index_for_dataset_with_fields(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_create_metadata_property(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_create_index_for_dataset_with_metadata_properties(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_create_index_for_dataset_with_questions(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_configure_metadata_property(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_annotators_limits(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch index mappings")
+    async def test_annotator_limits_increasing_default_fields_limit(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_index_records(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_index_records_with_suggestions(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_index_records_with_metadata(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_index_records_with_vectors(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_delete_records(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_delete_records_by_query(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_update_record_response(self):
+        pass
+
+    @pytest.mark.skip(reason="Checks Elasticsearch and OpenSearch indexed documents")
+    async def test_delete_record_response(self):
+        pass
+
+    @pytest.mark.skip(reason="Expects float metadata metrics rounded to float32 like Elasticsearch and OpenSearch do")
+    async def test_compute_metrics_for(self):
+        pass
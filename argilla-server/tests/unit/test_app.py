@@ -20,6 +20,7 @@ from pytest_mock import MockerFixture
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argilla_server import metrics
 from argilla_server._app import (
     create_server_app,
     configure_database,
@@ -75,6 +76,52 @@ class TestApp:
 
         assert response.headers["Server-Timing"]
 
+    def test_server_timing_header_spans(self):
+        client = TestClient(create_server_app())
+
+        response = client.get("/api/v1/version")
+
+        server_timing = response.headers["Server-Timing"]
+        assert server_timing.startswith("total;dur=")
+        assert "validation;dur=" in server_timing
+        assert "serialization;dur=" in server_timing
+
+    def test_server_timing_validation_span_excludes_time_recorded_by_other_spans(self, mocker: MockerFixture):
+        request_timing = metrics.start_request_timing()
+        request_timing.started_at = 0.0
+        metrics.record_query(0.25)
+
+        mocker.patch.object(metrics.time, "perf_counter", side_effect=[1.0, 2.0, 3.0])
+        metrics._timed_endpoint(lambda: None)()
+        request_timing.finish()
+
+        assert request_timing.spans == {
+            metrics.SPAN_DB: 0.25,
+            metrics.SPAN_VALIDATION: 0.75,
+            metrics.SPAN_SERIALIZATION: 1.0,
+        }
+
+    def test_metrics_endpoint(self, mocker: MockerFixture):
+        mocker.patch.object(settings, "metrics_enabled", True)
+        client = TestClient(create_server_app())
+
+        client.get("/api/v1/version")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert 'argilla_http_request_duration_seconds_count{method="GET",route="/api/v1/version",status="200"}' in (
+            response.text
+        )
+        assert 'argilla_http_request_span_duration_seconds_count{span="validation"}' in response.text
+
+    def test_metrics_endpoint_disabled(self):
+        client = TestClient(create_server_app())
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 404
+
     async def test_create_allowed_workspaces(self, db: AsyncSession):
         with mock.patch(
             "argilla_server.security.settings.Settings.oauth",
@@ -12,11 +12,32 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import time
+import asyncio
+
 import pytest
+import pytest_asyncio
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from pytest_mock import MockerFixture
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.dialects import sqlite
 from sqlalchemy.sql.expression import text
+from starlette.requests import Request
+from starlette.responses import Response
+
+from argilla_server.constants import API_KEY_HEADER_NAME
+from argilla_server import database
+from argilla_server.database import (
+    PRIMARY_PIN_COOKIE_NAME,
+    SQLiteWriterLock,
+    count_queries,
+    finish_query_timing,
+    get_read_async_db,
+    is_pinned_to_primary,
+    pin_to_primary,
+)
+from argilla_server.settings import settings
 
 
 @pytest.mark.asyncio
@@ -26,3 +47,171 @@ class TestDatabase:
             return
 
         assert (await db.execute(text("PRAGMA foreign_keys"))).scalar() == 1
+        assert (await db.execute(text("PRAGMA synchronous"))).scalar() == 1
+        assert (await db.execute(text("PRAGMA cache_size"))).scalar() == settings.database_sqlite_cache_size
+
+    async def test_count_queries(self, db: AsyncSession):
+        with count_queries() as query_counter:
+            await db.execute(text("SELECT 1"))
+            await db.execute(text("SELECT 2"))
+
+        assert query_counter.statements[-2:] == ["SELECT 1", "SELECT 2"]
+
+    async def test_count_queries_writes(self, db: AsyncSession):
+        with count_queries() as query_counter:
+            await db.execute(text("SELECT 1"))
+            await db.execute(text("UPDATE users SET first_name = 'name' WHERE 1 = 0"))
+
+        assert query_counter.writes == 1
+
+    async def test_slow_query_logging(self, db: AsyncSession, mocker: MockerFixture):
+        mocker.patch.object(settings, "database_slow_query_threshold", 0)
+        logger_mock = mocker.patch("argilla_server.database._LOGGER")
+
+        await db.execute(text("SELECT 1"))
+
+        logger_mock.warning.assert_called()
+        assert "SELECT 1" in logger_mock.warning.call_args.args[0]
+
+    async def test_query_instrumentation_is_disabled_by_default(self):
+        assert not settings.database_query_instrumentation_enabled
+        assert not event.contains(database.async_engine.sync_engine, "after_cursor_execute", finish_query_timing)
+
+    @pytest.mark.parametrize(
+        "settings_values",
+        [
+            {"database_query_instrumentation": True},
+            {"database_slow_query_threshold": 1.0},
+            {"metrics_enabled": True},
+            {"database_read_url": "sqlite+aiosqlite:///replica.db"},
+        ],
+    )
+    async def test_query_instrumentation_enabled(self, mocker: MockerFixture, settings_values: dict):
+        for name, value in settings_values.items():
+            mocker.patch.object(settings, name, value)
+
+        assert settings.database_query_instrumentation_enabled
+
+    async def test_slow_query_logging_disabled(self, db: AsyncSession, mocker: MockerFixture):
+        logger_mock = mocker.patch("argilla_server.database._LOGGER")
+
+        await db.execute(text("SELECT 1"))
+
+        logger_mock.warning.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestSQLiteWriterLock:
+    @pytest_asyncio.fixture
+    async def engine(self, tmp_path) -> AsyncEngine:
+        # NOTE: A tiny busy timeout makes concurrent writers fail if they are not serialised by the lock.
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", connect_args={"timeout": 0.1})
+        SQLiteWriterLock(timeout=5).install(engine.sync_engine)
+
+        async with engine.begin() as conn:
+            await conn.execute(text("CREATE TABLE counters (id INTEGER PRIMARY KEY, value INTEGER)"))
+            await conn.execute(text("INSERT INTO counters VALUES (1, 0)"))
+
+        yield engine
+
+        await engine.dispose()
+
+    async def test_concurrent_writes(self, engine: AsyncEngine):
+        async def increment_counter():
+            async with engine.connect() as conn:
+                await conn.execute(text("UPDATE counters SET value = value + 1 WHERE id = 1"))
+                await asyncio.sleep(0.02)
+                await conn.commit()
+
+        await asyncio.gather(*[increment_counter() for _ in range(20)])
+
+        async with engine.connect() as conn:
+            assert (await conn.execute(text("SELECT value FROM counters WHERE id = 1"))).scalar() == 20
+
+    async def test_reads_do_not_wait_for_writer(self, engine: AsyncEngine):
+        async with engine.connect() as writer_conn:
+            await writer_conn.execute(text("UPDATE counters SET value = 10 WHERE id = 1"))
+
+            async with engine.connect() as reader_conn:
+                assert (await reader_conn.execute(text("SELECT value FROM counters WHERE id = 1"))).scalar() == 0
+
+            await writer_conn.commit()
+
+    async def test_writer_lock_is_released_on_rollback(self, engine: AsyncEngine):
+        async with engine.connect() as conn:
+            await conn.execute(text("UPDATE counters SET value = 10 WHERE id = 1"))
+            await conn.rollback()
+
+        async with engine.connect() as conn:
+            await asyncio.wait_for(conn.execute(text("UPDATE counters SET value = 20 WHERE id = 1")), timeout=1)
+            await conn.commit()
+
+
+def _request(headers: dict) -> Request:
+    return Request(
+        {"type": "http", "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()]}
+    )
+
+
+def _request_with_cookies(response: Response) -> Request:
+    return _request({"Cookie": "; ".join(cookie.split(";", 1)[0] for cookie in response.headers.getlist("set-cookie"))})
+
+
+class TestPinToPrimary:
+    def test_pin_to_primary(self):
+        response = Response()
+
+        pin_to_primary(response)
+
+        assert is_pinned_to_primary(_request_with_cookies(response))
+        assert not is_pinned_to_primary(_request({}))
+
+    def test_pin_to_primary_expires(self, mocker: MockerFixture):
+        mocker.patch.object(settings, "database_read_primary_pin_seconds", 0.01)
+        response = Response()
+
+        pin_to_primary(response)
+        time.sleep(0.02)
+
+        assert not is_pinned_to_primary(_request_with_cookies(response))
+
+    def test_pin_to_primary_disabled(self, mocker: MockerFixture):
+        mocker.patch.object(settings, "database_read_primary_pin_seconds", 0)
+        response = Response()
+
+        pin_to_primary(response)
+
+        assert "set-cookie" not in response.headers
+
+    def test_is_pinned_to_primary_with_pin_beyond_pin_seconds(self):
+        request = _request({"Cookie": f"{PRIMARY_PIN_COOKIE_NAME}={time.time() + 10 * 365 * 24 * 60 * 60}"})
+
+        assert not is_pinned_to_primary(request)
+
+    def test_is_pinned_to_primary_with_invalid_pin(self):
+        assert not is_pinned_to_primary(_request({"Cookie": f"{PRIMARY_PIN_COOKIE_NAME}=invalid"}))
+
+
+@pytest.mark.asyncio
+class TestGetReadAsyncDb:
+    async def test_get_read_async_db_without_read_replica(self, db: AsyncSession):
+        async for read_db in get_read_async_db(_request({}), db):
+            assert read_db is db
+
+    async def test_get_read_async_db_with_read_replica(self, db: AsyncSession, mocker: MockerFixture):
+        replica_db = mocker.AsyncMock(AsyncSession)
+        mocker.patch.object(database, "async_read_engine", mocker.Mock())
+        mocker.patch.object(database, "AsyncReadSessionLocal", return_value=replica_db)
+
+        async for read_db in get_read_async_db(_request({API_KEY_HEADER_NAME: "reader.apikey"}), db):
+            assert read_db is replica_db
+
+        replica_db.close.assert_awaited_once()
+
+    async def test_get_read_async_db_with_read_replica_and_pinned_client(self, db: AsyncSession, mocker: MockerFixture):
+        mocker.patch.object(database, "async_read_engine", mocker.Mock())
+        response = Response()
+        pin_to_primary(response)
+
+        async for read_db in get_read_async_db(_request_with_cookies(response), db):
+            assert read_db is db
@@ -0,0 +1,72 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import sys
+import subprocess
+from typing import Dict
+
+import pytest
+
+HEAVY_MODULES = ["datasets", "huggingface_hub", "PIL", "pyarrow", "pandas", "standardwebhooks"]
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Imports the module in a new interpreter using `-X importtime` and returns cumulative microseconds by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        import_times[name.strip()] = int(cumulative)
+
+    return import_times
+
+
+class TestImportTime:
+    def test_import_argilla_server(self):
+        import_times = _import_times("argilla_server")
+
+        assert "fastapi" not in import_times
+        assert "sqlalchemy" not in import_times
+
+    @pytest.mark.parametrize(
+        "module, budget_in_seconds",
+        [
+            ("argilla_server.cli", 3.0),
+            ("argilla_server.jobs.dataset_jobs", 3.0),
+            ("argilla_server.jobs.hub_jobs", 3.0),
+            ("argilla_server.jobs.webhook_jobs", 3.0),
+        ],
+    )
+    def test_import_without_heavy_modules(self, module: str, budget_in_seconds: float):
+        import_times = _import_times(module)
+
+        assert [heavy_module for heavy_module in HEAVY_MODULES if heavy_module in import_times] == []
+        assert import_times[module] / 1_000_000 < budget_in_seconds
+
+    def test_import_app(self):
+        import_times = _import_times("argilla_server._app")
+
+        assert "datasets" not in import_times
+        assert "PIL" not in import_times
@@ -0,0 +1,111 @@
+#  Copyright 2021-present, the Recognai S.L. team.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+import os
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from argilla_server.static_rewrite import RewriteStaticFiles
+from argilla_server.statics import prepare_statics_folder
+
+SCRIPT_CONTENT = "window.baseUrl = '@@baseUrl@@';\n" + "console.log('argilla');\n" * 100
+
+
+@pytest.fixture
+def statics_folder(tmp_path) -> str:
+    statics_folder = tmp_path / "static"
+    (statics_folder / "_nuxt").mkdir(parents=True)
+    (statics_folder / "index.html").write_text("<html><script src='@@baseUrl@@/_nuxt/app.js'></script></html>")
+    (statics_folder / "_nuxt" / "app.js").write_text(SCRIPT_CONTENT)
+
+    return str(statics_folder)
+
+
+class TestPrepareStaticsFolder:
+    def test_prepare_statics_folder(self, statics_folder: str, tmp_path):
+        prepared_folder = prepare_statics_folder(statics_folder, str(tmp_path / "cache"), "/base/url/", "2.6.0")
+
+        with open(os.path.join(prepared_folder, "index.html")) as file:
+            assert file.read() == "<html><script src='/base/url/_nuxt/app.js'></script></html>"
+
+        expected_content = SCRIPT_CONTENT.replace("@@baseUrl@@", "/base/url").encode("utf-8")
+        with open(os.path.join(prepared_folder, "_nuxt", "app.js.br"), "rb") as file:
+            assert brotli.decompress(file.read()) == expected_content
+        with open(os.path.join(prepared_folder, "_nuxt", "app.js.gz"), "rb") as file:
+            assert gzip.decompress(file.read()) == expected_content
+
+        # NOTE: Small files are not precompressed
+        assert not os.path.exists(os.path.join(prepared_folder, "index.html.br"))
+
+    def test_prepare_statics_folder_reuses_prepared_folder(self, statics_folder: str, tmp_path):
+        cache_folder = str(tmp_path / "cache")
+
+        prepared_folder = prepare_statics_folder(statics_folder, cache_folder, "/", "2.6.0")
+        os.remove(os.path.join(prepared_folder, "_nuxt", "app.js.gz"))
+
+        assert prepare_statics_folder(statics_folder, cache_folder, "/", "2.6.0") == prepared_folder
+        assert not os.path.exists(os.path.join(prepared_folder, "_nuxt", "app.js.gz"))
+
+        assert prepare_statics_folder(statics_folder, cache_folder, "/base/url/", "2.6.0") != prepared_folder
+        assert prepare_statics_folder(statics_folder, cache_folder, "/", "2.7.0") != prepared_folder
+
+
+class TestRewriteStaticFiles:
+    @pytest.fixture
+    def client(self, statics_folder: str, tmp_path) -> TestClient:
+        app = FastAPI()
+        app.mount(
+            "/",
+            RewriteStaticFiles(
+                directory=prepare_statics_folder(statics_folder, str(tmp_path / "cache"), "/", "2.6.0"),
+                html=True,
+                immutable_directories=["_nuxt"],
+            ),
+        )
+
+        return TestClient(app)
+
+    def test_get_precompressed_file(self, client: TestClient):
+        response = client.get("/_nuxt/app.js", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "br"
+        assert response.headers["Content-Type"].startswith("text/javascript")
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.headers["Cache-Control"] == "public, max-age=31536000, immutable"
+
+    def test_get_precompressed_file_with_gzip(self, client: TestClient):
+        response = client.get("/_nuxt/app.js", headers={"Accept-Encoding": "gzip, br;q=0"})
+
+        assert response.status_code == 200
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert response.text == SCRIPT_CONTENT.replace("@@baseUrl@@", "")
+
+    def test_get_precompressed_file_without_accept_encoding(self, client: TestClient):
+        response = client.get("/_nuxt/app.js", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "Content-Encoding" not in response.headers
+        assert response.headers["Vary"] == "Accept-Encoding"
+        assert response.text == SCRIPT_CONTENT.replace("@@baseUrl@@", "")
+
+    def test_get_index_html(self, client: TestClient):
+        response = client.get("/dataset/annotation-mode")
+
+        assert response.status_code == 200
+        assert response.headers["Cache-Control"] == "no-cache"
@@ -12,13 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Generic, TYPE_CHECKING, TypeVar
+from typing import Generic, TYPE_CHECKING, TypeVar, Union
 from uuid import UUID
 
 from argilla._helpers import LoggingMixin
 
 if TYPE_CHECKING:
-    from httpx import Client
+    from httpx import AsyncClient, Client
 
 __all__ = ["ResourceAPI"]
 
@@ -30,7 +30,7 @@ T = TypeVar("T")
 class ResourceAPI(LoggingMixin, Generic[T]):
     """Base class for all API resources that contains common methods."""
 
-    def __init__(self, http_client: "Client") -> None:
+    def __init__(self, http_client: Union["Client", "AsyncClient"]) -> None:
         self.http_client = http_client
 
     ################
@@ -21,20 +21,20 @@ from argilla._api._webhooks import WebhooksAPI
 from argilla._exceptions._api import UnauthorizedError
 from argilla._exceptions._client import ArgillaCredentialsError
 
-from argilla._api import HTTPClientConfig, create_http_client
-from argilla._api._datasets import DatasetsAPI
+from argilla._api import HTTPClientConfig, create_async_http_client, create_http_client
+from argilla._api._datasets import AsyncDatasetsAPI, DatasetsAPI
 from argilla._api._fields import FieldsAPI
 from argilla._api._metadata import MetadataAPI
 from argilla._api._questions import QuestionsAPI
-from argilla._api._records import RecordsAPI
-from argilla._api._users import UsersAPI
+from argilla._api._records import AsyncRecordsAPI, RecordsAPI
+from argilla._api._users import AsyncUsersAPI, UsersAPI
 from argilla._api._vectors import VectorsAPI
-from argilla._api._workspaces import WorkspacesAPI
+from argilla._api._workspaces import AsyncWorkspacesAPI, WorkspacesAPI
 from argilla._exceptions import ArgillaError
 from argilla._constants import _DEFAULT_API_URL
 from argilla._api._token import get_secret
 
-__all__ = ["APIClient"]
+__all__ = ["APIClient", "AsyncAPIClient"]
 
 
 ARGILLA_API_URL = get_secret("ARGILLA_API_URL") or _DEFAULT_API_URL
@@ -160,3 +160,109 @@ class APIClient:
         user = self.api.users.get_me()
         message = f"Logged in as {user.username} with the role {user.role}"
         self.log(message=message, level=logging.INFO)
+
+
+class AsyncArgillaAPI:
+    """Argilla API access object using an asynchronous HTTP client.
+
+    Only the resources needed to work with records are available. Dataset settings must be managed with `ArgillaAPI`.
+    """
+
+    def __init__(self, http_client: httpx.AsyncClient):
+        self.http_client = http_client
+
+        self.__users = AsyncUsersAPI(http_client=self.http_client)
+        self.__workspaces = AsyncWorkspacesAPI(http_client=self.http_client)
+        self.__datasets = AsyncDatasetsAPI(http_client=self.http_client)
+        self.__records = AsyncRecordsAPI(http_client=self.http_client)
+
+    @property
+    def workspaces(self) -> "AsyncWorkspacesAPI":
+        return self.__workspaces
+
+    @property
+    def users(self) -> "AsyncUsersAPI":
+        return self.__users
+
+    @property
+    def datasets(self) -> "AsyncDatasetsAPI":
+        return self.__datasets
+
+    @property
+    def records(self) -> "AsyncRecordsAPI":
+        return self.__records
+
+
+class AsyncAPIClient:
+    """Initialize the SDK with the given API URL and API key using an asynchronous HTTP client.
+
+    Connection and credentials are validated when the client is used as an async context manager, since
+    they cannot be validated without awaiting a request.
+
+    Args:
+        api_url (str, optional): The URL of the Argilla API. Defaults to the value of
+            the `ARGILLA_API_URL` environment variable.
+        api_key (str, optional): The API key to authenticate with the Argilla API. Defaults to
+            the value of the `ARGILLA_API_KEY` environment variable.
+        timeout (int, optional): The timeout in seconds for the HTTP requests. Defaults to 60.
+        **http_client_args: Additional keyword arguments to pass to the httpx.AsyncClient instance.
+            See https://www.python-httpx.org/api/#asyncclient for more information.
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = DEFAULT_HTTP_CONFIG.api_url,
+        api_key: Optional[str] = DEFAULT_HTTP_CONFIG.api_key,
+        timeout: int = DEFAULT_HTTP_CONFIG.timeout,
+        retries: int = DEFAULT_HTTP_CONFIG.retries,
+        **http_client_args,
+    ):
+        if not api_url:
+            raise ArgillaError("Missing api_url. You must provide a valid API url")
+
+        if not api_key:
+            raise ArgillaError("Missing api_key. You must provide a valid API key.")
+
+        self.api_url = api_url
+        self.api_key = api_key
+
+        http_client_args = http_client_args or {}
+        http_client_args["timeout"] = timeout
+        http_client_args["retries"] = retries
+
+        self.http_client = create_async_http_client(
+            api_url=self.api_url,  # type: ignore
+            api_key=self.api_key,  # type: ignore
+            **http_client_args,
+        )
+
+        self.api = AsyncArgillaAPI(self.http_client)
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        try:
+            await self._validate_connection()
+        except UnauthorizedError as e:
+            raise ArgillaCredentialsError() from e
+
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client and its connections."""
+        await self.http_client.aclose()
+
+    ##############################
+    # Utility methods
+    ##############################
+
+    def log(self, message: str, level: int = logging.INFO) -> None:
+        class_name = self.__class__.__name__
+        message = f"{class_name}: {message}"
+        logging.log(level=level, msg=message)
+
+    async def _validate_connection(self) -> None:
+        user = await self.api.users.get_me()
+        message = f"Logged in as {user.username} with the role {user.role}"
+        self.log(message=message, level=logging.INFO)
@@ -20,7 +20,7 @@ from argilla._api._base import ResourceAPI
 from argilla._exceptions._api import api_error_handler
 from argilla._models import DatasetModel
 
-__all__ = ["DatasetsAPI"]
+__all__ = ["DatasetsAPI", "AsyncDatasetsAPI"]
 
 from argilla._models._dataset_progress import UserProgressModel, DatasetProgressModel
 
@@ -138,3 +138,92 @@ class DatasetsAPI(ResourceAPI[DatasetModel]):
 
     def _model_from_jsons(self, response_jsons: List[Dict]) -> List["DatasetModel"]:
         return list(map(self._model_from_json, response_jsons))
+
+
+class AsyncDatasetsAPI(DatasetsAPI):
+    """Manage datasets via the API using an asynchronous HTTP client"""
+
+    http_client: httpx.AsyncClient
+
+    ################
+    # CRUD methods #
+    ################
+
+    @api_error_handler
+    async def create(self, dataset: "DatasetModel") -> "DatasetModel":
+        response = await self.http_client.post(url=self.url_stub, json=dataset.model_dump(exclude_unset=True))
+        response.raise_for_status()
+        dataset = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Created dataset {dataset.name}")
+        return dataset
+
+    @api_error_handler
+    async def update(self, dataset: "DatasetModel") -> "DatasetModel":
+        json_body = dataset.model_dump(exclude_unset=True)
+        response = await self.http_client.patch(f"{self.url_stub}/{json_body['id']}", json=json_body)
+        response.raise_for_status()
+        dataset = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Updated dataset {dataset.id}")
+        return dataset
+
+    @api_error_handler
+    async def get(self, dataset_id: UUID) -> "DatasetModel":
+        response = await self.http_client.get(url=f"{self.url_stub}/{dataset_id}")
+        response.raise_for_status()
+        dataset = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Got dataset {dataset.id}")
+        return dataset
+
+    @api_error_handler
+    async def delete(self, dataset_id: UUID) -> None:
+        response = await self.http_client.delete(f"{self.url_stub}/{dataset_id}")
+        response.raise_for_status()
+        self._log_message(message=f"Deleted dataset {dataset_id}")
+
+    async def exists(self, dataset_id: UUID) -> bool:
+        response = await self.http_client.get(f"{self.url_stub}/{dataset_id}")
+        return response.status_code == 200
+
+    ####################
+    # Utility methods #
+    ####################
+
+    @api_error_handler
+    async def get_progress(self, dataset_id: UUID) -> DatasetProgressModel:
+        response = await self.http_client.get(f"{self.url_stub}/{dataset_id}/progress")
+        response.raise_for_status()
+        self._log_message(message=f"Got progress for dataset {dataset_id}")
+        return DatasetProgressModel.model_validate(response.json())
+
+    @api_error_handler
+    async def list_users_progress(self, dataset_id: UUID) -> List[UserProgressModel]:
+        response = await self.http_client.get(f"{self.url_stub}/{dataset_id}/users/progress")
+        response.raise_for_status()
+        self._log_message(message=f"Got users progress for dataset {dataset_id}")
+        return [UserProgressModel.model_validate(data) for data in response.json()["users"]]
+
+    @api_error_handler
+    async def publish(self, dataset_id: UUID) -> "DatasetModel":
+        response = await self.http_client.put(url=f"{self.url_stub}/{dataset_id}/publish")
+        response.raise_for_status()
+        self._log_message(message=f"Published dataset {dataset_id}")
+        return self._model_from_json(response_json=response.json())
+
+    @api_error_handler
+    async def list(self, workspace_id: Optional[UUID] = None) -> List["DatasetModel"]:
+        response = await self.http_client.get("/api/v1/me/datasets")
+        response.raise_for_status()
+        datasets = self._model_from_jsons(response_jsons=response.json()["items"])
+        if workspace_id:
+            datasets = [dataset for dataset in datasets if dataset.workspace_id == workspace_id]
+        self._log_message(message=f"Listed {len(datasets)} datasets")
+        return datasets
+
+    async def get_by_name_and_workspace_id(self, name: str, workspace_id: UUID) -> Optional["DatasetModel"]:
+        for dataset in await self.list(workspace_id=workspace_id):
+            if dataset.name == name:
+                self._log_message(message=f"Got dataset {dataset.name}")
+                return dataset
+
+    async def name_exists(self, name: str, workspace_id: UUID) -> bool:
+        return bool(await self.get_by_name_and_workspace_id(name=name, workspace_id=workspace_id))
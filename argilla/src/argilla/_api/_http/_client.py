@@ -41,3 +41,17 @@ def create_http_client(api_url: str, api_key: str, **client_args) -> httpx.Clien
         transport=httpx.HTTPTransport(retries=retries),
         **client_args,
     )
+
+
+def create_async_http_client(api_url: str, api_key: str, **client_args) -> httpx.AsyncClient:
+    """Initialize an asynchronous HTTP client with the given API URL and API key."""
+    headers = client_args.pop("headers", {})
+    headers["X-Argilla-Api-Key"] = api_key
+    retries = client_args.pop("retries", 0)
+
+    return httpx.AsyncClient(
+        base_url=api_url,
+        headers=headers,
+        transport=httpx.AsyncHTTPTransport(retries=retries),
+        **client_args,
+    )
@@ -12,7 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import List, Dict, Tuple, Union, Optional
+from datetime import datetime
+from typing import Any, List, Dict, Tuple, Union, Optional
 from uuid import UUID
 
 import httpx
@@ -20,9 +21,9 @@ from typing_extensions import deprecated
 
 from argilla._api._base import ResourceAPI
 from argilla._exceptions import api_error_handler
-from argilla._models import RecordModel, UserResponseModel, SearchQueryModel
+from argilla._models import DeletedRecordModel, RecordModel, UserResponseModel, SearchQueryModel
 
-__all__ = ["RecordsAPI"]
+__all__ = ["RecordsAPI", "AsyncRecordsAPI"]
 
 
 class RecordsAPI(ResourceAPI[RecordModel]):
@@ -60,6 +61,13 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         response.raise_for_status()
         self._log_message(message=f"Deleted record {record_id}")
 
+    @api_error_handler
+    def get_media(self, media_reference: str) -> bytes:
+        """Get the content of media stored by the server using a reference like `/api/v1/media/<hash>`."""
+        response = self.http_client.get(media_reference)
+        response.raise_for_status()
+        return response.content
+
     ####################
     # Utility methods #
     ####################
@@ -72,6 +80,7 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         with_suggestions: bool = True,
         with_responses: bool = True,
         with_vectors: Optional[Union[List, bool]] = None,
+        updated_at_ge: Optional[datetime] = None,
     ) -> List[RecordModel]:
         """List records in a dataset
         Args:
@@ -81,20 +90,16 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             with_vectors: The name of vectors to include
             with_suggestions: Whether to include suggestions
             with_responses: Whether to include responses
+            updated_at_ge: Only list records where the record, or any of its responses or suggestions,
+                was updated at or after this time
         """
-        include = []
-        if with_suggestions:
-            include.append("suggestions")
-        if with_responses:
-            include.append("responses")
-        if with_vectors:
-            include.append(self._represent_vectors_to_include(with_vectors))
-
         params = {
             "offset": offset,
             "limit": limit,
-            "include": include,
+            "include": self._represent_include(with_suggestions, with_responses, with_vectors),
         }
+        if updated_at_ge is not None:
+            params["updated_at_ge"] = updated_at_ge.isoformat()
 
         response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/records", params=params)
         response.raise_for_status()
@@ -102,6 +107,57 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         json_records = response_json["items"]
         return self._model_from_jsons(json_records)
 
+    @api_error_handler
+    def list_updated(
+        self,
+        dataset_id: UUID,
+        limit: int = 100,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        with_vectors: Optional[Union[List, bool]] = None,
+        updated_at_ge: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Tuple[RecordModel, datetime]]:
+        """List records in a dataset ordered by their last activity, including changes of their responses and
+        suggestions, and then by id
+        Args:
+            dataset_id: The ID of the dataset
+            limit: The number of records to return
+            with_vectors: The name of vectors to include
+            with_suggestions: Whether to include suggestions
+            with_responses: Whether to include responses
+            updated_at_ge: Only list records with activity at or after this time
+            after: The last activity and the id of the last record of the previous page
+        Returns:
+            The records together with the time of their last activity
+        """
+        params = self._list_updated_params(limit, with_suggestions, with_responses, with_vectors, updated_at_ge, after)
+
+        response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/records/updated", params=params)
+        response.raise_for_status()
+        return self._updated_models_from_jsons(response.json()["items"])
+
+    @api_error_handler
+    def list_deleted(
+        self,
+        dataset_id: UUID,
+        limit: int = 100,
+        deleted_at_ge: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[DeletedRecordModel]:
+        """List the records deleted from a dataset ordered by their deletion time, and then by id
+        Args:
+            dataset_id: The ID of the dataset
+            limit: The number of deleted records to return
+            deleted_at_ge: Only list records deleted at or after this time
+            after: The deletion time and the id of the last deleted record of the previous page
+        """
+        params = self._list_deleted_params(limit, deleted_at_ge, after)
+
+        response = self.http_client.get(f"/api/v1/datasets/{dataset_id}/records/deleted", params=params)
+        response.raise_for_status()
+        return [DeletedRecordModel(**item) for item in response.json()["items"]]
+
     @api_error_handler
     def search(
         self,
@@ -113,17 +169,10 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         with_responses: bool = True,
         with_vectors: Optional[Union[List, bool]] = None,
     ) -> Tuple[List[Tuple[RecordModel, float]], int]:
-        include = []
-        if with_suggestions:
-            include.append("suggestions")
-        if with_responses:
-            include.append("responses")
-        if with_vectors:
-            include.append(self._represent_vectors_to_include(with_vectors))
         params = {
             "offset": offset,
             "limit": limit,
-            "include": include,
+            "include": self._represent_include(with_suggestions, with_responses, with_vectors),
         }
 
         response = self.http_client.post(
@@ -185,10 +234,13 @@ class RecordsAPI(ResourceAPI[RecordModel]):
         return self._model_from_jsons(response_jsons=response_json["items"])
 
     @api_error_handler
-    def bulk_upsert(self, dataset_id: UUID, records: List[RecordModel]) -> Tuple[List[RecordModel], int]:
+    def bulk_upsert(
+        self, dataset_id: UUID, records: List[Union[RecordModel, Dict[str, Any]]]
+    ) -> Tuple[List[RecordModel], int]:
         if len(records) > self.MAX_RECORDS_PER_UPSERT_BULK:
             raise ValueError(f"Cannot upsert more than {self.MAX_RECORDS_PER_UPSERT_BULK} records at once")
-        record_dicts = [record.model_dump() for record in records]
+        # NOTE: Records can also be provided as already serialized payloads, like the ones built by the batch mapper
+        record_dicts = [record if isinstance(record, dict) else record.model_dump() for record in records]
         response = self.http_client.put(
             url=f"/api/v1/datasets/{dataset_id}/records/bulk",
             json={"items": record_dicts},
@@ -234,6 +286,52 @@ class RecordsAPI(ResourceAPI[RecordModel]):
     def _model_from_jsons(self, response_jsons: List[Dict]) -> List[RecordModel]:
         return list(map(self._model_from_json, response_jsons))
 
+    def _updated_model_from_json(self, response_json: Dict) -> Tuple[RecordModel, datetime]:
+        last_activity_at = datetime.fromisoformat(response_json.pop("last_activity_at"))
+        return self._model_from_json(response_json), last_activity_at
+
+    def _updated_models_from_jsons(self, response_jsons: List[Dict]) -> List[Tuple[RecordModel, datetime]]:
+        return list(map(self._updated_model_from_json, response_jsons))
+
+    def _list_updated_params(
+        self,
+        limit: int,
+        with_suggestions: bool,
+        with_responses: bool,
+        with_vectors: Optional[Union[List, bool]],
+        updated_at_ge: Optional[datetime],
+        after: Optional[Tuple[datetime, UUID]],
+    ) -> Dict[str, Any]:
+        params = {"limit": limit, "include": self._represent_include(with_suggestions, with_responses, with_vectors)}
+        if updated_at_ge is not None:
+            params["updated_at_ge"] = updated_at_ge.isoformat()
+        if after is not None:
+            params["after_last_activity_at"], params["after_id"] = after[0].isoformat(), str(after[1])
+        return params
+
+    def _list_deleted_params(
+        self, limit: int, deleted_at_ge: Optional[datetime], after: Optional[Tuple[datetime, UUID]]
+    ) -> Dict[str, Any]:
+        params = {"limit": limit}
+        if deleted_at_ge is not None:
+            params["deleted_at_ge"] = deleted_at_ge.isoformat()
+        if after is not None:
+            params["after_deleted_at"], params["after_id"] = after[0].isoformat(), str(after[1])
+        return params
+
+    def _represent_include(
+        self, with_suggestions: bool, with_responses: bool, with_vectors: Optional[Union[List, str, bool]]
+    ) -> List[str]:
+        """Represent the relationships to include in the API request"""
+        include = []
+        if with_suggestions:
+            include.append("suggestions")
+        if with_responses:
+            include.append("responses")
+        if with_vectors:
+            include.append(self._represent_vectors_to_include(with_vectors))
+        return include
+
     def _represent_vectors_to_include(self, with_vectors: Union[List, str, bool]) -> Union[str, None]:
         """Represent the vectors to include in the API request"""
         vector_stub = "vectors"
@@ -247,3 +345,195 @@ class RecordsAPI(ResourceAPI[RecordModel]):
             return f"{vector_stub}:{','.join(with_vectors)}"
         else:
             raise ValueError(f"Invalid value for with_vectors: {with_vectors}")
+
+
+class AsyncRecordsAPI(RecordsAPI):
+    """Manage records via the API using an asynchronous HTTP client"""
+
+    http_client: httpx.AsyncClient
+
+    ################
+    # CRUD methods #
+    ################
+    @api_error_handler
+    async def get(self, record_id: UUID) -> RecordModel:
+        response = await self.http_client.get(f"/api/v1/records/{record_id}")
+        response.raise_for_status()
+        return self._model_from_json(response_json=response.json())
+
+    @api_error_handler
+    async def update(self, record: RecordModel) -> RecordModel:
+        response = await self.http_client.patch(url=f"/api/v1/records/{record.id}", json=record.model_dump())
+        response.raise_for_status()
+        return self._model_from_json(response_json=response.json())
+
+    @api_error_handler
+    async def delete(self, record_id: UUID) -> None:
+        response = await self.http_client.delete(f"/api/v1/records/{record_id}")
+        response.raise_for_status()
+        self._log_message(message=f"Deleted record {record_id}")
+
+    @api_error_handler
+    async def get_media(self, media_reference: str) -> bytes:
+        response = await self.http_client.get(media_reference)
+        response.raise_for_status()
+        return response.content
+
+    ####################
+    # Utility methods #
+    ####################
+    @api_error_handler
+    async def list(
+        self,
+        dataset_id: UUID,
+        offset: int = 0,
+        limit: int = 100,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        with_vectors: Optional[Union[List, bool]] = None,
+    ) -> List[RecordModel]:
+        params = {
+            "offset": offset,
+            "limit": limit,
+            "include": self._represent_include(with_suggestions, with_responses, with_vectors),
+        }
+
+        response = await self.http_client.get(f"/api/v1/datasets/{dataset_id}/records", params=params)
+        response.raise_for_status()
+        return self._model_from_jsons(response.json()["items"])
+
+    @api_error_handler
+    async def list_updated(
+        self,
+        dataset_id: UUID,
+        limit: int = 100,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        with_vectors: Optional[Union[List, bool]] = None,
+        updated_at_ge: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Tuple[RecordModel, datetime]]:
+        params = self._list_updated_params(limit, with_suggestions, with_responses, with_vectors, updated_at_ge, after)
+
+        response = await self.http_client.get(f"/api/v1/datasets/{dataset_id}/records/updated", params=params)
+        response.raise_for_status()
+        return self._updated_models_from_jsons(response.json()["items"])
+
+    @api_error_handler
+    async def list_deleted(
+        self,
+        dataset_id: UUID,
+        limit: int = 100,
+        deleted_at_ge: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[DeletedRecordModel]:
+        params = self._list_deleted_params(limit, deleted_at_ge, after)
+
+        response = await self.http_client.get(f"/api/v1/datasets/{dataset_id}/records/deleted", params=params)
+        response.raise_for_status()
+        return [DeletedRecordModel(**item) for item in response.json()["items"]]
+
+    @api_error_handler
+    async def search(
+        self,
+        dataset_id: UUID,
+        query: SearchQueryModel,
+        offset: int = 0,
+        limit: int = 100,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        with_vectors: Optional[Union[List, bool]] = None,
+    ) -> Tuple[List[Tuple[RecordModel, float]], int]:
+        params = {
+            "offset": offset,
+            "limit": limit,
+            "include": self._represent_include(with_suggestions, with_responses, with_vectors),
+        }
+
+        response = await self.http_client.post(
+            f"/api/v1/datasets/{dataset_id}/records/search",
+            json=query.model_dump(by_alias=True),
+            params=params,
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        json_items = response_json["items"]
+        total = response_json["total"]
+        return [(self._model_from_json(item["record"]), item["query_score"]) for item in json_items], total
+
+    @deprecated("Use `bulk_create` or `bulk_upsert` instead")
+    @api_error_handler
+    async def create_many(self, dataset_id: UUID, records: List[RecordModel]) -> None:
+        response = await self.http_client.post(
+            url=f"/api/v1/datasets/{dataset_id}/records",
+            json={"items": [record.model_dump() for record in records]},
+        )
+        response.raise_for_status()
+        self._log_message(message=f"Created {len(records)} records in dataset {dataset_id}")
+
+    @deprecated("Use `bulk_create` or `bulk_upsert` instead")
+    @api_error_handler
+    async def update_many(self, dataset_id: UUID, records: List[RecordModel]) -> None:
+        response = await self.http_client.patch(
+            url=f"/api/v1/datasets/{dataset_id}/records",
+            json={"items": [record.model_dump() for record in records]},
+        )
+        response.raise_for_status()
+        self._log_message(message=f"Updated {len(records)} records in dataset {dataset_id}")
+
+    @api_error_handler
+    async def delete_many(self, dataset_id: UUID, records: List[RecordModel]) -> None:
+        record_ids_str = ",".join(str(record.id) for record in records)
+        response = await self.http_client.delete(
+            url=f"/api/v1/datasets/{dataset_id}/records", params={"ids": record_ids_str}
+        )
+        response.raise_for_status()
+        self._log_message(message=f"Deleted {len(records)} records in dataset {dataset_id}")
+
+    @api_error_handler
+    async def bulk_create(self, dataset_id: UUID, records: List[RecordModel]) -> List[RecordModel]:
+        if len(records) > self.MAX_RECORDS_PER_CREATE_BULK:
+            raise ValueError(f"Cannot create more than {self.MAX_RECORDS_PER_CREATE_BULK} records at once")
+        response = await self.http_client.post(
+            url=f"/api/v1/datasets/{dataset_id}/records/bulk",
+            json={"items": [record.model_dump() for record in records]},
+        )
+        response.raise_for_status()
+        self._log_message(message=f"Created {len(records)} in dataset {dataset_id}")
+        return self._model_from_jsons(response_jsons=response.json()["items"])
+
+    @api_error_handler
+    async def bulk_upsert(self, dataset_id: UUID, records: List[RecordModel]) -> Tuple[List[RecordModel], int]:
+        if len(records) > self.MAX_RECORDS_PER_UPSERT_BULK:
+            raise ValueError(f"Cannot upsert more than {self.MAX_RECORDS_PER_UPSERT_BULK} records at once")
+        response = await self.http_client.put(
+            url=f"/api/v1/datasets/{dataset_id}/records/bulk",
+            json={"items": [record.model_dump() for record in records]},
+        )
+        response.raise_for_status()
+        response_json = response.json()
+        updated = len(response_json.get("updated_item_ids", []))
+        self._log_message(
+            message=f"Updated {updated} records and create {len(records) - updated} records in dataset {dataset_id}"
+        )
+        return self._model_from_jsons(response_jsons=response_json["items"]), updated
+
+    ####################
+    # Response methods #
+    ####################
+
+    @api_error_handler
+    async def create_record_response(self, record_id: UUID, user_response: UserResponseModel) -> None:
+        response = await self.http_client.post(
+            url=f"/api/v1/records/{record_id}/responses",
+            json=user_response.model_dump(),
+        )
+        response.raise_for_status()
+
+    async def create_record_responses(self, record: RecordModel) -> None:
+        if not record.responses:
+            return
+        if not record.id:
+            raise ValueError("Record must have an ID to create responses")
+        for record_response in record.responses:
+            await self.create_record_response(record_id=record.id, user_response=record_response)
@@ -21,7 +21,7 @@ from argilla._api._base import ResourceAPI
 from argilla._exceptions import api_error_handler
 from argilla._models._user import UserModel
 
-__all__ = ["UsersAPI"]
+__all__ = ["UsersAPI", "AsyncUsersAPI"]
 
 
 class UsersAPI(ResourceAPI[UserModel]):
@@ -125,3 +125,92 @@ class UsersAPI(ResourceAPI[UserModel]):
 
     def _model_from_jsons(self, response_jsons) -> List[UserModel]:
         return list(map(self._model_from_json, response_jsons))
+
+
+class AsyncUsersAPI(UsersAPI):
+    """Manage users via the API using an asynchronous HTTP client"""
+
+    http_client: httpx.AsyncClient
+
+    ################
+    # CRUD methods #
+    ################
+
+    @api_error_handler
+    async def create(self, user: UserModel) -> UserModel:
+        json_body = user.model_dump()
+        response = (await self.http_client.post("/api/v1/users", json=json_body)).raise_for_status()
+        user_created = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Created user {user_created.username}")
+
+        return user_created
+
+    @api_error_handler
+    async def update(self, user: UserModel) -> UserModel:
+        json_body = user.model_dump(exclude_unset=True)
+        response = (await self.http_client.patch(f"/api/v1/users/{user.id}", json=json_body)).raise_for_status()
+        user_updated = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Updated user {user_updated.username}")
+
+        return user_updated
+
+    @api_error_handler
+    async def get(self, user_id: UUID) -> UserModel:
+        response = await self.http_client.get(url=f"/api/v1/users/{user_id}")
+        response.raise_for_status()
+        user = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Got user {user.username}")
+        return user
+
+    async def exist(self, user_id: UUID) -> bool:
+        response = await self.http_client.get(url=f"/api/v1/users/{user_id}")
+        return response.status_code == 200
+
+    @api_error_handler
+    async def delete(self, user_id: UUID) -> None:
+        (await self.http_client.delete(url=f"/api/v1/users/{user_id}")).raise_for_status()
+        self._log_message(message=f"Deleted user {user_id}")
+
+    ####################
+    # V0 API methods #
+    ####################
+
+    @api_error_handler
+    async def list(self) -> List[UserModel]:
+        response = await self.http_client.get(url="/api/v1/users")
+        response.raise_for_status()
+        users = self._model_from_jsons(response_jsons=response.json()["items"])
+        self._log_message(message=f"Listed {len(users)} users")
+        return users
+
+    @api_error_handler
+    async def list_by_workspace_id(self, workspace_id: UUID) -> List[UserModel]:
+        response = await self.http_client.get(url=f"/api/v1/workspaces/{workspace_id}/users")
+        response.raise_for_status()
+        users = self._model_from_jsons(response_jsons=response.json()["items"])
+        self._log_message(message=f"Listed {len(users)} users")
+        return users
+
+    @api_error_handler
+    async def get_me(self) -> UserModel:
+        response = await self.http_client.get("/api/v1/me")
+        response.raise_for_status()
+        user = self._model_from_json(response_json=response.json())
+        self._log_message(message=f"Got user {user.username}")
+        return user
+
+    @api_error_handler
+    async def add_to_workspace(self, workspace_id: UUID, user_id: UUID) -> "UserModel":
+        response = await self.http_client.post(
+            url=f"/api/v1/workspaces/{workspace_id}/users", json={"user_id": str(user_id)}
+        )
+        response.raise_for_status()
+        self._log_message(message=f"Added user {user_id} to workspace {workspace_id}")
+        return self._model_from_json(response_json=response.json())
+
+    @api_error_handler
+    async def delete_from_workspace(self, workspace_id: UUID, user_id: UUID) -> "UserModel":
+        response = await self.http_client.delete(url=f"/api/v1/workspaces/{workspace_id}/users/{user_id}")
+        response.raise_for_status()
+        self._log_message(message=f"Deleted user {user_id} from workspace {workspace_id}")
+        return self._model_from_json(response_json=response.json())
@@ -21,7 +21,7 @@ from argilla._api._base import ResourceAPI
 from argilla._exceptions._api import api_error_handler
 from argilla._models._workspace import WorkspaceModel
 
-__all__ = ["WorkspacesAPI"]
+__all__ = ["WorkspacesAPI", "AsyncWorkspacesAPI"]
 
 
 class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
@@ -118,3 +118,71 @@ class WorkspacesAPI(ResourceAPI[WorkspaceModel]):
 
     def _model_from_jsons(self, json_workspaces: List[Dict]) -> List[WorkspaceModel]:
         return list(map(self._model_from_json, json_workspaces))
+
+
+class AsyncWorkspacesAPI(WorkspacesAPI):
+    """Manage workspaces via the API using an asynchronous HTTP client"""
+
+    http_client: httpx.AsyncClient
+
+    ################
+    # CRUD methods #
+    ################
+
+    @api_error_handler
+    async def create(self, workspace: WorkspaceModel) -> WorkspaceModel:
+        response = await self.http_client.post(url="/api/v1/workspaces", json={"name": workspace.name})
+        response.raise_for_status()
+        workspace = self._model_from_json(json_workspace=response.json())
+        self._log_message(message=f"Created workspace {workspace.name}")
+        return workspace
+
+    @api_error_handler
+    async def get(self, workspace_id: UUID) -> WorkspaceModel:
+        response = await self.http_client.get(url=f"{self.url_stub}/{workspace_id}")
+        response.raise_for_status()
+        return self._model_from_json(json_workspace=response.json())
+
+    @api_error_handler
+    async def delete(self, workspace_id: UUID) -> None:
+        response = await self.http_client.delete(url=f"{self.url_stub}/{workspace_id}")
+        response.raise_for_status()
+
+    async def exists(self, workspace_id: UUID) -> bool:
+        response = await self.http_client.get(url=f"{self.url_stub}/{workspace_id}")
+        return response.status_code == 200
+
+    ####################
+    # Utility methods #
+    ####################
+
+    @api_error_handler
+    async def list(self) -> List[WorkspaceModel]:
+        response = await self.http_client.get(url="/api/v1/me/workspaces")
+        response.raise_for_status()
+        workspaces = self._model_from_jsons(json_workspaces=response.json()["items"])
+        self._log_message(message=f"Got {len(workspaces)} workspaces")
+        return workspaces
+
+    @api_error_handler
+    async def list_by_user_id(self, user_id: UUID) -> List[WorkspaceModel]:
+        response = await self.http_client.get(f"/api/v1/users/{user_id}/workspaces")
+        response.raise_for_status()
+        workspaces = self._model_from_jsons(json_workspaces=response.json()["items"])
+        self._log_message(message=f"Got {len(workspaces)} workspaces")
+        return workspaces
+
+    async def list_current_user_workspaces(self) -> List[WorkspaceModel]:
+        return await self.list()
+
+    async def get_by_name(self, name: str) -> Optional[WorkspaceModel]:
+        for workspace in await self.list():
+            if workspace.name == name:
+                self._log_message(message=f"Got workspace {workspace.name}")
+                return workspace
+
+    @api_error_handler
+    async def add_user(self, workspace_id: UUID, user_id: UUID) -> None:
+        response = await self.http_client.post(f"{self.url_stub}/{workspace_id}/users/{user_id}")
+        response.raise_for_status()
+        self._log_message(message=f"Added user {user_id} to workspace {workspace_id}")
@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import inspect
 from typing import Optional
 
 from httpx import HTTPStatusError
@@ -62,7 +63,7 @@ class UnauthorizedError(ArgillaAPIError):
 def api_error_handler(func):
     """Decorator to handle API errors from ResourceAPI methods
     and raise the appropriate exception.
-    Args: func: the request method to decorate
+    Args: func: the request method to decorate. Coroutine functions are supported too.
 
     Example:
     ```python
@@ -92,4 +93,13 @@ def api_error_handler(func):
         except HTTPStatusError as e:
             _error_switch(status_code=e.response.status_code, error_detail=e.response.text)
 
+    async def _async_handler_wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except HTTPStatusError as e:
+            _error_switch(status_code=e.response.status_code, error_detail=e.response.text)
+
+    if inspect.iscoroutinefunction(func):
+        return _async_handler_wrapper
+
     return _handler_wrapper
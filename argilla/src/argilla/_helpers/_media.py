@@ -13,12 +13,38 @@
 # limitations under the License.
 
 import base64
+import hashlib
 import io
+import os
 import warnings
 from pathlib import Path
-from typing import Union, Optional
+from typing import TYPE_CHECKING, Any, Union, Optional
 
-from PIL import Image
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+MEDIA_REFERENCE_PREFIX = "/api/v1/media/"
+
+
+def is_media_reference(value: Any) -> bool:
+    """Check if the value is a reference to media stored by the Argilla server (e.g. `/api/v1/media/<hash>`)."""
+    return isinstance(value, str) and value.startswith(MEDIA_REFERENCE_PREFIX)
+
+
+def media_content_to_data_uri(content: bytes) -> str:
+    """Convert the content of an image stored by the Argilla server to a base64 data URI string.
+    Parameters:
+        content (bytes): The image content downloaded from the server.
+    Returns:
+        str: The data URI string.
+    """
+    from PIL import Image
+
+    image_format = Image.open(io.BytesIO(content)).format or "PNG"
+    img_str = base64.b64encode(content).decode()
+
+    return f"data:image/{image_format.lower()};base64,{img_str}"
 
 
 def pil_to_data_uri(image_object: Optional["Image"]) -> Optional[str]:
@@ -28,6 +54,8 @@ def pil_to_data_uri(image_object: Optional["Image"]) -> Optional[str]:
     Returns:
         str: The data URI string.
     """
+    from PIL import Image
+
     if image_object is None:
         return None
     if not isinstance(image_object, Image.Image):
@@ -75,8 +103,10 @@ def cast_image(image: Union["Image", str, Path]) -> str:
     Returns:
         str: The data URI string.
     """
+    from PIL import Image
+
     if isinstance(image, str):
-        if image.startswith("data:") or image.startswith("http"):
+        if image.startswith("data:") or image.startswith("http") or is_media_reference(image):
             return image
         else:
             return filepath_to_data_uri(image)
@@ -88,8 +118,103 @@ def cast_image(image: Union["Image", str, Path]) -> str:
         raise ValueError("The image must be a data URI string, a file path, or a PIL Image object.")
 
 
+def is_encoded_image(value: Any) -> bool:
+    """Check if the value is an image that doesn't need to be encoded before sending it to the server."""
+    return isinstance(value, str) and (
+        value.startswith("data:") or value.startswith("http") or is_media_reference(value)
+    )
+
+
+def image_hash(image: Union["Image", "np.ndarray", str, Path]) -> str:
+    """Compute a hash of the content of an image, so the same image referenced several times is encoded once.
+    Parameters:
+        image (Image | np.ndarray | str | Path): A PIL image, a NumPy array, or the path to an image file.
+    Returns:
+        str: The hexadecimal digest of the image content.
+    """
+    from PIL import Image
+
+    digest = hashlib.sha256()
+    if isinstance(image, (str, Path)):
+        with open(image, "rb") as image_file:
+            for chunk in iter(lambda: image_file.read(1024 * 1024), b""):
+                digest.update(chunk)
+    elif isinstance(image, Image.Image):
+        digest.update(f"{image.mode}:{image.size}:{image.format}".encode())
+        # NOTE: Images opened from a file and not decoded yet (so they can't have been modified) are hashed by the
+        # file content, so they are not decoded just to be hashed.
+        filename = getattr(image, "filename", None)
+        if filename and getattr(image, "tile", None) and os.path.isfile(filename):
+            with open(filename, "rb") as image_file:
+                for chunk in iter(lambda: image_file.read(1024 * 1024), b""):
+                    digest.update(chunk)
+        else:
+            digest.update(image.tobytes())
+    elif hasattr(image, "__array_interface__"):
+        digest.update(f"{image.dtype}:{image.shape}".encode())
+        digest.update(image.tobytes())
+    else:
+        raise ValueError("The image must be a file path, a NumPy array, or a PIL Image object.")
+
+    return digest.hexdigest()
+
+
+def encode_image(
+    image: Union["Image", "np.ndarray", str, Path],
+    image_format: Optional[str] = None,
+    quality: Optional[int] = None,
+    max_dimension: Optional[int] = None,
+) -> str:
+    """Convert an image to a base64 data URI string, optionally resizing and re-encoding it.
+    Parameters:
+        image (Image | np.ndarray | str | Path): A PIL image, a NumPy array, or the path to an image file.
+        image_format (str): The format used to re-encode the image (e.g. "JPEG", "WEBP"). By default, the image
+            is kept in its original format, and NumPy arrays are encoded as PNG.
+        quality (int): The quality used to re-encode lossy formats like JPEG or WebP.
+        max_dimension (int): If set, images with a larger width or height are downscaled to fit this size,
+            keeping the aspect ratio.
+    Returns:
+        str: The data URI string.
+    """
+    from PIL import Image
+
+    if is_encoded_image(image):
+        return image
+
+    # NOTE: PIL images expose `__array_interface__` too, so they are checked before NumPy arrays
+    is_array = not isinstance(image, Image.Image) and hasattr(image, "__array_interface__")
+    if image_format is None and quality is None and max_dimension is None and not is_array:
+        return cast_image(image)
+
+    if isinstance(image, (str, Path)):
+        image = Image.open(image)
+    elif is_array:
+        image = Image.fromarray(image)
+    elif not isinstance(image, Image.Image):
+        raise ValueError("The image must be a data URI string, a file path, a NumPy array, or a PIL Image object.")
+
+    image_format = (image_format or image.format or "PNG").upper()
+    if max_dimension is not None and max(image.size) > max_dimension:
+        image = image.copy()
+        image.thumbnail((max_dimension, max_dimension))
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    save_kwargs = {"quality": quality} if quality is not None else {}
+    try:
+        buffered = io.BytesIO()
+        image.save(buffered, format=image_format, **save_kwargs)
+    except Exception as e:
+        raise ValueError("An error occurred while saving the image binary to buffer") from e
+
+    img_str = base64.b64encode(buffered.getvalue()).decode()
+    return f"data:image/{image_format.lower()};base64,{img_str}"
+
+
 def uncast_image(image: str) -> "Image":
     """Convert a base64 data URI string to a PIL image."""
+    from PIL import Image
+
     if isinstance(image, Image.Image):
         return image
     elif not isinstance(image, str):
@@ -101,7 +226,7 @@ def uncast_image(image: str) -> "Image":
         except Exception as e:
             raise ValueError("An error occurred while converting the data URI to a PIL image.") from e
         return image
-    elif image.startswith("http"):
+    elif image.startswith("http") or is_media_reference(image):
         return image
     elif Path(image).exists():
         return Image.open(image)
@@ -18,7 +18,7 @@ from argilla._models._resource import ResourceModel
 from argilla._models._workspace import WorkspaceModel
 from argilla._models._user import UserModel, Role
 from argilla._models._dataset import DatasetModel
-from argilla._models._record._record import RecordModel, FieldValue
+from argilla._models._record._record import RecordModel, DeletedRecordModel, FieldValue
 from argilla._models._record._suggestion import SuggestionModel
 from argilla._models._record._response import UserResponseModel, ResponseStatus
 from argilla._models._record._vector import VectorModel, VectorValue
@@ -28,7 +28,7 @@ from argilla._models._settings._task_distribution import TaskDistributionModel
 
 class DatasetModel(ResourceModel):
     name: str
-    status: Literal["draft", "ready"] = "draft"
+    status: Literal["draft", "ready", "deleting"] = "draft"
 
     guidelines: Optional[str] = None
     allow_extra_metadata: bool = True  # Ideally, the default value should be provided by the server
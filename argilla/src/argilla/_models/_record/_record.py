@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import warnings
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple, Union, Literal
 import uuid
 
@@ -146,3 +147,11 @@ class RecordModel(ResourceModel):
         if suggestions is None:
             return []
         return suggestions
+
+
+class DeletedRecordModel(BaseModel):
+    """Schema for the records deleted from a dataset, as tracked by the server."""
+
+    id: uuid.UUID
+    external_id: Optional[str] = None
+    deleted_at: datetime
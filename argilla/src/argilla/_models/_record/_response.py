@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import warnings
+from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional, Union, Any
 from uuid import UUID
@@ -32,6 +33,8 @@ class UserResponseModel(BaseModel):
     values: Union[Dict[str, Dict[str, Any]], None]
     status: ResponseStatus
     user_id: Optional[UUID] = Field(None, validate_default=True)
+    # Read-only timestamp set by the server, which is never sent back
+    updated_at: Optional[datetime] = Field(None, exclude=True)
 
     class Config:
         validate_assignment = True
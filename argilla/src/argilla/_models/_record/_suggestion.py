@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from datetime import datetime
 from typing import Any, Optional, Literal, Union, List
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, Field, field_serializer
 
 
 class SuggestionModel(BaseModel):
@@ -29,6 +30,8 @@ class SuggestionModel(BaseModel):
     agent: Optional[str] = None
     id: Optional[UUID] = uuid4()
     question_id: Optional[UUID] = None
+    # Read-only timestamp set by the server, which is never sent back
+    updated_at: Optional[datetime] = Field(None, exclude=True)
 
     @field_serializer("id", when_used="unless-none")
     def serialize_id(self, value: UUID) -> str:
@@ -12,20 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import re
-from typing import List
+from typing import TYPE_CHECKING, Any, List, Union
 
-from pydantic import field_validator
+from pydantic import ConfigDict, field_serializer, field_validator
 
 from argilla._models import ResourceModel
 
-__all__ = ["VectorModel", "VectorValue"]
+if TYPE_CHECKING:
+    import numpy as np
 
-VectorValue = List[float]
+__all__ = ["VectorModel", "VectorValue", "as_vector_array", "vector_values_equal"]
+
+VectorValue = Union[List[float], "np.ndarray"]
+
+
+def as_vector_array(values: VectorValue) -> "np.ndarray":
+    """Returns the vector values as a one-dimensional float32 NumPy array, without copying them if they already are."""
+    import numpy as np
+
+    array = np.asarray(values, dtype=np.float32)
+    if array.ndim != 1:
+        raise ValueError(f"Vector values must be one-dimensional, got an array with shape {array.shape}")
+    return array
+
+
+def vector_values_equal(values: VectorValue, other: Any) -> bool:
+    """Returns whether two vectors have the same values, once converted to float32 arrays."""
+    import numpy as np
+
+    try:
+        return bool(np.array_equal(as_vector_array(values), as_vector_array(other)))
+    except (TypeError, ValueError):
+        return False
 
 
 class VectorModel(ResourceModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     name: str
-    vector_values: VectorValue
+    # NOTE: Values are stored as a float32 NumPy array. The annotation is `Any` so NumPy is only imported when used
+    vector_values: Any
 
     @field_validator("name")
     @classmethod
@@ -34,3 +60,22 @@ class VectorModel(ResourceModel):
         if not re.match(r"^[a-zA-Z0-9_-]+$", value):
             raise ValueError("Vector name must be url safe")
         return value
+
+    @field_validator("vector_values", mode="before")
+    @classmethod
+    def validate_vector_values(cls, value: VectorValue) -> "np.ndarray":
+        return as_vector_array(value)
+
+    @field_serializer("vector_values")
+    def serialize_vector_values(self, value: "np.ndarray") -> List[float]:
+        return value.tolist()
+
+    def __eq__(self, other: Any) -> bool:
+        # NOTE: The default equality compares the values arrays element-wise, and the result can't be used as a bool
+        if not isinstance(other, VectorModel):
+            return NotImplemented
+
+        if self.model_dump(exclude={"vector_values"}) != other.model_dump(exclude={"vector_values"}):
+            return False
+
+        return vector_values_equal(self.vector_values, other.vector_values)
@@ -31,6 +31,8 @@ class EventType(str, Enum):
     record_deleted = "record.deleted"
     record_completed = "record.completed"
 
+    records_deleted = "records.deleted"
+
     response_created = "response.created"
     response_updated = "response.updated"
     response_deleted = "response.deleted"
@@ -41,7 +43,7 @@ class EventType(str, Enum):
         Get the instance type of the event.
 
         Returns:
-            str: The instance type. It can be "dataset", "record", or "response".
+            str: The instance type. It can be "dataset", "record", "records", or "response".
 
         """
         return self.split(".")[0]
@@ -31,8 +31,9 @@ from argilla._models import DatasetModel, ResourceModel, UserModel, WorkspaceMod
 
 if TYPE_CHECKING:
     from argilla import Dataset, User, Workspace, Webhook
+    from argilla.records import AsyncDatasetRecords
 
-__all__ = ["Argilla"]
+__all__ = ["Argilla", "AsyncArgilla"]
 
 
 class Argilla(_api.APIClient, SpacesDeploymentMixin, NotebookHTMLReprMixin):
@@ -117,6 +118,72 @@ class Argilla(_api.APIClient, SpacesDeploymentMixin, NotebookHTMLReprMixin):
         return cls._default_client
 
 
+class AsyncArgilla(_api.AsyncAPIClient):
+    """Asynchronous Argilla API client, backed by `httpx.AsyncClient`. It can be used to log, search and iterate
+    over records and to submit responses concurrently from a single event loop, for example in async web services.
+
+    Datasets and their settings are managed with the `Argilla` client, and `AsyncArgilla` works with the records of
+    those datasets using the same models and serialization:
+
+    ```python
+    dataset = client.datasets(name="my_dataset")
+
+    async with rg.AsyncArgilla(api_url=api_url, api_key=api_key) as async_client:
+        records = async_client.records(dataset)
+        await records.log([{"text": "Hello world"}])
+
+        async for record in records(query="hello"):
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        api_url: Optional[str] = DEFAULT_HTTP_CONFIG.api_url,
+        api_key: Optional[str] = DEFAULT_HTTP_CONFIG.api_key,
+        timeout: int = DEFAULT_HTTP_CONFIG.timeout,
+        retries: int = DEFAULT_HTTP_CONFIG.retries,
+        **http_client_args,
+    ) -> None:
+        """Inits the `AsyncArgilla` client.
+
+        Args:
+            api_url: the URL of the Argilla API. If not provided, then the value will try
+                to be set from `ARGILLA_API_URL` environment variable. Defaults to
+                `"http://localhost:6900"`.
+            api_key: the key to be used to authenticate in the Argilla API. If not provided,
+                then the value will try to be set from `ARGILLA_API_KEY` environment variable.
+                Defaults to `None`.
+            timeout: the maximum time in seconds to wait for a request to the Argilla API
+                to be completed before raising an exception. Defaults to `60`.
+            retries: the number of times to retry the HTTP connection to the Argilla API
+                before raising an exception. Defaults to `5`.
+        """
+        super().__init__(api_url=api_url, api_key=api_key, timeout=timeout, retries=retries, **http_client_args)
+
+        self._me: Optional[UserModel] = None
+
+    async def me(self) -> UserModel:
+        """The current user. It's fetched from the server only once."""
+        if self._me is None:
+            self._me = await self.api.users.get_me()
+
+        return self._me
+
+    def records(self, dataset: "Dataset") -> "AsyncDatasetRecords":
+        """The records of the given dataset, that can be logged, deleted and iterated asynchronously.
+
+        Args:
+            dataset: A dataset retrieved or created with the `Argilla` client.
+
+        Returns:
+            AsyncDatasetRecords: The asynchronous records of the dataset.
+        """
+        from argilla.records import AsyncDatasetRecords
+
+        return AsyncDatasetRecords(client=self, dataset=dataset, mapping=dataset.settings.mapping)
+
+
 class Users(Sequence["User"], ResourceHTMLReprMixin):
     """A collection of users. It can be used to create a new user or to get an existing one."""
 
@@ -17,13 +17,9 @@ import os
 import warnings
 from collections import defaultdict
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union, Literal
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Type, Union, Literal
 from uuid import UUID
 
-from datasets import DatasetDict
-from datasets.data_files import EmptyDatasetError
-from PIL import Image
-
 from argilla._exceptions import ImportDatasetError
 from argilla._exceptions._api import UnprocessableEntityError
 from argilla._exceptions._records import RecordsIngestionError
@@ -35,9 +31,9 @@ from argilla.records._mapping import IngestedRecordMapper
 from argilla.responses import Response
 
 if TYPE_CHECKING:
-    from datasets import Dataset as HFDataset
+    from datasets import Dataset as HFDataset, IterableDataset as HFIterableDataset
 
-    from argilla import Argilla, Dataset, Settings, Workspace
+    from argilla import Argilla, Dataset, Record, Settings, Workspace
 
 
 class HubImportExportMixin(DiskImportExportMixin):
@@ -122,6 +118,7 @@ class HubImportExportMixin(DiskImportExportMixin):
         settings: Union["Settings", Literal["auto", "ui"]] = "ui",
         split: Optional[str] = None,
         subset: Optional[str] = None,
+        streaming: bool = False,
         **kwargs: Any,
     ) -> Union["Dataset", str]:
         """Loads a `Dataset` from the Hugging Face Hub.
@@ -137,6 +134,9 @@ class HubImportExportMixin(DiskImportExportMixin):
                 the settings will be inferred from the `Features` of the dataset on the hub. Defaults to "ui".
             split: the split to load from the Hugging Face dataset. If not provided, the first split will be loaded.
             subset: the subset to load from the Hugging Face dataset. If not provided, the first subset will be loaded.
+            streaming: whether to stream the records from the Hugging Face Hub instead of downloading the whole dataset.
+                Records are logged in batches while they are read, so large datasets are never fully loaded in memory.
+                Defaults to `False`.
             **kwargs: the kwargs to pass to `datasets.Dataset.load_from_hub`.
 
         Returns:
@@ -144,6 +144,7 @@ class HubImportExportMixin(DiskImportExportMixin):
         """
         from argilla.settings import Settings
         from datasets import load_dataset
+        from datasets.data_files import EmptyDatasetError
         from huggingface_hub import snapshot_download
 
         settings = settings or "ui"
@@ -188,6 +189,7 @@ class HubImportExportMixin(DiskImportExportMixin):
                     settings=settings,
                     split=split,
                     subset=subset,
+                    streaming=streaming,
                     **kwargs,
                 )
                 return dataset
@@ -198,6 +200,7 @@ class HubImportExportMixin(DiskImportExportMixin):
                     path=repo_id,
                     split=split,
                     name=subset,
+                    streaming=streaming,
                     **kwargs,
                 )  # type: ignore
                 hf_dataset = cls._get_dataset_split(hf_dataset=hf_dataset, split=split, **kwargs)
@@ -211,40 +214,44 @@ class HubImportExportMixin(DiskImportExportMixin):
         return dataset
 
     @staticmethod
-    def _log_dataset_records(hf_dataset: "HFDataset", dataset: "Dataset"):
-        """This method extracts the responses from a Hugging Face dataset and returns a list of `Record` objects"""
+    def _log_dataset_records(hf_dataset: Union["HFDataset", "HFIterableDataset"], dataset: "Dataset"):
+        """This method extracts the responses from a Hugging Face dataset and logs the records row by row, so
+        streamed datasets are never fully loaded in memory."""
+        column_names = hf_dataset.column_names or []
+
         # Identify columns that columns that contain responses
-        responses_columns = [col for col in hf_dataset.column_names if ".responses" in col]
+        responses_columns = [col for col in column_names if ".responses" in col]
         response_questions = defaultdict(dict)
-        user_ids = {}
         for col in responses_columns:
             question_name = col.split(".")[0]
             if col.endswith("users"):
-                response_questions[question_name]["users"] = hf_dataset[col] or []
-                for users in hf_dataset[col]:
-                    if users is None:
-                        continue
-                    user_ids.update({UUID(user_id): user_id for user_id in users})
+                response_questions[question_name]["users"] = col
             elif col.endswith("responses"):
-                response_questions[question_name]["responses"] = hf_dataset[col]
+                response_questions[question_name]["responses"] = col
             elif col.endswith("status"):
-                response_questions[question_name]["status"] = hf_dataset[col]
+                response_questions[question_name]["status"] = col
 
-        # Check if all user ids are known to this Argilla client
-        known_users_ids = [user.id for user in dataset._client.users]
-        unknown_user_ids = set(user_ids.keys()) - set(known_users_ids)
+        # Check if user ids are known to this Argilla client while reading the rows
+        known_users_ids = {user.id for user in dataset._client.users}
+        unknown_user_ids = set()
         my_user = dataset._client.me
-        if len(unknown_user_ids) > 1:
-            warnings.warn(
-                message=f"""Found unknown user ids in dataset repo: {unknown_user_ids}.
+
+        def resolve_user_id(user_id: str) -> UUID:
+            user_id = UUID(user_id)
+            if user_id in known_users_ids:
+                return user_id
+
+            if not unknown_user_ids:
+                warnings.warn(
+                    message=f"""Found unknown user ids in dataset repo: {user_id}.
                     Assigning first response for each record to current user ({my_user.username}) and discarding the rest."""
-            )
-        for unknown_user_id in unknown_user_ids:
-            user_ids[unknown_user_id] = my_user.id
+                )
+            unknown_user_ids.add(user_id)
+            return my_user.id
 
         # Create a mapper to map the Hugging Face dataset to a Record object
         mapping = {}
-        for col in hf_dataset.column_names:
+        for col in column_names:
             if ".suggestion" in col:
                 mapping[col] = col
             elif col.startswith("metadata.") and col.replace("metadata.", "") in dataset.schema:
@@ -254,34 +261,33 @@ class HubImportExportMixin(DiskImportExportMixin):
 
         mapper = IngestedRecordMapper(dataset=dataset, mapping=mapping, user_id=my_user.id)
 
-        # Extract responses and create Record objects
-        records = []
-        hf_dataset = HFDatasetsIO.to_argilla(hf_dataset=hf_dataset, mapper=mapper)
-        for idx, row in enumerate(hf_dataset):
-            record = mapper(row)
-            for question_name, values in response_questions.items():
-                response_values = values["responses"][idx] or []
-                response_users = values["users"][idx] or []
-                response_status = values["status"][idx] or []
-
-                used_users = set()
-                for value, user_id, status in zip(response_values, response_users, response_status):
-                    user_id = user_ids[UUID(user_id)]
-                    if user_id in used_users:
-                        continue
-
-                    used_users.add(user_id)
-                    response = Response(
-                        user_id=user_id,
-                        question_name=question_name,
-                        value=value,
-                        status=status,
-                    )
-                    record.responses.add(response)
-            records.append(record)
+        def records_from_rows() -> Iterator["Record"]:
+            # Extract responses and create Record objects
+            for row in HFDatasetsIO.to_argilla(hf_dataset=hf_dataset, mapper=mapper):
+                record = mapper(row)
+                for question_name, columns in response_questions.items():
+                    response_values = row[columns["responses"]] or []
+                    response_users = row[columns["users"]] or []
+                    response_status = row[columns["status"]] or []
+
+                    used_users = set()
+                    for value, user_id, status in zip(response_values, response_users, response_status):
+                        user_id = resolve_user_id(user_id)
+                        if user_id in used_users:
+                            continue
+
+                        used_users.add(user_id)
+                        response = Response(
+                            user_id=user_id,
+                            question_name=question_name,
+                            value=value,
+                            status=status,
+                        )
+                        record.responses.add(response)
+                yield record
 
         try:
-            dataset.records.log(records=records)
+            dataset.records.log(records=records_from_rows())
         except (RecordsIngestionError, UnprocessableEntityError) as e:
             raise SettingsError(
                 message=f"Failed to load records from Hugging Face dataset. Defined settings do not match dataset schema. Hugging face dataset features: {hf_dataset.features}. Argilla dataset settings : {dataset.settings}"
@@ -297,8 +303,9 @@ class HubImportExportMixin(DiskImportExportMixin):
         Returns:
             HFDataset: The single dataset.
         """
+        from datasets import DatasetDict, IterableDatasetDict
 
-        if isinstance(hf_dataset, DatasetDict) and split is None:
+        if isinstance(hf_dataset, (DatasetDict, IterableDatasetDict)) and split is None:
             split = next(iter(hf_dataset.keys()))
             if len(hf_dataset.keys()) > 1:
                 warnings.warn(
@@ -318,6 +325,7 @@ class HubImportExportMixin(DiskImportExportMixin):
         Returns:
             Dict: The sample record.
         """
+        from PIL import Image
 
         if hf_dataset:
             sample_huggingface_record = {}
@@ -12,8 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from argilla.records._dataset_records import DatasetRecords
+from argilla.records._dataset_records import AsyncDatasetRecords, DatasetRecords
+from argilla.records._media import MediaEncoder
 from argilla.records._resource import Record
 from argilla.records._search import Query, Filter, Condition, Similar
 
-__all__ = ["Record", "DatasetRecords", "Query", "Filter", "Condition", "Similar"]
+__all__ = [
+    "Record",
+    "DatasetRecords",
+    "AsyncDatasetRecords",
+    "MediaEncoder",
+    "Query",
+    "Filter",
+    "Condition",
+    "Similar",
+]
@@ -11,26 +11,42 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
+import time
 import warnings
+from datetime import datetime, timedelta
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence, Union
+from collections import defaultdict, deque
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Sized, Tuple, Union
 from uuid import UUID
 from enum import Enum
 
+import httpx
 from tqdm import tqdm
 
-from argilla._api import RecordsAPI
+from argilla._api import AsyncRecordsAPI, RecordsAPI
 from argilla._helpers import LoggingMixin
 from argilla._models import RecordModel
-from argilla._exceptions import RecordsIngestionError
+from argilla._exceptions import ArgillaAPIError, NotFoundError, RecordsIngestionError
 from argilla.client import Argilla
-from argilla.records._io import GenericIO, HFDataset, HFDatasetsIO, JsonIO
+from argilla.records._io import ArrowIO, GenericIO, HFDatasetsIO, JsonIO, PandasIO, SQLiteIO
 from argilla.records._mapping import IngestedRecordMapper
 from argilla.records._resource import Record
 from argilla.records._search import Query
 
 if TYPE_CHECKING:
+    import sqlite3
+
+    import numpy as np
+    import pyarrow as pa
+    from datasets import Dataset as HFDataset, IterableDataset as HFIterableDataset
+    from pandas import DataFrame
+
+    from argilla.client import AsyncArgilla
     from argilla.datasets import Dataset
+    from argilla.records._media import MediaEncoder
 
 
 class RecordErrorHandling(Enum):
@@ -39,13 +55,19 @@ class RecordErrorHandling(Enum):
     IGNORE = "ignore"
 
 
-class DatasetRecordsIterator:
-    """This class is used to iterate over records in a dataset"""
+class BaseDatasetRecordsIterator:
+    """Common pagination logic shared by `DatasetRecordsIterator` and `AsyncDatasetRecordsIterator`.
+
+    Pages of records are requested ahead of time, keeping up to `prefetch` pages in flight while the current page is
+    consumed, so iterating over large datasets is not bound by the latency of each request.
+    """
+
+    DEFAULT_PREFETCH = 2
 
     def __init__(
         self,
         dataset: "Dataset",
-        client: "Argilla",
+        client: Union["Argilla", "AsyncArgilla"],
         query: Optional[Query] = None,
         start_offset: int = 0,
         batch_size: Optional[int] = None,
@@ -53,91 +75,197 @@ class DatasetRecordsIterator:
         with_responses: bool = False,
         with_vectors: Optional[Union[str, List[str], bool]] = None,
         limit: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH,
     ):
-        self.__dataset = dataset
-        self.__client = client
-        self.__query = query or Query()
-        self.__offset = start_offset or 0
-        self.__batch_size = batch_size or 100
-        self.__with_suggestions = with_suggestions
-        self.__with_responses = with_responses
-        self.__with_vectors = with_vectors
-        self.__records_batch = []
-        self.__limit = limit
-
-        if self.__limit is not None and self.__limit <= 0:
-            warnings.warn(f"Limit {self.__limit} is invalid: must be greater than 0. Setting limit to 1.")
-            self.__limit = 1
-
-        if self.__limit is not None and self.__limit < self.__batch_size:
-            self.__batch_size = self.__limit
+        self._dataset = dataset
+        self._client = client
+        self._query = query or Query()
+        self._offset = start_offset or 0
+        self._batch_size = batch_size or 100
+        self._with_suggestions = with_suggestions
+        self._with_responses = with_responses
+        self._with_vectors = with_vectors
+        self._records_batch: Deque[Record] = deque()
+        self._limit = limit
+        self._prefetch = max(prefetch, 1)
+        self._pages: Deque[Tuple[int, Any]] = deque()
+        self._last_page_requested = False
+        # Offset where the records of the dataset end, known once a page with fewer records than requested is fetched
+        self._end_offset: Optional[int] = None
+
+        if self._limit is not None and self._limit <= 0:
+            warnings.warn(f"Limit {self._limit} is invalid: must be greater than 0. Setting limit to 1.")
+            self._limit = 1
+
+        if self._limit is not None and self._limit < self._batch_size:
+            self._batch_size = self._limit
+
+        # Records not requested yet to the server, used to avoid prefetching pages beyond the limit
+        self._pending_limit = self._limit
 
-    def __iter__(self):
-        return self
+    def _limit_reached(self) -> bool:
+        if self._limit is None:
+            return False
+        return self._limit <= 0
+
+    def _no_records(self) -> bool:
+        return len(self._records_batch) <= 0
+
+    def _pop_record(self) -> Optional[Record]:
+        """Returns the next record of the current batch, or None when there are no more records to return."""
+        if self._limit_reached() or self._no_records():
+            return None
+
+        record = self._records_batch.popleft()
+
+        if self._limit is not None:
+            self._limit -= 1
+
+        return record
+
+    def _pages_to_request(self) -> Iterator[Tuple[int, int]]:
+        """Yields the offset and size of the next pages to request, while less than `prefetch` pages are in flight.
+        Callers must add every page to `_pages` before requesting the next one."""
+        if self._end_offset is not None:
+            self._last_page_requested = True
+
+        while not self._last_page_requested and len(self._pages) < self._prefetch:
+            page_size = self._batch_size
+            if self._pending_limit is not None:
+                page_size = min(page_size, self._pending_limit)
+                self._pending_limit -= page_size
+                self._last_page_requested = self._pending_limit <= 0
+
+            offset = self._offset
+            self._offset += page_size
+            yield offset, page_size
+
+    def _add_page(self, page_size: int, record_models: List[RecordModel]) -> bool:
+        """Adds the records of a fetched page to the current batch. Returns whether it was the last page, in which
+        case the pages already requested are beyond the end of the dataset."""
+        last_page = len(record_models) < page_size
+        if last_page:
+            self._last_page_requested = True
+
+        self._records_batch.extend(Record.from_model(model=model, dataset=self._dataset) for model in record_models)
+        return last_page
+
+    def _is_page_beyond_end(self, offset: int) -> bool:
+        # NOTE: Pages queued after a page with fewer records than requested can only be empty, so they are not sent.
+        return self._end_offset is not None and offset >= self._end_offset
+
+    def _track_end_offset(self, offset: int, limit: int, record_models: List[RecordModel]) -> None:
+        if len(record_models) < limit:
+            end_offset = offset + len(record_models)
+            self._end_offset = end_offset if self._end_offset is None else min(self._end_offset, end_offset)
+
+    def _is_search_query(self) -> bool:
+        return self._query.has_search()
+
+    def _page_params(self, offset: int, limit: int) -> Dict[str, Any]:
+        """Returns the params to request a page of records, using `search` or `list` depending on the query."""
+        params = dict(
+            dataset_id=self._dataset.id,
+            limit=limit,
+            offset=offset,
+            with_responses=self._with_responses,
+            with_suggestions=self._with_suggestions,
+            with_vectors=self._with_vectors,
+        )
+        if self._is_search_query():
+            params["query"] = self._query.api_model()
+        return params
+
+    def _warn_missing_dataset(self) -> None:
+        warnings.warn(f"Dataset {self._dataset.id!r} does not exist on the server. Skipping...")
+
+
+class DatasetRecordsIterator(BaseDatasetRecordsIterator):
+    """This class is used to iterate over records in a dataset.
+
+    Pages of records are fetched in background threads, keeping up to `prefetch` pages in flight while the current
+    page is consumed, so iterating over large datasets is not bound by the latency of each request.
+    """
+
+    # The thread pool fetching pages, created when the first page is requested
+    _executor: Optional[ThreadPoolExecutor] = None
+
+    def __iter__(self) -> Iterator[Record]:
+        # NOTE: A generator is returned so, when the loop consuming it exits early (e.g. using `break`), closing it
+        # cancels the prefetched pages and shuts the thread pool down.
+        try:
+            while True:
+                try:
+                    yield next(self)
+                except StopIteration:
+                    return
+        finally:
+            self._shutdown()
 
     def __next__(self) -> Record:
         if self._no_records():
             self._fetch_next_batch()
 
-        return self._next_record()
+        record = self._pop_record()
+        if record is None:
+            self._shutdown()
+            raise StopIteration()
 
-    def _limit_reached(self) -> bool:
-        if self.__limit is None:
-            return False
-        return self.__limit <= 0
+        return record
 
-    def _next_record(self) -> Record:
-        if self._limit_reached() or self._no_records():
-            raise StopIteration()
+    def close(self) -> None:
+        """Cancels the pages being prefetched. Only needed when records are consumed calling `next` directly."""
+        self._shutdown()
 
-        record = self.__records_batch.pop(0)
+    def _fetch_next_batch(self) -> None:
+        self._request_pages()
+        if not self._pages:
+            return
 
-        if self.__limit is not None:
-            self.__limit -= 1
+        page_size, page = self._pages.popleft()
+        if self._add_page(page_size, page.result()):
+            self._shutdown()
 
-        return record
+        self._request_pages()
 
-    def _no_records(self) -> bool:
-        return len(self.__records_batch) <= 0
+    def _request_pages(self) -> None:
+        for offset, page_size in self._pages_to_request():
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._prefetch)
 
-    def _fetch_next_batch(self) -> None:
-        self.__records_batch = list(self._list())
-        self.__offset += len(self.__records_batch)
+            self._pages.append((page_size, self._executor.submit(self._fetch_page, offset, page_size)))
 
-    def _list(self) -> Sequence[Record]:
-        for record_model in self._fetch_from_server():
-            yield Record.from_model(model=record_model, dataset=self.__dataset)
+    def _shutdown(self) -> None:
+        for _, page in self._pages:
+            page.cancel()
+        self._pages.clear()
 
-    def _fetch_from_server(self) -> List[RecordModel]:
-        if not self.__client.api.datasets.exists(self.__dataset.id):
-            warnings.warn(f"Dataset {self.__dataset.id!r} does not exist on the server. Skipping...")
-            return []
-        return self._fetch_from_server_with_search() if self._is_search_query() else self._fetch_from_server_with_list()
-
-    def _fetch_from_server_with_list(self) -> List[RecordModel]:
-        return self.__client.api.records.list(
-            dataset_id=self.__dataset.id,
-            limit=self.__batch_size,
-            offset=self.__offset,
-            with_responses=self.__with_responses,
-            with_suggestions=self.__with_suggestions,
-            with_vectors=self.__with_vectors,
-        )
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
 
-    def _fetch_from_server_with_search(self) -> List[RecordModel]:
-        search_items, total = self.__client.api.records.search(
-            dataset_id=self.__dataset.id,
-            query=self.__query.api_model(),
-            limit=self.__batch_size,
-            offset=self.__offset,
-            with_responses=self.__with_responses,
-            with_suggestions=self.__with_suggestions,
-            with_vectors=self.__with_vectors,
-        )
-        return [record_model for record_model, _ in search_items]
+    def _fetch_page(self, offset: int, limit: int) -> List[RecordModel]:
+        if self._is_page_beyond_end(offset):
+            return []
 
-    def _is_search_query(self) -> bool:
-        return self.__query.has_search()
+        record_models = self._fetch_from_server(offset=offset, limit=limit)
+        self._track_end_offset(offset, limit, record_models)
+
+        return record_models
+
+    def _fetch_from_server(self, offset: int, limit: int) -> List[RecordModel]:
+        params = self._page_params(offset=offset, limit=limit)
+        try:
+            if self._is_search_query():
+                search_items, _ = self._client.api.records.search(**params)
+                return [record_model for record_model, _ in search_items]
+            return self._client.api.records.list(**params)
+        except NotFoundError:
+            # NOTE: Existence is only checked when a page is not found, instead of before requesting every page.
+            if self._client.api.datasets.exists(self._dataset.id):
+                raise
+            self._warn_missing_dataset()
+            return []
 
     def to_list(self, flatten: bool) -> List[Dict[str, Any]]:
         return GenericIO.to_list(records=list(self), flatten=flatten)
@@ -150,10 +278,276 @@ class DatasetRecordsIterator:
         return JsonIO.to_json(records=list(self), path=path)
 
     def to_datasets(self) -> "HFDataset":
-        return HFDatasetsIO.to_datasets(records=list(self), dataset=self.__dataset)
+        return HFDatasetsIO.to_datasets(records=list(self), dataset=self._dataset)
+
+
+class LoggedRecordsCount:
+    """Counts the records logged, updated and failed while sending batches of records to a dataset."""
+
+    def __init__(self):
+        self.logged = 0
+        self.updated = 0
+        self.failed = 0
+
+    def add(self, models: List[RecordModel], updated: int) -> None:
+        self.logged += len(models)
+        self.updated += updated
+
+    def summary(self, dataset_name: str) -> str:
+        message = (
+            f"Updated {self.updated} records and added {self.logged - self.updated} records to dataset {dataset_name}"
+        )
+        if self.failed:
+            message += f". Failed to log {self.failed} records"
+        return message
+
+
+class BaseDatasetRecords(LoggingMixin):
+    """Common logic to ingest records into a dataset shared by `DatasetRecords` and `AsyncDatasetRecords`."""
+
+    RETRY_BACKOFF_FACTOR = 0.5
+
+    def __init__(
+        self,
+        client: Union["Argilla", "AsyncArgilla"],
+        dataset: "Dataset",
+        mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+    ):
+        self._client = client
+        self._dataset = dataset
+        self._mapping = mapping or {}
+        self._api = self._client.api.records
+
+    def _ingest_records(
+        self,
+        records: Union[List[Dict[str, Any]], List[Record], "HFDataset"],
+        mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        user_id: Optional[UUID] = None,
+        on_error: RecordErrorHandling = RecordErrorHandling.RAISE,
+    ) -> List[RecordModel]:
+        """Ingests records from a list of dictionaries, a Hugging Face Dataset, or a list of Record objects."""
+        if len(records) == 0:
+            raise ValueError("No records provided to ingest.")
+
+        return list(self._iter_ingested_records(records=records, mapping=mapping, user_id=user_id, on_error=on_error))
+
+    def _iter_ingested_records(
+        self,
+        records: Union[Iterable[Dict[str, Any]], Iterable[Record], "HFDataset", "HFIterableDataset"],
+        mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        user_id: Optional[UUID] = None,
+        on_error: RecordErrorHandling = RecordErrorHandling.RAISE,
+    ) -> Iterator[RecordModel]:
+        """Lazily ingests records from any iterable of dictionaries or Record objects, or a Hugging Face dataset."""
+
+        mapping = mapping or self._mapping
+        record_mapper = IngestedRecordMapper(mapping=mapping, dataset=self._dataset, user_id=user_id)
+
+        if HFDatasetsIO._is_hf_dataset(dataset=records):
+            records = HFDatasetsIO._record_dicts_from_datasets(hf_dataset=records, mapper=record_mapper)
+
+        for record in records:
+            try:
+                if isinstance(record, dict):
+                    record = record_mapper(data=record)
+                elif isinstance(record, Record):
+                    record.dataset = self._dataset
+                else:
+                    raise ValueError(
+                        "Records should be a a list Record instances, "
+                        "a Hugging Face Dataset, or a list of dictionaries representing the records."
+                        f"Found a record of type {type(record)}: {record}."
+                    )
+            except Exception as e:
+                if on_error == RecordErrorHandling.IGNORE:
+                    self._log_message(
+                        message=f"Failed to ingest record from dict {record}: {e}",
+                        level="info",
+                    )
+                    continue
+                elif on_error == RecordErrorHandling.WARN:
+                    warnings.warn(f"Failed to ingest record from dict {record}: {e}")
+                    continue
+                raise RecordsIngestionError(f"Failed to ingest record from dict {record}") from e
+            yield record.api_model()
+
+    def _iter_ingested_batches(
+        self,
+        records: Union[Iterable[Dict[str, Any]], Iterable[Record], "HFDataset", "HFIterableDataset", "DataFrame"],
+        batch_size: int,
+        mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
+        user_id: Optional[UUID] = None,
+        on_error: RecordErrorHandling = RecordErrorHandling.RAISE,
+        media_encoder: Optional["MediaEncoder"] = None,
+    ) -> Iterator[List[Union[RecordModel, Dict[str, Any]]]]:
+        """Lazily ingests records in batches. Tabular records, like Hugging Face datasets and pandas DataFrames, are
+        mapped column-wise into bulk upsert payloads. Any other records are ingested one by one. If a media encoder
+        is provided, the images of each batch are encoded together before the batch is mapped."""
+
+        record_mapper = IngestedRecordMapper(mapping=mapping or self._mapping, dataset=self._dataset, user_id=user_id)
+
+        if HFDatasetsIO._is_hf_dataset(dataset=records) or PandasIO._is_dataframe(data=records):
+            if PandasIO._is_dataframe(data=records):
+                columns_batches = PandasIO._record_columns_from_dataframe(dataframe=records, batch_size=batch_size)
+            else:
+                columns_batches = HFDatasetsIO._record_columns_from_datasets(
+                    hf_dataset=records, mapper=record_mapper, batch_size=batch_size, cast_images=media_encoder is None
+                )
+
+            for columns in columns_batches:
+                if media_encoder:
+                    columns = self._encode_columns_media(columns=columns, mapper=record_mapper, encoder=media_encoder)
+                try:
+                    yield record_mapper.map_batch(columns=columns)
+                except Exception:
+                    # Map the batch record by record, so errors are handled for each record using `on_error`
+                    rows = [dict(zip(columns.keys(), values)) for values in zip(*columns.values())]
+                    batch = list(
+                        self._iter_ingested_records(records=rows, mapping=mapping, user_id=user_id, on_error=on_error)
+                    )
+                    if batch:
+                        yield batch
+            return
+
+        if media_encoder:
+            records = iter(records)
+            while rows := list(islice(records, batch_size)):
+                rows = self._encode_rows_media(rows=rows, mapper=record_mapper, encoder=media_encoder)
+                batch = list(
+                    self._iter_ingested_records(records=rows, mapping=mapping, user_id=user_id, on_error=on_error)
+                )
+                if batch:
+                    yield batch
+            return
+
+        record_models = self._iter_ingested_records(
+            records=records, mapping=mapping, user_id=user_id, on_error=on_error
+        )
+        while batch := list(islice(record_models, batch_size)):
+            yield batch
+
+    def _image_fields_sources(self, mapper: IngestedRecordMapper) -> Dict[str, str]:
+        """Returns the source keys/ columns of the image fields of the dataset, by field name."""
+        return {
+            name: route.source
+            for name, route in mapper.mapping.field.items()
+            if getattr(self._dataset.schema.get(name), "type", None) == "image"
+        }
+
+    def _encode_columns_media(
+        self, columns: Dict[str, Sequence[Any]], mapper: IngestedRecordMapper, encoder: "MediaEncoder"
+    ) -> Dict[str, Sequence[Any]]:
+        """Encodes the images of a batch of columns, returning a new dictionary of columns."""
+        columns = dict(columns)
+        for source in set(self._image_fields_sources(mapper).values()):
+            if source in columns:
+                columns[source] = encoder.encode(columns[source])
+        return columns
+
+    def _encode_rows_media(
+        self, rows: List[Union[Dict[str, Any], Record]], mapper: IngestedRecordMapper, encoder: "MediaEncoder"
+    ) -> List[Union[Dict[str, Any], Record]]:
+        """Encodes the images of a batch of rows, which can be dictionaries or `Record` objects. The images of all
+        the rows are encoded together, so they can be encoded in parallel. Rows are copied instead of being
+        modified, so the records provided by the caller keep their original images."""
+        sources = self._image_fields_sources(mapper)
+
+        locations, images = [], []
+        for idx, row in enumerate(rows):
+            if isinstance(row, Record):
+                keys = [name for name in sources if dict.get(row.fields, name) is not None]
+                values = [dict.get(row.fields, name) for name in keys]
+            elif isinstance(row, dict):
+                keys = [source for source in set(sources.values()) if row.get(source) is not None]
+                values = [row[source] for source in keys]
+            else:
+                continue
+            locations.extend((idx, key) for key in keys)
+            images.extend(values)
+
+        if not images:
+            return rows
+
+        encoded: Dict[int, Dict[str, Any]] = defaultdict(dict)
+        for (idx, key), image in zip(locations, encoder.encode(images)):
+            encoded[idx][key] = image
+
+        rows = list(rows)
+        for idx, values in encoded.items():
+            row = rows[idx]
+            rows[idx] = row._copy_with_fields(values) if isinstance(row, Record) else {**row, **values}
+
+        return rows
+
+    def _prepare_log(
+        self, records: Any, batch_size: int, on_error: Union[RecordErrorHandling, str], workers: int
+    ) -> Tuple[RecordErrorHandling, Optional[int], int]:
+        """Validates the arguments of `log`, returning the error handling, the number of records when known, and
+        the normalized batch size."""
+        if workers < 1:
+            raise ValueError(f"The number of workers must be greater than 0. Found {workers}.")
+        on_error = RecordErrorHandling(on_error)
+
+        records_length = len(records) if isinstance(records, Sized) else None
+        if records_length == 0:
+            raise ValueError("No records provided to ingest.")
+
+        batch_size = self._normalize_batch_size(
+            batch_size=batch_size,
+            records_length=records_length,
+            max_value=self._api.MAX_RECORDS_PER_UPSERT_BULK,
+        )
+        return on_error, records_length, batch_size
+
+    def _retry_backoff(self, error: Exception, attempt: int, max_retries: int, records_length: int) -> float:
+        """Returns the seconds to wait before sending a batch of records again. Errors that can't be retried, like
+        client errors, and errors once the retries are exhausted are raised."""
+        if (isinstance(error, ArgillaAPIError) and error.status_code < 500) or attempt >= max_retries:
+            raise error
+
+        backoff = self.RETRY_BACKOFF_FACTOR * 2**attempt
+        self._log_message(
+            message=f"Failed to send {records_length} records: {error}. Retrying in {backoff} seconds "
+            f"({attempt + 1}/{max_retries}).",
+            level="warning",
+        )
+        return backoff
+
+    def _handle_failed_batch(self, start: int, end: int, error: Exception, on_error: RecordErrorHandling) -> None:
+        """Raises the error of a batch that could not be sent, or reports it depending on `on_error`."""
+        if on_error == RecordErrorHandling.RAISE:
+            raise error
+
+        message = f"Failed to log records from {start} to {end}: {error}"
+        if on_error == RecordErrorHandling.WARN:
+            warnings.warn(message)
+        else:
+            self._log_message(message=message, level="info")
+
+    def _normalize_batch_size(self, batch_size: int, records_length: Optional[int], max_value: int):
+        norm_batch_size = min(batch_size, max_value)
+        if records_length is not None:
+            norm_batch_size = min(norm_batch_size, records_length)
 
+        if batch_size != norm_batch_size:
+            self._log_message(
+                message=f"The provided batch size {batch_size} was normalized. Using value {norm_batch_size}.",
+                level="warning",
+            )
 
-class DatasetRecords(Iterable[Record], LoggingMixin):
+        return norm_batch_size
+
+    def _validate_vector_names(self, vector_names: Union[List[str], str]) -> None:
+        if not isinstance(vector_names, list):
+            vector_names = [vector_names]
+        for vector_name in vector_names:
+            if isinstance(vector_name, bool):
+                continue
+            if vector_name not in self._dataset.schema:
+                raise ValueError(f"Vector field {vector_name} not found in dataset schema.")
+
+
+class DatasetRecords(BaseDatasetRecords, Iterable[Record]):
     """This class is used to work with records from a dataset and is accessed via `Dataset.records`.
     The responsibility of this class is to provide an interface to interact with records in a dataset,
     by adding, updating, fetching, querying, deleting, and exporting records.
@@ -167,6 +561,10 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
     DEFAULT_BATCH_SIZE = 256
     DEFAULT_DELETE_BATCH_SIZE = 64
+    DEFAULT_MAX_RETRIES = 3
+    # Changes are fetched again starting a bit before the last synced change, so changes committed concurrently
+    # with the previous sync are not missed. Syncing a record twice is harmless.
+    SYNC_OVERLAP = timedelta(minutes=1)
 
     def __init__(
         self, client: "Argilla", dataset: "Dataset", mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None
@@ -176,13 +574,10 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             client: An Argilla client object.
             dataset: A Dataset object.
         """
-        self.__client = client
-        self.__dataset = dataset
-        self._mapping = mapping or {}
-        self._api = self.__client.api.records
+        super().__init__(client=client, dataset=dataset, mapping=mapping)
 
     def __iter__(self):
-        return DatasetRecordsIterator(self.__dataset, self.__client, with_suggestions=True, with_responses=True)
+        return DatasetRecordsIterator(self._dataset, self._client, with_suggestions=True, with_responses=True)
 
     def __call__(
         self,
@@ -193,6 +588,7 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         with_responses: bool = True,
         with_vectors: Optional[Union[List, bool, str]] = None,
         limit: Optional[int] = None,
+        prefetch: int = DatasetRecordsIterator.DEFAULT_PREFETCH,
     ) -> DatasetRecordsIterator:
         """Returns an iterator over the records in the dataset on the server.
 
@@ -206,6 +602,8 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
                 If a list is provided, only the specified vectors will be included.
                 If True is provided, all vectors will be included.
             limit: The maximum number of records to fetch. The default is None.
+            prefetch: The number of batches fetched in the background while the current one is consumed.
+                The default is 2.
 
         Returns:
             An iterator over the records in the dataset on the server.
@@ -218,8 +616,8 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             self._validate_vector_names(vector_names=with_vectors)
 
         return DatasetRecordsIterator(
-            dataset=self.__dataset,
-            client=self.__client,
+            dataset=self._dataset,
+            client=self._client,
             query=query,
             batch_size=batch_size,
             start_offset=start_offset,
@@ -227,10 +625,11 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
             with_responses=with_responses,
             with_vectors=with_vectors,
             limit=limit,
+            prefetch=prefetch,
         )
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}({self.__dataset})"
+        return f"{self.__class__.__name__}({self._dataset})"
 
     ############################
     # Public methods
@@ -238,11 +637,14 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
     def log(
         self,
-        records: Union[List[dict], List[Record], HFDataset],
+        records: Union[Iterable[dict], Iterable[Record], "HFDataset", "HFIterableDataset", "DataFrame"],
         mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
         user_id: Optional[UUID] = None,
         batch_size: int = DEFAULT_BATCH_SIZE,
-        on_error: RecordErrorHandling = RecordErrorHandling.RAISE,
+        on_error: Union[RecordErrorHandling, str] = RecordErrorHandling.RAISE,
+        workers: int = 1,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        media_encoder: Optional["MediaEncoder"] = None,
     ) -> "DatasetRecords":
         """Add or update records in a dataset on the server using the provided records.
         If the record includes a known `id` field, the record will be updated.
@@ -251,45 +653,76 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
         Parameters:
             records: A list of `Record` objects, a Hugging Face Dataset, or a list of dictionaries representing the records.
+                     Any iterable, like a generator or a Hugging Face `IterableDataset`, is accepted too. Records are
+                     read, mapped and sent in batches, so only a few batches are kept in memory at the same time.
+                     Hugging Face datasets and pandas DataFrames are mapped column-wise, which is faster for large inputs.
                      If records are defined as a dictionaries or a dataset, the keys/ column names should correspond to the
                      fields in the Argilla dataset's fields and questions. `id` should be provided to identify the records when updating.
             mapping: A dictionary that maps the keys/ column names in the records to the fields or questions in the Argilla dataset.
                      To assign an incoming key or column to multiple fields or questions, provide a list or tuple of field or question names.
             user_id: The user id to be associated with the records' response. If not provided, the current user id is used.
             batch_size: The number of records to send in each batch. The default is 256.
+            on_error: How to handle records that cannot be ingested and batches that cannot be sent to the server.
+                     With `raise` the first error is raised, with `warn` or `ignore` failed batches are reported and
+                     the remaining batches are still sent.
+            workers: The number of batches sent to the server concurrently. The default is 1.
+            max_retries: The number of times a batch is retried when the server is unreachable or answers with a
+                     server error. Records are upserted, so retrying a batch is safe. The default is 3.
+            media_encoder: A `rg.MediaEncoder` used to encode the images of each batch in a pool of processes,
+                     optionally resizing and re-encoding them. By default, images are encoded one by one.
 
         Returns:
             A list of Record objects representing the updated records.
         """
-        record_models = self._ingest_records(
-            records=records, mapping=mapping, user_id=user_id or self.__client.me.id, on_error=on_error
+        on_error, records_length, batch_size = self._prepare_log(
+            records=records, batch_size=batch_size, on_error=on_error, workers=workers
         )
-        batch_size = self._normalize_batch_size(
+        record_batches = self._iter_ingested_batches(
+            records=records,
+            mapping=mapping,
+            user_id=user_id or self._client.me.id,
+            on_error=on_error,
             batch_size=batch_size,
-            records_length=len(record_models),
-            max_value=self._api.MAX_RECORDS_PER_UPSERT_BULK,
+            media_encoder=media_encoder,
         )
 
-        created_or_updated = []
-        records_updated = 0
+        count = LoggedRecordsCount()
 
-        for batch in tqdm(
-            iterable=range(0, len(records), batch_size),
-            desc="Sending records...",
-            total=len(records) // batch_size,
-            unit="batch",
+        def collect_batch(start: int, end: int, future: Future) -> None:
+            try:
+                count.add(*future.result())
+            except Exception as e:
+                self._handle_failed_batch(start=start, end=end, error=e, on_error=on_error)
+                count.failed += end - start
+
+        # Records are mapped in this thread while the previous batches are being sent, and at most two batches per
+        # worker are kept in memory. Results are collected in submission order, so batches are reported in order.
+        pending: Deque[Tuple[int, int, Future]] = deque()
+        total_batches = -(-records_length // batch_size) if records_length is not None else None
+        start = 0
+
+        with (
+            ThreadPoolExecutor(max_workers=workers) as executor,
+            tqdm(desc="Sending records...", total=total_batches, unit="batch") as progress_bar,
         ):
-            self._log_message(message=f"Sending records from {batch} to {batch + batch_size}.")
-            batch_records = record_models[batch : batch + batch_size]
-            models, updated = self._api.bulk_upsert(dataset_id=self.__dataset.id, records=batch_records)
-            created_or_updated.extend([Record.from_model(model=model, dataset=self.__dataset) for model in models])
-            records_updated += updated
+            try:
+                for batch in record_batches:
+                    end = start + len(batch)
+                    pending.append((start, end, executor.submit(self._upsert_batch, batch, max_retries)))
+                    start = end
 
-        records_created = len(created_or_updated) - records_updated
-        self._log_message(
-            message=f"Updated {records_updated} records and added {records_created} records to dataset {self.__dataset.name}",
-            level="info",
-        )
+                    while len(pending) >= 2 * workers:
+                        collect_batch(*pending.popleft())
+                        progress_bar.update()
+
+                while pending:
+                    collect_batch(*pending.popleft())
+                    progress_bar.update()
+            finally:
+                for *_, future in pending:
+                    future.cancel()
+
+        self._log_message(message=count.summary(self._dataset.name), level="info")
 
         return self
 
@@ -310,7 +743,7 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
 
         """
         mapping = None
-        user_id = self.__client.me.id
+        user_id = self._client.me.id
         record_models = self._ingest_records(records=records, mapping=mapping, user_id=user_id)
         batch_size = self._normalize_batch_size(
             batch_size=batch_size,
@@ -327,11 +760,11 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         ):
             self._log_message(message=f"Sending records from {batch} to {batch + batch_size}.")
             batch_records = record_models[batch : batch + batch_size]
-            self._api.delete_many(dataset_id=self.__dataset.id, records=batch_records)
+            self._api.delete_many(dataset_id=self._dataset.id, records=batch_records)
             records_deleted += len(batch_records)
 
         self._log_message(
-            message=f"Deleted {len(record_models)} records from dataset {self.__dataset.name}",
+            message=f"Deleted {len(record_models)} records from dataset {self._dataset.name}",
             level="info",
         )
 
@@ -395,7 +828,144 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
         records = JsonIO._records_from_json(path=path)
         return self.log(records=records)
 
-    def to_datasets(self) -> HFDataset:
+    def sync(self, path: Union[Path, str], batch_size: int = DEFAULT_BATCH_SIZE, with_vectors: bool = False) -> Path:
+        """
+        Sync the records to a local SQLite mirror. The first sync downloads all the records, and the next ones only
+        fetch the records where the record, or any of its responses or suggestions, changed since the previous
+        sync. Records deleted from the dataset are kept in the mirror as tombstones, with `deleted_at` set.
+        The server only tracks deleted records for a limited time (30 days by default), so a mirror not synced within
+        that time is rejected and must be synced again from scratch to a new path.
+
+        Parameters:
+            path (str): The path to the SQLite database of the mirror. It's created if it doesn't exist.
+            batch_size (int): The number of records fetched in each request. The default is 256.
+            with_vectors (bool): Whether to include the record vectors. The default is False.
+
+        Returns:
+            The path to the SQLite database of the mirror.
+        """
+        path = Path(path)
+        connection = SQLiteIO.connect(path)
+        try:
+            state = SQLiteIO.read_sync_state(connection)
+            if state.get("dataset_id", str(self._dataset.id)) != str(self._dataset.id):
+                raise ValueError(f"The local mirror at {path} belongs to dataset {state['dataset_id']}.")
+
+            updated_at_mark = self._from_sync_mark(state.get("updated_at"))
+            deleted_at_mark = self._from_sync_mark(state.get("deleted_at"))
+
+            records_synced, updated_at_mark = self._sync_updated_records(
+                connection, batch_size, with_vectors, updated_at_mark
+            )
+            records_deleted, deleted_at_mark = self._sync_deleted_records(connection, batch_size, deleted_at_mark)
+
+            SQLiteIO.write_sync_state(
+                connection,
+                {
+                    "dataset_id": str(self._dataset.id),
+                    "updated_at": updated_at_mark and updated_at_mark.isoformat(),
+                    "deleted_at": deleted_at_mark and deleted_at_mark.isoformat(),
+                },
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        self._log_message(
+            message=f"Synced {records_synced} records and {records_deleted} deleted records of dataset "
+            f"{self._dataset.name} to {path}",
+            level="info",
+        )
+        return path
+
+    def to_arrow_batches(
+        self, batch_size: int = DEFAULT_BATCH_SIZE, with_vectors: bool = True
+    ) -> Iterator["pa.RecordBatch"]:
+        """
+        Export the records as Arrow record batches. Records are fetched from the server page by page, so
+        only one batch of records is kept in memory at a time.
+
+        All the batches share the same schema, which is derived from the dataset settings: a column for the
+        fields, metadata and vectors, and columns for the responses and suggestions of each question. Vectors
+        are exported as fixed-size lists of float32 values.
+
+        Parameters:
+            batch_size (int): The number of records in each batch. The default is 256.
+            with_vectors (bool): Whether to include the record vectors. The default is True.
+
+        Returns:
+            An iterator over the record batches.
+        """
+        schema = ArrowIO.to_schema(dataset=self._dataset, with_vectors=with_vectors)
+        records = iter(self(batch_size=batch_size, with_vectors=with_vectors or None))
+
+        while batch := list(islice(records, batch_size)):
+            yield ArrowIO.to_record_batch(records=batch, schema=schema, dataset=self._dataset)
+
+    def to_parquet(
+        self, path: Union[Path, str], batch_size: int = DEFAULT_BATCH_SIZE, with_vectors: bool = True
+    ) -> Path:
+        """
+        Export the records to a Parquet file on disk. Each batch of records is written as a row group as soon as
+        it is fetched, so large datasets can be exported without loading all the records in memory.
+
+        Parameters:
+            path (str): The path to the Parquet file to save the records.
+            batch_size (int): The number of records in each row group. The default is 256.
+            with_vectors (bool): Whether to include the record vectors. The default is True.
+
+        Returns:
+            The path to the file where the records were saved.
+        """
+        schema = ArrowIO.to_schema(dataset=self._dataset, with_vectors=with_vectors)
+        batches = self.to_arrow_batches(batch_size=batch_size, with_vectors=with_vectors)
+
+        return ArrowIO.to_parquet(batches=batches, schema=schema, path=path)
+
+    def vectors_matrix(self, name: str, batch_size: int = DEFAULT_BATCH_SIZE) -> "np.ndarray":
+        """
+        Export the values of a vector as a float32 NumPy matrix with a row per record, in the same order used when
+        iterating over the records. Records are fetched page by page without their responses and suggestions, and
+        their vectors are copied into a matrix preallocated for all the dataset records.
+
+        Parameters:
+            name (str): The name of the vector, as defined in the dataset settings.
+            batch_size (int): The number of records fetched in each request. The default is 256.
+
+        Returns:
+            The matrix of vectors. Rows of records without the vector are filled with NaN.
+        """
+        import numpy as np
+
+        self._validate_vector_names(vector_names=name)
+        dimensions = self._dataset.settings.vectors[name].dimensions
+        total = self._client.api.datasets.get_progress(dataset_id=self._dataset.id).total
+        matrix = np.full((total, dimensions), np.nan, dtype=np.float32)
+
+        offset = 0
+        while True:
+            models = self._api.list(
+                dataset_id=self._dataset.id,
+                offset=offset,
+                limit=batch_size,
+                with_suggestions=False,
+                with_responses=False,
+                with_vectors=[name],
+            )
+            if offset + len(models) > len(matrix):
+                # NOTE: Records created while fetching the vectors don't fit in the preallocated matrix
+                missing_rows = np.full((offset + len(models) - len(matrix), dimensions), np.nan, dtype=np.float32)
+                matrix = np.concatenate([matrix, missing_rows])
+
+            for idx, model in enumerate(models, start=offset):
+                for vector in model.vectors:
+                    matrix[idx] = vector.vector_values
+
+            offset += len(models)
+            if len(models) < batch_size:
+                return matrix[:offset]
+
+    def to_datasets(self) -> "HFDataset":
         """
         Export the records to a HFDataset.
 
@@ -410,67 +980,301 @@ class DatasetRecords(Iterable[Record], LoggingMixin):
     # Private methods
     ############################
 
-    def _ingest_records(
+    def _sync_updated_records(
+        self, connection: "sqlite3.Connection", batch_size: int, with_vectors: bool, mark: Optional[datetime]
+    ) -> Tuple[int, Optional[datetime]]:
+        """Stores the records changed since `mark`, returning their number and the time of the latest change.
+
+        Records are listed in order of their last activity, as tracked by the server, and paginated by keyset, so no
+        record is skipped when other records change while syncing. Records changed after being stored are listed
+        again in a later page.
+        """
+        updated_at_ge = mark - self.SYNC_OVERLAP if mark else None
+        after, synced = None, 0
+        while True:
+            models = self._api.list_updated(
+                dataset_id=self._dataset.id,
+                limit=batch_size,
+                with_vectors=with_vectors or None,
+                updated_at_ge=updated_at_ge,
+                after=after,
+            )
+            records = []
+            for model, last_activity_at in models:
+                record = Record.from_model(model=model, dataset=self._dataset)
+                records.append({**record.to_dict(), "updated_at": model.updated_at})
+                after = (last_activity_at, model.id)
+                mark = max(filter(None, [mark, last_activity_at]))
+
+            synced += SQLiteIO.upsert_records(connection, records)
+            if len(models) < batch_size:
+                return synced, mark
+
+    def _sync_deleted_records(
+        self, connection: "sqlite3.Connection", batch_size: int, mark: Optional[datetime]
+    ) -> Tuple[int, Optional[datetime]]:
+        """Stores the tombstones of the records deleted since `mark`, returning their number and the latest time."""
+        deleted_at_ge = mark - self.SYNC_OVERLAP if mark else None
+        after, deleted = None, 0
+        while True:
+            deleted_records = self._api.list_deleted(
+                dataset_id=self._dataset.id, limit=batch_size, deleted_at_ge=deleted_at_ge, after=after
+            )
+            for deleted_record in deleted_records:
+                after = (deleted_record.deleted_at, deleted_record.id)
+                mark = max(filter(None, [mark, deleted_record.deleted_at]))
+
+            deleted += SQLiteIO.tombstone_records(connection, deleted_records)
+            if len(deleted_records) < batch_size:
+                return deleted, mark
+
+    @staticmethod
+    def _from_sync_mark(value: Optional[str]) -> Optional[datetime]:
+        return datetime.fromisoformat(value) if value else None
+
+    def _upsert_batch(
+        self, records: List[Union[RecordModel, Dict[str, Any]]], max_retries: int
+    ) -> Tuple[List[RecordModel], int]:
+        """Upserts a batch of records, retrying with exponential backoff on connection and server errors."""
+        attempt = 0
+        while True:
+            try:
+                return self._api.bulk_upsert(dataset_id=self._dataset.id, records=records)
+            except (httpx.TransportError, ArgillaAPIError) as e:
+                backoff = self._retry_backoff(
+                    error=e, attempt=attempt, max_retries=max_retries, records_length=len(records)
+                )
+                attempt += 1
+                time.sleep(backoff)
+
+
+class AsyncDatasetRecordsIterator(BaseDatasetRecordsIterator):
+    """This class is used to asynchronously iterate over records in a dataset. Like `DatasetRecordsIterator`, up to
+    `prefetch` pages are requested concurrently while the current page is consumed."""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Record:
+        if self._no_records():
+            await self._fetch_next_batch()
+
+        record = self._pop_record()
+        if record is None:
+            self._cancel_pages()
+            raise StopAsyncIteration()
+
+        return record
+
+    async def aclose(self) -> None:
+        """Cancels the pages being prefetched, e.g. when the iteration is stopped before consuming all the records."""
+        self._cancel_pages()
+
+    async def to_list(self, flatten: bool = False) -> List[Dict[str, Any]]:
+        return GenericIO.to_list(records=[record async for record in self], flatten=flatten)
+
+    async def to_dict(self, flatten: bool = False, orient: str = "names") -> Dict[str, Any]:
+        return GenericIO.to_dict(records=[record async for record in self], flatten=flatten, orient=orient)
+
+    async def _fetch_next_batch(self) -> None:
+        self._request_pages()
+        if not self._pages:
+            return
+
+        page_size, page = self._pages.popleft()
+        if self._add_page(page_size, await page):
+            self._cancel_pages()
+
+        self._request_pages()
+
+    def _request_pages(self) -> None:
+        for offset, page_size in self._pages_to_request():
+            self._pages.append((page_size, asyncio.ensure_future(self._fetch_page(offset, page_size))))
+
+    def _cancel_pages(self) -> None:
+        for _, page in self._pages:
+            page.cancel()
+        self._pages.clear()
+
+    async def _fetch_page(self, offset: int, limit: int) -> List[RecordModel]:
+        if self._is_page_beyond_end(offset):
+            return []
+
+        record_models = await self._fetch_from_server(offset=offset, limit=limit)
+        self._track_end_offset(offset, limit, record_models)
+
+        return record_models
+
+    async def _fetch_from_server(self, offset: int, limit: int) -> List[RecordModel]:
+        params = self._page_params(offset=offset, limit=limit)
+        try:
+            if self._is_search_query():
+                search_items, _ = await self._client.api.records.search(**params)
+                return [record_model for record_model, _ in search_items]
+            return await self._client.api.records.list(**params)
+        except NotFoundError:
+            if await self._client.api.datasets.exists(self._dataset.id):
+                raise
+            self._warn_missing_dataset()
+            return []
+
+
+class AsyncDatasetRecords(BaseDatasetRecords):
+    """This class is used to work with records from a dataset using an `AsyncArgilla` client and is accessed via
+    `AsyncArgilla.records(dataset)`. Records are ingested and converted exactly like in `DatasetRecords`, but every
+    request to the server is awaited so several operations can run concurrently on the same event loop.
+
+    Attributes:
+        client (AsyncArgilla): The asynchronous Argilla client object.
+        dataset (Dataset): The dataset object.
+    """
+
+    _api: AsyncRecordsAPI
+
+    def __aiter__(self):
+        return AsyncDatasetRecordsIterator(self._dataset, self._client, with_suggestions=True, with_responses=True)
+
+    def __call__(
         self,
-        records: Union[List[Dict[str, Any]], List[Record], HFDataset],
+        query: Optional[Union[str, Query]] = None,
+        batch_size: Optional[int] = DatasetRecords.DEFAULT_BATCH_SIZE,
+        start_offset: int = 0,
+        with_suggestions: bool = True,
+        with_responses: bool = True,
+        with_vectors: Optional[Union[List, bool, str]] = None,
+        limit: Optional[int] = None,
+        prefetch: int = AsyncDatasetRecordsIterator.DEFAULT_PREFETCH,
+    ) -> AsyncDatasetRecordsIterator:
+        """Returns an asynchronous iterator over the records in the dataset on the server.
+        Parameters are the same as in `DatasetRecords.__call__`.
+        """
+        if query and isinstance(query, str):
+            query = Query(query=query)
+
+        if with_vectors:
+            self._validate_vector_names(vector_names=with_vectors)
+
+        return AsyncDatasetRecordsIterator(
+            dataset=self._dataset,
+            client=self._client,
+            query=query,
+            batch_size=batch_size,
+            start_offset=start_offset,
+            with_suggestions=with_suggestions,
+            with_responses=with_responses,
+            with_vectors=with_vectors,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._dataset})"
+
+    ############################
+    # Public methods
+    ############################
+
+    async def log(
+        self,
+        records: Union[Iterable[dict], Iterable[Record], "HFDataset", "HFIterableDataset", "DataFrame"],
         mapping: Optional[Dict[str, Union[str, Sequence[str]]]] = None,
         user_id: Optional[UUID] = None,
-        on_error: RecordErrorHandling = RecordErrorHandling.RAISE,
-    ) -> List[RecordModel]:
-        """Ingests records from a list of dictionaries, a Hugging Face Dataset, or a list of Record objects."""
-
-        mapping = mapping or self._mapping
-        if len(records) == 0:
-            raise ValueError("No records provided to ingest.")
+        batch_size: int = DatasetRecords.DEFAULT_BATCH_SIZE,
+        on_error: Union[RecordErrorHandling, str] = RecordErrorHandling.RAISE,
+        workers: int = 1,
+        max_retries: int = DatasetRecords.DEFAULT_MAX_RETRIES,
+        media_encoder: Optional["MediaEncoder"] = None,
+    ) -> "AsyncDatasetRecords":
+        """Add or update records in a dataset on the server using the provided records.
+        Parameters are the same as in `DatasetRecords.log`, and up to `workers` batches are sent concurrently.
+        """
+        on_error, _, batch_size = self._prepare_log(
+            records=records, batch_size=batch_size, on_error=on_error, workers=workers
+        )
+        record_batches = self._iter_ingested_batches(
+            records=records,
+            mapping=mapping,
+            user_id=user_id or (await self._client.me()).id,
+            on_error=on_error,
+            batch_size=batch_size,
+            media_encoder=media_encoder,
+        )
 
-        record_mapper = IngestedRecordMapper(mapping=mapping, dataset=self.__dataset, user_id=user_id)
+        count = LoggedRecordsCount()
+        semaphore = asyncio.Semaphore(workers)
 
-        if HFDatasetsIO._is_hf_dataset(dataset=records):
-            records = HFDatasetsIO._record_dicts_from_datasets(hf_dataset=records, mapper=record_mapper)
+        async def upsert_batch(batch: List[Union[RecordModel, Dict[str, Any]]]) -> Tuple[List[RecordModel], int]:
+            async with semaphore:
+                return await self._upsert_batch(batch, max_retries)
 
-        ingested_records = []
-        for record in records:
+        async def collect_batch(start: int, end: int, task: asyncio.Future) -> None:
             try:
-                if isinstance(record, dict):
-                    record = record_mapper(data=record)
-                elif isinstance(record, Record):
-                    record.dataset = self.__dataset
-                else:
-                    raise ValueError(
-                        "Records should be a a list Record instances, "
-                        "a Hugging Face Dataset, or a list of dictionaries representing the records."
-                        f"Found a record of type {type(record)}: {record}."
-                    )
+                count.add(*(await task))
             except Exception as e:
-                if on_error == RecordErrorHandling.IGNORE:
-                    self._log_message(
-                        message=f"Failed to ingest record from dict {record}: {e}",
-                        level="info",
-                    )
-                    continue
-                elif on_error == RecordErrorHandling.WARN:
-                    warnings.warn(f"Failed to ingest record from dict {record}: {e}")
-                    continue
-                raise RecordsIngestionError(f"Failed to ingest record from dict {record}") from e
-            ingested_records.append(record.api_model())
-        return ingested_records
+                self._handle_failed_batch(start=start, end=end, error=e, on_error=on_error)
+                count.failed += end - start
+
+        # Like in `DatasetRecords.log`, records are mapped while the previous batches are being sent, at most two
+        # batches per worker are kept in memory, and results are collected in submission order.
+        pending: Deque[Tuple[int, int, asyncio.Future]] = deque()
+        start = 0
+        try:
+            for batch in record_batches:
+                end = start + len(batch)
+                pending.append((start, end, asyncio.ensure_future(upsert_batch(batch))))
+                start = end
+
+                while len(pending) >= 2 * workers:
+                    await collect_batch(*pending.popleft())
+
+            while pending:
+                await collect_batch(*pending.popleft())
+        finally:
+            for *_, task in pending:
+                task.cancel()
+
+        self._log_message(message=count.summary(self._dataset.name), level="info")
 
-    def _normalize_batch_size(self, batch_size: int, records_length, max_value: int):
-        norm_batch_size = min(batch_size, records_length, max_value)
+        return self
 
-        if batch_size != norm_batch_size:
-            self._log_message(
-                message=f"The provided batch size {batch_size} was normalized. Using value {norm_batch_size}.",
-                level="warning",
-            )
+    async def delete(
+        self,
+        records: List[Record],
+        batch_size: int = DatasetRecords.DEFAULT_DELETE_BATCH_SIZE,
+    ) -> List[Record]:
+        """Delete records in a dataset on the server using the provided records and matching based on the id.
+        Parameters are the same as in `DatasetRecords.delete`.
+        """
+        user_id = (await self._client.me()).id
+        record_models = self._ingest_records(records=records, user_id=user_id)
+        batch_size = self._normalize_batch_size(
+            batch_size=batch_size,
+            records_length=len(record_models),
+            max_value=self._api.MAX_RECORDS_PER_DELETE_BULK,
+        )
 
-        return norm_batch_size
+        for batch in range(0, len(record_models), batch_size):
+            self._log_message(message=f"Sending records from {batch} to {batch + batch_size}.")
+            await self._api.delete_many(dataset_id=self._dataset.id, records=record_models[batch : batch + batch_size])
 
-    def _validate_vector_names(self, vector_names: Union[List[str], str]) -> None:
-        if not isinstance(vector_names, list):
-            vector_names = [vector_names]
-        for vector_name in vector_names:
-            if isinstance(vector_name, bool):
-                continue
-            if vector_name not in self.__dataset.schema:
-                raise ValueError(f"Vector field {vector_name} not found in dataset schema.")
+        self._log_message(
+            message=f"Deleted {len(record_models)} records from dataset {self._dataset.name}",
+            level="info",
+        )
+
+        return records
+
+    async def _upsert_batch(
+        self, records: List[Union[RecordModel, Dict[str, Any]]], max_retries: int
+    ) -> Tuple[List[RecordModel], int]:
+        """Upserts a batch of records, retrying with exponential backoff on connection and server errors."""
+        attempt = 0
+        while True:
+            try:
+                return await self._api.bulk_upsert(dataset_id=self._dataset.id, records=records)
+            except (httpx.TransportError, ArgillaAPIError) as e:
+                backoff = self._retry_backoff(
+                    error=e, attempt=attempt, max_retries=max_retries, records_length=len(records)
+                )
+                attempt += 1
+                await asyncio.sleep(backoff)
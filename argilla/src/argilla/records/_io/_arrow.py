@@ -0,0 +1,235 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+
+from argilla._helpers._media import is_media_reference, media_content_to_data_uri
+from argilla.records._io._generic import GenericIO
+from argilla.settings import IntegerMetadataProperty, TermsMetadataProperty
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+    from argilla.datasets import Dataset
+    from argilla.records import Record
+
+ValueConverter = Callable[[Any], Any]
+
+
+class ArrowIO:
+    """Exports records as Arrow record batches and Parquet files.
+
+    The Arrow schema is derived from the dataset settings, so it is stable across batches and doesn't depend on
+    the values of the exported records. Columns are named like in the flattened exports of `GenericIO`.
+    """
+
+    @staticmethod
+    def to_schema(dataset: "Dataset", with_vectors: bool = True) -> "pa.Schema":
+        """Builds the Arrow schema of the records of a dataset.
+
+        Parameters:
+            dataset (Dataset): The dataset the records belong to.
+            with_vectors (bool): Whether to include a column for each vector of the dataset.
+
+        Returns:
+            pa.Schema: The Arrow schema of the exported records.
+        """
+        import pyarrow as pa
+
+        columns = [("id", pa.string()), ("status", pa.string()), ("_server_id", pa.string())]
+
+        for field in dataset.settings.fields:
+            columns.append((field.name, ArrowIO._field_type(field.type)))
+
+        for metadata in dataset.settings.metadata:
+            columns.append((metadata.name, ArrowIO._metadata_type(metadata)))
+
+        if with_vectors:
+            for vector in dataset.settings.vectors:
+                columns.append((vector.name, pa.list_(pa.float32(), vector.dimensions)))
+
+        for question in dataset.settings.questions:
+            value_type = ArrowIO._question_value_type(question.type)
+            columns += [
+                (f"{question.name}.responses", pa.list_(value_type)),
+                (f"{question.name}.responses.users", pa.list_(pa.string())),
+                (f"{question.name}.responses.status", pa.list_(pa.string())),
+                (f"{question.name}.suggestion", value_type),
+                (f"{question.name}.suggestion.score", ArrowIO._question_score_type(question.type)),
+                (f"{question.name}.suggestion.agent", pa.string()),
+            ]
+
+        return pa.schema(columns)
+
+    @staticmethod
+    def to_record_batch(records: List["Record"], schema: "pa.Schema", dataset: "Dataset") -> "pa.RecordBatch":
+        """Converts a list of records into an Arrow record batch with the given schema.
+
+        Parameters:
+            records (List[Record]): The records to convert.
+            schema (pa.Schema): The schema built with `ArrowIO.to_schema`.
+            dataset (Dataset): The dataset the records belong to.
+
+        Returns:
+            pa.RecordBatch: The record batch containing the records.
+        """
+        import pyarrow as pa
+
+        rows = [GenericIO._record_to_dict(record=record, flatten=True) for record in records]
+        converters = ArrowIO._value_converters(dataset=dataset)
+        vector_names = {vector.name for vector in dataset.settings.vectors}
+
+        arrays = []
+        for column in schema:
+            if column.name in vector_names and pa.types.is_fixed_size_list(column.type):
+                arrays.append(ArrowIO._vector_array(records=records, name=column.name, type=column.type))
+                continue
+
+            converter = converters.get(column.name)
+            values = [row.get(column.name) for row in rows]
+            if converter:
+                values = [None if value is None else converter(value) for value in values]
+            arrays.append(pa.array(values, type=column.type))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    @staticmethod
+    def to_parquet(batches: Iterable["pa.RecordBatch"], schema: "pa.Schema", path: Union[Path, str]) -> Path:
+        """Writes record batches to a Parquet file, writing one row group per batch.
+
+        Parameters:
+            batches (Iterable[pa.RecordBatch]): The record batches to write.
+            schema (pa.Schema): The schema of the record batches.
+            path (Path | str): The path of the Parquet file.
+
+        Returns:
+            Path: The path of the Parquet file.
+        """
+        import pyarrow.parquet as pq
+
+        path = Path(path)
+        if path.exists():
+            raise FileExistsError(f"File {path} already exists.")
+
+        with pq.ParquetWriter(path, schema=schema) as writer:
+            for batch in batches:
+                writer.write_batch(batch)
+
+        return path
+
+    ############################
+    # Private methods
+    ############################
+
+    @staticmethod
+    def _field_type(field_type: str) -> "pa.DataType":
+        import pyarrow as pa
+
+        if field_type == "chat":
+            return pa.list_(pa.struct([("role", pa.string()), ("content", pa.string())]))
+        # Custom field values are exported as JSON strings, since their structure is not defined by the settings
+        return pa.string()
+
+    @staticmethod
+    def _metadata_type(metadata: Any) -> "pa.DataType":
+        import pyarrow as pa
+
+        if isinstance(metadata, TermsMetadataProperty):
+            return pa.list_(pa.string())
+        elif isinstance(metadata, IntegerMetadataProperty):
+            return pa.int64()
+        return pa.float64()
+
+    @staticmethod
+    def _question_value_type(question_type: str) -> "pa.DataType":
+        import pyarrow as pa
+
+        if question_type in ("multi_label_selection", "ranking"):
+            return pa.list_(pa.string())
+        elif question_type == "rating":
+            return pa.int64()
+        elif question_type == "span":
+            return pa.list_(pa.struct([("label", pa.string()), ("start", pa.int64()), ("end", pa.int64())]))
+        return pa.string()
+
+    @staticmethod
+    def _question_score_type(question_type: str) -> "pa.DataType":
+        import pyarrow as pa
+
+        if question_type in ("multi_label_selection", "ranking", "span"):
+            return pa.list_(pa.float64())
+        return pa.float64()
+
+    @staticmethod
+    def _vector_array(records: List["Record"], name: str, type: "pa.FixedSizeListType") -> "pa.FixedSizeListArray":
+        """Copies the record vectors into a float32 matrix and hands its buffer over to Arrow without copying it."""
+        import numpy as np
+        import pyarrow as pa
+
+        matrix = np.zeros((len(records), type.list_size), dtype=np.float32)
+        valid = np.zeros(len(records), dtype=bool)
+        for idx, record in enumerate(records):
+            vector = record.vectors.get(name)
+            if vector is not None:
+                matrix[idx] = vector
+                valid[idx] = True
+
+        values = pa.array(matrix.reshape(-1))
+        if valid.all():
+            return pa.FixedSizeListArray.from_arrays(values, type=type)
+
+        validity = pa.array(valid).buffers()[1]
+        return pa.FixedSizeListArray.from_buffers(type, len(records), [validity], children=[values])
+
+    @staticmethod
+    def _value_converters(dataset: "Dataset") -> Dict[str, ValueConverter]:
+        """Returns the functions used to normalize the exported values that don't match the schema types."""
+        converters = {}
+
+        for field in dataset.settings.fields:
+            if field.type == "custom":
+                converters[field.name] = json.dumps
+            elif field.type == "image" and dataset._client:
+                converters[field.name] = ArrowIO._media_reference_converter(dataset)
+
+        for metadata in dataset.settings.metadata:
+            if isinstance(metadata, TermsMetadataProperty):
+                converters[metadata.name] = lambda value: [str(v) for v in ArrowIO._as_list(value)]
+
+        for question in dataset.settings.questions:
+            if question.type in ("multi_label_selection", "ranking", "span"):
+                converters[f"{question.name}.suggestion.score"] = ArrowIO._as_list
+
+        return converters
+
+    @staticmethod
+    def _media_reference_converter(dataset: "Dataset") -> ValueConverter:
+        """Returns a function replacing references to media stored by the server with their content, downloaded
+        using the authenticated client. Media referenced by several records is downloaded once."""
+        media_content = {}
+
+        def convert(value: Any) -> Any:
+            if not is_media_reference(value):
+                return value
+            if value not in media_content:
+                media_content[value] = media_content_to_data_uri(dataset._client.api.records.get_media(value))
+            return media_content[value]
+
+        return convert
+
+    @staticmethod
+    def _as_list(value: Any) -> Optional[List[Any]]:
+        return value if isinstance(value, list) else [value]
@@ -12,16 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import sys
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Union, Optional
 
-from datasets import Dataset as HFDataset, Sequence
-from datasets import Image, ClassLabel, Value
-
-from argilla._helpers._media import pil_to_data_uri, uncast_image
+from argilla._helpers._media import is_media_reference, media_content_to_data_uri, pil_to_data_uri, uncast_image
 from argilla.records._io._generic import GenericIO
 
 if TYPE_CHECKING:
+    from datasets import Dataset as HFDataset, IterableDataset as HFIterableDataset
+
     from argilla.records import Record
     from argilla.datasets import Dataset
     from argilla.records._mapping import IngestedRecordMapper
@@ -37,6 +37,7 @@ def _cast_images_as_urls(hf_dataset: "HFDataset", columns: List[str]) -> "HFData
     Returns:
         HFDataset: The Hugging Face dataset with image features cast as URLs.
     """
+    from datasets import Value
 
     for column in columns:
         # make an updated features object with the new column type
@@ -55,36 +56,23 @@ def _cast_images_as_urls(hf_dataset: "HFDataset", columns: List[str]) -> "HFData
     return hf_dataset
 
 
-def _int2class_name(feature: ClassLabel, value: int) -> Optional[str]:
-    try:
-        return feature.int2str(value)
-    except Exception as ex:
-        warnings.warn(f"Could not cast {value} to string. Error: {ex}")
-        return None
-
-
-def _cast_class_label_sequence_as_string_list(hf_dataset: "HFDataset", columns: List[str]) -> "HFDataset":
-    def map2str_list(x: dict, column_name: str, features: dict):
-        value = x[column_name]
-        feature = features[column]
-
-        value = [_int2class_name(feature.feature, v) for v in value]
-        return {column: value}
-
-    for column in columns:
-        features = hf_dataset.features.copy()
-        features[column] = Sequence(Value("string"))
-        hf_dataset = hf_dataset.map(
-            map2str_list,
-            fn_kwargs={"column_name": column, "features": hf_dataset.features},
-            features=features,
-        )
-
-    return hf_dataset
+def _class_names2str(names: List[str], values: List[Optional[int]]) -> List[Optional[str]]:
+    """Converts class label integers into their names using a precomputed list of names."""
+    strings = []
+    for value in values:
+        if value is None:
+            strings.append(None)
+        elif 0 <= value < len(names):
+            strings.append(names[value])
+        else:
+            warnings.warn(f"Could not cast {value} to string. Error: Invalid integer class label {value}")
+            strings.append(None)
+    return strings
 
 
 def _cast_classlabels_as_strings(hf_dataset: "HFDataset", columns: List[str]) -> "HFDataset":
-    """Cast the class label features in the Hugging Face dataset as strings.
+    """Cast the class label features, and sequences of class label features, in the Hugging Face dataset as strings.
+    All the columns are cast in a single batched pass over the dataset.
 
     Parameters:
         hf_dataset (HFDataset): The Hugging Face dataset to cast.
@@ -93,22 +81,31 @@ def _cast_classlabels_as_strings(hf_dataset: "HFDataset", columns: List[str]) ->
     Returns:
         HFDataset: The Hugging Face dataset with class label features cast as strings.
     """
+    from datasets import Sequence, Value
 
-    def label_column2str(x: dict, column: str, features: dict) -> Dict[str, Union[str, None]]:
-        value = x[column]
-        feature = features[column]
-
-        value = _int2class_name(feature, value)
-        return {column: value}
-
+    features = hf_dataset.features.copy()
+    names, sequence_columns = {}, set()
     for column in columns:
-        features = hf_dataset.features.copy()
-        features[column] = Value("string")
-        hf_dataset = hf_dataset.map(
-            label_column2str, fn_kwargs={"column": column, "features": hf_dataset.features}, features=features
-        )
-
-    return hf_dataset
+        feature = features[column]
+        if isinstance(feature, Sequence):
+            names[column] = feature.feature.names
+            sequence_columns.add(column)
+            features[column] = Sequence(Value("string"))
+        else:
+            names[column] = feature.names
+            features[column] = Value("string")
+
+    def classlabels2str(batch: Dict[str, list]) -> Dict[str, list]:
+        for column in columns:
+            if column in sequence_columns:
+                batch[column] = [
+                    None if values is None else _class_names2str(names[column], values) for values in batch[column]
+                ]
+            else:
+                batch[column] = _class_names2str(names[column], batch[column])
+        return batch
+
+    return hf_dataset.map(classlabels2str, batched=True, features=features)
 
 
 def _uncast_uris_as_images(hf_dataset: "HFDataset", columns: List[str]) -> "HFDataset":
@@ -121,6 +118,7 @@ def _uncast_uris_as_images(hf_dataset: "HFDataset", columns: List[str]) -> "HFDa
     Returns:
         HFDataset: The Hugging Face dataset with image features cast as PIL images.
     """
+    from datasets import Image
 
     casted_hf_dataset = hf_dataset
 
@@ -128,7 +126,7 @@ def _uncast_uris_as_images(hf_dataset: "HFDataset", columns: List[str]) -> "HFDa
         features = hf_dataset.features.copy()
         features[column] = Image()
         casted_hf_dataset = hf_dataset.map(
-            function=lambda batch: {column: [uncast_image(sample) for sample in batch]},
+            function=lambda batch: {column: [None if sample is None else uncast_image(sample) for sample in batch]},
             with_indices=False,
             batched=True,
             input_columns=[column],
@@ -147,31 +145,38 @@ def _uncast_uris_as_images(hf_dataset: "HFDataset", columns: List[str]) -> "HFDa
 
 
 def _uncast_label_questions_as_classlabels(hf_dataset: "HFDataset", columns: List[str]) -> "HFDataset":
-    """Cast the class label features in the Hugging Face dataset as strings.
+    """Cast the label question suggestions in the Hugging Face dataset as class labels.
+    All the columns are cast in a single batched pass over the dataset.
 
     Parameters:
         hf_dataset (HFDataset): The Hugging Face dataset to cast.
-        columns (List[str]): The names of the columns containing the class label features.
+        columns (List[str]): The names of the label questions.
 
     Returns:
-        HFDataset: The Hugging Face dataset with class label features cast as strings.
+        HFDataset: The Hugging Face dataset with label question suggestions cast as class labels.
     """
+    from datasets import ClassLabel
+
+    features = hf_dataset.features.copy()
+    class_ids = {}
     for column in columns:
         column = f"{column}.suggestion"
         if column not in hf_dataset.column_names:
             continue
-        values = list(hf_dataset.unique(column))
-        features = hf_dataset.features.copy()
-        features[column] = ClassLabel(names=values)
-        hf_dataset = hf_dataset.map(
-            function=lambda batch: {column: [values.index(sample) for sample in batch]},
-            with_indices=False,
-            batched=True,
-            input_columns=[column],
-            remove_columns=[column],
-            features=features,
-        )
-    return hf_dataset
+        # NOTE: Records without suggestion are kept as missing values instead of being cast as a class label.
+        names = [value for value in hf_dataset.unique(column) if value is not None]
+        features[column] = ClassLabel(names=names)
+        class_ids[column] = {name: idx for idx, name in enumerate(names)}
+
+    if not class_ids:
+        return hf_dataset
+
+    def str2classlabels(batch: Dict[str, list]) -> Dict[str, list]:
+        for column, ids in class_ids.items():
+            batch[column] = [None if value is None else ids[value] for value in batch[column]]
+        return batch
+
+    return hf_dataset.map(str2classlabels, batched=True, features=features)
 
 
 ATTRIBUTE_UNCASTERS = {
@@ -181,9 +186,11 @@ ATTRIBUTE_UNCASTERS = {
 
 
 class HFDatasetsIO:
+    DEFAULT_BATCH_SIZE = 1000
+
     @staticmethod
     def _is_hf_dataset(dataset: Any) -> bool:
-        """Check if the object is a Hugging Face dataset.
+        """Check if the object is a Hugging Face dataset, including streamed `IterableDataset` objects.
 
         Parameters:
             dataset (Dataset): The object to check.
@@ -191,43 +198,103 @@ class HFDatasetsIO:
         Returns:
             bool: True if the object is a Hugging Face dataset, False otherwise.
         """
-        return isinstance(dataset, HFDataset)
+        # NOTE: If `datasets` has not been imported yet, the object cannot be a Hugging Face dataset.
+        if "datasets" not in sys.modules:
+            return False
+
+        from datasets import Dataset as HFDataset, IterableDataset as HFIterableDataset
+
+        return isinstance(dataset, (HFDataset, HFIterableDataset))
 
     @staticmethod
-    def to_datasets(records: List["Record"], dataset: "Dataset") -> HFDataset:
+    def to_datasets(records: List["Record"], dataset: "Dataset") -> "HFDataset":
         """
         Export the records to a Hugging Face dataset.
 
         Returns:
             The dataset containing the records.
         """
+        from datasets import Dataset as HFDataset
+
         record_dicts = GenericIO.to_dict(records, flatten=True)
+        record_dicts = HFDatasetsIO._resolve_media_references(record_dicts, dataset)
         hf_dataset = HFDataset.from_dict(record_dicts)
         hf_dataset = HFDatasetsIO._uncast_argilla_attributes_to_datasets(hf_dataset, dataset.schema)
         return hf_dataset
 
+    @staticmethod
+    def _resolve_media_references(record_dicts: Dict[str, list], dataset: "Dataset") -> Dict[str, list]:
+        """Replace references to media stored by the server with their content, downloaded using the authenticated
+        client. Media referenced by several records is downloaded once.
+
+        Parameters:
+            record_dicts (Dict[str, list]): The exported records as a dictionary of columns.
+            dataset (Dataset): The dataset the records belong to.
+
+        Returns:
+            Dict[str, list]: The exported records with media references resolved as data URIs.
+        """
+        if dataset._client is None:
+            return record_dicts
+
+        media_content = {}
+        for name, attribute_schema in dataset.schema.items():
+            if getattr(attribute_schema, "type", None) != "image" or name not in record_dicts:
+                continue
+
+            for idx, value in enumerate(record_dicts[name]):
+                if not is_media_reference(value):
+                    continue
+                if value not in media_content:
+                    media_content[value] = media_content_to_data_uri(dataset._client.api.records.get_media(value))
+                record_dicts[name][idx] = media_content[value]
+
+        return record_dicts
+
     @staticmethod
     def _record_dicts_from_datasets(
-        hf_dataset: "HFDataset", mapper: "IngestedRecordMapper"
-    ) -> List[Dict[str, Union[str, float, int, list]]]:
+        hf_dataset: Union["HFDataset", "HFIterableDataset"],
+        mapper: "IngestedRecordMapper",
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Dict[str, Union[str, float, int, list]]]:
         """Creates a dictionaries from an HF dataset that can be passed to DatasetRecords.add or DatasetRecords.update.
+        The dataset is read in batches of columns, so only one batch of rows is materialized as dictionaries at a time.
 
         Parameters:
             hf_dataset (HFDataset): The dataset containing the records.
+            batch_size (int): The number of rows read from the dataset at a time.
 
         Returns:
             Generator[Dict[str, Union[str, float, int, list]], None, None]: A generator of dictionaries to be passed to DatasetRecords.add or DatasetRecords.update.
         """
 
-        hf_dataset = HFDatasetsIO.to_argilla(hf_dataset=hf_dataset, mapper=mapper)
+        for columns in HFDatasetsIO._record_columns_from_datasets(
+            hf_dataset=hf_dataset, mapper=mapper, batch_size=batch_size
+        ):
+            names = list(columns)
+            yield from (dict(zip(names, values)) for values in zip(*columns.values()))
 
-        try:
-            hf_dataset = hf_dataset.to_iterable_dataset()
-        except AttributeError:
-            pass
+    @staticmethod
+    def _record_columns_from_datasets(
+        hf_dataset: Union["HFDataset", "HFIterableDataset"],
+        mapper: "IngestedRecordMapper",
+        batch_size: int,
+        cast_images: bool = True,
+    ) -> Iterator[Dict[str, List[Any]]]:
+        """Reads an HF dataset in batches of columns that can be mapped with `IngestedRecordMapper.map_batch`.
 
-        record_dicts = [example for example in hf_dataset]
-        return record_dicts
+        Parameters:
+            hf_dataset (HFDataset): The dataset containing the records.
+            batch_size (int): The number of rows of each batch.
+            cast_images (bool): Whether to cast image features as data URIs. If False, images are read as PIL images.
+
+        Returns:
+            Iterator[Dict[str, List[Any]]]: An iterator of dictionaries mapping column names to lists of values.
+        """
+
+        hf_dataset = HFDatasetsIO.to_argilla(hf_dataset=hf_dataset, mapper=mapper, cast_images=cast_images)
+
+        yield from hf_dataset.iter(batch_size=batch_size)
 
     @staticmethod
     def _uncast_argilla_attributes_to_datasets(hf_dataset: "HFDataset", schema: Dict) -> "HFDataset":
@@ -250,47 +317,51 @@ class HFDatasetsIO:
         return hf_dataset
 
     @staticmethod
-    def to_argilla(hf_dataset: "HFDataset", mapper: "IngestedRecordMapper") -> "HFDataset":
+    def to_argilla(
+        hf_dataset: Union["HFDataset", "HFIterableDataset"], mapper: "IngestedRecordMapper", cast_images: bool = True
+    ) -> Union["HFDataset", "HFIterableDataset"]:
         """Check if the Hugging Face dataset contains image features.
 
         Parameters:
             hf_dataset (HFDataset): The Hugging Face dataset to check.
+            cast_images (bool): Whether to cast image features as data URIs.
 
         Returns:
             bool: True if the Hugging Face dataset contains image features, False otherwise.
         """
-        id_column_name = mapper.mapping.id.source
-        if id_column_name not in hf_dataset.column_names:
-            split = hf_dataset.split
-            warnings.warn(
-                message="Record id column not found in Hugging Face dataset. "
-                "Using row index and split for record ids.",
-            )
-
-            hf_dataset = hf_dataset.map(
-                lambda row, idx: {id_column_name: f"{split}_{idx}"},
-                with_indices=True,
-            )
+        from datasets import ClassLabel, Image, Sequence
 
         image_columns = []
         class_label_columns = []
-        class_label_sequence_columns = []
 
-        for name, feature in hf_dataset.features.items():
+        for name, feature in (hf_dataset.features or {}).items():
             if isinstance(feature, Image):
                 image_columns.append(name)
-            elif isinstance(feature, ClassLabel):
+            elif isinstance(feature, ClassLabel) or (
+                isinstance(feature, Sequence) and isinstance(feature.feature, ClassLabel)
+            ):
                 class_label_columns.append(name)
-            elif isinstance(feature, Sequence) and isinstance(feature.feature, ClassLabel):
-                class_label_sequence_columns.append(name)
 
-        if image_columns:
+        if image_columns and cast_images:
             hf_dataset = _cast_images_as_urls(hf_dataset, image_columns)
 
         if class_label_columns:
             hf_dataset = _cast_classlabels_as_strings(hf_dataset, class_label_columns)
 
-        if class_label_sequence_columns:
-            hf_dataset = _cast_class_label_sequence_as_string_list(hf_dataset, class_label_sequence_columns)
+        # NOTE: Columns and features of streamed datasets can be unknown until the first rows are read. The id
+        # column is added after casting the other columns, since mapping streamed datasets drops their features.
+        id_column_name = mapper.mapping.id.source
+        if hf_dataset.column_names is not None and id_column_name not in hf_dataset.column_names:
+            split = hf_dataset.split
+            warnings.warn(
+                message="Record id column not found in Hugging Face dataset. "
+                "Using row index and split for record ids.",
+            )
+
+            hf_dataset = hf_dataset.map(
+                lambda batch, indices: {id_column_name: [f"{split}_{idx}" for idx in indices]},
+                with_indices=True,
+                batched=True,
+            )
 
         return hf_dataset
@@ -0,0 +1,56 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
+
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
+
+class PandasIO:
+    @staticmethod
+    def _is_dataframe(data: Any) -> bool:
+        """Check if the object is a pandas DataFrame.
+
+        Parameters:
+            data (Any): The object to check.
+
+        Returns:
+            bool: True if the object is a pandas DataFrame, False otherwise.
+        """
+        # NOTE: If `pandas` has not been imported yet, the object cannot be a DataFrame.
+        if "pandas" not in sys.modules:
+            return False
+
+        from pandas import DataFrame
+
+        return isinstance(data, DataFrame)
+
+    @staticmethod
+    def _record_columns_from_dataframe(dataframe: "DataFrame", batch_size: int) -> Iterator[Dict[str, List[Any]]]:
+        """Splits a DataFrame into batches of columns that can be mapped with `IngestedRecordMapper.map_batch`.
+
+        Parameters:
+            dataframe (DataFrame): The DataFrame containing the records.
+            batch_size (int): The number of rows of each batch.
+
+        Returns:
+            Iterator[Dict[str, List[Any]]]: An iterator of dictionaries mapping column names to lists of values.
+        """
+        for start in range(0, len(dataframe), batch_size):
+            chunk = dataframe.iloc[start : start + batch_size]
+            # Missing values are sent as `None`, so they are skipped like in the records defined as dictionaries
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            yield {str(column): chunk[column].tolist() for column in chunk.columns}
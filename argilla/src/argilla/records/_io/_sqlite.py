@@ -0,0 +1,120 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Union
+
+from argilla._models import DeletedRecordModel
+
+
+class SQLiteIO:
+    """Stores a local mirror of the records of a dataset in a SQLite database.
+
+    Records are stored as JSON documents together with their server id. Deleted records are kept as tombstones,
+    with their document removed and `deleted_at` set, so consumers of the mirror can tell deletions apart from
+    records that were never synced. The sync state, like the high-water marks of the last sync, is stored in
+    the `sync_state` table.
+    """
+
+    @staticmethod
+    def connect(path: Union[Path, str]) -> sqlite3.Connection:
+        """Opens the SQLite database of a local mirror, creating its tables if needed.
+
+        Parameters:
+            path (Path | str): The path of the SQLite database.
+
+        Returns:
+            sqlite3.Connection: The connection to the database.
+        """
+        connection = sqlite3.connect(Path(path))
+        connection.executescript("""
+            CREATE TABLE IF NOT EXISTS records (
+                server_id TEXT PRIMARY KEY,
+                id TEXT,
+                status TEXT,
+                updated_at TEXT,
+                deleted_at TEXT,
+                document TEXT
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            """)
+        return connection
+
+    @staticmethod
+    def read_sync_state(connection: sqlite3.Connection) -> Dict[str, str]:
+        return dict(connection.execute("SELECT key, value FROM sync_state").fetchall())
+
+    @staticmethod
+    def write_sync_state(connection: sqlite3.Connection, state: Dict[str, Optional[str]]) -> None:
+        connection.executemany(
+            "INSERT INTO sync_state (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(key, value) for key, value in state.items() if value is not None],
+        )
+
+    @staticmethod
+    def upsert_records(connection: sqlite3.Connection, records: Iterable[Dict[str, Any]]) -> int:
+        """Inserts or replaces the given records, as returned by `Record.to_dict`. Returns the number of records."""
+        rows = [
+            (
+                record["_server_id"],
+                record["id"],
+                record["status"],
+                SQLiteIO._format_datetime(record.get("updated_at")),
+                json.dumps(record, default=str),
+            )
+            for record in records
+        ]
+        connection.executemany(
+            """
+            INSERT INTO records (server_id, id, status, updated_at, deleted_at, document)
+            VALUES (?, ?, ?, ?, NULL, ?)
+            ON CONFLICT(server_id) DO UPDATE SET
+                id = excluded.id,
+                status = excluded.status,
+                updated_at = excluded.updated_at,
+                deleted_at = NULL,
+                document = excluded.document
+            """,
+            rows,
+        )
+        return len(rows)
+
+    @staticmethod
+    def tombstone_records(connection: sqlite3.Connection, deleted_records: Iterable[DeletedRecordModel]) -> int:
+        """Marks the given records as deleted, removing their documents. Returns the number of records."""
+        rows = [
+            (str(record.id), record.external_id, SQLiteIO._format_datetime(record.deleted_at))
+            for record in deleted_records
+        ]
+        connection.executemany(
+            """
+            INSERT INTO records (server_id, id, status, updated_at, deleted_at, document)
+            VALUES (?, ?, NULL, NULL, ?, NULL)
+            ON CONFLICT(server_id) DO UPDATE SET deleted_at = excluded.deleted_at, document = NULL
+            """,
+            rows,
+        )
+        return len(rows)
+
+    @staticmethod
+    def _format_datetime(value: Optional[Union[datetime, str]]) -> Optional[str]:
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
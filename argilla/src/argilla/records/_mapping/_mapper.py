@@ -14,13 +14,16 @@
 
 import re
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union, Tuple
-from uuid import UUID
+from uuid import UUID, uuid4
 import warnings
 
 from argilla._exceptions import RecordsIngestionError
+from argilla._helpers._media import cast_image
+from argilla._models import RecordModel
+from argilla._models._record._vector import as_vector_array
 from argilla.records._resource import Record
-from argilla.responses import Response
-from argilla.settings import FieldBase, VectorField
+from argilla.responses import Response, ResponseStatus
+from argilla.settings import FieldBase, RankingQuestion, VectorField
 from argilla.settings._metadata import MetadataPropertyBase
 from argilla.settings._question import QuestionBase
 from argilla.suggestions import Suggestion
@@ -50,6 +53,7 @@ class IngestedRecordMapper:
     """
 
     mapping: RecordAttributesMap = None
+    _attribute_pattern: Optional[re.Pattern] = None
 
     def __init__(
         self,
@@ -112,6 +116,79 @@ class IngestedRecordMapper:
             _dataset=self._dataset,
         )
 
+    def map_batch(self, columns: Dict[str, Sequence[Any]], user_id: Optional[UUID] = None) -> List[Dict[str, Any]]:
+        """Maps a batch of data, provided as columns, to the payloads used to upsert records on the server.
+
+        Routes are resolved once for the whole batch instead of once per record, and the payloads are built
+        directly, without creating intermediate `Record`, `Suggestion`, `Response` or `Vector` objects.
+
+        Parameters:
+            columns: A dictionary mapping source keys/ columns to lists of values of the same length.
+            user_id: The user id to associate with the record responses.
+
+        Returns:
+            A list of dictionaries representing the records, as expected by the records bulk upsert endpoint.
+        """
+        num_rows = len(next(iter(columns.values()), []))
+        user_id = str(user_id or self.user_id)
+
+        unknown_keys = [key for key in columns.keys() if key not in self.mapping.keys()]
+        if unknown_keys:
+            warnings.warn(f"Keys {unknown_keys} in data are not present in the mapping and will be ignored.")
+
+        if len([k for k in columns if k != self.mapping.id.source]) == 0:
+            raise RecordsIngestionError(message="Records have no data. All records must have at least one attribute.")
+
+        ids = columns.get(self.mapping.id.source, [None] * num_rows)
+        fields = self._batch_attribute_columns(columns=columns, mapping=self.mapping.field)
+        metadata = self._batch_attribute_columns(columns=columns, mapping=self.mapping.metadata)
+        vectors = self._batch_attribute_columns(columns=columns, mapping=self.mapping.vector)
+        responses = [
+            (name, columns[route.source], isinstance(self._dataset.questions[name], RankingQuestion))
+            for name, route in self.mapping.response.items()
+            if route.source in columns
+        ]
+        suggestions = []
+        for name, route in self.mapping.suggestion.items():
+            if route.source not in columns:
+                continue
+            question = self._dataset.questions[name]
+            parameters = {param.parameter_type.value: columns.get(param.source) for param in route.parameters}
+            suggestions.append((question, parameters))
+
+        payloads = []
+        for idx in range(num_rows):
+            record_id = ids[idx]
+            record_fields = self._batch_fields(fields=fields, idx=idx)
+            if not record_fields and record_id is None:
+                raise RecordsIngestionError(
+                    message=f"Record has no fields and no id. Records must have at least one field or an id. "
+                    f"Available keys: {self.mapping.keys()}. Unkown keys: {unknown_keys}."
+                )
+
+            record_vectors = {}
+            for name, values in vectors:
+                value = values[idx]
+                if value is not None:
+                    record_vectors[name] = as_vector_array(value).tolist()
+
+            payloads.append(
+                {
+                    "id": None,
+                    "external_id": str(record_id if record_id is not None else uuid4()),
+                    "fields": record_fields or None,
+                    "metadata": {name: values[idx] for name, values in metadata if values[idx] is not None},
+                    "vectors": record_vectors,
+                    "responses": self._batch_responses(responses=responses, idx=idx, user_id=user_id),
+                    "suggestions": self._batch_suggestions(suggestions=suggestions, idx=idx),
+                    "status": "pending",
+                    "inserted_at": None,
+                    "updated_at": None,
+                }
+            )
+
+        return payloads
+
     ##########################################
     # Private helper functions - Build Mapping
     ##########################################
@@ -155,13 +232,15 @@ class IngestedRecordMapper:
         available_types = AttributeType.values()
 
         # The pattern is in the format of 'attribute[.type[.parameter]]' where type and parameter are optional.
-        pattern = re.compile(
-            rf"^({'|'.join(available_attributes)})"
-            rf"(?:\.({'|'.join(available_types)}))?"
-            rf"(?:\.({'|'.join(available_parameters)}))?$"
-        )
+        # It is compiled once and reused for every mapped attribute.
+        if self._attribute_pattern is None:
+            self._attribute_pattern = re.compile(
+                rf"^({'|'.join(available_attributes)})"
+                rf"(?:\.({'|'.join(available_types)}))?"
+                rf"(?:\.({'|'.join(available_parameters)}))?$"
+            )
 
-        match = pattern.match(attribute_mapping)
+        match = self._attribute_pattern.match(attribute_mapping)
         if not match:
             raise ValueError(
                 f"Invalid attribute mapping format: {attribute_mapping}. "
@@ -309,3 +388,80 @@ class IngestedRecordMapper:
             attributes[name] = value
 
         return attributes
+
+    ##########################################
+    # Private helper functions - Map Batches
+    ##########################################
+
+    @staticmethod
+    def _batch_attribute_columns(
+        columns: Dict[str, Sequence[Any]], mapping: Dict[str, AttributeRoute]
+    ) -> List[Tuple[str, Sequence[Any]]]:
+        """Resolves the columns of a batch that are mapped to the given attributes."""
+        return [(name, columns[route.source]) for name, route in mapping.items() if route.source in columns]
+
+    def _batch_fields(self, fields: List[Tuple[str, Sequence[Any]]], idx: int) -> Dict[str, Any]:
+        record_fields = {}
+        for name, values in fields:
+            value = values[idx]
+            if value is None:
+                continue
+            field_type = self._schema[name].type
+            if field_type == "image":
+                value = cast_image(value)
+            elif isinstance(value, list):
+                value = [message.model_dump() for message in RecordModel._validate_field_value(value)]
+            record_fields[name] = value
+
+        return record_fields
+
+    @staticmethod
+    def _batch_responses(
+        responses: List[Tuple[str, Sequence[Any], bool]], idx: int, user_id: str
+    ) -> List[Dict[str, Any]]:
+        values = {}
+        for name, column, is_ranking in responses:
+            value = column[idx]
+            if value is None:
+                continue
+            if is_ranking:
+                value = [IngestedRecordMapper._batch_ranking_response_value(v) for v in value or []]
+            values[name] = {"value": value}
+
+        if not values:
+            return []
+
+        return [{"values": values, "status": ResponseStatus.draft.value, "user_id": user_id}]
+
+    @staticmethod
+    def _batch_ranking_response_value(value: Any) -> Dict[str, Any]:
+        if isinstance(value, dict):
+            return value
+        if isinstance(value, str):
+            return {"value": value}
+        raise ValueError(f"Invalid value for ranking question: {value}")
+
+    @staticmethod
+    def _batch_suggestions(
+        suggestions: List[Tuple["QuestionBase", Dict[str, Optional[Sequence[Any]]]]], idx: int
+    ) -> List[Dict[str, Any]]:
+        record_suggestions = []
+        for question, parameters in suggestions:
+            values = {parameter: column[idx] for parameter, column in parameters.items() if column is not None}
+            value = values.get(ParameterType.VALUE.value)
+            if value is None:
+                continue
+            if isinstance(question, RankingQuestion):
+                value = [{"value": str(v)} for v in value]
+            record_suggestions.append(
+                {
+                    "value": value,
+                    "question_name": question.name,
+                    "question_id": str(question.id) if question.id else None,
+                    "type": None,
+                    "score": values.get(ParameterType.SCORE.value),
+                    "agent": values.get(ParameterType.AGENT.value),
+                }
+            )
+
+        return record_suggestions
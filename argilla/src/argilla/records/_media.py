@@ -0,0 +1,141 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence
+
+from argilla._helpers._media import encode_image, image_hash, is_encoded_image
+
+__all__ = ["MediaEncoder"]
+
+
+class MediaEncoder:
+    """Encodes images as base64 data URIs in a pool of processes before records are sent to the server.
+
+    Images can be PIL images, NumPy arrays, or paths to image files. Encoded images are cached by the hash of their
+    content, so the same image referenced from several records is only encoded once. Values that are already
+    encoded, like data URIs or URLs, are kept as they are.
+
+    Examples:
+        ```python
+        with rg.MediaEncoder(workers=8, image_format="WEBP", quality=80, max_dimension=1024) as encoder:
+            dataset.records.log(records, media_encoder=encoder)
+        ```
+
+    Attributes:
+        workers (int): The number of processes used to encode images. If 0, images are encoded in the calling process.
+        image_format (str): The format used to re-encode images (e.g. "JPEG", "WEBP"). By default, images are kept
+            in their original format.
+        quality (int): The quality used to re-encode images in lossy formats like JPEG or WebP.
+        max_dimension (int): If set, images with a larger width or height are downscaled to fit this size.
+        cache_size (int): The maximum number of encoded images kept in the cache.
+    """
+
+    DEFAULT_CACHE_SIZE = 256
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        image_format: Optional[str] = None,
+        quality: Optional[int] = None,
+        max_dimension: Optional[int] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        if workers is not None and workers < 0:
+            raise ValueError(f"The number of workers must be greater than or equal to 0. Found {workers}.")
+        if max_dimension is not None and max_dimension < 1:
+            raise ValueError(f"The maximum dimension must be greater than 0. Found {max_dimension}.")
+
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.image_format = image_format
+        self.quality = quality
+        self.max_dimension = max_dimension
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._executor: Optional[Executor] = None
+
+    def __enter__(self) -> "MediaEncoder":
+        return self
+
+    def __exit__(self, *args, **kwargs) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"MediaEncoder(workers={self.workers}, image_format={self.image_format}, quality={self.quality}, "
+            f"max_dimension={self.max_dimension})"
+        )
+
+    def encode(self, images: Sequence[Any]) -> List[Any]:
+        """Encodes a batch of images as data URIs. Missing values and images that are already encoded are returned
+        unchanged.
+
+        Parameters:
+            images (Sequence[Any]): The images to encode, as PIL images, NumPy arrays, or file paths.
+
+        Returns:
+            List[Any]: The encoded images, in the same order as the input images.
+        """
+        encoded = list(images)
+        pending: Dict[str, List[int]] = {}
+        for idx, image in enumerate(encoded):
+            if image is None or is_encoded_image(image):
+                continue
+            key = image_hash(image)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                encoded[idx] = self._cache[key]
+            else:
+                pending.setdefault(key, []).append(idx)
+
+        if not pending:
+            return encoded
+
+        encode = partial(
+            encode_image, image_format=self.image_format, quality=self.quality, max_dimension=self.max_dimension
+        )
+        sources = [encoded[indices[0]] for indices in pending.values()]
+        if self.workers == 0 or len(sources) == 1:
+            results = map(encode, sources)
+        else:
+            results = self._get_executor().map(encode, sources)
+
+        for (key, indices), data_uri in zip(pending.items(), results):
+            for idx in indices:
+                encoded[idx] = data_uri
+            self._cache_data_uri(key, data_uri)
+
+        return encoded
+
+    def close(self) -> None:
+        """Shuts down the pool of processes used to encode images."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        return self._executor
+
+    def _cache_data_uri(self, key: str, data_uri: str) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = data_uri
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
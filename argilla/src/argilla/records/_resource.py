@@ -12,12 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import copy
+import io
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Union
 from uuid import UUID
 
 from argilla._exceptions import ArgillaError
-from argilla._helpers._media import cast_image, uncast_image
+from argilla._helpers._media import cast_image, is_media_reference, uncast_image
 from argilla._models import (
     FieldValue,
     RecordModel,
@@ -27,6 +29,7 @@ from argilla._models import (
     VectorValue,
 )
 from argilla._models._record._metadata import MetadataModel
+from argilla._models._record._vector import as_vector_array, vector_values_equal
 from argilla._resource import Resource
 from argilla.responses import Response, UserResponse
 from argilla.suggestions import Suggestion
@@ -288,6 +291,12 @@ class Record(Resource):
         if self._client:
             return self._client.api.records
 
+    def _copy_with_fields(self, fields: Dict[str, FieldValue]) -> "Record":
+        """Returns a shallow copy of the record with some field values replaced, leaving this record unchanged."""
+        record = copy.copy(self)
+        record.__fields = RecordFields(fields={**dict(dict.items(self.__fields)), **fields}, record=record)
+        return record
+
 
 class RecordFields(dict):
     """This is a container class for the fields of a Record.
@@ -297,6 +306,7 @@ class RecordFields(dict):
     def __init__(self, record: Record, fields: Optional[Dict[str, FieldValue]] = None) -> None:
         super().__init__(fields or {})
         self.record = record
+        self._media_content: Dict[str, bytes] = {}
 
     def to_dict(self) -> dict:
         fields = {}
@@ -314,7 +324,19 @@ class RecordFields(dict):
 
     def __getitem__(self, key: str) -> FieldValue:
         value = super().__getitem__(key)
-        return uncast_image(value) if self._is_image(key) else value
+        if not self._is_image(key):
+            return value
+
+        # Media stored by the server is only downloaded the first time the field is accessed
+        if is_media_reference(value) and self.record._api:
+            from PIL import Image
+
+            if value not in self._media_content:
+                self._media_content[value] = self.record._api.get_media(value)
+
+            return Image.open(io.BytesIO(self._media_content[value]))
+
+        return uncast_image(value)
 
     def _is_image(self, key: str) -> bool:
         if not self.record.dataset:
@@ -343,13 +365,30 @@ class RecordMetadata(dict):
 class RecordVectors(dict):
     """This is a container class for the vectors of a Record.
     It allows for accessing suggestions by attribute and key name.
+    Vector values are stored as float32 NumPy arrays.
     """
 
     def __init__(self, vectors: Dict[str, VectorValue]) -> None:
-        super().__init__(vectors or {})
+        super().__init__({name: as_vector_array(value) for name, value in (vectors or {}).items()})
+
+    def __setitem__(self, name: str, value: VectorValue) -> None:
+        super().__setitem__(name, as_vector_array(value))
+
+    def __eq__(self, other: Any) -> bool:
+        # NOTE: Vectors are compared by value, so they can be compared with dictionaries of lists too
+        if not isinstance(other, dict):
+            return NotImplemented
+
+        return self.keys() == other.keys() and all(
+            vector_values_equal(value, other[name]) for name, value in self.items()
+        )
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
 
     def to_dict(self) -> Dict[str, List[float]]:
-        return dict(self.items())
+        return {name: value.tolist() for name, value in self.items()}
 
     def api_models(self) -> List[VectorModel]:
         return [Vector(name=name, values=value).api_model() for name, value in self.items()]
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from argilla._models import VectorModel
+from argilla._models import VectorModel, VectorValue
 from argilla._resource import Resource
 
+if TYPE_CHECKING:
+    import numpy as np
+
 __all__ = ["Vector"]
 
 
@@ -26,7 +29,7 @@ class Vector(Resource):
 
     Attributes:
         name (str): The name of the vector.
-        values (list[float]): The values of the vector.
+        values (np.ndarray): The values of the vector, as a float32 NumPy array.
     """
 
     _model: VectorModel
@@ -34,13 +37,13 @@ class Vector(Resource):
     def __init__(
         self,
         name: str,
-        values: list[float],
+        values: VectorValue,
     ) -> None:
         """Initializes a Vector with a name and values that can be used to search in the Argilla ui.
 
         Parameters:
             name (str): Name of the vector
-            values (list[float]): List of float values
+            values (list[float] | np.ndarray): List or NumPy array of float values
 
         """
         self._model = VectorModel(
@@ -61,8 +64,8 @@ class Vector(Resource):
         return self._model.name
 
     @property
-    def values(self) -> list[float]:
-        """List of float values that represent the vector."""
+    def values(self) -> "np.ndarray":
+        """Float32 NumPy array with the values that represent the vector."""
         return self._model.vector_values
 
     ##############################
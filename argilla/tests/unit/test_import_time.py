@@ -0,0 +1,47 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Imports the module in a new interpreter using `-X importtime` and returns cumulative microseconds by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        import_times[name.strip()] = int(cumulative)
+
+    return import_times
+
+
+class TestImportTime:
+    def test_import_argilla_without_heavy_modules(self):
+        import_times = _import_times("argilla")
+
+        assert [module for module in ["datasets", "PIL", "pyarrow", "pandas"] if module in import_times] == []
+        assert import_times["argilla"] / 1_000_000 < 2.0
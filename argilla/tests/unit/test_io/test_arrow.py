@@ -0,0 +1,134 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import uuid
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pytest_httpx import HTTPXMock
+
+import argilla as rg
+from argilla.records._io import ArrowIO
+
+API_URL = "http://test_url"
+
+
+@pytest.fixture
+def dataset() -> rg.Dataset:
+    settings = rg.Settings(
+        fields=[rg.TextField(name="text"), rg.ChatField(name="chat", required=False)],
+        questions=[
+            rg.LabelQuestion(name="label", labels=["positive", "negative"]),
+            rg.MultiLabelQuestion(name="topics", labels=["a", "b", "c"]),
+            rg.RatingQuestion(name="rating", values=[1, 2, 3]),
+        ],
+        metadata=[rg.TermsMetadataProperty(name="tags"), rg.IntegerMetadataProperty(name="length")],
+        vectors=[rg.VectorField(name="vector", dimensions=3)],
+    )
+    dataset = rg.Dataset(name="test_dataset", settings=settings, client=rg.Argilla(API_URL))
+    dataset.id = uuid.uuid4()
+
+    return dataset
+
+
+def record_json(text: str) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "external_id": text,
+        "status": "pending",
+        "fields": {"text": text},
+        "metadata": {"tags": "tag", "length": len(text)},
+        "vectors": {"vector": [0.1, 0.2, 0.3]},
+    }
+
+
+class TestArrowIO:
+    def test_to_schema(self, dataset: rg.Dataset):
+        schema = ArrowIO.to_schema(dataset=dataset)
+
+        assert schema.names[:8] == ["id", "status", "_server_id", "text", "chat", "tags", "length", "vector"]
+        assert schema.field("chat").type == pa.list_(pa.struct([("role", pa.string()), ("content", pa.string())]))
+        assert schema.field("tags").type == pa.list_(pa.string())
+        assert schema.field("length").type == pa.int64()
+        assert schema.field("vector").type == pa.list_(pa.float32(), 3)
+        assert schema.field("label.suggestion").type == pa.string()
+        assert schema.field("topics.suggestion").type == pa.list_(pa.string())
+        assert schema.field("topics.suggestion.score").type == pa.list_(pa.float64())
+        assert schema.field("rating.responses").type == pa.list_(pa.int64())
+        assert "vector" not in ArrowIO.to_schema(dataset=dataset, with_vectors=False).names
+
+    def test_to_record_batch(self, dataset: rg.Dataset):
+        user_id = uuid.uuid4()
+        records = [
+            rg.Record(
+                fields={"text": "Hello", "chat": [{"role": "user", "content": "Hi"}]},
+                metadata={"tags": "tag", "length": 5},
+                vectors={"vector": [0.1, 0.2, 0.3]},
+                suggestions=[rg.Suggestion(question_name="topics", value=["a", "b"], score=0.5)],
+                responses=[rg.Response(question_name="rating", value=2, user_id=user_id)],
+            ),
+            rg.Record(fields={"text": "World"}),
+        ]
+        schema = ArrowIO.to_schema(dataset=dataset)
+
+        batch = ArrowIO.to_record_batch(records=records, schema=schema, dataset=dataset)
+
+        assert batch.schema == schema
+        assert batch.num_rows == 2
+        assert batch.column("chat").to_pylist() == [[{"role": "user", "content": "Hi"}], None]
+        assert batch.column("tags").to_pylist() == [["tag"], None]
+        assert batch.column("topics.suggestion").to_pylist() == [["a", "b"], None]
+        assert batch.column("topics.suggestion.score").to_pylist() == [[0.5], None]
+        assert batch.column("rating.responses").to_pylist() == [[2], None]
+        assert batch.column("rating.responses.users").to_pylist() == [[str(user_id)], None]
+        assert batch.column("label.suggestion").to_pylist() == [None, None]
+        assert batch.column("vector").null_count == 1
+        assert batch.column("vector").to_pylist()[0] == pytest.approx([0.1, 0.2, 0.3])
+
+    def test_records_to_parquet(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        records_url = (
+            f"{API_URL}/api/v1/datasets/{dataset.id}/records"
+            "?offset={offset}&limit=2&include=suggestions&include=responses&include=vectors"
+        )
+        httpx_mock.add_response(url=records_url.format(offset=0), json={"items": [record_json("a"), record_json("bb")]})
+        httpx_mock.add_response(url=records_url.format(offset=2), json={"items": []})
+
+        path = dataset.records.to_parquet(tmp_path / "records.parquet", batch_size=2)
+
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.schema_arrow == ArrowIO.to_schema(dataset=dataset)
+        assert parquet_file.num_row_groups == 1
+
+        table = parquet_file.read()
+        assert table.column("text").to_pylist() == ["a", "bb"]
+        assert table.column("length").to_pylist() == [1, 2]
+        assert [vector == pytest.approx([0.1, 0.2, 0.3]) for vector in table.column("vector").to_pylist()] == [
+            True,
+            True,
+        ]
+
+    def test_records_to_datasets_keeps_metadata_values(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        records_url = (
+            f"{API_URL}/api/v1/datasets/{dataset.id}/records"
+            "?offset={offset}&limit=256&include=suggestions&include=responses"
+        )
+        record = record_json("a")
+        record["metadata"]["undeclared"] = "value"
+        httpx_mock.add_response(url=records_url.format(offset=0), json={"items": [record]})
+
+        hf_dataset = dataset.records.to_datasets()
+
+        assert hf_dataset["tags"] == ["tag"]
+        assert hf_dataset["undeclared"] == ["value"]
@@ -14,7 +14,8 @@
 
 from uuid import uuid4
 
-from datasets import Value, Sequence, load_dataset
+import pytest
+from datasets import ClassLabel, Dataset as HFDataset, Features, Value, Sequence, load_dataset
 
 import argilla as rg
 from argilla.records._io import HFDatasetsIO
@@ -142,3 +143,63 @@ class TestHFDatasetsIO:
                 "id": "ed0bdzj",
             },
         ]
+
+    def test_to_argilla_with_class_labels(self):
+        dataset = rg.Dataset(name="test", settings=rg.Settings(fields=[rg.TextField(name="text")]))
+        mapper = IngestedRecordMapper(dataset, uuid4())
+        features = Features(
+            {
+                "text": Value("string"),
+                "label": ClassLabel(names=["positive", "negative"]),
+                "labels": Sequence(ClassLabel(names=["a", "b", "c"])),
+            }
+        )
+        hf_ds = HFDataset.from_dict(
+            {"text": ["one", "two", "three"], "label": [0, 1, -1], "labels": [[0, 2], [], [1]]}, features=features
+        )
+
+        with pytest.warns(UserWarning, match="Could not cast -1 to string"):
+            hf_ds = HFDatasetsIO.to_argilla(hf_ds, mapper)
+
+        assert hf_ds.features["label"] == Value("string")
+        assert hf_ds.features["labels"] == Sequence(Value("string"))
+        assert hf_ds.to_list() == [
+            {"text": "one", "label": "positive", "labels": ["a", "c"], "id": "None_0"},
+            {"text": "two", "label": "negative", "labels": [], "id": "None_1"},
+            {"text": "three", "label": None, "labels": ["b"], "id": "None_2"},
+        ]
+
+    def test_record_dicts_from_iterable_dataset_with_class_labels(self):
+        dataset = rg.Dataset(name="test", settings=rg.Settings(fields=[rg.TextField(name="text")]))
+        mapper = IngestedRecordMapper(dataset, uuid4())
+        features = Features({"id": Value("string"), "text": Value("string"), "label": ClassLabel(names=["a", "b"])})
+        hf_ds = HFDataset.from_dict(
+            {"id": ["1", "2", "3"], "text": ["one", "two", "three"], "label": [1, 0, 1]}, features=features
+        )
+
+        record_dicts = HFDatasetsIO._record_dicts_from_datasets(hf_ds.to_iterable_dataset(), mapper, batch_size=2)
+
+        assert list(record_dicts) == [
+            {"id": "1", "text": "one", "label": "b"},
+            {"id": "2", "text": "two", "label": "a"},
+            {"id": "3", "text": "three", "label": "b"},
+        ]
+
+    def test_to_datasets_with_label_suggestions_as_class_labels(self):
+        dataset = rg.Dataset(
+            name="test",
+            settings=rg.Settings(
+                fields=[rg.TextField(name="text")],
+                questions=[rg.LabelQuestion(name="label", labels=["positive", "negative"])],
+            ),
+        )
+        records = [
+            rg.Record(fields={"text": "one"}, suggestions=[rg.Suggestion("label", value="negative")]),
+            rg.Record(fields={"text": "two"}),
+            rg.Record(fields={"text": "three"}, suggestions=[rg.Suggestion("label", value="positive")]),
+        ]
+
+        hf_ds = HFDatasetsIO.to_datasets(records, dataset=dataset)
+
+        assert hf_ds.features["label.suggestion"] == ClassLabel(names=["negative", "positive"])
+        assert hf_ds["label.suggestion"] == [0, None, 1]
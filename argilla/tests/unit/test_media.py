@@ -11,11 +11,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
 from tempfile import NamedTemporaryFile
+from unittest import mock
 
+import numpy as np
 import pytest
 from PIL import Image
-from argilla._helpers._media import cast_image, pil_to_data_uri, uncast_image
+
+import argilla as rg
+from argilla._helpers import _media
+from argilla._helpers._media import (
+    cast_image,
+    encode_image,
+    image_hash,
+    media_content_to_data_uri,
+    pil_to_data_uri,
+    uncast_image,
+)
 
 
 @pytest.fixture
@@ -84,3 +97,85 @@ def test_uncast_image_with_url():
     image_url = "https://example.com/image.jpg"
     result = uncast_image(image_url)
     assert result == image_url
+
+
+def test_cast_image_with_media_reference():
+    media_reference = f"/api/v1/media/{'a' * 64}"
+
+    assert cast_image(media_reference) == media_reference
+    assert uncast_image(media_reference) == media_reference
+
+
+def test_media_content_to_data_uri(pil_image):
+    buffered = io.BytesIO()
+    pil_image.save(buffered, format="PNG")
+
+    data_uri = media_content_to_data_uri(buffered.getvalue())
+
+    assert data_uri.startswith("data:image/png;base64,")
+    assert uncast_image(data_uri).size == pil_image.size
+
+
+def test_encode_image_resizing_and_reencoding(pil_image):
+    result = encode_image(pil_image, image_format="jpeg", quality=50, max_dimension=10)
+    uncasted = uncast_image(result)
+
+    assert result.startswith("data:image/jpeg;base64,")
+    assert uncasted.format == "JPEG"
+    assert uncasted.size == (10, 10)
+    assert pil_image.size == (100, 100)
+
+
+def test_encode_image_with_numpy_array():
+    array = np.zeros((20, 40, 3), dtype=np.uint8)
+
+    result = encode_image(array)
+
+    assert result.startswith("data:image/png;base64,")
+    assert uncast_image(result).size == (40, 20)
+
+
+def test_image_hash_of_image_opened_from_file_does_not_decode_it(path_to_image):
+    image = Image.open(path_to_image)
+
+    with mock.patch.object(Image.Image, "tobytes") as tobytes_mock:
+        key = image_hash(image)
+
+    tobytes_mock.assert_not_called()
+    assert key == image_hash(Image.open(path_to_image))
+    assert key != image_hash(Image.new("RGB", (100, 100), color="blue"))
+
+
+class TestMediaEncoder:
+    def test_encode_images_in_calling_process(self, pil_image, path_to_image):
+        encoder = rg.MediaEncoder(workers=0)
+
+        result = encoder.encode([pil_image, None, path_to_image, "https://example.com/image.jpg"])
+
+        assert result == [cast_image(pil_image), None, cast_image(path_to_image), "https://example.com/image.jpg"]
+
+    def test_encode_images_in_process_pool(self, path_to_image):
+        images = [Image.new("RGB", (100, 100), color=color) for color in ("red", "green", "blue")]
+
+        with rg.MediaEncoder(workers=2, image_format="WEBP", max_dimension=50) as encoder:
+            result = encoder.encode(images + [path_to_image])
+
+        assert all(data_uri.startswith("data:image/webp;base64,") for data_uri in result)
+        assert [uncast_image(data_uri).size for data_uri in result] == [(50, 50)] * 4
+        assert encoder._executor is None
+
+    def test_encode_same_image_once(self, pil_image, path_to_image):
+        encoder = rg.MediaEncoder(workers=0)
+        other_image = pil_image.copy()
+
+        with mock.patch.object(_media, "cast_image", wraps=_media.cast_image) as cast_image_mock:
+            first = encoder.encode([pil_image, other_image, path_to_image])
+            second = encoder.encode([path_to_image])
+
+        assert first[0] == first[1]
+        assert second == [first[2]]
+        assert cast_image_mock.call_count == 2
+
+    def test_encode_with_invalid_workers(self):
+        with pytest.raises(ValueError, match="number of workers"):
+            rg.MediaEncoder(workers=-1)
@@ -12,13 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import io
 import pytest
 import random
 from tempfile import NamedTemporaryFile
 
 from PIL import Image
+from pytest_httpx import HTTPXMock
 
-from argilla import Record, Settings, ImageField, Dataset, ChatField, TextField
+from argilla import Argilla, Record, Settings, ImageField, Dataset, ChatField, TextField
 
 
 @pytest.fixture
@@ -92,3 +94,22 @@ class TestRecordFields:
         assert isinstance(fields["chat"], list)
         assert all(isinstance(chat, dict) for chat in fields["chat"])
         assert isinstance(fields["text"], str)
+
+    def test_create_record_with_media_reference(self, httpx_mock: HTTPXMock, pil_image):
+        api_url = "http://test_url"
+        media_reference = f"/api/v1/media/{'a' * 64}"
+
+        image_content = io.BytesIO()
+        pil_image.save(image_content, format="PNG")
+        httpx_mock.add_response(url=f"{api_url}{media_reference}", content=image_content.getvalue())
+
+        client = Argilla(api_url=api_url, api_key="admin.apikey")
+        dataset = Dataset(name="test_dataset", settings=Settings(fields=[ImageField(name="image")]), client=client)
+        record = Record(fields={"image": media_reference}, _dataset=dataset)
+
+        assert record.fields.to_dict() == {"image": media_reference}
+        assert len(httpx_mock.get_requests()) == 0
+
+        assert isinstance(record.fields["image"], Image.Image)
+        assert record.fields["image"].size == pil_image.size
+        assert len(httpx_mock.get_requests()) == 1
@@ -11,14 +11,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import warnings
 from uuid import uuid4
 
+import pandas as pd
 import pytest
 
 import argilla as rg
 from argilla._exceptions import RecordsIngestionError
 from argilla.records._dataset_records import RecordErrorHandling
+from argilla.records._mapping import IngestedRecordMapper
 
 
 @pytest.fixture
@@ -171,7 +174,7 @@ def test_ingest_record_from_dict_with_mapped_metadata_vectors(dataset):
     record = record_api_models[0]
     assert record.fields["prompt"] == "Hello World, how are you?"
     assert record.suggestions[0].value == "negative"
-    assert record.vectors[0].vector_values == [1, 2, 3]
+    assert record.vectors[0].vector_values.tolist() == [1, 2, 3]
     assert record.vectors[0].name == "vector"
     assert record.metadata[0].value == 0.9
     assert record.metadata[0].name == "score"
@@ -260,3 +263,81 @@ def test_ingest_records_on_error_ignore(dataset, caplog):
     assert records[0].fields["prompt"] == "Valid record 1"
     assert records[1].fields["prompt"] == "Valid record 2"
     assert "Failed to ingest record" not in caplog.text
+
+
+def test_map_batch_matches_records_mapped_one_by_one(dataset):
+    user_id = uuid4()
+    mapping = {
+        "my_prompt": "prompt",
+        "my_label": "label.suggestion.value",
+        "my_score": "label.suggestion.score",
+        "model": "label.suggestion.agent",
+        "annotation": "label.response",
+    }
+    rows = [
+        {
+            "id": "record-1",
+            "my_prompt": "What is the capital of France?",
+            "my_label": "positive",
+            "my_score": 0.9,
+            "model": "model-1",
+            "annotation": "negative",
+            "score": 0.5,
+            "vector": [0.1, 0.2, 0.3],
+        },
+        {
+            "id": "record-2",
+            "my_prompt": "What is the capital of Spain?",
+            "my_label": None,
+            "my_score": None,
+            "model": None,
+            "annotation": None,
+            "score": None,
+            "vector": None,
+        },
+    ]
+    columns = {key: [row[key] for row in rows] for key in rows[0]}
+
+    mapper = IngestedRecordMapper(dataset=dataset, mapping=mapping, user_id=user_id)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        payloads = mapper.map_batch(columns=columns)
+        expected = [
+            record.model_dump()
+            for record in dataset.records._ingest_records(records=rows, mapping=mapping, user_id=user_id)
+        ]
+
+    for suggestion in expected[0]["suggestions"]:
+        suggestion.pop("id")
+    assert json.loads(json.dumps(payloads)) == json.loads(json.dumps(expected))
+
+
+def test_map_batch_record_without_fields_and_id_raises(dataset):
+    mapper = IngestedRecordMapper(dataset=dataset, user_id=uuid4())
+
+    with pytest.raises(RecordsIngestionError):
+        mapper.map_batch(columns={"prompt": ["Valid record", None], "score": [0.1, 0.2]})
+
+
+def test_ingest_batches_from_dataframe(dataset):
+    dataframe = pd.DataFrame({"prompt": ["first", "second", "third"], "score": [0.1, float("nan"), 0.3]})
+
+    batches = list(dataset.records._iter_ingested_batches(records=dataframe, batch_size=2, user_id=uuid4()))
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert [payload["fields"]["prompt"] for batch in batches for payload in batch] == ["first", "second", "third"]
+    assert [payload["metadata"] for batch in batches for payload in batch] == [{"score": 0.1}, {}, {"score": 0.3}]
+
+
+def test_ingest_batches_from_dataframe_on_error_warn(dataset):
+    dataframe = pd.DataFrame({"prompt": ["Valid record", None], "score": [0.1, 0.2]})
+
+    with pytest.warns(UserWarning, match="Failed to ingest record"):
+        batches = list(
+            dataset.records._iter_ingested_batches(
+                records=dataframe, batch_size=2, user_id=uuid4(), on_error=RecordErrorHandling.WARN
+            )
+        )
+
+    assert len(batches) == 1
+    assert [record.fields["prompt"] for record in batches[0]] == ["Valid record"]
@@ -0,0 +1,233 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import json
+import uuid
+from datetime import datetime
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import argilla as rg
+from argilla._exceptions import ArgillaCredentialsError, UnprocessableEntityError
+from argilla.records._dataset_records import AsyncDatasetRecords
+
+API_URL = "http://test_url"
+
+
+@pytest.fixture
+def dataset() -> rg.Dataset:
+    dataset = rg.Dataset(
+        name="test_dataset",
+        settings=rg.Settings(
+            fields=[rg.TextField(name="text")],
+            questions=[rg.TextQuestion(name="response")],
+        ),
+        client=rg.Argilla(API_URL),
+    )
+    dataset.id = uuid.uuid4()
+
+    return dataset
+
+
+@pytest.fixture
+def user_id(httpx_mock: HTTPXMock) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    httpx_mock.add_response(
+        url=f"{API_URL}/api/v1/me",
+        method="GET",
+        json={"id": str(user_id), "username": "owner", "role": "owner"},
+    )
+
+    return user_id
+
+
+def record_json(text: str) -> dict:
+    return {"id": str(uuid.uuid4()), "fields": {"text": text}, "external_id": text, "status": "pending"}
+
+
+class TestAsyncArgilla:
+    def test_async_context_manager_validates_connection(self, httpx_mock: HTTPXMock, user_id: uuid.UUID):
+        async def run():
+            async with rg.AsyncArgilla(API_URL) as client:
+                assert isinstance(client.http_client, httpx.AsyncClient)
+                assert client.http_client.headers["X-Argilla-Api-Key"] == "argilla.apikey"
+                return client
+
+        client = asyncio.run(run())
+
+        assert client.http_client.is_closed
+
+    def test_async_context_manager_with_invalid_credentials(self, httpx_mock: HTTPXMock):
+        httpx_mock.add_response(url=f"{API_URL}/api/v1/me", method="GET", status_code=401, json={"detail": "error"})
+
+        async def run():
+            async with rg.AsyncArgilla(API_URL):
+                pass
+
+        with pytest.raises(ArgillaCredentialsError):
+            asyncio.run(run())
+
+
+class TestAsyncDatasetRecords:
+    def test_log_records_in_batches(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID):
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_response(url=url, method="PUT", json={"items": [record_json("a"), record_json("b")]})
+        httpx_mock.add_response(url=url, method="PUT", json={"items": [record_json("c")]})
+
+        async def run():
+            records = rg.AsyncArgilla(API_URL).records(dataset)
+            return await records.log(
+                [{"text": "a", "answer": "yes"}, {"text": "b"}, {"text": "c"}],
+                mapping={"answer": "response.response"},
+                batch_size=2,
+            )
+
+        result = asyncio.run(run())
+
+        assert isinstance(result, rg.AsyncDatasetRecords)
+        requests = [json.loads(request.content) for request in httpx_mock.get_requests(url=url)]
+        assert [[item["fields"]["text"] for item in request["items"]] for request in requests] == [["a", "b"], ["c"]]
+        assert requests[0]["items"][0]["responses"][0]["user_id"] == str(user_id)
+
+    def test_log_records_with_workers(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def bulk_upsert(request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+            items = [record_json(item["fields"]["text"]) for item in json.loads(request.content)["items"]]
+            return httpx.Response(status_code=200, json={"items": items})
+
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_callback(bulk_upsert, url=url, method="PUT")
+
+        async def run():
+            records = rg.AsyncArgilla(API_URL).records(dataset)
+            await records.log([{"text": text} for text in "abcdefgh"], batch_size=2, workers=2)
+
+        asyncio.run(run())
+
+        requests = [json.loads(request.content) for request in httpx_mock.get_requests(url=url)]
+        assert sorted(item["fields"]["text"] for request in requests for item in request["items"]) == list("abcdefgh")
+        assert len(requests) == 4
+        assert max_in_flight == 2
+
+    def test_log_records_with_server_error(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID):
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk",
+            method="PUT",
+            status_code=422,
+            json={"detail": "error"},
+        )
+
+        async def run():
+            await rg.AsyncArgilla(API_URL).records(dataset).log([{"text": "a"}])
+
+        with pytest.raises(UnprocessableEntityError):
+            asyncio.run(run())
+
+    def test_log_records_retries_batch_on_server_error(
+        self, monkeypatch: pytest.MonkeyPatch, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID
+    ):
+        monkeypatch.setattr(AsyncDatasetRecords, "RETRY_BACKOFF_FACTOR", 0)
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_response(url=url, method="PUT", status_code=500)
+        httpx_mock.add_response(url=url, method="PUT", json={"items": [record_json("a")]})
+
+        async def run():
+            await rg.AsyncArgilla(API_URL).records(dataset).log([{"text": "a"}], max_retries=1)
+
+        asyncio.run(run())
+
+        assert len(httpx_mock.get_requests(url=url)) == 2
+
+    def test_log_records_from_generator_with_warn(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID):
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_response(url=url, method="PUT", status_code=400, json={"detail": "error"})
+        httpx_mock.add_response(url=url, method="PUT", json={"items": [record_json("c")]})
+
+        async def run():
+            records = ({"text": text} for text in "abc")
+            await rg.AsyncArgilla(API_URL).records(dataset).log(records, batch_size=2, on_error="warn")
+
+        with pytest.warns(UserWarning, match="Failed to log records from 0 to 2"):
+            asyncio.run(run())
+
+        requests = [json.loads(request.content) for request in httpx_mock.get_requests(url=url)]
+        assert [[item["fields"]["text"] for item in request["items"]] for request in requests] == [["a", "b"], ["c"]]
+
+    def test_iterate_records(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/records?offset=0&limit=2&include=suggestions&include=responses",
+            method="GET",
+            json={"items": [record_json("a"), record_json("b")]},
+        )
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/records?offset=2&limit=2&include=suggestions&include=responses",
+            method="GET",
+            json={"items": [record_json("c")]},
+        )
+
+        async def run():
+            records = rg.AsyncArgilla(API_URL).records(dataset)
+            return [record async for record in records(batch_size=2, prefetch=1)]
+
+        records = asyncio.run(run())
+
+        assert [record.fields["text"] for record in records] == ["a", "b", "c"]
+        assert all(record.dataset == dataset for record in records)
+
+    def test_iterate_records_with_query_and_limit(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/search?offset=0&limit=1&include=suggestions&include=responses",
+            method="POST",
+            json={"items": [{"record": record_json("a"), "query_score": 1.0}], "total": 2},
+        )
+
+        async def run():
+            records = rg.AsyncArgilla(API_URL).records(dataset)
+            return [record async for record in records(query="a", limit=1)]
+
+        records = asyncio.run(run())
+
+        assert [record.fields["text"] for record in records] == ["a"]
+        request = httpx_mock.get_request(method="POST")
+        assert json.loads(request.content)["query"]["text"]["q"] == "a"
+
+    def test_list_deleted_records(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        deleted_id = uuid.uuid4()
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/deleted?limit=2&deleted_at_ge=2024-01-01T00%3A00%3A00",
+            method="GET",
+            json={"items": [{"id": str(deleted_id), "external_id": "a", "deleted_at": "2024-01-02T00:00:00"}]},
+        )
+
+        async def run():
+            return await rg.AsyncArgilla(API_URL).api.records.list_deleted(
+                dataset.id, limit=2, deleted_at_ge=datetime(2024, 1, 1)
+            )
+
+        [deleted_record] = asyncio.run(run())
+
+        assert deleted_record.id == deleted_id
+        assert deleted_record.external_id == "a"
+        assert deleted_record.deleted_at == datetime(2024, 1, 2)
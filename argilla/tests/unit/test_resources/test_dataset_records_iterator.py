@@ -0,0 +1,120 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+import uuid
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from pytest_mock import MockerFixture
+
+import argilla as rg
+
+API_URL = "http://test_url"
+
+
+@pytest.fixture
+def dataset() -> rg.Dataset:
+    dataset = rg.Dataset(
+        name="test_dataset",
+        settings=rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="response")]),
+        client=rg.Argilla(API_URL),
+    )
+    dataset.id = uuid.uuid4()
+
+    return dataset
+
+
+def record_json(text: str) -> dict:
+    return {"id": str(uuid.uuid4()), "fields": {"text": text}, "external_id": text, "status": "pending"}
+
+
+def records_url(dataset: rg.Dataset, offset: int, limit: int) -> str:
+    return (
+        f"{API_URL}/api/v1/datasets/{dataset.id}/records"
+        f"?offset={offset}&limit={limit}&include=suggestions&include=responses"
+    )
+
+
+class TestDatasetRecordsIterator:
+    def test_iterate_records_without_checking_dataset_existence(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(
+            url=records_url(dataset, offset=0, limit=2), json={"items": [record_json("a"), record_json("b")]}
+        )
+        httpx_mock.add_response(url=records_url(dataset, offset=2, limit=2), json={"items": [record_json("c")]})
+
+        records = list(dataset.records(batch_size=2, prefetch=1))
+
+        assert [record.fields["text"] for record in records] == ["a", "b", "c"]
+        assert all(request.url.path.endswith("/records") for request in httpx_mock.get_requests())
+
+    def test_iterate_records_prefetching_pages_up_to_limit(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(
+            url=records_url(dataset, offset=0, limit=2), json={"items": [record_json("a"), record_json("b")]}
+        )
+        httpx_mock.add_response(
+            url=records_url(dataset, offset=2, limit=2), json={"items": [record_json("c"), record_json("d")]}
+        )
+
+        records = list(dataset.records(batch_size=2, limit=4, prefetch=2))
+
+        assert [record.fields["text"] for record in records] == ["a", "b", "c", "d"]
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_iterate_records_of_missing_dataset(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(url=records_url(dataset, offset=0, limit=2), status_code=404)
+        httpx_mock.add_response(url=f"{API_URL}/api/v1/datasets/{dataset.id}", status_code=404)
+
+        with pytest.warns(UserWarning, match="does not exist on the server"):
+            records = list(dataset.records(batch_size=2, prefetch=1))
+
+        assert records == []
+
+    def test_iterate_records_stops_requesting_pages_after_a_short_page(
+        self, httpx_mock: HTTPXMock, mocker: MockerFixture, dataset: rg.Dataset
+    ):
+        def first_page(request: httpx.Request) -> httpx.Response:
+            # The short page is fetched before the first one is consumed
+            time.sleep(0.1)
+            return httpx.Response(status_code=200, json={"items": [record_json("a"), record_json("b")]})
+
+        httpx_mock.add_callback(first_page, url=records_url(dataset, offset=0, limit=2))
+        httpx_mock.add_response(url=records_url(dataset, offset=2, limit=2), json={"items": [record_json("c")]})
+
+        list_spy = mocker.spy(dataset._client.api.records, "list")
+
+        records = []
+        for record in dataset.records(batch_size=2, prefetch=2):
+            # Give the prefetching threads time to send any pending request
+            time.sleep(0.05)
+            records.append(record)
+
+        assert [record.fields["text"] for record in records] == ["a", "b", "c"]
+        assert list_spy.call_count == 2
+
+    def test_iterate_records_breaking_early_shuts_down_prefetching(
+        self, httpx_mock: HTTPXMock, mocker: MockerFixture, dataset: rg.Dataset
+    ):
+        httpx_mock.add_response(url=records_url(dataset, offset=0, limit=1), json={"items": [record_json("a")]})
+        httpx_mock.add_response(url=records_url(dataset, offset=1, limit=1), json={"items": [record_json("b")]})
+
+        iterator = dataset.records(batch_size=1, prefetch=2)
+        shutdown_spy = mocker.spy(iterator, "_shutdown")
+
+        for record in iterator:
+            break
+
+        assert record.fields["text"] == "a"
+        shutdown_spy.assert_called()
@@ -0,0 +1,183 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import uuid
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import argilla as rg
+from argilla._exceptions import BadRequestError, InternalServerError
+from argilla.records._dataset_records import DatasetRecords
+
+API_URL = "http://test_url"
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(DatasetRecords, "RETRY_BACKOFF_FACTOR", 0)
+
+
+@pytest.fixture
+def dataset() -> rg.Dataset:
+    dataset = rg.Dataset(
+        name="test_dataset",
+        settings=rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="response")]),
+        client=rg.Argilla(API_URL),
+    )
+    dataset.id = uuid.uuid4()
+
+    return dataset
+
+
+@pytest.fixture
+def user_id(httpx_mock: HTTPXMock) -> uuid.UUID:
+    user_id = uuid.uuid4()
+    httpx_mock.add_response(
+        url=f"{API_URL}/api/v1/me",
+        method="GET",
+        json={"id": str(user_id), "username": "owner", "role": "owner"},
+    )
+
+    return user_id
+
+
+def bulk_upsert_callback(request: httpx.Request) -> httpx.Response:
+    items = json.loads(request.content)["items"]
+    return httpx.Response(
+        status_code=200,
+        json={"items": [{**item, "id": str(uuid.uuid4()), "status": "pending"} for item in items]},
+    )
+
+
+class TestDatasetRecordsLog:
+    def test_log_records_with_workers_sends_all_batches(
+        self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID
+    ):
+        httpx_mock.add_callback(
+            bulk_upsert_callback, url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk", method="PUT"
+        )
+
+        records = [{"text": f"text-{idx}"} for idx in range(10)]
+        dataset.records.log(records, batch_size=2, workers=4)
+
+        requests = httpx_mock.get_requests(method="PUT")
+        assert len(requests) == 5
+        sent = sorted(item["fields"]["text"] for request in requests for item in json.loads(request.content)["items"])
+        assert sent == sorted(record["text"] for record in records)
+
+    def test_log_records_retries_batch_on_server_error(
+        self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID
+    ):
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_response(url=url, method="PUT", status_code=500)
+        httpx_mock.add_callback(bulk_upsert_callback, url=url, method="PUT")
+
+        dataset.records.log([{"text": "text"}], max_retries=1)
+
+        assert len(httpx_mock.get_requests(method="PUT")) == 2
+
+    def test_log_records_raises_when_retries_are_exhausted(
+        self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID
+    ):
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_response(url=url, method="PUT", status_code=500)
+        httpx_mock.add_response(url=url, method="PUT", status_code=500)
+
+        with pytest.raises(InternalServerError):
+            dataset.records.log([{"text": "text"}], max_retries=1)
+
+    def test_log_records_does_not_retry_client_errors(
+        self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID
+    ):
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk", method="PUT", status_code=400
+        )
+
+        with pytest.raises(BadRequestError):
+            dataset.records.log([{"text": "text"}])
+
+        assert len(httpx_mock.get_requests(method="PUT")) == 1
+
+    def test_log_records_with_warn_reports_failed_batches(
+        self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID
+    ):
+        url = f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk"
+        httpx_mock.add_response(url=url, method="PUT", status_code=400)
+        httpx_mock.add_callback(bulk_upsert_callback, url=url, method="PUT")
+
+        with pytest.warns(UserWarning, match="Failed to log records from 0 to 1"):
+            dataset.records.log([{"text": "first"}, {"text": "second"}], batch_size=1, on_error="warn")
+
+        assert len(httpx_mock.get_requests(method="PUT")) == 2
+
+    def test_log_records_with_invalid_workers(self, dataset: rg.Dataset):
+        with pytest.raises(ValueError, match="The number of workers must be greater than 0"):
+            dataset.records.log([{"text": "text"}], workers=0)
+
+    def test_log_records_from_generator(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID):
+        httpx_mock.add_callback(
+            bulk_upsert_callback, url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk", method="PUT"
+        )
+
+        dataset.records.log(({"text": f"text-{idx}"} for idx in range(5)), batch_size=2)
+
+        requests = httpx_mock.get_requests(method="PUT")
+        assert [len(json.loads(request.content)["items"]) for request in requests] == [2, 2, 1]
+
+    def test_log_records_from_hf_iterable_dataset(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, user_id: uuid.UUID):
+        from datasets import Dataset as HFDataset
+
+        httpx_mock.add_callback(
+            bulk_upsert_callback, url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk", method="PUT"
+        )
+        hf_dataset = HFDataset.from_list([{"id": str(idx), "text": f"text-{idx}"} for idx in range(3)])
+
+        dataset.records.log(hf_dataset.to_iterable_dataset(), batch_size=2)
+
+        requests = httpx_mock.get_requests(method="PUT")
+        sent = [item["fields"]["text"] for request in requests for item in json.loads(request.content)["items"]]
+        assert sent == ["text-0", "text-1", "text-2"]
+
+    def test_log_records_with_empty_list(self, dataset: rg.Dataset):
+        with pytest.raises(ValueError, match="No records provided to ingest."):
+            dataset.records.log([])
+
+    def test_log_records_with_media_encoder(self, httpx_mock: HTTPXMock, user_id: uuid.UUID):
+        from PIL import Image
+
+        dataset = rg.Dataset(
+            name="test_dataset",
+            settings=rg.Settings(fields=[rg.ImageField(name="image")], questions=[rg.TextQuestion(name="response")]),
+            client=rg.Argilla(API_URL),
+        )
+        dataset.id = uuid.uuid4()
+        httpx_mock.add_callback(
+            bulk_upsert_callback, url=f"{API_URL}/api/v1/datasets/{dataset.id}/records/bulk", method="PUT"
+        )
+
+        image = Image.new("RGB", (100, 100), color="red")
+        records = [{"picture": image}, rg.Record(fields={"image": image}), {"picture": "https://example.com/a.png"}]
+        with rg.MediaEncoder(workers=0, image_format="JPEG", max_dimension=10) as encoder:
+            dataset.records.log(records, mapping={"picture": "image"}, media_encoder=encoder)
+
+        items = json.loads(httpx_mock.get_request(method="PUT").content)["items"]
+        images = [item["fields"]["image"] for item in items]
+        assert images[0] == images[1]
+        assert images[0].startswith("data:image/jpeg;base64,")
+        assert images[2] == "https://example.com/a.png"
+        assert records[0]["picture"] is image
+        assert dict.get(records[1].fields, "image") is image
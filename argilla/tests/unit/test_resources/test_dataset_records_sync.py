@@ -0,0 +1,214 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import re
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import Optional
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+import argilla as rg
+
+API_URL = "http://test_url"
+
+
+@pytest.fixture
+def dataset() -> rg.Dataset:
+    dataset = rg.Dataset(
+        name="test_dataset",
+        settings=rg.Settings(fields=[rg.TextField(name="text")], questions=[rg.TextQuestion(name="response")]),
+        client=rg.Argilla(API_URL),
+    )
+    dataset.id = uuid.uuid4()
+
+    return dataset
+
+
+def record_json(external_id: str, text: str, updated_at: str, last_activity_at: Optional[str] = None) -> dict:
+    return {
+        "id": str(uuid.uuid5(uuid.NAMESPACE_URL, external_id)),
+        "external_id": external_id,
+        "status": "pending",
+        "fields": {"text": text},
+        "metadata": {},
+        "responses": [],
+        "suggestions": [],
+        "inserted_at": "2024-01-01T00:00:00",
+        "updated_at": updated_at,
+        "last_activity_at": last_activity_at or updated_at,
+    }
+
+
+def mock_sync(httpx_mock: HTTPXMock, dataset: rg.Dataset, records: list, deleted: list) -> None:
+    httpx_mock.add_response(
+        url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records/updated\\?.*"),
+        method="GET",
+        json={"items": records},
+    )
+    httpx_mock.add_response(
+        url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records/deleted\\?.*"),
+        method="GET",
+        json={"items": deleted},
+    )
+
+
+def read_records(path) -> dict:
+    with sqlite3.connect(path) as connection:
+        rows = connection.execute("SELECT id, deleted_at, document FROM records").fetchall()
+    return {id: (deleted_at, json.loads(document) if document else None) for id, deleted_at, document in rows}
+
+
+class TestDatasetRecordsSync:
+    def test_sync_records_to_an_empty_mirror(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        path = tmp_path / "mirror.db"
+        mock_sync(
+            httpx_mock,
+            dataset,
+            records=[record_json("a", "hello", "2024-01-02T00:00:00"), record_json("b", "bye", "2024-01-03T00:00:00")],
+            deleted=[],
+        )
+
+        assert dataset.records.sync(path) == path
+
+        records = read_records(path)
+        assert records.keys() == {"a", "b"}
+        assert records["a"][0] is None
+        assert records["a"][1]["fields"] == {"text": "hello"}
+
+        [request, deleted_request] = httpx_mock.get_requests(method="GET")
+        assert "updated_at_ge" not in request.url.params
+        assert "deleted_at_ge" not in deleted_request.url.params
+
+    def test_sync_only_fetches_changes_since_the_last_sync(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        path = tmp_path / "mirror.db"
+        mock_sync(
+            httpx_mock,
+            dataset,
+            records=[record_json("a", "hello", "2024-01-02T00:00:00"), record_json("b", "bye", "2024-01-03T00:00:00")],
+            deleted=[],
+        )
+        dataset.records.sync(path)
+
+        deleted_id = uuid.uuid5(uuid.NAMESPACE_URL, "b")
+        mock_sync(
+            httpx_mock,
+            dataset,
+            records=[record_json("a", "hello again", "2024-01-04T00:00:00")],
+            deleted=[{"id": str(deleted_id), "external_id": "b", "deleted_at": "2024-01-05T00:00:00"}],
+        )
+        dataset.records.sync(path)
+
+        records = read_records(path)
+        assert records["a"][1]["fields"] == {"text": "hello again"}
+        assert records["b"] == ("2024-01-05T00:00:00", None)
+
+        [request, deleted_request] = httpx_mock.get_requests(method="GET")[2:]
+        updated_at_ge = datetime.fromisoformat(request.url.params["updated_at_ge"])
+        assert updated_at_ge == datetime(2024, 1, 3) - dataset.records.SYNC_OVERLAP
+        assert "deleted_at_ge" not in deleted_request.url.params
+
+    def test_sync_pages_through_all_changes(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        path = tmp_path / "mirror.db"
+        records = [record_json(f"record-{idx}", "text", f"2024-01-0{idx + 1}T00:00:00") for idx in range(3)]
+        pages = [records[:2], [record_json("record-0", "changed", "2024-01-04T00:00:00"), records[2]], []]
+
+        def records_callback(request: httpx.Request) -> httpx.Response:
+            # The first record changes while syncing, so it's listed again after the last record of the first page
+            return httpx.Response(200, json={"items": pages.pop(0)})
+
+        httpx_mock.add_callback(
+            records_callback,
+            url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records/updated\\?.*"),
+            method="GET",
+        )
+        httpx_mock.add_response(
+            url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records/deleted\\?.*"),
+            method="GET",
+            json={"items": []},
+        )
+
+        dataset.records.sync(path, batch_size=2)
+
+        stored = read_records(path)
+        assert len(stored) == 3
+        assert stored["record-0"][1]["fields"] == {"text": "changed"}
+
+        requests = httpx_mock.get_requests(url=re.compile(".*/records/updated\\?.*"))
+        assert "after_id" not in requests[0].url.params
+        assert requests[1].url.params["after_last_activity_at"] == "2024-01-02T00:00:00"
+        assert requests[1].url.params["after_id"] == records[1]["id"]
+        assert requests[2].url.params["after_id"] == records[2]["id"]
+
+    def test_sync_uses_the_last_activity_of_records(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        path = tmp_path / "mirror.db"
+        # The response of the record changed after the record itself, so its last activity is later
+        mock_sync(
+            httpx_mock,
+            dataset,
+            records=[record_json("a", "hello", "2024-01-02T00:00:00", last_activity_at="2024-01-06T00:00:00")],
+            deleted=[],
+        )
+        dataset.records.sync(path)
+
+        mock_sync(httpx_mock, dataset, records=[], deleted=[])
+        dataset.records.sync(path)
+
+        request = httpx_mock.get_requests(url=re.compile(".*/records/updated\\?.*"))[-1]
+        updated_at_ge = datetime.fromisoformat(request.url.params["updated_at_ge"])
+        assert updated_at_ge == datetime(2024, 1, 6) - dataset.records.SYNC_OVERLAP
+
+    def test_sync_pages_through_all_deleted_records(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        path = tmp_path / "mirror.db"
+        deleted = [
+            {"id": str(uuid.uuid4()), "external_id": f"record-{idx}", "deleted_at": "2024-01-02T00:00:00"}
+            for idx in range(3)
+        ]
+        pages = [deleted[:2], deleted[2:]]
+
+        def deleted_callback(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"items": pages.pop(0)})
+
+        httpx_mock.add_response(
+            url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records/updated\\?.*"),
+            method="GET",
+            json={"items": []},
+        )
+        httpx_mock.add_callback(
+            deleted_callback,
+            url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records/deleted\\?.*"),
+            method="GET",
+        )
+
+        dataset.records.sync(path, batch_size=2)
+
+        assert {deleted_at for deleted_at, _ in read_records(path).values()} == {"2024-01-02T00:00:00"}
+        requests = httpx_mock.get_requests(url=re.compile(".*/records/deleted\\?.*"))
+        assert "after_id" not in requests[0].url.params
+        assert "offset" not in requests[1].url.params
+        assert requests[1].url.params["after_deleted_at"] == "2024-01-02T00:00:00"
+        assert requests[1].url.params["after_id"] == deleted[1]["id"]
+
+    def test_sync_with_a_mirror_of_another_dataset(self, httpx_mock: HTTPXMock, dataset: rg.Dataset, tmp_path):
+        path = tmp_path / "mirror.db"
+        mock_sync(httpx_mock, dataset, records=[], deleted=[])
+        dataset.records.sync(path)
+
+        dataset.id = uuid.uuid4()
+        with pytest.raises(ValueError, match="belongs to dataset"):
+            dataset.records.sync(path)
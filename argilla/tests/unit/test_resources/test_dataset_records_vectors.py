@@ -0,0 +1,99 @@
+# Copyright 2024-present, Argilla, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import uuid
+
+import numpy as np
+import pytest
+from pytest_httpx import HTTPXMock
+
+import argilla as rg
+from argilla._models import VectorModel
+
+API_URL = "http://test_url"
+
+
+@pytest.fixture
+def dataset() -> rg.Dataset:
+    dataset = rg.Dataset(
+        name="test_dataset",
+        settings=rg.Settings(
+            fields=[rg.TextField(name="text")],
+            questions=[rg.TextQuestion(name="response")],
+            vectors=[rg.VectorField(name="vector", dimensions=2)],
+        ),
+        client=rg.Argilla(API_URL),
+    )
+    dataset.id = uuid.uuid4()
+
+    return dataset
+
+
+def record_json(vector: list = None) -> dict:
+    return {
+        "id": str(uuid.uuid4()),
+        "status": "pending",
+        "fields": {"text": "text"},
+        "vectors": {"vector": vector} if vector else {},
+    }
+
+
+class TestVectorModel:
+    def test_vector_values_are_float32_arrays(self):
+        values = np.array([0.5, 1.5], dtype=np.float32)
+
+        model = VectorModel(name="vector", vector_values=values)
+
+        assert model.vector_values is values
+        assert VectorModel(name="vector", vector_values=[1, 2]).vector_values.dtype == np.float32
+        assert model.model_dump()["vector_values"] == [0.5, 1.5]
+
+    def test_vector_values_must_be_one_dimensional(self):
+        with pytest.raises(ValueError, match="one-dimensional"):
+            VectorModel(name="vector", vector_values=[[1.0, 2.0]])
+
+
+class TestDatasetRecordsVectorsMatrix:
+    def test_vectors_matrix(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/progress", json={"total": 3, "completed": 0, "pending": 3}
+        )
+        records_url = f"{API_URL}/api/v1/datasets/{dataset.id}/records?offset={{offset}}&limit=2&include=vectors:vector"
+        httpx_mock.add_response(
+            url=records_url.format(offset=0), json={"items": [record_json([0.5, 1.5]), record_json()]}
+        )
+        httpx_mock.add_response(url=records_url.format(offset=2), json={"items": [record_json([2.5, 3.5])]})
+
+        matrix = dataset.records.vectors_matrix("vector", batch_size=2)
+
+        assert matrix.dtype == np.float32
+        np.testing.assert_array_equal(matrix, [[0.5, 1.5], [np.nan, np.nan], [2.5, 3.5]])
+
+    def test_vectors_matrix_with_records_created_while_fetching(self, httpx_mock: HTTPXMock, dataset: rg.Dataset):
+        httpx_mock.add_response(
+            url=f"{API_URL}/api/v1/datasets/{dataset.id}/progress", json={"total": 1, "completed": 0, "pending": 1}
+        )
+        httpx_mock.add_response(
+            url=re.compile(f"{API_URL}/api/v1/datasets/{dataset.id}/records\\?.*"),
+            json={"items": [record_json([0.5, 1.5]), record_json([2.5, 3.5])]},
+        )
+
+        matrix = dataset.records.vectors_matrix("vector", batch_size=5)
+
+        np.testing.assert_array_equal(matrix, [[0.5, 1.5], [2.5, 3.5]])
+
+    def test_vectors_matrix_with_unknown_vector(self, dataset: rg.Dataset):
+        with pytest.raises(ValueError, match="not found"):
+            dataset.records.vectors_matrix("unknown")
@@ -14,9 +14,10 @@
 
 import uuid
 
+import numpy as np
 import pytest
 
-from argilla import Dataset, Record, Response, Settings, Suggestion, TextField, TextQuestion
+from argilla import Dataset, Record, Response, Settings, Suggestion, TextField, TextQuestion, Vector
 from argilla._exceptions import ArgillaError
 from argilla._models import RecordModel
 from argilla._models._record._metadata import MetadataModel
@@ -95,6 +96,20 @@ class TestRecords:
 
         record.vectors["new-vector"] = [1.0, 2.0, 3.0]
         assert record.vectors == {"vector": [1.0, 2.0, 3.0], "new-vector": [1.0, 2.0, 3.0]}
+        assert record.vectors["new-vector"].dtype == np.float32
+
+    def test_compare_record_vectors(self):
+        record = Record(fields={"name": "John"}, vectors={"vector": [0.1, 0.2, 0.3]})
+        other_record = Record(fields={"name": "John"}, vectors={"vector": np.array([0.1, 0.2, 0.3])})
+
+        assert record.vectors == other_record.vectors
+        assert record.vectors == {"vector": [0.1, 0.2, 0.3]}
+        assert record.vectors != {"vector": [0.1, 0.2, 0.4]}
+        assert record.vectors != {"other-vector": [0.1, 0.2, 0.3]}
+        assert record.vectors != {"vector": [0.1, 0.2]}
+        assert record.vectors.api_models() == other_record.vectors.api_models()
+        assert Vector(name="vector", values=[0.1, 0.2]) == Vector(name="vector", values=[0.1, 0.2])
+        assert Vector(name="vector", values=[0.1, 0.2]) != Vector(name="vector", values=[0.1, 0.3])
 
     def test_prevent_update_record(self):
         record = Record(fields={"name": "John"})